@@ -0,0 +1,319 @@
+"""Verarbeitung vieler Rohdaten in einem Durchgang
+
+Jede Rohdatei wird in einem eigenen Prozess eingelesen, die Pakete und
+Regeln werden berechnet und ein Bericht pro Datei exportiert, siehe
+Kommandozeile.pipeline. Am Schluss werden die Kennzahlen aller Dateien in
+einer gemeinsamen Zusammenfassung geschrieben.
+
+Der Stand wird nach jeder Datei im Zielordner gespeichert (BATCH_STAND).
+Wird der Batch erneut gestartet, werden Dateien, die seither nicht
+geaendert wurden und mit den gleichen Optionen fertig verarbeitet wurden,
+uebersprungen. Fehlgeschlagene oder noch nicht verarbeitete Dateien werden
+verarbeitet.
+"""
+
+import glob
+import json
+import os
+import pathlib
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from .ExcelCalc import UIError
+from .Export import istSQLite
+from .LazyImport import lazyImport
+
+pd = lazyImport('pandas')
+
+BATCH_FORMAT = 'Paketmanager-Batch'
+BATCH_VERSION = 1
+
+# Dateiname des Stands im Zielordner
+BATCH_STAND = 'batch.json'
+# Dateinamen der gemeinsamen Zusammenfassung im Zielordner
+ZUSAMMENFASSUNG_JSON = 'zusammenfassung.json'
+ZUSAMMENFASSUNG_CSV = 'zusammenfassung.csv'
+
+# Endungen, die in einem Ordner als Rohdaten erkannt werden
+ROHDATEN_ENDUNGEN = ['.csv', '.xlsx', '.xls', '.parquet']
+
+FERTIG = 'fertig'
+FEHLER = 'Fehler'
+
+def rohdatenFinden(quellen):
+    """Sucht die Rohdaten in Ordnern, Mustern und Dateinamen
+
+    :quellen: Liste mit Ordnern, glob Mustern (z.B. 'daten/*.csv') oder
+    Dateinamen
+    :returns: Sortierte Liste mit pathlib.Path ohne Duplikate
+    """
+    dateien = set()
+    for quelle in quellen:
+        path = pathlib.Path(quelle)
+        if path.is_dir():
+            dateien.update(p for p in path.iterdir()
+                           if p.is_file() and p.suffix in ROHDATEN_ENDUNGEN)
+        elif glob.has_magic(str(quelle)):
+            dateien.update(pathlib.Path(p) for p in glob.glob(str(quelle))
+                           if os.path.isfile(p))
+        else:
+            dateien.add(path)
+    return sorted(p.resolve() for p in dateien)
+
+def signatur(dateiname):
+    """Gibt Groesse und Aenderungszeit einer Datei zurueck, um Aenderungen
+    zu erkennen, oder None, wenn die Datei nicht existiert"""
+    try:
+        stat = os.stat(str(dateiname))
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def berichtNamen(dateien):
+    """Bestimmt fuer jede Rohdatei einen eindeutigen Namen fuer ihre Berichte
+
+    Der Name ist der Dateiname ohne Endung. Haben mehrere Dateien den gleichen
+    Namen, wird die Endung angehaengt (foo_csv, foo_parquet) und, solange der
+    Name nicht eindeutig ist, ein Ordner nach dem anderen vorangestellt
+    (daten_foo_csv). Reicht auch der ganze Pfad nicht, z.B. weil sich die
+    Pfade nur in Gross- und Kleinschreibung unterscheiden, wird eine Nummer
+    angehaengt. Gross- und Kleinschreibung wird nicht unterschieden, da sie
+    unter Windows den gleichen Bericht ergeben.
+
+    :dateien: Liste mit pathlib.Path
+    :returns: Dict Rohdatei -> Name ohne Endung
+    """
+    kandidaten = {}
+    for path in dateien:
+        name = path.stem
+        liste = [name]
+        if path.suffix:
+            name = '{}_{}'.format(name, path.suffix.lstrip('.'))
+            liste.append(name)
+        for ordner in path.parents:
+            if not ordner.name:
+                break
+            name = '{}_{}'.format(ordner.name, name)
+            liste.append(name)
+        kandidaten[path] = liste
+
+    stufen = dict.fromkeys(dateien, 0)
+    while True:
+        namen = {path: kandidaten[path][stufen[path]] for path in dateien}
+        gruppen = defaultdict(list)
+        for path in dateien:
+            gruppen[namen[path].casefold()].append(path)
+        verlaengern = [path for gruppe in gruppen.values() if len(gruppe) > 1
+                       for path in gruppe
+                       if stufen[path] + 1 < len(kandidaten[path])]
+        if not verlaengern:
+            break
+        for path in verlaengern:
+            stufen[path] += 1
+
+    vergeben = set(gruppen)
+    for gruppe in gruppen.values():
+        for path in gruppe[1:]:
+            nummer = 2
+            while '{}_{}'.format(namen[path], nummer).casefold() in vergeben:
+                nummer += 1
+            namen[path] = '{}_{}'.format(namen[path], nummer)
+            vergeben.add(namen[path].casefold())
+    return namen
+
+def standLesen(zielordner):
+    """Liest den Stand eines frueheren Batch, leer wenn es keinen gibt"""
+    path = pathlib.Path(zielordner) / BATCH_STAND
+    try:
+        with open(str(path), encoding='utf-8') as datei:
+            stand = json.load(datei)
+        if stand.get('format') == BATCH_FORMAT and \
+                stand.get('version', 0) <= BATCH_VERSION:
+            return stand
+    except (OSError, ValueError):
+        pass
+    return {'format': BATCH_FORMAT, 'version': BATCH_VERSION, 'dateien': {}}
+
+def standSchreiben(zielordner, stand):
+    """Schreibt den Stand, ueber eine temporaere Datei, damit ein Abbruch
+    keinen halben Stand hinterlaesst"""
+    path = pathlib.Path(zielordner) / BATCH_STAND
+    temp = path.with_name(path.name + '.tmp')
+    with open(str(temp), 'w', encoding='utf-8') as datei:
+        json.dump(stand, datei, indent=1, ensure_ascii=False)
+    os.replace(str(temp), str(path))
+
+def istErledigt(eintrag, dateiSignatur, optionen):
+    """Gibt True zurueck, wenn eine Datei mit den gleichen Optionen fertig
+    verarbeitet wurde und seither nicht geaendert hat"""
+    return (eintrag is not None
+            and eintrag.get('status') == FERTIG
+            and eintrag.get('signatur') == dateiSignatur
+            and eintrag.get('optionen') == optionen
+            and all(os.path.exists(d) for d in
+                    eintrag['zusammenfassung'].get('dateien', [])))
+
+def batchOptionen(endung, regelDatei, kategorien, backend, faerben,
+                  proKategorie):
+    """Gibt die Optionen zurueck, mit denen eine Datei verarbeitet wird. Eine
+    Datei wird neu verarbeitet, wenn sie sich aendern."""
+    return {
+        'endung': endung,
+        'regeln': str(regelDatei) if regelDatei is not None else None,
+        'regelSignatur': signatur(regelDatei) if regelDatei else None,
+        'kategorien': list(kategorien) if kategorien is not None else None,
+        'backend': backend,
+        'faerben': faerben,
+        'proKategorie': proKategorie,
+        }
+
+def dateiVerarbeiten(auftrag):
+    """Verarbeitet eine Rohdatei. Laeuft in einem Prozess des Pools.
+
+    :auftrag: Dict mit rohdaten, name, zielordner, endung, regeln, kategorien,
+    backend, faerben und proKategorie
+    :returns: Dict mit status, zusammenfassung bzw. fehler
+    """
+    # Erst hier importieren, damit der Hauptprozess schnell startet
+    from .Kommandozeile import pipeline
+    zielordner = pathlib.Path(auftrag['zielordner'])
+    name = auftrag['name']
+    ausgabe = zielordner / (name + auftrag['endung'])
+    regelAusgabe = None
+    if auftrag['regeln'] is not None and not istSQLite(ausgabe):
+        # In SQLite sind die Regeln bereits enthalten
+        regelAusgabe = zielordner / (name + '_Regeln' + auftrag['endung'])
+    ordner = None
+    if auftrag['backend'] != 'pandas':
+        ordner = zielordner / (name + '_index')
+    try:
+        zusammenfassung = pipeline(
+            [auftrag['rohdaten']], ausgabe, auftrag['regeln'],
+            auftrag['kategorien'], regelAusgabe, auftrag['backend'], ordner,
+            auftrag['faerben'], auftrag['proKategorie'])
+        return {'status': FERTIG, 'zusammenfassung': zusammenfassung}
+    except Exception as error:
+        # Eine fehlerhafte Datei soll den Batch nicht abbrechen
+        return {'status': FEHLER,
+                'fehler': '{}: {}'.format(type(error).__name__, error)}
+
+def zusammenfassungSchreiben(zielordner, stand, dateien):
+    """Schreibt die gemeinsame Zusammenfassung aller Dateien als JSON und CSV
+
+    :returns: Pandas objekt mit einer Zeile pro Rohdatei
+    """
+    zeilen = []
+    for path in dateien:
+        eintrag = stand['dateien'].get(str(path), {})
+        zusammenfassung = eintrag.get('zusammenfassung') or {}
+        zeile = {
+            'Datei': str(path),
+            'Status': eintrag.get('status', ''),
+            'Zeilen': zusammenfassung.get('anzahlZeilen'),
+            'Falldaten': zusammenfassung.get('anzahlFalldaten'),
+            'Pakete': zusammenfassung.get('anzahlPakete'),
+            'Dauer': round(sum(zusammenfassung.get('dauer', {}).values()), 3)
+                     if zusammenfassung else None,
+            'Fehler': eintrag.get('fehler', ''),
+            }
+        for regel, anzahl in zusammenfassung.get('regeln', {}).items():
+            zeile['Regel {}'.format(regel)] = anzahl
+        zeilen.append(zeile)
+    tabelle = pd.DataFrame(zeilen)
+
+    zielordner = pathlib.Path(zielordner)
+    tabelle.to_csv(str(zielordner / ZUSAMMENFASSUNG_CSV), index=False)
+    gesamt = {
+        'anzahlDateien': len(dateien),
+        'anzahlFertig': int((tabelle['Status'] == FERTIG).sum()),
+        'anzahlFehler': int((tabelle['Status'] == FEHLER).sum()),
+        'anzahlZeilen': int(tabelle['Zeilen'].fillna(0).sum()),
+        'anzahlFalldaten': int(tabelle['Falldaten'].fillna(0).sum()),
+        'dateien': {str(path): stand['dateien'].get(str(path))
+                    for path in dateien},
+        }
+    with open(str(zielordner / ZUSAMMENFASSUNG_JSON), 'w',
+              encoding='utf-8') as datei:
+        json.dump(gesamt, datei, indent=1, ensure_ascii=False)
+    return tabelle
+
+def batch(quellen, zielordner, endung='.xlsx', regelDatei=None,
+          kategorien=None, backend='pandas', faerben=True, proKategorie=False,
+          prozesse=None, neu=False, still=False):
+    """Verarbeitet alle Rohdaten gleichzeitig in einem Prozesspool
+
+    :quellen: Ordner, glob Muster oder Dateinamen, siehe rohdatenFinden
+    :zielordner: Ordner fuer die Berichte, die Zusammenfassung und den Stand
+    :endung: Endung der Berichte, bestimmt das Format
+    :regelDatei: Optional, Regelfile fuer alle Dateien
+    :kategorien: Optional, Liste mit Kategorien fuer alle Dateien
+    :backend: Siehe Datenbank.datenLaden
+    :prozesse: Anzahl Prozesse, Standard ist die Anzahl CPUs
+    :neu: Wenn True, werden auch bereits verarbeitete Dateien neu verarbeitet
+    :still: Wenn True, wird nichts auf stderr geschrieben
+    :returns: Pandas objekt mit einer Zeile pro Rohdatei, siehe
+    zusammenfassungSchreiben
+    """
+    dateien = rohdatenFinden(quellen)
+    if not dateien:
+        raise UIError("Keine Rohdaten gefunden")
+    zielordner = pathlib.Path(zielordner)
+    zielordner.mkdir(parents=True, exist_ok=True)
+
+    optionen = batchOptionen(endung, regelDatei, kategorien, backend, faerben,
+                             proKategorie)
+    stand = {'format': BATCH_FORMAT, 'version': BATCH_VERSION, 'dateien': {}}
+    if not neu:
+        stand = standLesen(zielordner)
+    namen = berichtNamen(dateien)
+
+    auftraege = {}
+    for path in dateien:
+        dateiSignatur = signatur(path)
+        if istErledigt(stand['dateien'].get(str(path)), dateiSignatur,
+                       optionen):
+            continue
+        auftraege[str(path)] = (dateiSignatur, {
+            'rohdaten': str(path),
+            'name': namen[path],
+            'zielordner': str(zielordner),
+            'endung': endung,
+            'regeln': str(regelDatei) if regelDatei is not None else None,
+            'kategorien': optionen['kategorien'],
+            'backend': backend,
+            'faerben': faerben,
+            'proKategorie': proKategorie,
+            })
+    if not still:
+        print('{} Dateien, {} bereits verarbeitet'.format(
+            len(dateien), len(dateien) - len(auftraege)), file=sys.stderr)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=prozesse) as executor:
+        laufend = {
+            executor.submit(dateiVerarbeiten, auftrag): pfad
+            for pfad, (_, auftrag) in auftraege.items()
+            }
+        for i, future in enumerate(as_completed(laufend)):
+            pfad = laufend[future]
+            try:
+                resultat = future.result()
+            except BrokenProcessPool as error:
+                # Z.B. wenn ein Prozess wegen zu wenig Speicher beendet wurde
+                resultat = {'status': FEHLER, 'fehler': str(error) or
+                            'Der Prozess wurde unerwartet beendet'}
+            resultat['signatur'] = auftraege[pfad][0]
+            resultat['optionen'] = optionen
+            stand['dateien'][pfad] = resultat
+            standSchreiben(zielordner, stand)
+            if not still:
+                meldung = resultat['status']
+                if resultat['status'] == FEHLER:
+                    meldung += ': ' + resultat['fehler']
+                print('[{}/{}] {} {} ({:.1f} s)'.format(
+                    i + 1, len(laufend), pathlib.Path(pfad).name, meldung,
+                    time.perf_counter() - start), file=sys.stderr)
+
+    return zusammenfassungSchreiben(zielordner, stand, dateien)
@@ -0,0 +1,263 @@
+"""Beobachtet einen Ordner und aktualisiert die Berichte laufend
+
+Neue oder geaenderte Rohdaten werden erkannt, sobald sich ihre Groesse und
+Aenderungszeit zwischen zwei Durchlaeufen nicht mehr aendern (die Datei
+also fertig geschrieben ist). Nur die betroffenen Dateien werden neu
+berechnet, in einem Prozesspool, der die ganze Zeit laeuft.
+
+Die berechneten Pakete jeder Datei werden im Cache Ordner als Projektdatei
+gespeichert (siehe Projekt), die keinen Code ausfuehren kann, auch wenn
+andere in den Zielordner schreiben koennen.
+Aendern sich nur die Regeln, werden nur die Regeln auf den gespeicherten
+Paketen neu ausgewertet, aendern sich Kategorien oder Format, werden nur
+die Berichte neu geschrieben. Eingelesen und berechnet wird nur, wenn sich
+die Rohdatei selbst geaendert hat.
+
+Der Stand und die Zusammenfassung sind die gleichen wie bei Batch.
+"""
+
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from .Export import istSQLite, exportZiel
+from .Batch import rohdatenFinden, signatur, berichtNamen, standLesen
+from .Batch import standSchreiben, zusammenfassungSchreiben, batchOptionen
+from .Batch import FERTIG, FEHLER
+from .Projekt import PROJEKT_ENDUNG
+
+# Unterordner des Zielordners mit den berechneten Paketen
+CACHE_ORDNER = '.cache'
+
+# Was fuer eine Datei neu gemacht werden muss, von viel zu wenig
+NEU_BERECHNEN = 'berechnen'
+NEU_SCHREIBEN = 'schreiben'
+NEU_REGELN = 'regeln'
+
+# Optionen, von denen nur die Regelberichte abhaengen
+REGEL_OPTIONEN = ['regeln', 'regelSignatur']
+
+def cacheDateiname(zielordner, name):
+    """Gibt den Dateinamen der gespeicherten Pakete einer Rohdatei zurueck"""
+    return pathlib.Path(zielordner) / CACHE_ORDNER / (name + PROJEKT_ENDUNG)
+
+def aufgabeBestimmen(eintrag, dateiSignatur, optionen, cache):
+    """Bestimmt, was fuer eine Rohdatei neu gemacht werden muss
+
+    :eintrag: Eintrag der Datei im Stand oder None
+    :dateiSignatur: Aktuelle Signatur der Rohdatei
+    :optionen: Aktuelle Optionen
+    :cache: Aktueller Dateiname des Cache, siehe cacheDateiname. Aendert sich
+    der Name der Berichte, weil eine gleichnamige Rohdatei dazukommt, wird
+    die Datei unter dem neuen Namen neu verarbeitet.
+    :returns: NEU_BERECHNEN, NEU_SCHREIBEN, NEU_REGELN oder None
+    """
+    if eintrag is None or eintrag.get('signatur') != dateiSignatur:
+        return NEU_BERECHNEN
+    alteOptionen = eintrag.get('optionen') or {}
+    if eintrag.get('status') == FEHLER:
+        # Eine fehlerhafte Datei erst wieder versuchen, wenn sie oder die
+        # Optionen sich aendern
+        return None if alteOptionen == optionen else NEU_BERECHNEN
+    if eintrag.get('cache') != str(cache) or not os.path.exists(str(cache)):
+        return NEU_BERECHNEN
+    if any(not os.path.exists(d)
+           for d in eintrag['zusammenfassung'].get('dateien', [])):
+        return NEU_SCHREIBEN
+    geaendert = [k for k in optionen if optionen[k] != alteOptionen.get(k)]
+    if not geaendert:
+        return None
+    if all(k in REGEL_OPTIONEN for k in geaendert):
+        return NEU_REGELN
+    return NEU_SCHREIBEN
+
+def dateiAktualisieren(auftrag):
+    """Aktualisiert die Berichte einer Rohdatei. Laeuft in einem Prozess des
+    Pools.
+
+    :auftrag: Dict wie bei Batch.dateiVerarbeiten, zusaetzlich mit aufgabe
+    und cache
+    :returns: Dict mit status, zusammenfassung bzw. fehler
+    """
+    from .ExcelCalc import ExcelDaten, UIError, convertLeistung
+    from .Kommandozeile import paketeLaden, auswerten, Protokoll
+    from .Projekt import projektSpeichern, projektLaden
+    zielordner = pathlib.Path(auftrag['zielordner'])
+    name = auftrag['name']
+    cache = pathlib.Path(auftrag['cache'])
+    ausgabe = zielordner / (name + auftrag['endung'])
+    regelAusgabe = None
+    if auftrag['regeln'] is not None and not istSQLite(ausgabe):
+        regelAusgabe = zielordner / (name + '_Regeln' + auftrag['endung'])
+    elif auftrag['aufgabe'] == NEU_REGELN:
+        # In SQLite sind die Regeln im Bericht der Pakete enthalten
+        auftrag['aufgabe'] = NEU_SCHREIBEN
+    try:
+        protokoll = Protokoll(still=True)
+        if auftrag['aufgabe'] == NEU_BERECHNEN:
+            excelDaten, _ = paketeLaden([auftrag['rohdaten']],
+                                        protokoll=protokoll)
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            # Ueber eine temporaere Datei, damit ein Abbruch keinen halben
+            # Cache hinterlaesst
+            temp = cache.with_name(cache.name + '.tmp')
+            projektSpeichern(temp, excelDaten.dataframe,
+                             excelDaten.getKategorien(), [],
+                             auftrag['rohdaten'])
+            os.replace(str(temp), str(cache))
+        else:
+            projekt = projektLaden(cache)
+            if projekt.excelName != auftrag['rohdaten']:
+                raise UIError("Der Cache gehört zu einer anderen Rohdatei")
+            excelDaten = ExcelDaten()
+            excelDaten.dataframe = projekt.dataframe()
+            for kategorie in projekt.kategorien:
+                excelDaten.addKategorie(convertLeistung(kategorie))
+            protokoll.schritt('Cache')
+
+        kategorien = list(excelDaten.getKategorien()) or None
+        if auftrag['kategorien'] is not None:
+            kategorien = [convertLeistung(k) for k in auftrag['kategorien']]
+            excelDaten.clearKategorien()
+            for kategorie in kategorien:
+                excelDaten.addKategorie(kategorie)
+        paketDateien = []
+        if auftrag['aufgabe'] == NEU_REGELN:
+            # Der Bericht der Pakete ist noch aktuell
+            paketDateien = [str(exportZiel(ausgabe))]
+            ausgabe = None
+        zusammenfassung = auswerten(
+            excelDaten, kategorien, [auftrag['rohdaten']], ausgabe,
+            auftrag['regeln'], regelAusgabe, 'pandas', auftrag['faerben'],
+            auftrag['proKategorie'], protokoll)
+        zusammenfassung['dateien'] = paketDateien + zusammenfassung['dateien']
+        return {'status': FERTIG, 'zusammenfassung': zusammenfassung,
+                'cache': str(cache), 'aufgabe': auftrag['aufgabe']}
+    except Exception as error:
+        return {'status': FEHLER, 'aufgabe': auftrag['aufgabe'],
+                'fehler': '{}: {}'.format(type(error).__name__, error)}
+
+def beobachten(ordner, zielordner, endung='.xlsx', regelDatei=None,
+               kategorien=None, faerben=True, proKategorie=False,
+               prozesse=None, intervall=2.0, durchlaeufe=None, neu=False,
+               still=False):
+    """Beobachtet Ordner mit Rohdaten und aktualisiert die Berichte, bis das
+    Programm mit Ctrl-C beendet wird
+
+    :ordner: Liste mit Ordnern oder glob Mustern, siehe Batch.rohdatenFinden
+    :zielordner: Ordner fuer Berichte, Zusammenfassung, Stand und Cache
+    :endung: Endung der Berichte, bestimmt das Format
+    :regelDatei: Optional, Regelfile. Aenderungen werden ebenfalls erkannt
+    :kategorien: Optional, Liste mit Kategorien fuer alle Dateien
+    :prozesse: Anzahl Prozesse, Standard ist die Anzahl CPUs
+    :intervall: Sekunden zwischen zwei Durchlaeufen
+    :durchlaeufe: Optional, Anzahl Durchlaeufe, unbeschraenkt wenn None
+    :neu: Wenn True, wird der Stand eines frueheren Laufs nicht verwendet
+    :still: Wenn True, wird nichts auf stderr geschrieben
+    """
+    zielordner = pathlib.Path(zielordner)
+    zielordner.mkdir(parents=True, exist_ok=True)
+    stand = standLesen(zielordner)
+    if neu:
+        stand['dateien'] = {}
+    letzteSignaturen = {}
+    alteDateien = None
+
+    def melden(text):
+        if not still:
+            print(time.strftime('%H:%M:%S'), text, file=sys.stderr)
+
+    melden('Beobachte {}'.format(', '.join(str(o) for o in ordner)))
+    executor = ProcessPoolExecutor(max_workers=prozesse)
+    durchlauf = 0
+    try:
+        while durchlaeufe is None or durchlauf < durchlaeufe:
+            if durchlauf:
+                time.sleep(intervall)
+            durchlauf += 1
+
+            # Neu bei jedem Durchlauf, um Aenderungen am Regelfile zu sehen
+            optionen = batchOptionen(endung, regelDatei, kategorien, 'pandas',
+                                     faerben, proKategorie)
+            dateien = rohdatenFinden(ordner)
+            signaturen = {str(p): signatur(p) for p in dateien}
+            namen = berichtNamen(dateien)
+
+            auftraege = {}
+            for path in dateien:
+                pfad = str(path)
+                eintrag = stand['dateien'].get(pfad)
+                cache = cacheDateiname(zielordner, namen[path])
+                aufgabe = aufgabeBestimmen(eintrag, signaturen[pfad],
+                                           optionen, cache)
+                if aufgabe is None:
+                    continue
+                if aufgabe == NEU_BERECHNEN and \
+                        letzteSignaturen.get(pfad) != signaturen[pfad]:
+                    # Die Datei wird vielleicht noch geschrieben
+                    continue
+                auftraege[pfad] = {
+                    'rohdaten': pfad,
+                    'name': namen[path],
+                    'zielordner': str(zielordner),
+                    'endung': endung,
+                    'regeln': optionen['regeln'],
+                    'kategorien': optionen['kategorien'],
+                    'faerben': faerben,
+                    'proKategorie': proKategorie,
+                    'aufgabe': aufgabe,
+                    'cache': str(cache),
+                    }
+            letzteSignaturen = signaturen
+
+            entfernt = [p for p in stand['dateien'] if p not in signaturen]
+            for pfad in entfernt:
+                cache = stand['dateien'].pop(pfad).get('cache')
+                if cache and os.path.exists(cache):
+                    os.remove(cache)
+                melden('{} entfernt'.format(pathlib.Path(pfad).name))
+
+            if not auftraege and not entfernt and dateien == alteDateien:
+                continue
+            alteDateien = dateien
+
+            start = time.perf_counter()
+            abgestuerzt = False
+            laufend = {executor.submit(dateiAktualisieren, auftrag): pfad
+                       for pfad, auftrag in auftraege.items()}
+            for future in as_completed(laufend):
+                pfad = laufend[future]
+                try:
+                    resultat = future.result()
+                except BrokenProcessPool as error:
+                    resultat = {'status': FEHLER, 'fehler': str(error) or
+                                'Der Prozess wurde unerwartet beendet'}
+                    abgestuerzt = True
+                resultat['signatur'] = signaturen[pfad]
+                resultat['optionen'] = optionen
+                alterCache = stand['dateien'].get(pfad, {}).get('cache')
+                if resultat['status'] == FERTIG and alterCache and \
+                        alterCache != resultat['cache'] and \
+                        os.path.exists(alterCache):
+                    os.remove(alterCache)
+                stand['dateien'][pfad] = resultat
+                standSchreiben(zielordner, stand)
+                meldung = '{} {} ({})'.format(pathlib.Path(pfad).name,
+                    resultat['status'], auftraege[pfad]['aufgabe'])
+                if resultat['status'] == FEHLER:
+                    meldung += ': ' + resultat['fehler']
+                melden('{} nach {:.1f} s'.format(
+                    meldung, time.perf_counter() - start))
+            if abgestuerzt:
+                # Ein kaputter Pool nimmt keine Auftraege mehr an
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(max_workers=prozesse)
+            standSchreiben(zielordner, stand)
+            if dateien:
+                zusammenfassungSchreiben(zielordner, stand, dateien)
+    except KeyboardInterrupt:
+        melden('Beendet')
+    finally:
+        executor.shutdown(wait=True)
@@ -0,0 +1,351 @@
+"""Berechnung der Pakete und Regeln in einer SQLite Datenbank
+
+Fuer sehr grosse Rohdaten koennen die Pakete und Regeln statt mit Pandas im
+Speicher in einer lokalen SQLite Datenbank berechnet werden. Die Rohdaten
+werden dafuer in Stuecken in die Datenbank geladen, SQLite lagert
+Zwischenresultate bei Bedarf auf die Festplatte aus.
+
+Die Resultate sind die gleichen wie mit createPakete und regelnAuswerten:
+ * key und keyAlle sind die sortierten, verschiedenen Leistungen eines Falls
+ * die paketID ist der Rang des keys in sortierter Reihenfolge
+ * eine Regel ist erfuellt, wenn ihre Leistungen in keyAlle enthalten sind
+
+Ein Datenbank Objekt hat die gleichen Methoden wie ein LeistungsIndex und
+kann mit ExcelDaten.setIndex verwendet werden.
+"""
+
+import pathlib
+import sqlite3
+import threading
+from .ExcelCalc import UIError, Regel, createPakete, datenEinlesen
+from .ExcelCalc import ExcelDaten, excelKategorien
+from .Index import CHUNK_GROESSE, rohdatenStuecke, indexErstellen
+from .LazyImport import lazyImport
+from .Messung import schritt
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+
+DATENBANK_VERSION = 1
+
+# Verfuegbare Backends fuer datenLaden
+BACKENDS = ['pandas', 'index', 'sqlite']
+
+# Groesse des Caches von SQLite in KiB, groessere Zwischenresultate werden
+# in temporaere Dateien ausgelagert
+CACHE_GROESSE = 256 * 1024
+
+DATENBANK_SCHEMA = """
+CREATE TABLE info (
+    schluessel TEXT PRIMARY KEY,
+    wert TEXT
+);
+CREATE TABLE zeilen (
+    zeile INTEGER PRIMARY KEY,
+    fall_nr,
+    datum TEXT,
+    tarifgruppe TEXT,
+    leistung TEXT NOT NULL,
+    fall INTEGER NOT NULL
+);
+"""
+
+# Die Keys werden mit group_concat als Fensterfunktion zusammengesetzt, nur
+# so ist die Reihenfolge (nach Leistung) garantiert. Die letzte Zeile jedes
+# Falls enthaelt den ganzen Key. Der Vergleich von Texten in SQLite (BINARY)
+# sortiert gleich wie Python.
+KEYS_SQL = """
+CREATE TABLE {tabelle} AS
+SELECT fall, {spalte}
+FROM (
+    SELECT fall, group_concat(leistung, ',') OVER fenster AS {spalte},
+           row_number() OVER fenster AS nummer,
+           count(*) OVER (PARTITION BY fall) AS anzahl
+    FROM (SELECT DISTINCT fall, leistung FROM zeilen {bedingung})
+    WINDOW fenster AS (PARTITION BY fall ORDER BY leistung
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+    )
+WHERE nummer = anzahl;
+"""
+
+PAKETE_SQL = KEYS_SQL.format(
+    tabelle='keys', spalte='key',
+    bedingung="WHERE instr(tarifgruppe, 'TARMED') > 0") + KEYS_SQL.format(
+    tabelle='keysAlle', spalte='keyAlle', bedingung='') + """
+CREATE TABLE faelle AS
+SELECT a.fall AS fall, coalesce(k.key, '') AS key, a.keyAlle AS keyAlle
+FROM keysAlle a LEFT JOIN keys k ON k.fall = a.fall;
+DROP TABLE keys;
+DROP TABLE keysAlle;
+CREATE TABLE pakete AS
+SELECT row_number() OVER (ORDER BY key) - 1 AS paket_id, key,
+       count(*) AS anzahl
+FROM faelle
+GROUP BY key;
+CREATE UNIQUE INDEX idx_pakete_key ON pakete (key);
+CREATE TABLE fall_pakete AS
+SELECT f.fall AS fall, f.key AS key, f.keyAlle AS keyAlle,
+       p.paket_id AS paket_id, p.anzahl AS anzahl
+FROM faelle f JOIN pakete p ON p.key = f.key
+ORDER BY f.fall;
+DROP TABLE faelle;
+CREATE UNIQUE INDEX idx_fall_pakete_fall ON fall_pakete (fall);
+CREATE INDEX idx_zeilen_fall ON zeilen (fall);
+CREATE TABLE leistungen AS
+SELECT DISTINCT leistung FROM zeilen ORDER BY leistung;
+CREATE UNIQUE INDEX idx_leistungen_leistung ON leistungen (leistung);
+"""
+
+def verbinden(dateiname):
+    """Oeffnet eine Verbindung mit den Einstellungen fuer grosse Daten"""
+    verbindung = sqlite3.connect(str(dateiname))
+    verbindung.execute('PRAGMA temp_store = FILE')
+    verbindung.execute('PRAGMA cache_size = -{}'.format(CACHE_GROESSE))
+    return verbindung
+
+def datenbankErstellen(quelle, dateiname, chunkGroesse=CHUNK_GROESSE):
+    """Laedt Rohdaten in eine Datenbank und berechnet die Pakete
+
+    :quelle: Dateiname der Rohdaten (CSV oder Excel)
+    :dateiname: Dateiname der Datenbank, eine bestehende Datei wird ersetzt
+    :chunkGroesse: Anzahl Zeilen, die auf einmal gelesen werden
+    :returns: Die geoeffnete Datenbank
+    """
+    path = pathlib.Path(dateiname)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    verbindung = verbinden(path)
+    try:
+        verbindung.execute('PRAGMA journal_mode = OFF')
+        verbindung.execute('PRAGMA synchronous = OFF')
+        verbindung.executescript(DATENBANK_SCHEMA)
+        anzahlZeilen = 0
+        for stueck in rohdatenStuecke(quelle, chunkGroesse):
+            zeilenEinfuegen(verbindung, stueck, anzahlZeilen)
+            anzahlZeilen += stueck.shape[0]
+        if anzahlZeilen == 0:
+            raise UIError("Die Rohdaten enthalten keine Zeilen")
+        verbindung.commit()
+        verbindung.executescript(PAKETE_SQL)
+        verbindung.executemany('INSERT INTO info VALUES (?, ?)', [
+            ('version', str(DATENBANK_VERSION)),
+            ('quelle', str(quelle)),
+            ])
+        verbindung.execute('ANALYZE')
+        verbindung.commit()
+    finally:
+        verbindung.close()
+
+    return Datenbank(path)
+
+def zeilenEinfuegen(verbindung, daten, ersteZeile):
+    """Fuegt ein Stueck der Rohdaten in die Tabelle zeilen ein"""
+    def ohneNaN(spalte):
+        spalte = spalte.astype(object)
+        return spalte.where(spalte.notna(), None).tolist()
+
+    datum = daten['Datumsfeld'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    verbindung.executemany('INSERT INTO zeilen VALUES (?, ?, ?, ?, ?, ?)', zip(
+        range(ersteZeile, ersteZeile + daten.shape[0]),
+        ohneNaN(daten['FallNr']),
+        ohneNaN(datum),
+        ohneNaN(daten['Tarifgruppe']),
+        daten['Leistung'].astype(str).tolist(),
+        daten['FallDatum'].astype('int64').tolist(),
+        ))
+
+class Datenbank:
+    """Eine Datenbank mit berechneten Paketen, siehe datenbankErstellen
+
+    Jeder Thread erhaelt eine eigene Verbindung, damit mehrere Threads
+    gleichzeitig abfragen koennen, z.B. im Dienst oder in einem Job.
+    """
+
+    def __init__(self, dateiname):
+        self._dateiname = pathlib.Path(dateiname)
+        self._leistungen = None
+        self._anzahl = {}
+        self._lokal = threading.local()
+        self._verbindungen = []
+        self._lock = threading.Lock()
+        try:
+            info = dict(self.verbindung().execute('SELECT * FROM info'))
+        except sqlite3.DatabaseError:
+            raise UIError("Die Datei ist keine gültige Datenbank")
+        if int(info.get('version', 0)) > DATENBANK_VERSION:
+            raise UIError(
+                "Die Datenbank wurde mit einer neueren Version erstellt")
+
+    def verbindung(self):
+        """Gibt die Verbindung des aktuellen Threads zurueck"""
+        verbindung = getattr(self._lokal, 'verbindung', None)
+        if verbindung is None:
+            verbindung = verbinden(self._dateiname)
+            self._lokal.verbindung = verbindung
+            with self._lock:
+                self._verbindungen.append(verbindung)
+        return verbindung
+
+    def abfrage(self, sql, parameter=()):
+        """Fuehrt eine Abfrage aus und gibt alle Zeilen zurueck"""
+        return self.verbindung().execute(sql, parameter).fetchall()
+
+    def anzahl(self, tabelle):
+        """Anzahl Zeilen einer Tabelle, wird nur einmal gezaehlt"""
+        if tabelle not in self._anzahl:
+            sql = 'SELECT count(*) FROM {}'.format(tabelle)
+            self._anzahl[tabelle] = self.abfrage(sql)[0][0]
+        return self._anzahl[tabelle]
+
+    @property
+    def dateiname(self):
+        """Dateiname der Datenbank"""
+        return self._dateiname
+
+    @property
+    def anzahlZeilen(self):
+        """Anzahl Zeilen der Rohdaten"""
+        return self.anzahl('zeilen')
+
+    @property
+    def anzahlFaelle(self):
+        """Anzahl Falldaten"""
+        return self.anzahl('fall_pakete')
+
+    @property
+    def anzahlPakete(self):
+        """Anzahl Pakete"""
+        return self.anzahl('pakete')
+
+    def getLeistungen(self):
+        """Gibt alle Leistungen sortiert zurueck"""
+        if self._leistungen is None:
+            leistungen = self.abfrage('SELECT leistung FROM leistungen')
+            self._leistungen = np.empty(len(leistungen), dtype=object)
+            self._leistungen[:] = [l for l, in leistungen]
+        return self._leistungen
+
+    def leistungID(self, leistung):
+        """Gibt die ID einer Leistung zurueck oder None"""
+        zeile = self.abfrage(
+            'SELECT rowid FROM leistungen WHERE leistung = ?', (leistung,))
+        return zeile[0][0] if zeile else None
+
+    def regelFalldaten(self, bedingungen):
+        """Gibt die Falldaten zurueck, die eine Regel erfuellen
+
+        :bedingungen: Dict wie von Regel.getDict
+        :returns: numpy array mit den Werten von FallDatum, sortiert
+        """
+        bedingung = ['1']
+        parameter = []
+        for leistung in bedingungen[Regel.UND]:
+            bedingung.append('instr(keyAlle, ?) > 0')
+            parameter.append(leistung)
+        if bedingungen[Regel.ODER]:
+            oder = ['instr(keyAlle, ?) > 0'] * len(bedingungen[Regel.ODER])
+            bedingung.append('(' + ' OR '.join(oder) + ')')
+            parameter.extend(bedingungen[Regel.ODER])
+        for leistung in bedingungen[Regel.NICHT]:
+            bedingung.append('instr(keyAlle, ?) = 0')
+            parameter.append(leistung)
+        sql = 'SELECT fall FROM fall_pakete WHERE {} ORDER BY fall'.format(
+            ' AND '.join(bedingung))
+        return np.array([f for f, in self.abfrage(sql, parameter)],
+                        dtype=np.int64)
+
+    def falldaten(self):
+        """Gibt die FallDatum Werte aller Faelle zurueck"""
+        return np.array(
+            [f for f, in self.abfrage('SELECT fall FROM fall_pakete')],
+            dtype=np.int64)
+
+    def paketStatistik(self):
+        """Gibt eine Tabelle mit allen Paketen zurueck
+
+        :returns: Pandas objekt mit den Spalten paketID, key und Anzahl
+        """
+        return pd.read_sql_query(
+            'SELECT paket_id AS paketID, key, anzahl AS Anzahl '
+            'FROM pakete ORDER BY paket_id',
+            self.verbindung())
+
+    def dataframe(self, chunkGroesse=None):
+        """Liest die Daten mit den Paketen, wie sie createPakete berechnet
+
+        :chunkGroesse: Optional, wenn angegeben wird ein Generator mit
+        Stuecken von chunkGroesse Zeilen zurueckgegeben
+        :returns: Pandas objekt
+        """
+        sql = ('SELECT z.fall_nr AS FallNr, z.datum AS Datumsfeld, '
+               'z.tarifgruppe AS Tarifgruppe, z.leistung AS Leistung, '
+               'z.fall AS FallDatum, f.key AS key, f.keyAlle AS keyAlle, '
+               'f.paket_id AS paketID, f.anzahl AS Anzahl '
+               'FROM zeilen z JOIN fall_pakete f ON f.fall = z.fall '
+               'ORDER BY z.zeile')
+        def umwandeln(daten):
+            daten['Datumsfeld'] = pd.to_datetime(daten['Datumsfeld'])
+            daten['paketID'] = daten['paketID'].astype(float)
+            daten['Anzahl'] = daten['Anzahl'].astype(float)
+            return daten
+        if chunkGroesse is None:
+            return umwandeln(pd.read_sql_query(sql, self.verbindung()))
+        return (umwandeln(d) for d in pd.read_sql_query(
+            sql, self.verbindung(), chunksize=chunkGroesse))
+
+    def schliessen(self):
+        """Schliesst die Verbindungen zur Datenbank"""
+        # Verbindungen anderer Threads koennen nur mit check_same_thread
+        # geschlossen werden, sie werden mit ihrem Thread freigegeben
+        with self._lock:
+            verbindungen, self._verbindungen = self._verbindungen, []
+        self._lokal = threading.local()
+        for verbindung in verbindungen:
+            try:
+                verbindung.close()
+            except sqlite3.ProgrammingError:
+                pass
+
+def datenbankOeffnen(dateiname):
+    """Oeffnet eine mit datenbankErstellen erstellte Datenbank"""
+    return Datenbank(dateiname)
+
+def datenLaden(dateiname, backend='pandas', ordner=None):
+    """Liest Rohdaten ein und berechnet die Pakete mit dem gewaehlten Backend
+
+    :dateiname: Dateiname der Rohdaten
+    :backend: 'pandas' (im Speicher), 'index' (Index auf der Festplatte,
+    siehe Index.indexErstellen) oder 'sqlite' (siehe datenbankErstellen)
+    :ordner: Ordner fuer den Index oder die Datenbank, noetig fuer 'index'
+    und 'sqlite'
+    :returns: ExcelDaten Objekt
+    """
+    if backend not in BACKENDS:
+        raise UIError("Unbekanntes Backend '{}'".format(backend))
+    excelDaten = ExcelDaten()
+    if backend == 'pandas':
+        daten, kategorien = datenEinlesen(dateiname)
+        for kategorie in (kategorien if kategorien is not None else []):
+            excelDaten.addKategorie(kategorie)
+        excelDaten.dataframe = createPakete(daten, kategorien)
+        return excelDaten
+
+    if ordner is None:
+        raise UIError("Für das Backend '{}' wird ein Ordner benötigt".format(
+            backend))
+    ordner = pathlib.Path(ordner)
+    # Die Kategorien stehen wie bei datenEinlesen im zweiten Sheet
+    kategorien = excelKategorien(dateiname)
+    for kategorie in (kategorien if kategorien is not None else []):
+        excelDaten.addKategorie(kategorie)
+    if backend == 'index':
+        with schritt('Index erstellen'):
+            excelDaten.setIndex(indexErstellen(dateiname, ordner))
+    else:
+        ordner.mkdir(parents=True, exist_ok=True)
+        name = pathlib.Path(dateiname).stem + '.sqlite'
+        with schritt('Datenbank erstellen'):
+            excelDaten.setIndex(datenbankErstellen(dateiname, ordner / name))
+    return excelDaten
@@ -0,0 +1,571 @@
+"""Lokaler Abfragedienst ueber HTTP/JSON
+
+Der Dienst laedt einen Datensatz einmal und beantwortet Abfragen mehrerer
+Benutzer gleichzeitig, ohne dass jeder die Daten selbst laden muss. Die
+Verbindungen werden mit asyncio bedient, die Berechnungen laufen in einem
+Threadpool auf den gemeinsamen Daten, die nur gelesen werden.
+
+Abfragen (Antworten sind JSON):
+
+    GET  /status                       Kennzahlen des Datensatzes
+    GET  /leistungen?filter=&limit=    Leistungen, siehe LeistungsSuche
+    GET  /pakete?offset=&limit=&sortierung=anzahl|id
+    GET  /pakete/<paketID>?limit=      Ein Paket mit seinen Falldaten
+    GET  /faelle?leistung=&limit=      Falldaten, die eine Leistung enthalten
+    GET  /falldaten?offset=&limit=     Falldaten, sortiert
+    POST /regeln                       Regeln auswerten, siehe regelnAbfragen
+
+Der Inhalt von POST /regeln ist ein JSON Objekt mit einer Liste 'regeln'
+von Objekten mit einem Namen 'Name' und Listen von Leistungen 'UND', 'ODER'
+und 'NICHT', optional 'falldaten' (true, um die Falldaten mitzuschicken) und
+'limit', siehe regelAnfragePruefen. Ungueltige Abfragen werden mit 400 und
+einer Fehlermeldung beantwortet.
+
+Mit DienstIndex kann ein laufender Dienst wie ein Index verwendet werden,
+z.B. von der GUI mit ExcelDaten.setIndex.
+"""
+
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from .ExcelCalc import UIError, Regel, regelnErstellen, getKategorie
+from .LazyImport import lazyImport
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+
+DIENST_HOST = '127.0.0.1'
+DIENST_PORT = 8765
+
+# Standard fuer die Anzahl Eintraege einer Antwort
+LIMIT = 1000
+# Maximale Groesse eines Requests in Bytes
+MAX_REQUEST = 16 * 1024 * 1024
+# Maximale Groesse der Kopfzeilen eines Requests in Bytes
+MAX_KOPF = 64 * 1024
+
+HTTP_STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+class RequestAbgelehnt(Exception):
+    """Ein Request wird abgelehnt, bevor er ganz gelesen wurde"""
+
+    def __init__(self, status, fehler):
+        super().__init__(fehler)
+        self.status = status
+        self.fehler = fehler
+
+def zahlParameter(parameter, name, standard):
+    """Liest einen Parameter, der eine ganze Zahl nicht kleiner als 0 sein
+    muss
+
+    :parameter: Dict mit den Parametern der Abfrage
+    :standard: Wert, wenn der Parameter fehlt
+    :raises UIError: Wenn der Parameter keine solche Zahl ist
+    """
+    if name not in parameter:
+        return standard
+    try:
+        wert = int(parameter[name])
+    except (TypeError, ValueError):
+        wert = -1
+    if wert < 0:
+        raise UIError("{} muss eine ganze Zahl grösser oder gleich 0 "
+                      "sein".format(name))
+    return wert
+
+def regelAnfragePruefen(anfrage):
+    """Prueft den Inhalt von POST /regeln
+
+    :anfrage: Mit JSON dekodierter Inhalt
+    :returns: Tupel (Liste mit Definitionen der Regeln, True wenn die
+    Falldaten mitgeschickt werden, maximale Anzahl Falldaten oder None)
+    :raises UIError: Wenn der Inhalt nicht das erwartete Format hat
+    """
+    if not isinstance(anfrage, dict):
+        raise UIError("Der Inhalt muss ein JSON Objekt sein")
+    regeln = anfrage.get('regeln')
+    if not isinstance(regeln, list):
+        raise UIError("'regeln' muss eine Liste sein")
+    for i, regel in enumerate(regeln):
+        if not isinstance(regel, dict):
+            raise UIError("Regel {} ist kein JSON Objekt".format(i + 1))
+        if not isinstance(regel.get('Name'), str):
+            raise UIError("Regel {} hat keinen Namen 'Name'".format(i + 1))
+        for typ in ['UND', 'ODER', 'NICHT']:
+            leistungen = regel.get(typ, [])
+            if not isinstance(leistungen, list) or not all(
+                    isinstance(l, (str, int, float))
+                    and not isinstance(l, bool) for l in leistungen):
+                raise UIError("'{}' der Regel '{}' muss eine Liste mit "
+                              "Leistungen sein".format(typ, regel['Name']))
+    falldaten = anfrage.get('falldaten', False)
+    if not isinstance(falldaten, bool):
+        raise UIError("'falldaten' muss true oder false sein")
+    limit = anfrage.get('limit')
+    if limit is not None and (not isinstance(limit, int)
+                              or isinstance(limit, bool) or limit < 0):
+        raise UIError("'limit' muss eine ganze Zahl grösser oder gleich 0 "
+                      "sein")
+    return regeln, falldaten, limit
+
+class Abfragen:
+    """Abfragen auf einem geladenen Datensatz, die nur lesen und deshalb
+    gleichzeitig aus mehreren Threads aufgerufen werden koennen
+
+    Pakete und Falldaten werden beim Erstellen einmal vorbereitet.
+    """
+
+    def __init__(self, excelDaten, kategorien=None):
+        """
+        :excelDaten: ExcelDaten Objekt mit dataframe oder Index
+        :kategorien: Optional, Liste mit Kategorien
+        """
+        self._excelDaten = excelDaten
+        self._kategorien = list(kategorien or excelDaten.getKategorien())
+        daten = excelDaten.dataframe
+        index = excelDaten.getIndex()
+        if daten is not None:
+            pakete = daten.drop_duplicates('paketID').sort_values('paketID')
+            self._pakete = pakete[['paketID', 'key', 'Anzahl']].astype(
+                {'paketID': 'int64', 'Anzahl': 'int64'})
+            faelle = daten.drop_duplicates('FallDatum')
+            faelle = faelle.sort_values(['paketID', 'FallDatum'])
+            self._fallPakete = faelle['paketID'].to_numpy(dtype='int64')
+            self._falldaten = faelle['FallDatum'].to_numpy(dtype='int64')
+        elif index is not None:
+            self._pakete = index.paketStatistik().astype(
+                {'paketID': 'int64', 'Anzahl': 'int64'})
+            self._fallPakete = None
+            self._falldaten = np.asarray(index.falldaten(), dtype='int64')
+        else:
+            raise UIError("Noch keine Daten vorhanden")
+        self._pakete = self._pakete.reset_index(drop=True)
+        self._falldatenSortiert = np.sort(self._falldaten)
+        self._nachAnzahl = np.lexsort((self._pakete['paketID'].to_numpy(),
+                                       -self._pakete['Anzahl'].to_numpy()))
+        # Alles, was ExcelDaten beim ersten Zugriff berechnet, jetzt
+        # berechnen, danach wird nur noch gelesen
+        self._statistik = excelDaten.getStatistik()
+        excelDaten.getLeistungsSuche()
+        if daten is not None:
+            excelDaten.getKeyCodes()
+
+    def status(self):
+        """Kennzahlen des Datensatzes"""
+        statistik = self._statistik
+        return {
+            'anzahlZeilen': int(statistik['anzahlZeilen']),
+            'anzahlFalldaten': int(statistik['anzahlFalldaten']),
+            'anzahlLeistungen': int(statistik['anzahlLeistungen']),
+            'anzahlPakete': int(statistik['anzahlPakete']),
+            'kategorien': self._kategorien,
+            }
+
+    def leistungen(self, filter='', limit=None):
+        """Leistungen, die den Filter enthalten, Treffer am Anfang zuerst"""
+        suche = self._excelDaten.getLeistungsSuche()
+        if filter:
+            treffer = suche.suchen(filter)
+        else:
+            treffer = np.arange(len(suche.leistungen))
+        return {'anzahl': len(treffer),
+                'leistungen': [str(suche.leistungen[i])
+                               for i in treffer[:limit]]}
+
+    def paketZeile(self, zeile):
+        """Gibt ein Paket als Dict zurueck"""
+        paket = self._pakete.iloc[zeile]
+        eintrag = {
+            'paketID': int(paket['paketID']),
+            'key': paket['key'],
+            'Anzahl': int(paket['Anzahl']),
+            }
+        if self._kategorien:
+            eintrag['Kategorie'] = getKategorie(paket['key'],
+                                                self._kategorien)
+        return eintrag
+
+    def pakete(self, offset=0, limit=LIMIT, sortierung='anzahl'):
+        """Pakete, nach Anzahl absteigend oder nach paketID sortiert"""
+        if offset < 0 or limit < 0:
+            raise UIError("offset und limit dürfen nicht negativ sein")
+        if sortierung == 'anzahl':
+            zeilen = self._nachAnzahl[offset:offset + limit]
+        elif sortierung == 'id':
+            zeilen = range(offset, min(offset + limit, self._pakete.shape[0]))
+        else:
+            raise UIError("Unbekannte Sortierung '{}'".format(sortierung))
+        return {'anzahl': int(self._pakete.shape[0]),
+                'pakete': [self.paketZeile(z) for z in zeilen]}
+
+    def paket(self, paketID, limit=LIMIT):
+        """Ein Paket mit seinen Falldaten oder None, wenn es nicht existiert.
+        Mit einem Index sind die Falldaten nicht verfuegbar."""
+        if not 0 <= paketID < self._pakete.shape[0]:
+            return None
+        # Die Pakete sind nach paketID sortiert, die paketID ist der Rang
+        eintrag = self.paketZeile(paketID)
+        if self._fallPakete is not None:
+            start, ende = np.searchsorted(self._fallPakete,
+                                          [paketID, paketID + 1])
+            eintrag['falldaten'] = \
+                self._falldaten[start:min(ende, start + limit)].tolist()
+        return eintrag
+
+    def falldaten(self, offset=0, limit=LIMIT):
+        """Falldaten, sortiert, ab offset hoechstens limit"""
+        if offset < 0 or limit < 0:
+            raise UIError("offset und limit dürfen nicht negativ sein")
+        return {'anzahl': int(self._falldatenSortiert.size),
+                'falldaten':
+                    self._falldatenSortiert[offset:offset + limit].tolist()}
+
+    def regelnAbfragen(self, definitionen, mitFalldaten=False, limit=None):
+        """Wertet Regeln aus, ohne die Regeln anderer Benutzer zu aendern
+
+        :definitionen: Liste mit Dicts mit Name, UND, ODER und NICHT, wie
+        von ExcelCalc.regelDefinitionen
+        :mitFalldaten: Wenn True, werden die Falldaten mit zurueckgegeben
+        :limit: Optional, maximale Anzahl Falldaten pro Regel
+        :returns: Dict mit einer Liste mit Name, anzahl und evtl. falldaten
+        """
+        regeln = regelnErstellen(definitionen, self._excelDaten)
+        resultate = []
+        for regel in regeln:
+            falldaten = np.sort(np.asarray(regel.getErfuellteFalldaten(),
+                                           dtype='int64'))
+            resultat = {'Name': regel.name, 'anzahl': int(falldaten.size)}
+            if mitFalldaten:
+                resultat['falldaten'] = falldaten[:limit].tolist()
+            resultate.append(resultat)
+        return {'regeln': resultate}
+
+    def faelle(self, leistung, limit=None):
+        """Falldaten, die eine Leistung enthalten, wie eine Regel mit einer
+        UND Bedingung"""
+        resultat = self.regelnAbfragen([{'Name': leistung, 'UND': [leistung]}],
+                                       True, limit)['regeln'][0]
+        return {'leistung': leistung, 'anzahl': resultat['anzahl'],
+                'falldaten': resultat['falldaten']}
+
+class Dienst:
+    """HTTP Server fuer Abfragen auf einem Datensatz"""
+
+    def __init__(self, abfragen, host=DIENST_HOST, port=DIENST_PORT,
+                 workers=None):
+        """
+        :abfragen: Abfragen Objekt
+        :host: Adresse, Standard ist nur lokal
+        :port: Port, 0 fuer einen freien Port
+        :workers: Anzahl Threads fuer die Berechnungen
+        """
+        self._abfragen = abfragen
+        self.host = host
+        self.port = port
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix='Dienst')
+        self._server = None
+
+    def beantworten(self, methode, pfad, parameter, inhalt):
+        """Fuehrt eine Abfrage aus. Laeuft in einem Thread des Pools.
+
+        :returns: Tupel (HTTP Status, Dict fuer die JSON Antwort)
+        """
+        abfragen = self._abfragen
+        limit = zahlParameter(parameter, 'limit', LIMIT)
+        offset = zahlParameter(parameter, 'offset', 0)
+        teile = [t for t in pfad.split('/') if t]
+        if methode == 'POST':
+            if teile != ['regeln']:
+                return 404, {'fehler': 'Unbekannte Abfrage'}
+            try:
+                anfrage = json.loads(inhalt.decode('utf-8'))
+            except ValueError:
+                raise UIError("Der Inhalt ist kein gültiges JSON")
+            return 200, abfragen.regelnAbfragen(*regelAnfragePruefen(anfrage))
+        if methode != 'GET':
+            return 405, {'fehler': 'Nur GET und POST'}
+        if teile == ['status']:
+            return 200, abfragen.status()
+        if teile == ['leistungen']:
+            return 200, abfragen.leistungen(parameter.get('filter', ''), limit)
+        if teile == ['pakete']:
+            return 200, abfragen.pakete(offset, limit,
+                                        parameter.get('sortierung', 'anzahl'))
+        if len(teile) == 2 and teile[0] == 'pakete':
+            paket = None
+            if teile[1].isascii() and teile[1].isdigit():
+                paket = abfragen.paket(int(teile[1]), limit)
+            if paket is None:
+                return 404, {'fehler': 'Unbekanntes Paket'}
+            return 200, paket
+        if teile == ['faelle']:
+            if 'leistung' not in parameter:
+                return 400, {'fehler': 'Parameter leistung fehlt'}
+            return 200, abfragen.faelle(parameter['leistung'], limit)
+        if teile == ['falldaten']:
+            return 200, abfragen.falldaten(offset, limit)
+        return 404, {'fehler': 'Unbekannte Abfrage'}
+
+    async def verbindung(self, reader, writer):
+        """Bedient eine Verbindung mit einem Request"""
+        rest = False
+        try:
+            status, antwort = await self.request(reader)
+        except RequestAbgelehnt as abgelehnt:
+            status, antwort = abgelehnt.status, {'fehler': abgelehnt.fehler}
+            rest = True
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        daten = json.dumps(antwort, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            'HTTP/1.1 {} {}\r\nContent-Type: application/json; '
+            'charset=utf-8\r\nContent-Length: {}\r\nConnection: close\r\n'
+            '\r\n'.format(status, HTTP_STATUS[status], len(daten))
+            .encode('ascii'))
+        writer.write(daten)
+        try:
+            await writer.drain()
+            if rest:
+                await self.restVerwerfen(reader)
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def restVerwerfen(self, reader, timeout=1):
+        """Liest den Rest eines abgelehnten Requests und verwirft ihn.
+        Wird die Verbindung mit ungelesenen Daten geschlossen, setzt sie das
+        Betriebssystem zurueck und der Client erhaelt die Antwort nicht."""
+        async def lesen():
+            gelesen = 0
+            while gelesen <= MAX_REQUEST:
+                daten = await reader.read(64 * 1024)
+                if not daten:
+                    return
+                gelesen += len(daten)
+        try:
+            await asyncio.wait_for(lesen(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def request(self, reader):
+        """Liest einen Request und berechnet die Antwort im Threadpool
+
+        :returns: Tupel (HTTP Status, Dict)
+        """
+        try:
+            kopf = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.LimitOverrunError:
+            raise RequestAbgelehnt(413, 'Kopfzeilen zu gross')
+        zeilen = kopf.decode('latin-1').split('\r\n')
+        try:
+            methode, ziel, _ = zeilen[0].split(' ', 2)
+        except ValueError:
+            return 400, {'fehler': 'Ungültiger Request'}
+        header = {}
+        for zeile in zeilen[1:]:
+            if ':' in zeile:
+                name, wert = zeile.split(':', 1)
+                header[name.strip().lower()] = wert.strip()
+        try:
+            laenge = int(header.get('content-length', 0))
+        except ValueError:
+            raise RequestAbgelehnt(400, 'Ungültige Content-Length')
+        if laenge < 0:
+            raise RequestAbgelehnt(400, 'Ungültige Content-Length')
+        if laenge > MAX_REQUEST:
+            raise RequestAbgelehnt(413, 'Request zu gross')
+        inhalt = await reader.readexactly(laenge) if laenge else b''
+
+        url = urllib.parse.urlsplit(ziel)
+        parameter = dict(urllib.parse.parse_qsl(url.query))
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor, self.beantworten, methode,
+                urllib.parse.unquote(url.path), parameter, inhalt)
+        except UIError as error:
+            return 400, {'fehler': str(error)}
+        except Exception as error:
+            return 500, {'fehler': '{}: {}'.format(type(error).__name__,
+                                                    error)}
+
+    async def starten(self):
+        """Startet den Server und gibt den tatsaechlichen Port zurueck"""
+        self._server = await asyncio.start_server(
+            self.verbindung, self.host, self.port, limit=MAX_KOPF)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def laufen(self, gestartet=None):
+        """Startet den Server und bedient Verbindungen, bis er beendet wird
+
+        :gestartet: Optional, Funktion, die mit dem Port aufgerufen wird,
+        sobald der Server Verbindungen annimmt
+        """
+        await self.starten()
+        if gestartet is not None:
+            gestartet(self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def beenden(self):
+        """Beendet den Server und den Threadpool"""
+        if self._server is not None:
+            self._server.close()
+        self._executor.shutdown(wait=False)
+
+def definitionErstellen(bedingungen):
+    """Erstellt die Definition einer Regel ohne Namen fuer POST /regeln
+
+    :bedingungen: Dict wie von Regel.getDict
+    """
+    return {
+        'Name': '',
+        'UND': list(bedingungen[Regel.UND]),
+        'ODER': list(bedingungen[Regel.ODER]),
+        'NICHT': list(bedingungen[Regel.NICHT]),
+        }
+
+class DienstIndex:
+    """Verwendet einen laufenden Dienst wie einen LeistungsIndex, z.B. mit
+    ExcelDaten.setIndex in der GUI. Nur die Abfragen werden uebertragen,
+    die Daten bleiben beim Dienst."""
+
+    # Abfragen gehen ueber das Netzwerk, Regeln werden deshalb mit einer
+    # Abfrage und nur mit der Anzahl ausgewertet, siehe regelnAuswerten
+    entfernt = True
+
+    def __init__(self, url, timeout=600):
+        """
+        :url: Adresse des Dienstes, z.B. 'http://127.0.0.1:8765'
+        :timeout: Maximale Wartezeit pro Abfrage in Sekunden
+        """
+        self.url = url.rstrip('/')
+        self._timeout = timeout
+        self._leistungen = None
+        try:
+            self._status = self.abfrage('/status')
+        except OSError as error:
+            raise UIError("Keine Verbindung zum Dienst {}: {}".format(
+                self.url, error))
+
+    def abfrage(self, pfad, parameter=None, inhalt=None):
+        """Sendet eine Abfrage und gibt die JSON Antwort zurueck"""
+        url = self.url + pfad
+        if parameter:
+            url += '?' + urllib.parse.urlencode(parameter)
+        daten = None
+        if inhalt is not None:
+            daten = json.dumps(inhalt).encode('utf-8')
+        request = urllib.request.Request(url, data=daten, headers={
+            'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as a:
+                return json.loads(a.read().decode('utf-8'))
+        except urllib.error.HTTPError as error:
+            try:
+                meldung = json.loads(error.read().decode('utf-8'))['fehler']
+            except (ValueError, KeyError):
+                meldung = str(error)
+            raise UIError("Fehler vom Dienst: {}".format(meldung))
+
+    @property
+    def anzahlZeilen(self):
+        """Anzahl Zeilen der Rohdaten"""
+        return self._status['anzahlZeilen']
+
+    @property
+    def anzahlFaelle(self):
+        """Anzahl Falldaten"""
+        return self._status['anzahlFalldaten']
+
+    @property
+    def anzahlPakete(self):
+        """Anzahl Pakete"""
+        return self._status['anzahlPakete']
+
+    def getKategorien(self):
+        """Gibt die Kategorien des Dienstes zurueck"""
+        return list(self._status['kategorien'])
+
+    def getLeistungen(self):
+        """Gibt alle Leistungen sortiert zurueck"""
+        if self._leistungen is None:
+            leistungen = self.abfrage('/leistungen',
+                {'limit': self._status['anzahlLeistungen']})['leistungen']
+            self._leistungen = np.empty(len(leistungen), dtype=object)
+            self._leistungen[:] = sorted(leistungen)
+        return self._leistungen
+
+    def leistungID(self, leistung):
+        """Gibt die Position einer Leistung zurueck oder None"""
+        leistungen = self.getLeistungen()
+        i = np.searchsorted(leistungen, leistung)
+        if i < len(leistungen) and leistungen[i] == leistung:
+            return int(i)
+        return None
+
+    def regelFalldaten(self, bedingungen):
+        """Gibt die Falldaten zurueck, die eine Regel erfuellen
+
+        :bedingungen: Dict wie von Regel.getDict
+        :returns: numpy array mit den Werten von FallDatum, sortiert
+        """
+        antwort = self.abfrage('/regeln', inhalt={
+            'regeln': [definitionErstellen(bedingungen)], 'falldaten': True})
+        return np.array(antwort['regeln'][0]['falldaten'], dtype=np.int64)
+
+    def regelnAnzahlen(self, bedingungenListe):
+        """Wertet mehrere Regeln mit einer Abfrage aus, ohne die Falldaten
+        zu uebertragen
+
+        :bedingungenListe: Liste mit Dicts wie von Regel.getDict
+        :returns: Liste mit der Anzahl Falldaten pro Regel
+        """
+        antwort = self.abfrage('/regeln', inhalt={
+            'regeln': [definitionErstellen(b) for b in bedingungenListe],
+            'falldaten': False})
+        return [int(regel['anzahl']) for regel in antwort['regeln']]
+
+    def falldaten(self):
+        """Gibt die FallDatum Werte aller Faelle zurueck"""
+        return np.array(self.abfrage('/falldaten', {
+            'limit': self.anzahlFaelle})['falldaten'], dtype=np.int64)
+
+    def paketStatistik(self):
+        """Gibt eine Tabelle mit allen Paketen zurueck
+
+        :returns: Pandas objekt mit den Spalten paketID, key und Anzahl
+        """
+        pakete = self.abfrage('/pakete', {
+            'limit': self.anzahlPakete, 'sortierung': 'id'})['pakete']
+        return pd.DataFrame(pakete, columns=['paketID', 'key', 'Anzahl'])
+
+def dienstStarten(abfragen, host=DIENST_HOST, port=DIENST_PORT,
+                  workers=None, gestartet=None):
+    """Startet den Dienst und laeuft, bis das Programm mit Ctrl-C beendet
+    wird
+
+    :abfragen: Abfragen Objekt
+    :gestartet: Optional, Funktion, die mit dem Port aufgerufen wird, sobald
+    der Dienst Verbindungen annimmt
+    """
+    dienst = Dienst(abfragen, host, port, workers)
+    try:
+        asyncio.run(dienst.laufen(gestartet))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dienst.beenden()
@@ -1,9 +1,21 @@
-import pickle
 from collections import defaultdict
-import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import contextlib
+import json
+import multiprocessing
 import pathlib
-import xlsxwriter
+from .LazyImport import lazyImport
+from .Messung import schritt
+from .Verfolgung import aktiveVerfolgung
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+xlsxwriter = lazyImport('xlsxwriter')
+
+# Format des JSON Regelfiles
+REGEL_FORMAT = 'Paketmanager-Regeln'
+REGEL_VERSION = 1
+REGEL_ENDUNG = '.json'
 
 class UIError(Exception):
     pass
@@ -22,66 +34,168 @@ def datenEinlesen(dateiname):
     """Liest ein Excel ein
 
     :returns: Ein pandas Objekt mit allen Daten im ersten Sheet des Excels und
-    eine Liste mit den Kategorien aus dem zweiten Sheet des Excels
+    eine Liste mit den Kategorien aus dem zweiten Sheet des Excels. CSV und
+    Parquet Dateien haben keine Kategorien.
 
     """
+    with schritt('Einlesen') as gemessen:
+        daten, kategorien = dateiLesen(dateiname)
+        gemessen.zeilen = daten.shape[0]
+
+    spaltenPruefen(daten)
+    if not 'FallDatum' in daten.columns:
+        with schritt('FallDatum', zeilen=daten.shape[0]):
+            daten['FallDatum'] = fallDatumBerechnen(daten)
+    return daten, kategorien
+
+def dateiLesen(dateiname):
+    """Liest die Rohdaten und die Kategorien, siehe datenEinlesen"""
     if '.xls' in dateiname:
         daten = pd.read_excel(
             dateiname,
             converters={'Leistung':convertLeistung},
             parse_dates=['Datumsfeld'],
         )
-        try:
-            kategorien = pd.read_excel(
-                dateiname,
-                sheet_name=1,
-                converters={0:convertLeistung},
-                header=None,
-            )
-            kategorien = kategorien.values.flatten()
-        except IndexError:
-            kategorien = None
+        kategorien = excelKategorien(dateiname)
     elif '.csv' in dateiname:
         daten = pd.read_csv(
             dateiname,
             converters={'Leistung':convertLeistung},
+            parse_dates=['Datumsfeld'],
         )
         kategorien = None
+    elif '.parquet' in dateiname:
+        daten = pd.read_parquet(dateiname)
+        if 'Leistung' in daten.columns:
+            daten['Leistung'] = daten['Leistung'].map(convertLeistung)
+        if 'Datumsfeld' in daten.columns:
+            daten['Datumsfeld'] = pd.to_datetime(daten['Datumsfeld'])
+        kategorien = None
     else:
-        raise UIError("Datei hat nicht die Endung '.xls','.xlsx' oder '.csv'")
+        raise UIError("Datei hat nicht die Endung '.xls', '.xlsx', '.csv' "
+                      "oder '.parquet'")
+    return daten, kategorien
 
+def excelKategorien(dateiname):
+    """Liest die Kategorien aus dem zweiten Sheet eines Excels
+
+    :returns: numpy array mit den Kategorien oder None, wenn die Datei kein
+    Excel ist oder kein zweites Sheet hat
+    """
+    if '.xls' not in str(dateiname):
+        return None
+    try:
+        kategorien = pd.read_excel(
+            dateiname,
+            sheet_name=1,
+            converters={0:convertLeistung},
+            header=None,
+        )
+    except IndexError:
+        return None
+    return kategorien.values.flatten()
+
+def spaltenPruefen(daten):
+    """Prueft, ob alle benoetigten Spalten in den Rohdaten vorhanden sind"""
     benoetigteSpalten = ['FallNr', 'Datumsfeld', 'Tarifgruppe', 'Leistung']
     fehlerMeldung = "Die Spalte {} muss in den Rohdaten vorhanden sein"
     for spalte in benoetigteSpalten:
         if not spalte in daten.columns:
             raise UIError(fehlerMeldung.format(spalte))
 
+def fallDatumBerechnen(daten):
+    """Berechnet die Spalte FallDatum aus FallNr und Datumsfeld
+
+    :returns: Pandas Series mit einer Zahl pro Fall und Tag
+    """
     # Serial Date Format von Excel sind Tage seit dem 01.01.1900
-    startDate = pd.datetime(1900,1,1) 
+    startDate = pd.Timestamp(1900,1,1)
     serialDate = (daten['Datumsfeld'] - startDate).dt.days
-    if not 'FallDatum' in daten.columns:
-        daten['FallDatum'] = pd.to_numeric(
-            daten['FallNr'].astype(str) + serialDate.astype(str)
-            )
-    return daten, kategorien
+    return pd.to_numeric(daten['FallNr'].astype(str) + serialDate.astype(str))
 
-def sheetSchreiben(sheetname, daten, writer):
+# Maximale Anzahl Zeilen eines Excel sheets, inklusive Titelzeile
+MAX_ZEILEN_EXCEL = 1048576
+
+def sheetAufteilen(sheetname, daten, maxZeilen=MAX_ZEILEN_EXCEL - 1):
+    """Teilt Daten, die nicht in ein sheet passen, auf mehrere sheets auf
+
+    Die Folgesheets heissen 'sheetname (2)', 'sheetname (3)', ... Die Zeilen
+    eines Pakets landen immer im selben sheet; sind die Pakete in den Daten
+    nicht zusammenhaengend, werden die Zeilen dafuer nach paketID sortiert.
+    Es wird jeweils nur der Ausschnitt fuer ein sheet erstellt, das spart
+    die Kopie der Daten durch pandas. Die Zellen bleiben trotzdem im
+    Speicher, siehe writePaketeToExcel.
+
+    :returns: Generator mit Tupeln (Name des sheets, Daten des sheets)
+    """
+    anzahlZeilen = daten.shape[0]
+    if anzahlZeilen <= maxZeilen:
+        yield sheetname, daten
+        return
+
+    paketID = daten['paketID'].values
+    reihenfolge = None
+    wechsel = np.flatnonzero(np.diff(paketID)) + 1
+    if wechsel.size + 1 > pd.unique(paketID).size:
+        reihenfolge = np.argsort(paketID, kind='mergesort')
+        wechsel = np.flatnonzero(np.diff(paketID[reihenfolge])) + 1
+    grenzen = np.hstack(([0], wechsel, [anzahlZeilen]))
+
+    start, nummer = 0, 1
+    while start < anzahlZeilen:
+        ende = grenzen[np.searchsorted(grenzen, start + maxZeilen, 'right') - 1]
+        if ende <= start:
+            # Ein einzelnes Paket ist groesser als ein ganzes sheet
+            ende = start + maxZeilen
+        if reihenfolge is None:
+            teil = daten.iloc[start:ende]
+        else:
+            teil = daten.iloc[reihenfolge[start:ende]]
+        name = sheetname
+        if nummer > 1:
+            # Excel erlaubt hoechstens 31 Zeichen fuer den Namen eines sheets
+            name = '{} ({})'.format(sheetname[:25], nummer)
+        yield name, teil
+        start, nummer = ende, nummer + 1
+
+def sheetSchreiben(sheetname, daten, writer, faerben=True):
     """Schreibt Daten in ein neues sheet in einem Excel
+
+    Passen die Daten nicht in ein sheet, werden sie mit sheetAufteilen auf
+    mehrere sheets verteilt.
+
+    :faerben: Wenn True, werden die Zeilen nach paketID abwechselnd gefaerbt
     """
+    for name, teil in sheetAufteilen(sheetname, daten):
+        with schritt('Sheet {}'.format(name), zeilen=teil.shape[0]):
+            sheetTeilSchreiben(name, teil, writer, faerben)
+
+def sheetTeilSchreiben(sheetname, daten, writer, faerben):
+    """Schreibt Daten, die in ein sheet passen, in ein neues sheet"""
     # Daten schreiben
     daten.to_excel(writer, sheet_name=sheetname, index=False)
+    if not faerben or daten.empty:
+        return
 
-    # Zeilen nach paketID abwechselnd faerben
+    # Zeilen nach paketID abwechselnd faerben. Die Paritaet des Pakets wird in
+    # eine versteckte Spalte geschrieben, eine einzige bedingte Formatierung
+    # faerbt dann alle Zeilen mit ungerader Paritaet
     paketID = daten['paketID'].values
     paketIDwechsel = 1 * (np.absolute(np.diff(paketID)) > 0)
     paketIDwechsel = np.hstack(([0], paketIDwechsel))
-    paketIDwechsel[np.where(paketIDwechsel)[0][1::2]] = -1
-    graueZeilen = np.where(np.cumsum(paketIDwechsel))[0] + 1
+    paritaet = np.cumsum(paketIDwechsel) % 2
+
     sheet = writer.sheets[sheetname]
     workbook = writer.book
     cellFormatGrey = workbook.add_format({'bg_color':'#dddddd'})
-    for zeile in graueZeilen:
-        sheet.set_row(zeile, None, cellFormatGrey)
+    anzahlZeilen, paritaetSpalte = daten.shape
+    sheet.write_column(1, paritaetSpalte, paritaet.tolist())
+    sheet.set_column(paritaetSpalte, paritaetSpalte, None, None, {'hidden': True})
+    sheet.conditional_format(1, 0, anzahlZeilen, paritaetSpalte - 1, {
+        'type': 'formula',
+        'criteria': '=${}2=1'.format(xlsxwriter.utility.xl_col_to_name(paritaetSpalte)),
+        'format': cellFormatGrey,
+        })
 
 def getKategorie(key, kategorien):
     if len(key) == 0:
@@ -94,39 +208,152 @@ def getKategorie(key, kategorien):
 ###############################################################################
 # Hauptfunktion, geht alle Leistungen durch und schreibt sie in ein Excel
 ###############################################################################
-def createPakete(daten, kategorien):
+def createPakete(daten, kategorien, fortschritt=None):
     """
     :daten: Pandas objekt mit allen Daten
     :kategorien: Liste mit den Kategorien
+    :fortschritt: Optional, Funktion, die mit dem erledigten Anteil (0 bis 1)
+    aufgerufen wird. Sie kann mit einer Exception abbrechen.
     """
-    buildKey = lambda s: ','.join(set(s))
+    # Die Leistungen werden sortiert, damit der gleiche Satz Leistungen
+    # immer den gleichen Key und damit das gleiche Paket ergibt
+    buildKey = lambda s: ','.join(sorted(set(s)))
+
+    anzahlZeilen = daten.shape[0]
+    with schritt('Keys TARMED', zeilen=anzahlZeilen):
+        indexGueltig = daten['Tarifgruppe'].str.contains('TARMED').fillna(False)
+        leistungen = daten[indexGueltig][['FallDatum', 'Leistung']]
+        keys = leistungen.groupby('FallDatum').aggregate(buildKey)
+        keys.rename({'Leistung': 'key'}, axis=1, inplace=True)
+
+    with schritt('Keys alle', zeilen=anzahlZeilen):
+        alleLeistungen = daten[['FallDatum', 'Leistung']]
+        alleKeys = alleLeistungen.groupby('FallDatum').aggregate(buildKey)
+        alleKeys.rename({'Leistung': 'keyAlle'}, axis=1, inplace=True)
+    if fortschritt:
+        fortschritt(0.3)
+
+    with schritt('Keys zuordnen', zeilen=anzahlZeilen):
+        daten = daten.join(keys, on='FallDatum')
+        daten = daten.join(alleKeys, on='FallDatum')
+        daten.fillna({'key':'', 'keyAlle':''}, inplace=True)
+
+    with schritt('Pakete zuordnen', zeilen=anzahlZeilen):
+        gruppen = daten.groupby('key')
+        anzahlGruppen = gruppen.ngroups
+        for i, (_, group) in enumerate(gruppen):
+            daten.loc[group.index, 'paketID'] = int(i)
+            daten.loc[group.index, 'Anzahl'] = group['FallDatum'].drop_duplicates().shape[0]
+            if fortschritt and i % 500 == 0:
+                fortschritt(0.3 + 0.7 * i / anzahlGruppen)
 
-    indexGueltig = daten['Tarifgruppe'].str.contains('TARMED').fillna(False)
-    leistungen = daten[indexGueltig][['FallDatum', 'Leistung']]
-    keys = leistungen.groupby('FallDatum').aggregate(buildKey)
-    keys.rename({'Leistung': 'key'}, axis=1, inplace=True)
+    return daten
 
-    alleLeistungen = daten[['FallDatum', 'Leistung']]
-    alleKeys = alleLeistungen.groupby('FallDatum').aggregate(buildKey)
-    alleKeys.rename({'Leistung': 'keyAlle'}, axis=1, inplace=True)
+def paketVertreter(daten):
+    """Waehlt pro Paket das erste Falldatum aus und sortiert die Pakete
+    absteigend nach Anzahl. Pakete mit gleicher Anzahl bleiben in der
+    Reihenfolge, in der sie in den Daten zuerst vorkommen.
 
-    daten = daten.join(keys, on='FallDatum')
-    daten = daten.join(alleKeys, on='FallDatum')
-    daten.fillna({'key':'', 'keyAlle':''}, inplace=True)
+    :daten: Pandas objekt mit den Paketen
+    :returns: Pandas objekt mit einem Falldatum pro Paket
+    :raises ValueError: Wenn daten keine Pakete enthaelt
+    """
+    erste = daten.drop_duplicates('paketID')[['paketID', 'FallDatum', 'Anzahl']]
+    erste = erste[erste['paketID'].notna()]
+    if erste.empty:
+        raise ValueError("Keine Pakete vorhanden")
+
+    # Zeilen, die zum ersten Falldatum ihres Pakets gehoeren
+    erstesFalldatum = pd.Series(erste['FallDatum'].values,
+                                index=erste['paketID'].values)
+    istVertreter = (daten['paketID'].map(erstesFalldatum).values
+                    == daten['FallDatum'].values)
+    vertreter = daten[istVertreter]
+
+    # Absteigend nach Anzahl, dann nach erstem Vorkommen des Pakets
+    rang = pd.Series(np.arange(erste.shape[0]), index=erste['paketID'].values)
+    reihenfolge = np.lexsort((
+        np.arange(vertreter.shape[0]),
+        vertreter['paketID'].map(rang).values,
+        -vertreter['Anzahl'].values,
+        ))
+    return vertreter.iloc[reihenfolge]
+
+def paketTabellen(daten, kategorien, workers=None):
+    """Erstellt die Tabellen eines Paket-Exports: Rohdaten, AllePakete und
+    eine Tabelle pro Kategorie. Wird fuer alle Exportformate verwendet.
+
+    Die Tabellen werden parallel in einem Threadpool vorbereitet, waehrend
+    der Aufrufer die bereits fertigen Tabellen schreibt. Die Reihenfolge der
+    Tabellen bleibt dabei immer gleich.
 
-    for i, (_, group) in enumerate(daten.groupby('key')):
-        daten.loc[group.index, 'paketID'] = int(i)
-        daten.loc[group.index, 'Anzahl'] = group['FallDatum'].drop_duplicates().shape[0]
+    :daten: Pandas objekt mit allen Daten
+    :kategorien: Liste mit den Kategorien oder None
+    :workers: Anzahl Threads, Standard von concurrent.futures wenn None
+    :returns: Generator mit Tupeln (Name der Tabelle, Daten)
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Alle Pakete, jeweils die erste Fallnummer im entsprechenden Paket
+        auftraege = [('AllePakete', executor.submit(paketVertreter, daten))]
 
-    return daten
+        if kategorien is not None:
+            with schritt('Kategorien', zeilen=daten.shape[0]):
+                kategorie = daten['key'].apply(
+                    lambda k: getKategorie(k, kategorien))
+
+            # Pro Kategorie
+            for kat in list(kategorien) + ['Restgruppe', 'OhneTarmed']:
+                auftraege.append((kat, executor.submit(
+                    paketVertreter, daten[kategorie == kat])))
+
+        yield 'Rohdaten', daten
+        for name, auftrag in auftraege:
+            try:
+                yield name, auftrag.result()
+            except ValueError:
+                if name == 'AllePakete':
+                    raise
 
-def getFirstGroup(groups):
-    """Gibt die erste Gruppe eines Groupby Objektes zurueck"""
-    for i, g in groups:
-        return g
+def kategorieExcelSchreiben(daten, sheetname, filename, faerben=True):
+    """Schreibt die Pakete einer Kategorie in ein eigenes Excel
 
-def writePaketeToExcel(daten, kategorien, filename):
-    """ Schreibt die Daten in ein Excel, nach kategorien sortiert"""
+    Laeuft in einem eigenen Prozess, siehe writePaketeToExcel.
+    """
+    writer = pd.ExcelWriter(str(filename), engine='xlsxwriter')
+    sheetSchreiben(sheetname, daten, writer, faerben)
+    writer.book.close()
+    return str(filename)
+
+def anzahlTabellen(kategorien):
+    """Gibt die Anzahl Tabellen zurueck, die paketTabellen hoechstens
+    erstellt"""
+    if kategorien is None:
+        return 2
+    return 4 + len(kategorien)
+
+def writePaketeToExcel(daten, kategorien, filename, faerben=True,
+                       proKategorie=False, workers=None, fortschritt=None):
+    """ Schreibt die Daten in ein Excel, nach kategorien sortiert
+
+    xlsxwriter haelt alle Zellen aller sheets im Speicher, bis das Excel
+    geschlossen wird, der Speicherbedarf waechst also mit der Groesse des
+    ganzen Excels. Der Modus constant_memory, der jede Zeile sofort
+    schreibt, kann nicht verwendet werden, weil pandas die Zellen spaltenweise
+    schreibt und er nur zeilenweise geschriebene Zellen behaelt. Fuer sehr
+    grosse Daten sind die spaltenorientierten Exporte besser geeignet, siehe
+    Export.
+
+    :faerben: Wenn False, werden die Pakete nicht abwechselnd eingefaerbt
+    :proKategorie: Wenn True, wird jede Kategorie in ein eigenes Excel
+    'filename_Kategorie.xlsx' geschrieben. Diese Excel werden gleichzeitig in
+    mehreren Prozessen geschrieben, die Tabellen werden dafuer an die
+    Prozesse uebertragen. Die Prozesse werden neu gestartet (spawn), nicht
+    mit fork kopiert, weil der Export auch aus den Threads der GUI laeuft.
+    :workers: Anzahl Threads bzw. Prozesse, Standard wenn None
+    :fortschritt: Optional, Funktion, die nach jeder Tabelle mit dem
+    erledigten Anteil (0 bis 1) aufgerufen wird
+    """
+    from .Export import eindeutigerDateiname
 
     fname = pathlib.Path(filename)
 
@@ -136,41 +363,59 @@ def writePaketeToExcel(daten, kategorien, filename):
     writer = pd.ExcelWriter(str(fname), engine='xlsxwriter')
     workbook = writer.book
 
-    if kategorien is not None:
-        daten['Kategorie'] = daten['key'].apply(
-            lambda k: getKategorie(k, kategorien))
-
-        daten.drop(['Kategorie'], axis=1).to_excel(
-            writer, sheet_name='Rohdaten', index=False
-            )
-
-        # Alle Pakete, jeweils die erste Fallnummer im entsprechenden Paket
-        allePakete = pd.concat(sorted([
-            getFirstGroup(g[1].groupby('FallDatum', sort=False))
-            for g in daten.drop('Kategorie', axis=1).groupby('paketID', sort=False)
-            ], key=lambda x : x.Anzahl.max(), reverse=True))
-        sheetSchreiben('AllePakete', allePakete, writer)
-
-        # Pro Kategorie
-        for kategorie in kategorien + ['Restgruppe', 'OhneTarmed']:
-            katData = daten[daten['Kategorie'] == kategorie].drop('Kategorie', axis=1)
-            try:
-                katData = pd.concat(sorted([
-                    getFirstGroup(g[1].groupby('FallDatum', sort=False))
-                    for g in katData.groupby('paketID', sort=False)
-                    ], key=lambda x: x.Anzahl.max(), reverse=True))
-                sheetSchreiben(kategorie, katData, writer)
-            except ValueError:
-                pass
-    else:
-        daten.to_excel(writer, sheet_name='Rohdaten', index=False)
-        allePakete = pd.concat(sorted([
-            getFirstGroup(g[1].groupby('FallDatum', sort=False))
-            for g in daten.groupby('paketID', sort=False)
-            ], key=lambda x: x.Anzahl.max(), reverse=True))
-        sheetSchreiben('AllePakete', allePakete, writer)
-
-    workbook.close()
+    executor = contextlib.nullcontext()
+    if proKategorie:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    with executor:
+        kategorieExcel = []
+        vergeben = set()
+        anzahl = anzahlTabellen(kategorien)
+        for i, (name, tabelle) in enumerate(
+                paketTabellen(daten, kategorien, workers)):
+            if fortschritt:
+                fortschritt(i / anzahl)
+            if proKategorie and name not in ['Rohdaten', 'AllePakete']:
+                katName = eindeutigerDateiname(name, vergeben)
+                katFile = fname.with_name(
+                    '{}_{}{}'.format(fname.stem, katName, fname.suffix))
+                kategorieExcel.append(executor.submit(
+                    kategorieExcelSchreiben, tabelle, name, katFile, faerben))
+            else:
+                sheetSchreiben(name, tabelle, writer,
+                               faerben and name != 'Rohdaten')
+        workbook.close()
+        for auftrag in kategorieExcel:
+            auftrag.result()
+    if fortschritt:
+        fortschritt(1)
+
+def statistikBerechnen(daten, index=None):
+    """Berechnet die Kennzahlen eines Datensatzes
+
+    :daten: Pandas objekt oder None
+    :index: Optional, Index, der verwendet wird, wenn daten None ist
+    :returns: Dict mit anzahlZeilen, anzahlFalldaten, anzahlPakete und
+    speicher (Bytes im Speicher oder None)
+    """
+    statistik = {
+        'anzahlZeilen': 0,
+        'anzahlFalldaten': 0,
+        'anzahlPakete': 0,
+        'speicher': None,
+        }
+    if daten is not None:
+        statistik['anzahlZeilen'] = daten.shape[0]
+        statistik['anzahlFalldaten'] = daten['FallDatum'].nunique()
+        if 'paketID' in daten.columns:
+            statistik['anzahlPakete'] = daten['paketID'].nunique()
+        statistik['speicher'] = int(
+            daten.memory_usage(index=True, deep=True).sum())
+    elif index is not None:
+        statistik['anzahlZeilen'] = index.anzahlZeilen
+        statistik['anzahlFalldaten'] = index.anzahlFaelle
+        statistik['anzahlPakete'] = index.anzahlPakete
+    return statistik
 
 class ObserverSubject:
     """Klasse, die eine Liste von Observern hat und diese updaten kann"""
@@ -188,9 +433,14 @@ class ObserverSubject:
         self._observer.append(observer)
 
     def notifyObserver(self):
-        """Ruft die Methode update fuer alle Observer auf
+        """Ruft die Methode update fuer alle Observer auf. Ist eine
+        Verfolgung aktiv, wird der Aufruf aufgezeichnet, siehe Verfolgung.
 
         """
+        verfolgung = aktiveVerfolgung()
+        if verfolgung is not None:
+            verfolgung.benachrichtigen(self, self._observer)
+            return
         for observer in self._observer:
             observer.update()
 
@@ -201,16 +451,29 @@ class Regel:
     ODER = 1
     NICHT = 2
 
-    def __init__(self, name, daten):
+    def __init__(self, name, daten, bedingungen=None):
+        """Erstellt eine Regel, ohne sie auszuwerten
+
+        :name: Name der Regel
+        :daten: ExcelDaten Objekt
+        :bedingungen: Optional, Dict mit Listen von Leistungen fuer Regel.UND,
+        Regel.ODER und Regel.NICHT
+        """
         self.name = name
         self._bedingungen = {
             Regel.UND: [],
             Regel.ODER : [],
             Regel.NICHT : [],
             }
+        for typ, leistungen in (bedingungen or {}).items():
+            self.validateTyp(typ)
+            self._bedingungen[typ] = [convertLeistung(l) for l in leistungen]
         self.anzahl = '-'
         self._daten = daten
         self._erfuellt = None
+        self._erfuellteFalldaten = None
+        # True, wenn nur die Anzahl bekannt ist, siehe setErfuellteAnzahl
+        self._nurAnzahl = False
 
     def validateTyp(self, typ):
         """Ueberprueft, ob der Typ ein gueltiger Regel-Typ ist"""
@@ -225,23 +488,26 @@ class Regel:
         """
         return self._bedingungen
 
-    def addLeistung(self, newItem, typ):
+    def addLeistung(self, newItem, typ, auswerten=True):
         """Fuegt eine neue Leistung zur einer Liste hinzu
 
         :new_item: Neue Leistung
         :bedingungs_art: Regel.UND, ODER oder NICHT
+        :auswerten: Wenn False, wird die Regel nicht neu ausgewertet
         """
 
         self.validateTyp(typ)
         newItem = convertLeistung(newItem)
         self._bedingungen[typ].append(newItem)
-        self.update()
+        if auswerten:
+            self.update()
 
-    def removeLeistung(self, index, typ):
+    def removeLeistung(self, index, typ, auswerten=True):
         """Loescht eine Leistung aus einer Liste
 
         :index: Index der zu loeschenden Leistung
         :bedingungs_art: Regel.UND, ODER oder NICHT
+        :auswerten: Wenn False, wird die Regel nicht neu ausgewertet
         """
 
         self.validateTyp(typ)
@@ -252,7 +518,8 @@ class Regel:
                     ]
         except TypeError: # index nicht iterierbar
             del self._bedingungen[typ][index]
-        self.update()
+        if auswerten:
+            self.update()
 
     def clearItems(self, typ):
         """Loescht die Leistungen aus einer Liste
@@ -267,22 +534,72 @@ class Regel:
 
     def update(self):
         """Berechnet die Pakete, die diese Regel erfuellen"""
+        regelnAuswerten([self], self._daten)
+
+    def erfuellt(self, key):
+        """Checkt, ob ein Key diese Regel erfuellt"""
+        erfuelltalle = all([(k in key) for k in self._bedingungen[Regel.UND]])
+        erfuelltoder = len(self._bedingungen[Regel.ODER]) == 0 or \
+                       any([(k in key) for k in self._bedingungen[Regel.ODER]])
+        erfuelltnot = all([(k not in key) for k in self._bedingungen[Regel.NICHT]])
+        return  erfuelltalle and erfuelltoder and erfuelltnot
 
-        if self._daten.dataframe is None:
+    def setErfuellt(self, erfuellt):
+        """Setzt die Zeilen, die diese Regel erfuellen
+
+        :erfuellt: Pandas objekt mit den Zeilen oder None, wenn keine Daten
+        vorhanden sind
+        """
+        self._erfuellt = erfuellt
+        self._erfuellteFalldaten = None
+        self._nurAnzahl = False
+        if erfuellt is None:
             self.anzahl = '-'
-            return
+        else:
+            self.anzahl = str(erfuellt['FallDatum'].nunique())
+
+    def setErfuellteFalldaten(self, falldaten):
+        """Setzt die Falldaten, die diese Regel erfuellen, wenn die Regel auf
+        einem Index statt auf einem Pandas objekt ausgewertet wurde
+
+        :falldaten: numpy array mit den Werten von FallDatum
+        """
+        self._erfuellt = None
+        self._erfuellteFalldaten = falldaten
+        self._nurAnzahl = False
+        self.anzahl = str(falldaten.size)
 
-        def erfuellt(key):
-            """Checkt, ob ein Key diese Regel erfuellt"""
-            erfuelltalle = all([(k in key) for k in self._bedingungen[Regel.UND]])
-            erfuelltoder = len(self._bedingungen[Regel.ODER]) == 0 or \
-                           any([(k in key) for k in self._bedingungen[Regel.ODER]])
-            erfuelltnot = all([(k not in key) for k in self._bedingungen[Regel.NICHT]])
-            return  erfuelltalle and erfuelltoder and erfuelltnot
+    def setErfuellteAnzahl(self, anzahl):
+        """Setzt nur die Anzahl der Falldaten, die diese Regel erfuellen,
+        z.B. von einem Dienst. Die Falldaten werden erst mit
+        getErfuellteFalldaten vom Index abgefragt.
 
-        ind = self._daten.dataframe.keyAlle.apply(erfuellt)
-        self._erfuellt = self._daten.dataframe[ind]
-        self.anzahl = str(len(self._erfuellt.groupby('FallDatum')))
+        :anzahl: Anzahl Falldaten
+        """
+        self._erfuellt = None
+        self._erfuellteFalldaten = None
+        self._nurAnzahl = True
+        self.anzahl = str(anzahl)
+
+    def setAusstehend(self):
+        """Markiert die Regel, waehrend sie im Hintergrund ausgewertet
+        wird, siehe Regeln.setHintergrund"""
+        self._erfuellt = None
+        self._erfuellteFalldaten = None
+        self._nurAnzahl = False
+        self.anzahl = '...'
+
+    def ergebnisUebernehmen(self, regel):
+        """Uebernimmt das Resultat einer Regel mit den gleichen Bedingungen,
+        die im Hintergrund auf einem Datensatz ausgewertet wurde, siehe
+        regelnBerechnen
+
+        :regel: Ausgewertetes Regel Objekt
+        """
+        self._erfuellt = regel._erfuellt
+        self._erfuellteFalldaten = regel._erfuellteFalldaten
+        self._nurAnzahl = regel._nurAnzahl
+        self.anzahl = regel.anzahl
 
     def getAnzahlErfuellt(self):
         """Gibt die Anzahl der Falldaten zurueck, die diese Regel erfuellen
@@ -319,6 +636,21 @@ class Regel:
             spalten.append('Regel')
             return pd.DataFrame(columns=spalten)
 
+    def getErfuellteFalldaten(self):
+        """Gibt die Falldaten zurueck, die diese Regel erfuellen
+
+        :returns: numpy array mit den Werten von FallDatum
+        """
+        if self._nurAnzahl:
+            self.setErfuellteFalldaten(np.asarray(
+                self._daten.getIndex().regelFalldaten(self._bedingungen),
+                dtype=np.int64))
+        if self._erfuellteFalldaten is not None:
+            return self._erfuellteFalldaten
+        if self._erfuellt is None or self._daten.dataframe is None:
+            return np.array([], dtype=np.int64)
+        return self._erfuellt['FallDatum'].unique()
+
     def getLeistungen(self, typ):
         """Gibt die Leistungen im Typ der Regel zurueck
 
@@ -328,6 +660,151 @@ class Regel:
         self.validateTyp(typ)
         return self._bedingungen[typ]
 
+def regelnAuswerten(regeln, excelDaten):
+    """Berechnet fuer mehrere Regeln die Zeilen, die sie erfuellen. Jeder
+    verschiedene Key wird nur einmal geprueft, nicht jede Zeile.
+
+    :regeln: Liste mit Regel Objekten
+    :excelDaten: ExcelDaten oder Kern.Datensatz Objekt
+    """
+    daten = excelDaten.dataframe
+    index = excelDaten.getIndex()
+    if daten is None and index is not None:
+        if getattr(index, 'entfernt', False):
+            # Eine Abfrage fuer alle Regeln, die Falldaten erst bei Bedarf
+            if regeln:
+                anzahlen = index.regelnAnzahlen(
+                    [regel.getDict() for regel in regeln])
+                for regel, anzahl in zip(regeln, anzahlen):
+                    regel.setErfuellteAnzahl(anzahl)
+            return
+        for regel in regeln:
+            regel.setErfuellteFalldaten(index.regelFalldaten(regel.getDict()))
+        return
+    if daten is None:
+        for regel in regeln:
+            regel.setErfuellt(None)
+        return
+
+    with schritt('Keys codieren', zeilen=daten.shape[0]):
+        codes, keys = excelDaten.getKeyCodes()
+    with schritt('Regeln', zeilen=daten.shape[0] * len(regeln)):
+        for regel in regeln:
+            keyErfuellt = np.fromiter(
+                (regel.erfuellt(key) for key in keys), dtype=bool,
+                count=len(keys))
+            # Zeilen ohne keyAlle haben den Code -1
+            keyErfuellt = np.append(keyErfuellt, False)
+            regel.setErfuellt(daten[keyErfuellt[codes]])
+
+def regelnBerechnen(datensatz, bedingungen):
+    """Wertet Regeln auf einem Datensatz aus, z.B. in einem Job, siehe
+    Regeln.setHintergrund
+
+    :datensatz: Kern.Datensatz
+    :bedingungen: Liste mit den Bedingungen der Regeln, wie von
+    Regel.getDict
+    :returns: Liste mit ausgewerteten Regel Objekten ohne Namen
+    """
+    regeln = [Regel('', datensatz, b) for b in bedingungen]
+    regelnAuswerten(regeln, datensatz)
+    return regeln
+
+def bedingungsliste(regeln):
+    """Erstellt die Liste der Falldaten, die Regeln erfuellen, mit einem
+    Falldatum pro Regel
+
+    :regeln: Liste mit ausgewerteten Regel Objekten
+    :returns: Pandas Dataframe mit der zusaetzlichen Spalte Regel
+    """
+    datenListe = [regel.getErfuellt() for regel in regeln]
+    datenListe = [l.drop_duplicates(subset='FallDatum') for l in datenListe]
+    return pd.concat(datenListe)
+
+def regelDefinitionen(regeln):
+    """Erstellt aus Regel Objekten eine Liste von Dicts, z.B. zum Speichern
+
+    :regeln: Liste mit Regel Objekten
+    :returns: Liste mit Dicts mit den Eintraegen Name, UND, ODER und NICHT
+    """
+    definitionen = []
+    for regel in regeln:
+        bedingungen = regel.getDict()
+        definitionen.append({
+            'Name': regel.name,
+            'UND': list(bedingungen[Regel.UND]),
+            'ODER': list(bedingungen[Regel.ODER]),
+            'NICHT': list(bedingungen[Regel.NICHT]),
+            })
+    return definitionen
+
+def regelnErstellen(definitionen, excelDaten, auswerten=True):
+    """Erstellt Regel Objekte aus einer Liste von Dicts. Die Regeln werden
+    erst am Schluss gemeinsam ausgewertet.
+
+    :definitionen: Liste mit Dicts, wie von regelDefinitionen
+    :excelDaten: ExcelDaten oder Kern.Datensatz Objekt, auf dem die Regeln
+    ausgewertet werden
+    :auswerten: Wenn False, werden die Regeln nicht ausgewertet, z.B. um sie
+    nur zu speichern
+    :returns: Liste mit Regel Objekten
+    """
+    regeln = [
+        Regel(definition['Name'], excelDaten, {
+            Regel.UND: definition.get('UND', []),
+            Regel.ODER: definition.get('ODER', []),
+            Regel.NICHT: definition.get('NICHT', []),
+            })
+        for definition in definitionen
+        ]
+    if auswerten:
+        regelnAuswerten(regeln, excelDaten)
+    return regeln
+
+def regelnLaden(filename):
+    """Liest Regeln aus einem File
+
+    :filename: Regelfile, entweder JSON (siehe Regeln.saveToFile) oder ein
+    Excel mit den Spalten Name, UND, ODER und NICHT
+    :returns: Liste mit Dicts, wie von regelDefinitionen
+    """
+    path = pathlib.Path(filename)
+    fehlerMeldung = "Fehler beim Laden der Regeln, ungültiges File"
+    if path.suffix == REGEL_ENDUNG:
+        try:
+            with open(str(path), encoding='utf-8') as datei:
+                inhalt = json.load(datei)
+            if inhalt['format'] != REGEL_FORMAT:
+                raise UIError(fehlerMeldung)
+            if inhalt['version'] > REGEL_VERSION:
+                raise UIError(
+                    "Das Regelfile wurde mit einer neueren Version gespeichert")
+            return [
+                {
+                    'Name': regel['Name'],
+                    'UND': [str(l) for l in regel.get('UND', [])],
+                    'ODER': [str(l) for l in regel.get('ODER', [])],
+                    'NICHT': [str(l) for l in regel.get('NICHT', [])],
+                }
+                for regel in inhalt['regeln']
+                ]
+        except (ValueError, KeyError, TypeError):
+            raise UIError(fehlerMeldung)
+
+    try:
+        regelnDF = pd.read_excel(str(path), dtype=object)
+        return [
+            {
+                'Name': name,
+                'UND': [str(l) for l in lists['UND'].dropna().values],
+                'ODER': [str(l) for l in lists['ODER'].dropna().values],
+                'NICHT': [str(l) for l in lists['NICHT'].dropna().values],
+            }
+            for name, lists in regelnDF.groupby('Name')
+            ]
+    except (AttributeError, KeyError):
+        raise UIError(fehlerMeldung)
+
 class Regeln(ObserverSubject):
     """Klasse, die die Regeln speichert"""
 
@@ -337,10 +814,20 @@ class Regeln(ObserverSubject):
         self._aktiveRegel = None
         self._excelDaten = excelDaten
         self._excelDaten.registerObserver(self)
+        # Version der Daten, auf denen die Regeln ausgewertet wurden
+        self._version = excelDaten.getVersion()
+        self._hintergrund = None
+        # Datensatz fuer die Auswertungen im Hintergrund und seine Version
+        self._datensatz = (None, None)
 
     def update(self):
-        """Wird aufgerufen, wenn die ExcelDaten sich aendern"""
-        self.updateRegel()
+        """Wird aufgerufen, wenn die ExcelDaten sich aendern. Die Regeln
+        werden nur fuer neue Daten ausgewertet, nicht wenn sich nur die
+        Kategorien aendern."""
+        version = self._excelDaten.getVersion()
+        if version != self._version:
+            self._version = version
+            self.updateRegel()
         self.notifyObserver()
 
     def updateRegel(self, index=None):
@@ -350,10 +837,68 @@ class Regeln(ObserverSubject):
         :index: Index der zu updatenden Regel. Alle, wenn None
         """
         if index is None:
-            for regel in self.regeln:
-                regel.update()
+            self.auswerten(self.regeln)
         else:
-            self.regeln[index].update()
+            self.auswerten([self.regeln[index]])
+
+    def setHintergrund(self, hintergrund):
+        """Setzt eine Funktion, die Regeln im Hintergrund auswertet, z.B. als
+        Job in der GUI. Ohne sie werden die Regeln sofort ausgewertet.
+
+        :hintergrund: Funktion, die mit einem Kern.Datensatz, einer Liste mit
+        den Bedingungen der Regeln (wie von Regel.getDict) und einer Funktion
+        fertig aufgerufen wird. Sie wertet die Regeln mit regelnBerechnen aus
+        und ruft fertig im gleichen Thread wie Regeln mit der Liste der
+        ausgewerteten Regeln oder mit None nach einem Fehler auf.
+        """
+        self._hintergrund = hintergrund
+
+    def datensatz(self):
+        """Gibt den Datensatz fuer die Auswertungen im Hintergrund zurueck.
+        Er wird nur fuer neue Daten erstellt, damit die Keys nur einmal
+        codiert werden."""
+        version, datensatz = self._datensatz
+        if version != self._excelDaten.getVersion():
+            version = self._excelDaten.getVersion()
+            datensatz = self._excelDaten.getDatensatz()
+            self._datensatz = (version, datensatz)
+        return datensatz
+
+    def auswerten(self, regeln):
+        """Wertet Regeln aus, im Hintergrund, wenn setHintergrund gesetzt
+        ist. Bis das Resultat da ist, zeigen die Regeln '...'."""
+        if self._hintergrund is None:
+            regelnAuswerten(regeln, self._excelDaten)
+            return
+        if not regeln:
+            return
+        regeln = list(regeln)
+        version = self._excelDaten.getVersion()
+        # Kopien, die Regeln koennen waehrenddessen geaendert werden
+        bedingungen = [{typ: list(leistungen)
+                        for typ, leistungen in regel.getDict().items()}
+                       for regel in regeln]
+        for regel in regeln:
+            regel.setAusstehend()
+
+        def fertig(ergebnisse):
+            self._auswertungFertig(version, regeln, bedingungen, ergebnisse)
+        self._hintergrund(self.datensatz(), bedingungen, fertig)
+
+    def _auswertungFertig(self, version, regeln, bedingungen, ergebnisse):
+        """Uebernimmt die Resultate einer Auswertung im Hintergrund. Regeln,
+        die inzwischen geaendert wurden, und Resultate fuer andere Daten
+        werden ignoriert."""
+        if self._excelDaten.getVersion() != version:
+            return
+        for i, regel in enumerate(regeln):
+            if regel.getDict() != bedingungen[i]:
+                continue
+            if ergebnisse is None:
+                regel.setErfuellt(None)
+            else:
+                regel.ergebnisUebernehmen(ergebnisse[i])
+        self.notifyObserver()
 
     def addRegel(self, name):
         """Fuegt eine neu Regel hinzu
@@ -397,16 +942,46 @@ class Regeln(ObserverSubject):
             raise UIError("Keine Regeln definiert")
         if self._excelDaten.dataframe is None:
             raise UIError("Noch keine Daten vorhanden")
-        datenListe = [regel.getErfuellt() for regel in self.regeln]
-        datenListe = [l.drop_duplicates(subset='FallDatum') for l in datenListe]
-        return pd.concat(datenListe)
+        return bedingungsliste(self.regeln)
+
+    def getDefinitionen(self):
+        """Gibt die Definitionen der Regeln zurueck, siehe regelDefinitionen.
+        Sie aendern sich nicht mehr, wenn die Regeln geaendert werden.
+        """
+        return regelDefinitionen(self.regeln)
+
+    def setRegeln(self, regeln, auswerten=False):
+        """Ersetzt alle Regeln
+
+        :regeln: Liste mit Regel Objekten
+        :auswerten: Wenn True, werden die Regeln ausgewertet, siehe auswerten
+        """
+        self.regeln = list(regeln)
+        self._aktiveRegel = None
+        if auswerten:
+            self.auswerten(self.regeln)
+        self.notifyObserver()
 
     def saveToFile(self, filename):
-        """Speichert die enthaltenen Regeln in ein File
+        """Speichert die enthaltenen Regeln in ein File. Endet der Name auf
+        .json, werden die Regeln als JSON gespeichert, sonst als Excel.
 
         :filename: Filename
         """
         path = pathlib.Path(filename)
+        if not self.regeln:
+            raise RuntimeError("Keine Regeln zum Speichern")
+
+        if path.suffix == REGEL_ENDUNG:
+            inhalt = {
+                'format': REGEL_FORMAT,
+                'version': REGEL_VERSION,
+                'regeln': regelDefinitionen(self.regeln),
+                }
+            with open(str(path), 'w', encoding='utf-8') as datei:
+                json.dump(inhalt, datei, indent=1, ensure_ascii=False)
+            return
+
         head = {Regel.UND: 'UND', Regel.ODER: 'ODER', Regel.NICHT: 'NICHT'}
         regelDataFrames = []
         for regel in self.regeln:
@@ -416,8 +991,6 @@ class Regeln(ObserverSubject):
                 )
             regelDF['Name'] = regel.name
             regelDataFrames.append(regelDF)
-        if not regelDataFrames:
-            raise RuntimeError("Keine Regeln zum Speichern")
         regeln = pd.concat(regelDataFrames)
         columns = ['Name'] + list(head.values())
         regeln.to_excel(path, index=False, columns=columns)
@@ -439,12 +1012,14 @@ class Regeln(ObserverSubject):
 
     def addLeistungToAktiverRegel(self, name, typ):
         if self._aktiveRegel:
-            self._aktiveRegel.addLeistung(name, typ)
+            self._aktiveRegel.addLeistung(name, typ, auswerten=False)
+            self.auswerten([self._aktiveRegel])
             self.notifyObserver()
 
     def removeLeistungenFromAktiverRegel(self, indices, typ):
         if self._aktiveRegel:
-            self._aktiveRegel.removeLeistung(indices, typ)
+            self._aktiveRegel.removeLeistung(indices, typ, auswerten=False)
+            self.auswerten([self._aktiveRegel])
             self.notifyObserver()
 
     def getErfuelltAktiveRegel(self):
@@ -458,6 +1033,60 @@ class Regeln(ObserverSubject):
             return '-'
 
 
+class LeistungsSuche:
+    """Sortierter Index der Leistungen fuer die Suche nach Teiltexten
+
+    Die Leistungen werden einmal sortiert. Leistungen, die mit dem Suchtext
+    beginnen, werden mit einer binaeren Suche gefunden und zuerst
+    zurueckgegeben. Wird der Suchtext nur verlaengert, wird nur in den
+    Treffern der letzten Suche weitergesucht.
+    """
+
+    # Groesser als jedes Zeichen, begrenzt die Leistungen mit einem Prefix
+    GROESSTES_ZEICHEN = chr(0x10FFFF)
+
+    def __init__(self, leistungen):
+        leistungen = sorted({str(l) for l in leistungen})
+        self._leistungen = np.empty(len(leistungen), dtype=object)
+        self._leistungen[:] = leistungen
+        self._letzteSuche = ('', np.arange(len(leistungen)))
+
+    @property
+    def leistungen(self):
+        """Alle Leistungen, sortiert"""
+        return self._leistungen
+
+    def suchen(self, text):
+        """Sucht die Leistungen, die den Text enthalten
+
+        :text: Suchtext
+        :returns: numpy array mit den Positionen der Leistungen in
+        self.leistungen. Zuerst die Leistungen, die mit dem Text beginnen.
+        """
+        letzterText, letzteTreffer = self._letzteSuche
+        if not text:
+            return np.arange(self._leistungen.size)
+        if text == letzterText:
+            return letzteTreffer
+
+        anfang = np.searchsorted(self._leistungen, text, side='left')
+        ende = np.searchsorted(self._leistungen,
+                               text + self.GROESSTES_ZEICHEN, side='left')
+        if letzterText and text.startswith(letzterText):
+            kandidaten = letzteTreffer
+        else:
+            kandidaten = np.arange(self._leistungen.size)
+        leistungen = self._leistungen
+        rest = [
+            i for i in kandidaten.tolist()
+            if (i < anfang or i >= ende) and text in leistungen[i]
+            ]
+        treffer = np.concatenate([
+            np.arange(anfang, ende), np.sort(np.array(rest, dtype=np.int64))
+            ])
+        self._letzteSuche = (text, treffer)
+        return treffer
+
 class ExcelDaten(ObserverSubject):
     """Objekt, das die Excel Daten enthaelt"""
 
@@ -466,6 +1095,13 @@ class ExcelDaten(ObserverSubject):
         self._dataframe = None
         self._kategorien = []
         self._leistungen = None
+        self._keyCodes = None
+        self._index = None
+        self._leistungsSuche = None
+        self._leistungenSet = None
+        self._version = 0
+        self._statistik = None
+        self._ladezeiten = {}
 
     @property
     def dataframe(self):
@@ -474,11 +1110,101 @@ class ExcelDaten(ObserverSubject):
 
     @dataframe.setter
     def dataframe(self, daten):
-        """Setter dataframe"""
+        """Setter dataframe, ein vorheriger Index wird nicht mehr verwendet"""
+        self.datenSetzen(daten)
+
+    def datenSetzen(self, daten, index=None):
+        """Setzt dataframe und Index zusammen. Die Observer werden nur einmal
+        benachrichtigt, nachdem beide gesetzt sind.
+
+        :daten: Pandas objekt mit den Paketen oder None
+        :index: Optional, LeistungsIndex, Datenbank oder DienstIndex Objekt
+        """
         self._dataframe = daten
+        self._index = index
         self.calcUniqueLeistungen()
+        self.datenGeaendert()
+
+    def setIndex(self, index):
+        """Setzt einen Index auf der Festplatte, siehe Index.indexErstellen
+        und Datenbank.datenbankErstellen. Solange kein dataframe gesetzt ist,
+        werden Leistungen, Falldaten und Regeln aus dem Index berechnet.
+
+        :index: LeistungsIndex oder Datenbank Objekt oder None
+        """
+        self._index = index
+        self.datenGeaendert()
+
+    def datenGeaendert(self):
+        """Erhoeht die Version der Daten, loescht alles, was pro Datensatz
+        berechnet wird, und benachrichtigt die Observer"""
+        self._version += 1
+        self._keyCodes = None
+        self._leistungsSuche = None
+        self._leistungenSet = None
+        self._statistik = None
+        self._ladezeiten = {}
         self.notifyObserver()
 
+    def getVersion(self):
+        """Gibt die Version der Daten zurueck. Sie wird bei jedem neuen
+        Datensatz erhoeht."""
+        return self._version
+
+    def setLadezeiten(self, ladezeiten):
+        """Setzt die Zeiten, die das Laden des Datensatzes gebraucht hat
+
+        :ladezeiten: Dict Schritt -> Sekunden, z.B. {'Einlesen': 2.1}
+        """
+        self._ladezeiten = dict(ladezeiten)
+
+    def getStatistik(self):
+        """Gibt Kennzahlen des Datensatzes zurueck. Sie werden nur einmal
+        pro Version der Daten berechnet.
+
+        :returns: Dict mit anzahlZeilen, anzahlFalldaten, anzahlLeistungen,
+        anzahlPakete, speicher (Bytes im Speicher oder None) und ladezeiten
+        """
+        if self._statistik is None:
+            statistik = statistikBerechnen(self._dataframe, self._index)
+            statistik['anzahlLeistungen'] = len(self.getLeistungenSet())
+            self._statistik = statistik
+        return dict(self._statistik, ladezeiten=dict(self._ladezeiten))
+
+    def getIndex(self):
+        """Gibt den Index zurueck oder None"""
+        return self._index
+
+    def getDatensatz(self):
+        """Gibt den aktuellen Stand als unveraenderlichen Datensatz zurueck,
+        siehe Kern.Datensatz. Das Pandas objekt wird nicht kopiert.
+
+        :returns: Datensatz mit dem dataframe, dem Index und einer Kopie der
+        Kategorien
+        """
+        from .Kern import Datensatz
+        return Datensatz(self._dataframe, self._kategorien, self._index,
+                         self._keyCodes)
+
+    def getKeyCodes(self):
+        """Gibt die Spalte keyAlle als Codes und die verschiedenen Keys
+        zurueck. Wird nur einmal pro Datensatz berechnet.
+
+        :returns: Tupel (Codes pro Zeile, numpy array mit den Keys)
+        """
+        if self._keyCodes is None:
+            codes, keys = pd.factorize(self._dataframe['keyAlle'])
+            self._keyCodes = (codes, np.asarray(keys))
+        return self._keyCodes
+
+    def indexVerwenden(self, index):
+        """Verwendet nur einen Index ohne dataframe, z.B. einen Dienst. Die
+        Observer werden nur einmal benachrichtigt.
+
+        :index: LeistungsIndex, Datenbank oder DienstIndex Objekt
+        """
+        self.datenSetzen(None, index)
+
     def addKategorie(self, kategorie):
         """Fuegt eine Kategorie hinzu"""
         if not kategorie in self._kategorien:
@@ -487,6 +1213,9 @@ class ExcelDaten(ObserverSubject):
 
     def calcUniqueLeistungen(self):
         """Berechnet eine Liste mit allen Leistungen im Excel"""
+        if self._dataframe is None:
+            self._leistungen = None
+            return
         leistungen = self._dataframe['Leistung']
         self._leistungen = leistungen.drop_duplicates()
 
@@ -496,6 +1225,11 @@ class ExcelDaten(ObserverSubject):
         :returns: Die Leistungen
 
         """
+        if self._leistungen is None and self._index is not None:
+            leistungen = pd.Series(self._index.getLeistungen())
+            if filterLeistung:
+                return leistungen[leistungen.str.contains(filterLeistung)].values
+            return leistungen
         if self._leistungen is None:
             return []
         if filterLeistung:
@@ -503,15 +1237,34 @@ class ExcelDaten(ObserverSubject):
             return self._leistungen[ind].values
         return self._leistungen
 
+    def getLeistungenSet(self):
+        """Gibt die Leistungen als Set zurueck. Wird nur einmal pro Datensatz
+        erstellt.
+
+        :returns: frozenset mit den Leistungen
+        """
+        if self._leistungenSet is None:
+            self._leistungenSet = frozenset(
+                str(l) for l in self.getLeistungen())
+        return self._leistungenSet
+
+    def getLeistungsSuche(self):
+        """Gibt den Suchindex der Leistungen zurueck. Wird nur einmal pro
+        Datensatz erstellt.
+
+        :returns: LeistungsSuche Objekt
+        """
+        if self._leistungsSuche is None:
+            self._leistungsSuche = LeistungsSuche(self.getLeistungen())
+        return self._leistungsSuche
+
     def getAnzahlFalldaten(self):
         """Gibt die Anzahl Falldaten zurueck
 
         :return: Anzahl Falldaten
         """
 
-        if self._dataframe is not None:
-            return self.dataframe.FallDatum.drop_duplicates().shape[0]
-        return 0
+        return self.getStatistik()['anzahlFalldaten']
 
     def checkItem(self, label):
         """Prueft, ob eine Leistung in den Daten vorhanden ist
@@ -519,9 +1272,7 @@ class ExcelDaten(ObserverSubject):
         :label: Name der Leistung
         :returns: True, wenn die Bedingung vorhanden ist
         """
-        if self._dataframe is None:
-            return False
-        return label in self._leistungen.values
+        return label in self.getLeistungenSet()
 
     def clearKategorien(self):
         """Loescht alle Kategorien"""
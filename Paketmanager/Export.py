@@ -0,0 +1,449 @@
+"""Export der Pakete und Regeln in spaltenorientierte Formate und SQLite
+
+Neben dem Excel koennen die Pakete als Parquet, komprimiertes CSV oder Arrow
+IPC exportiert werden. Diese Formate sind viel schneller zu schreiben und
+wieder einzulesen. Ein Export ist ein Ordner mit einer Datei pro Tabelle, die
+Tabellen entsprechen den sheets im Excel. Die Regeln stehen in der Datei
+AlleRegeln und im Unterordner Regeln mit einer Datei pro Regel.
+
+Die Dateinamen werden aus den Namen der Kategorien und Regeln gebildet, ohne
+Zeichen, die unter Windows nicht erlaubt sind, und mit einer Nummer, wenn
+zwei Namen die gleiche Datei ergeben. Welche Dateien ein Export geschrieben
+hat, steht in EXPORT_INHALT im Ordner. Wird in den gleichen Ordner erneut
+exportiert, werden die Dateien des letzten Exports geloescht, die nicht mehr
+geschrieben werden, andere Dateien im Ordner bleiben.
+
+Fuer Abfragen nach dem Export koennen Faelle, Pakete und Regeln ausserdem in
+eine SQLite Datenbank mit normalisierten, indizierten Tabellen geschrieben
+werden.
+"""
+
+import datetime
+import json
+import pathlib
+import re
+import sqlite3
+from .ExcelCalc import paketTabellen, getKategorie, Regel, UIError
+from .ExcelCalc import anzahlTabellen, writePaketeToExcel
+from .LazyImport import lazyImport
+from .Messung import schritt
+
+pd = lazyImport('pandas')
+
+# Dateiendung -> Exportformat
+FORMATE = {
+    '.parquet': 'parquet',
+    '.csv.gz': 'csv',
+    '.arrow': 'arrow',
+}
+
+# Dateiendungen einer SQLite Datenbank
+SQLITE_ENDUNGEN = ['.sqlite', '.db']
+
+# Datei im Ordner eines Exports mit den geschriebenen Dateien
+EXPORT_INHALT = 'export.json'
+EXPORT_FORMAT = 'Paketmanager-Export'
+EXPORT_VERSION = 1
+
+# Unterordner mit einer Datei pro Regel
+REGEL_ORDNER = 'Regeln'
+
+# Zeichen, die unter Windows nicht in Dateinamen vorkommen duerfen
+VERBOTENE_ZEICHEN = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+# Namen, die unter Windows Geraete bezeichnen, auch mit Endung
+RESERVIERTE_NAMEN = {'CON', 'PRN', 'AUX', 'NUL'} | \
+    {'COM{}'.format(i) for i in range(1, 10)} | \
+    {'LPT{}'.format(i) for i in range(1, 10)}
+
+SQLITE_SCHEMA_VERSION = 1
+
+SQLITE_SCHEMA = """
+CREATE TABLE export (
+    schluessel TEXT PRIMARY KEY,
+    wert TEXT
+);
+CREATE TABLE kategorien (
+    kategorie_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE leistungen (
+    leistung_id INTEGER PRIMARY KEY,
+    leistung TEXT NOT NULL
+);
+CREATE TABLE faelle (
+    fall_id INTEGER PRIMARY KEY,
+    fall_nr,
+    datum TEXT
+);
+CREATE TABLE fall_leistungen (
+    fall_id INTEGER NOT NULL REFERENCES faelle,
+    leistung_id INTEGER NOT NULL REFERENCES leistungen,
+    tarifgruppe TEXT
+);
+CREATE TABLE pakete (
+    paket_id INTEGER PRIMARY KEY,
+    key TEXT,
+    anzahl INTEGER,
+    kategorie_id INTEGER REFERENCES kategorien
+);
+CREATE TABLE paket_faelle (
+    paket_id INTEGER NOT NULL REFERENCES pakete,
+    fall_id INTEGER NOT NULL REFERENCES faelle
+);
+CREATE TABLE regeln (
+    regel_id INTEGER PRIMARY KEY,
+    name TEXT
+);
+CREATE TABLE regel_bedingungen (
+    regel_id INTEGER NOT NULL REFERENCES regeln,
+    typ TEXT NOT NULL,
+    leistung TEXT NOT NULL
+);
+CREATE TABLE regel_faelle (
+    regel_id INTEGER NOT NULL REFERENCES regeln,
+    fall_id INTEGER NOT NULL REFERENCES faelle
+);
+"""
+
+# Die Indizes werden erst nach dem Befuellen der Tabellen erstellt
+SQLITE_INDIZES = """
+CREATE UNIQUE INDEX idx_kategorien_name ON kategorien (name);
+CREATE UNIQUE INDEX idx_leistungen_leistung ON leistungen (leistung);
+CREATE INDEX idx_fall_leistungen_fall ON fall_leistungen (fall_id);
+CREATE INDEX idx_fall_leistungen_leistung ON fall_leistungen (leistung_id, fall_id);
+CREATE INDEX idx_pakete_anzahl ON pakete (anzahl);
+CREATE INDEX idx_pakete_kategorie ON pakete (kategorie_id);
+CREATE INDEX idx_paket_faelle_paket ON paket_faelle (paket_id, fall_id);
+CREATE UNIQUE INDEX idx_paket_faelle_fall ON paket_faelle (fall_id);
+CREATE INDEX idx_regeln_name ON regeln (name);
+CREATE INDEX idx_regel_bedingungen_regel ON regel_bedingungen (regel_id);
+CREATE INDEX idx_regel_bedingungen_leistung ON regel_bedingungen (leistung);
+CREATE INDEX idx_regel_faelle_regel ON regel_faelle (regel_id, fall_id);
+CREATE INDEX idx_regel_faelle_fall ON regel_faelle (fall_id);
+"""
+
+def formatVonDateiname(dateiname):
+    """Bestimmt das Exportformat anhand der Dateiendung
+
+    :dateiname: Name der Exportdatei, z.B. 'export.parquet'
+    :returns: Tupel (Format, Ordner fuer den Export) oder (None, None), wenn
+    die Endung kein spaltenorientiertes Format ist
+    """
+    path = pathlib.Path(dateiname)
+    for endung, format in FORMATE.items():
+        if path.name.endswith(endung):
+            return format, path.with_name(path.name[:-len(endung)])
+    return None, None
+
+def dateinameBereinigen(name):
+    """Macht aus dem Namen einer Kategorie oder Regel einen Dateinamen, der
+    unter Windows und Unix gueltig und nicht versteckt ist
+
+    :returns: Dateiname ohne Endung, nie leer
+    """
+    name = VERBOTENE_ZEICHEN.sub('_', str(name))
+    # Windows entfernt Punkte und Leerzeichen am Ende
+    name = name.rstrip(' .')
+    if name.startswith('.'):
+        name = '_' + name
+    if not name:
+        return '_'
+    if name.split('.')[0].upper() in RESERVIERTE_NAMEN:
+        name = '_' + name
+    return name
+
+def eindeutigerDateiname(name, vergeben, endung=''):
+    """Gibt einen bereinigten Dateinamen zurueck, siehe dateinameBereinigen,
+    der noch nicht vergeben ist
+
+    :name: Name, z.B. die Kategorie oder die Regel
+    :vergeben: Set mit den bereits vergebenen Dateinamen in Kleinbuchstaben.
+    Ergibt ein Name einen vergebenen Dateinamen, wird eine Nummer angehaengt.
+    Der neue Dateiname wird hinzugefuegt.
+    :endung: Endung des Dateinamens
+    """
+    basis = dateinameBereinigen(name)
+    dateiname, nummer = basis + endung, 2
+    while dateiname.casefold() in vergeben:
+        dateiname = '{}_{}{}'.format(basis, nummer, endung)
+        nummer += 1
+    vergeben.add(dateiname.casefold())
+    return dateiname
+
+def tabellenDateiname(name, format, vergeben):
+    """Gibt den Dateinamen einer Tabelle im Export zurueck, siehe
+    eindeutigerDateiname
+
+    :format: 'parquet', 'csv' oder 'arrow'
+    """
+    endung = {v: k for k, v in FORMATE.items()}[format]
+    return eindeutigerDateiname(name, vergeben, endung)
+
+def inhaltAktualisieren(ordner, teil, dateien):
+    """Speichert die Dateien eines Exports in EXPORT_INHALT und loescht die
+    Dateien des letzten Exports, die nicht mehr geschrieben wurden
+
+    :ordner: Ordner des Exports
+    :teil: 'pakete' oder 'regeln', die beiden Exporte koennen in den
+    gleichen Ordner geschrieben werden
+    :dateien: Liste mit den geschriebenen Dateien relativ zum Ordner
+    """
+    path = ordner / EXPORT_INHALT
+    inhalt = {'format': EXPORT_FORMAT, 'version': EXPORT_VERSION}
+    try:
+        with open(str(path), encoding='utf-8') as datei:
+            alt = json.load(datei)
+        if alt.get('format') == EXPORT_FORMAT:
+            inhalt = alt
+    except (OSError, ValueError):
+        pass
+
+    neu = list(dateien)
+    basis = ordner.resolve()
+    for name in set(inhalt.get(teil, [])) - set(neu):
+        alteDatei = (ordner / str(name)).resolve()
+        # Nur Dateien im Ordner des Exports, auch wenn die Datei veraendert
+        # wurde
+        if basis in alteDatei.parents and alteDatei.is_file():
+            alteDatei.unlink()
+    regelOrdner = ordner / REGEL_ORDNER
+    if regelOrdner.is_dir() and not any(regelOrdner.iterdir()):
+        regelOrdner.rmdir()
+
+    inhalt['version'] = EXPORT_VERSION
+    inhalt[teil] = neu
+    with open(str(path), 'w', encoding='utf-8') as datei:
+        json.dump(inhalt, datei, indent=1, ensure_ascii=False)
+
+def tabelleSchreiben(daten, filename, format):
+    """Schreibt eine Tabelle im angegebenen Format
+
+    :daten: Pandas objekt
+    :filename: Dateiname
+    :format: 'parquet', 'csv' oder 'arrow'
+    """
+    try:
+        if format == 'parquet':
+            daten.to_parquet(str(filename), index=False)
+        elif format == 'csv':
+            daten.to_csv(str(filename), index=False, compression='gzip')
+        elif format == 'arrow':
+            daten.reset_index(drop=True).to_feather(str(filename))
+        else:
+            raise UIError("Unbekanntes Exportformat '{}'".format(format))
+    except ImportError:
+        raise UIError(
+            "Für den Export als {} wird das Modul pyarrow benötigt".format(format))
+
+def writePaketeToFormat(daten, kategorien, ordner, format, fortschritt=None):
+    """Schreibt die Pakete in einen Ordner, mit einer Datei pro Tabelle
+
+    :daten: Pandas objekt mit allen Daten
+    :kategorien: Liste mit den Kategorien oder None
+    :ordner: Zielordner
+    :format: 'parquet', 'csv' oder 'arrow'
+    :fortschritt: Optional, Funktion, die vor jeder Tabelle mit dem
+    erledigten Anteil (0 bis 1) aufgerufen wird
+    """
+    ordner = pathlib.Path(ordner)
+    ordner.mkdir(parents=True, exist_ok=True)
+    anzahl = anzahlTabellen(kategorien)
+    vergeben = set()
+    dateien = []
+    for i, (name, tabelle) in enumerate(paketTabellen(daten, kategorien)):
+        if fortschritt:
+            fortschritt(i / anzahl)
+        dateien.append(tabellenDateiname(name, format, vergeben))
+        with schritt('Tabelle {}'.format(name), zeilen=tabelle.shape[0]):
+            tabelleSchreiben(tabelle, ordner / dateien[-1], format)
+    inhaltAktualisieren(ordner, 'pakete', dateien)
+
+def writeBedingungenToFormat(bedingungen, ordner, format, fortschritt=None):
+    """Schreibt die Falldaten, die Regeln erfuellen, in einen Ordner. Es gibt
+    eine Datei 'AlleRegeln' und eine Datei pro Regel im Unterordner
+    REGEL_ORDNER.
+
+    :bedingungen: Pandas objekt, wie von Regeln.getBedingungsliste
+    :ordner: Zielordner
+    :format: 'parquet', 'csv' oder 'arrow'
+    :fortschritt: Optional, Funktion, die vor jeder Datei mit dem erledigten
+    Anteil (0 bis 1) aufgerufen wird
+    """
+    ordner = pathlib.Path(ordner)
+    regelOrdner = ordner / REGEL_ORDNER
+    regelOrdner.mkdir(parents=True, exist_ok=True)
+    dateien = [tabellenDateiname('AlleRegeln', format, set())]
+    tabelleSchreiben(bedingungen, ordner / dateien[0], format)
+    vergeben = set()
+    regeln = bedingungen.groupby('Regel', sort=False)
+    for i, (name, regel) in enumerate(regeln):
+        if fortschritt:
+            fortschritt((i + 1) / (regeln.ngroups + 1))
+        dateiname = tabellenDateiname(name, format, vergeben)
+        tabelleSchreiben(regel, regelOrdner / dateiname, format)
+        dateien.append('{}/{}'.format(REGEL_ORDNER, dateiname))
+    inhaltAktualisieren(ordner, 'regeln', dateien)
+
+def paketeExportieren(daten, kategorien, dateiname, faerben=True, regeln=None,
+                      proKategorie=False, fortschritt=None):
+    """Exportiert die Pakete im Format, das zur Dateiendung passt: Excel,
+    SQLite oder ein Ordner im spaltenorientierten Format
+
+    :daten: Pandas objekt mit allen Daten
+    :kategorien: Liste mit den Kategorien oder None
+    :dateiname: Name der Exportdatei
+    :faerben: Nur fuer Excel, siehe writePaketeToExcel
+    :regeln: Nur fuer SQLite, Liste mit ausgewerteten Regel Objekten
+    :proKategorie: Nur fuer Excel, siehe writePaketeToExcel
+    :fortschritt: Optional, Funktion, die mit dem erledigten Anteil (0 bis 1)
+    aufgerufen wird
+    :returns: pathlib.Path der geschriebenen Datei oder des Ordners
+    """
+    format, ordner = formatVonDateiname(dateiname)
+    with schritt('Export Pakete', zeilen=daten.shape[0]):
+        if istSQLite(dateiname):
+            writeToSQLite(daten, kategorien, regeln or [], dateiname,
+                          fortschritt)
+        elif format is None:
+            writePaketeToExcel(daten, kategorien, dateiname, faerben,
+                               proKategorie, fortschritt=fortschritt)
+        else:
+            writePaketeToFormat(daten, kategorien, ordner, format, fortschritt)
+            return ordner
+    return pathlib.Path(dateiname)
+
+def bedingungenExportieren(bedingungen, dateiname, fortschritt=None):
+    """Exportiert die Falldaten, die Regeln erfuellen, als Excel oder als
+    Ordner im spaltenorientierten Format
+
+    :bedingungen: Pandas objekt, wie von ExcelCalc.bedingungsliste
+    :dateiname: Name der Exportdatei
+    :fortschritt: Optional, siehe writeBedingungenToFormat
+    :returns: pathlib.Path der geschriebenen Datei oder des Ordners
+    """
+    format, ordner = formatVonDateiname(dateiname)
+    with schritt('Export Regeln', zeilen=bedingungen.shape[0]):
+        if format is None:
+            bedingungen.to_excel(str(dateiname), index=False)
+            return pathlib.Path(dateiname)
+        writeBedingungenToFormat(bedingungen, ordner, format, fortschritt)
+    return ordner
+
+def exportZiel(dateiname):
+    """Gibt die Datei oder den Ordner zurueck, den paketeExportieren bzw.
+    bedingungenExportieren fuer den Dateinamen schreiben"""
+    format, ordner = formatVonDateiname(dateiname)
+    return pathlib.Path(dateiname) if format is None else ordner
+
+def istSQLite(dateiname):
+    """Gibt True zurueck, wenn der Dateiname eine SQLite Datenbank ist"""
+    return pathlib.Path(dateiname).suffix in SQLITE_ENDUNGEN
+
+def writeToSQLite(daten, kategorien, regeln, filename, fortschritt=None):
+    """Schreibt Faelle, Leistungen, Pakete, Kategorien und Regeln in eine
+    SQLite Datenbank. Die Tabellen werden in einer Transaktion befuellt, die
+    Indizes erst danach erstellt.
+
+    :daten: Pandas objekt mit allen Daten
+    :kategorien: Liste mit den Kategorien oder None
+    :regeln: Liste mit Regel Objekten
+    :filename: Dateiname der Datenbank, eine bestehende Datei wird ersetzt
+    :fortschritt: Optional, Funktion, die mit dem erledigten Anteil (0 bis 1)
+    aufgerufen wird
+    """
+    path = pathlib.Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    verbindung = sqlite3.connect(str(path))
+    try:
+        verbindung.execute('PRAGMA journal_mode = OFF')
+        verbindung.execute('PRAGMA synchronous = OFF')
+        verbindung.executescript(SQLITE_SCHEMA)
+        sqliteBefuellen(verbindung, daten, kategorien, regeln, fortschritt)
+        verbindung.commit()
+        if fortschritt:
+            fortschritt(0.8)
+        verbindung.executescript(SQLITE_INDIZES)
+        verbindung.execute('ANALYZE')
+        verbindung.commit()
+    finally:
+        verbindung.close()
+
+def sqliteBefuellen(verbindung, daten, kategorien, regeln, fortschritt=None):
+    """Fuellt die Tabellen einer leeren Datenbank, siehe writeToSQLite"""
+    einfuegen = verbindung.executemany
+    fortschritt = fortschritt or (lambda anteil: None)
+
+    # Kategorien
+    kategorieIDs = {}
+    if kategorien is not None:
+        namen = list(kategorien) + ['Restgruppe', 'OhneTarmed']
+        kategorieIDs = {name: i for i, name in enumerate(namen)}
+    einfuegen('INSERT INTO kategorien VALUES (?, ?)',
+              ((i, str(name)) for name, i in kategorieIDs.items()))
+
+    # Leistungen
+    leistungIDs, leistungen = pd.factorize(daten['Leistung'])
+    einfuegen('INSERT INTO leistungen VALUES (?, ?)',
+              enumerate(leistungen.astype(str).tolist()))
+
+    # Faelle und ihre Leistungen
+    fortschritt(0.1)
+    fallID = daten['FallDatum'].astype('int64')
+    faelle = daten.drop_duplicates('FallDatum')
+    einfuegen('INSERT INTO faelle VALUES (?, ?, ?)', zip(
+        faelle['FallDatum'].astype('int64').tolist(),
+        faelle['FallNr'].tolist(),
+        faelle['Datumsfeld'].astype(str).tolist(),
+        ))
+    tarifgruppe = daten['Tarifgruppe'].astype(object)
+    tarifgruppe = tarifgruppe.where(tarifgruppe.notna(), None)
+    einfuegen('INSERT INTO fall_leistungen VALUES (?, ?, ?)', zip(
+        fallID.tolist(), leistungIDs.tolist(), tarifgruppe.tolist(),
+        ))
+
+    # Pakete
+    fortschritt(0.5)
+    pakete = daten.drop_duplicates('paketID')
+    if kategorieIDs:
+        paketKategorie = [
+            kategorieIDs[getKategorie(key, kategorien)]
+            for key in pakete['key']
+            ]
+    else:
+        paketKategorie = [None] * pakete.shape[0]
+    einfuegen('INSERT INTO pakete VALUES (?, ?, ?, ?)', zip(
+        pakete['paketID'].astype('int64').tolist(),
+        pakete['key'].tolist(),
+        pakete['Anzahl'].astype('int64').tolist(),
+        paketKategorie,
+        ))
+    einfuegen('INSERT INTO paket_faelle VALUES (?, ?)', zip(
+        faelle['paketID'].astype('int64').tolist(),
+        faelle['FallDatum'].astype('int64').tolist(),
+        ))
+
+    # Regeln
+    fortschritt(0.6)
+    typen = {Regel.UND: 'UND', Regel.ODER: 'ODER', Regel.NICHT: 'NICHT'}
+    for regelID, regel in enumerate(regeln):
+        verbindung.execute('INSERT INTO regeln VALUES (?, ?)',
+                           (regelID, regel.name))
+        einfuegen('INSERT INTO regel_bedingungen VALUES (?, ?, ?)', (
+            (regelID, typen[typ], leistung)
+            for typ, leistungen in regel.getDict().items()
+            for leistung in leistungen
+            ))
+        einfuegen('INSERT INTO regel_faelle VALUES (?, ?)', (
+            (regelID, fall)
+            for fall in regel.getErfuellteFalldaten().astype('int64').tolist()
+            ))
+
+    # Metadaten, um mehrere Exporte vergleichen zu koennen
+    einfuegen('INSERT INTO export VALUES (?, ?)', [
+        ('schema_version', str(SQLITE_SCHEMA_VERSION)),
+        ('erstellt', datetime.datetime.now().isoformat(timespec='seconds')),
+        ('anzahl_zeilen', str(daten.shape[0])),
+        ])
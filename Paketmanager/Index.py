@@ -0,0 +1,456 @@
+"""Index auf der Festplatte fuer Rohdaten, die nicht in den Speicher passen
+
+Der Index wird einmal aus den Rohdaten erstellt, die dafuer in Stuecken
+gelesen werden. Er besteht aus einem Ordner mit .npy Dateien, die beim
+Oeffnen nur gemappt werden; das Betriebssystem laedt die benoetigten Teile
+bei Bedarf in den Page Cache.
+
+Der Index enthaelt
+ * faelle.npy: FallDatum aller Faelle, sortiert
+ * fallPaket.npy: paketID jedes Falls
+ * leistungen.*: alle Leistungen, sortiert, als Texttabelle
+ * postings.*: pro Leistung die Faelle, in denen sie vorkommt (CSR Format)
+ * pakete.*: Key und Anzahl Falldaten jedes Pakets
+
+Die Pakete entsprechen genau denen von createPakete: Pakete bestehen aus den
+Faellen mit den gleichen TARMED Leistungen, die paketID ist der Rang des
+Keys in sortierter Reihenfolge.
+
+Beim Erstellen werden Arrays pro Zeile nur in Stuecken von chunkGroesse
+Zeilen verarbeitet: Die Zeilen werden in temporaere Dateien geschrieben, die
+Faelle und die Paare (Leistung, Fall) pro Stueck sortiert und danach auf der
+Festplatte gemischt. Im Speicher bleiben Arrays pro Fall (etwa 50 Bytes pro
+Fall) und pro Leistung. CSV Dateien werden in Stuecken gelesen, Excel und
+Parquet Dateien nur als Ganzes, fuer sehr grosse Rohdaten muessen sie
+deshalb als CSV vorliegen.
+"""
+
+import json
+import pathlib
+import shutil
+import tempfile
+from .ExcelCalc import UIError, Regel
+from .ExcelCalc import convertLeistung, datenEinlesen, fallDatumBerechnen
+from .ExcelCalc import spaltenPruefen
+from .LazyImport import lazyImport
+from .Projekt import textTabelle, textTabelleLesen
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+
+INDEX_FORMAT = 'Paketmanager-Index'
+INDEX_VERSION = 1
+
+# Anzahl Zeilen, die beim Erstellen des Index auf einmal gelesen werden
+CHUNK_GROESSE = 1000000
+
+def rohdatenStuecke(dateiname, chunkGroesse=CHUNK_GROESSE):
+    """Liest Rohdaten in Stuecken
+
+    CSV Dateien werden in Stuecken von chunkGroesse Zeilen gelesen, Excel
+    und Parquet Dateien koennen nur als Ganzes gelesen werden.
+
+    :returns: Generator mit Pandas objekten, jeweils mit der Spalte FallDatum
+    """
+    dateiname = str(dateiname)
+    if '.csv' in dateiname:
+        stuecke = pd.read_csv(
+            dateiname,
+            converters={'Leistung':convertLeistung},
+            parse_dates=['Datumsfeld'],
+            chunksize=chunkGroesse,
+        )
+        for stueck in stuecke:
+            spaltenPruefen(stueck)
+            if not 'FallDatum' in stueck.columns:
+                stueck['FallDatum'] = fallDatumBerechnen(stueck)
+            yield stueck
+    else:
+        daten, _ = datenEinlesen(dateiname)
+        yield daten
+
+def anhaengen(path, array):
+    """Haengt ein numpy array binaer an eine Datei an"""
+    with open(str(path), 'ab') as datei:
+        np.ascontiguousarray(array).tofile(datei)
+
+def npyErstellen(path, dtype, anzahl):
+    """Erstellt eine .npy Datei und mappt sie zum Schreiben
+
+    :returns: numpy memmap, bei anzahl 0 ein leeres array
+    """
+    if anzahl == 0:
+        leer = np.empty(0, dtype=dtype)
+        np.save(str(path), leer, allow_pickle=False)
+        return leer
+    return np.lib.format.open_memmap(
+        str(path), mode='w+', dtype=dtype, shape=(anzahl,))
+
+def eindeutigMischen(laeufe, ziel, blockGroesse=CHUNK_GROESSE):
+    """Mischt sortierte Laeufe zu einer sortierten Datei ohne Duplikate
+
+    Von jedem Lauf wird nur ein Block gelesen. Alle Werte bis zum kleinsten
+    letzten Wert der Bloecke sind vollstaendig und werden geschrieben.
+
+    :laeufe: Liste mit Dateien, jede mit aufsteigend sortierten int64 ohne
+    Duplikate, siehe anhaengen
+    :ziel: Datei, in die die Werte geschrieben werden
+    :blockGroesse: Anzahl Werte, die insgesamt auf einmal gelesen werden
+    :returns: Die Werte in ziel als memmap, ein leeres array, wenn es keine
+    gibt
+    """
+    quellen = [np.memmap(str(lauf), dtype=np.int64, mode='r')
+               for lauf in laeufe if pathlib.Path(lauf).stat().st_size]
+    positionen = [0] * len(quellen)
+    block = max(1, blockGroesse // max(1, len(quellen)))
+    open(str(ziel), 'wb').close()
+    anzahl = 0
+    while True:
+        bloecke = [(i, quelle[position:position + block])
+                   for i, (quelle, position)
+                   in enumerate(zip(quellen, positionen))]
+        bloecke = [(i, werte) for i, werte in bloecke if werte.size]
+        if not bloecke:
+            break
+        grenze = min(werte[-1] for _, werte in bloecke)
+        teile = []
+        for i, werte in bloecke:
+            n = int(np.searchsorted(werte, grenze, side='right'))
+            teile.append(werte[:n])
+            positionen[i] += n
+        werte = np.unique(np.concatenate(teile))
+        anhaengen(ziel, werte)
+        anzahl += werte.size
+    del quellen
+    if anzahl == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.memmap(str(ziel), dtype=np.int64, mode='r')
+
+def csrErstellen(paare, anzahlGruppen, anzahlWerte, ziel,
+                 chunkGroesse=CHUNK_GROESSE):
+    """Erstellt eine CSR Struktur aus Paaren gruppe * anzahlWerte + wert
+
+    :paare: Sortierte Paare ohne Duplikate, z.B. eine memmap
+    :ziel: .npy Datei, in die die Werte geschrieben werden
+    :returns: Tupel (offsets, werte). Die Werte der Gruppe i sind
+    werte[offsets[i]:offsets[i+1]], aufsteigend sortiert.
+    """
+    werte = npyErstellen(ziel, np.int32, paare.size)
+    anzahl = np.zeros(anzahlGruppen, dtype=np.int64)
+    for start in range(0, paare.size, chunkGroesse):
+        stueck = np.asarray(paare[start:start + chunkGroesse])
+        werte[start:start + stueck.size] = stueck % anzahlWerte
+        # Die Gruppen sind sortiert, das Stueck deckt einen Bereich ab
+        gruppe = stueck // anzahlWerte
+        anzahl[gruppe[0]:gruppe[-1] + 1] += np.bincount(gruppe - gruppe[0])
+    if isinstance(werte, np.memmap):
+        werte.flush()
+    offsets = np.zeros(anzahlGruppen + 1, dtype=np.int64)
+    np.cumsum(anzahl, out=offsets[1:])
+    return offsets, werte
+
+def zeilenSchreiben(quelle, temp, chunkGroesse):
+    """Erster Durchgang: Schreibt die Zeilen als Zahlen in temporaere Dateien
+    und die Faelle jedes Stuecks sortiert als Lauf fuer eindeutigMischen
+
+    :returns: Tupel (Dict Leistung -> vorlaeufige ID, Anzahl Zeilen, Liste
+    mit den Laeufen der Faelle)
+    """
+    vokabular = {}
+    anzahlZeilen = 0
+    laeufe = []
+    for stueck in rohdatenStuecke(quelle, chunkGroesse):
+        codes, werte = pd.factorize(stueck['Leistung'].astype(str))
+        ids = np.array([vokabular.setdefault(w, len(vokabular))
+                        for w in werte], dtype=np.int32)
+        tarmed = stueck['Tarifgruppe'].str.contains('TARMED')
+        fall = stueck['FallDatum'].values.astype(np.int64)
+        anhaengen(temp / 'zeilen_fall.bin', fall)
+        anhaengen(temp / 'zeilen_leistung.bin', ids[codes])
+        anhaengen(temp / 'zeilen_tarmed.bin',
+                  tarmed.fillna(False).values.astype(bool))
+        lauf = temp / 'faelle_{}.bin'.format(len(laeufe))
+        anhaengen(lauf, np.unique(fall))
+        laeufe.append(lauf)
+        anzahlZeilen += stueck.shape[0]
+    return vokabular, anzahlZeilen, laeufe
+
+def indexErstellen(quelle, ordner, chunkGroesse=CHUNK_GROESSE):
+    """Erstellt einen Index aus Rohdaten
+
+    :quelle: Dateiname der Rohdaten (CSV oder Excel)
+    :ordner: Ordner, in den der Index geschrieben wird
+    :chunkGroesse: Anzahl Zeilen, die auf einmal gelesen werden
+    :returns: Der geoeffnete LeistungsIndex
+    """
+    ordner = pathlib.Path(ordner)
+    ordner.mkdir(parents=True, exist_ok=True)
+    temp = pathlib.Path(tempfile.mkdtemp(prefix='_erstellen', dir=str(ordner)))
+    try:
+        vokabular, anzahlZeilen, fallLaeufe = zeilenSchreiben(
+            quelle, temp, chunkGroesse)
+        if anzahlZeilen == 0:
+            raise UIError("Die Rohdaten enthalten keine Zeilen")
+
+        faelle = eindeutigMischen(fallLaeufe, temp / 'faelle.bin', chunkGroesse)
+        anzahlFaelle = faelle.size
+
+        # Leistungen sortieren, damit die IDs der Sortierung der Texte folgen
+        texte = np.empty(len(vokabular), dtype=object)
+        texte[:] = list(vokabular)
+        reihenfolge = np.argsort(texte, kind='mergesort')
+        neueID = np.empty_like(reihenfolge)
+        neueID[reihenfolge] = np.arange(reihenfolge.size)
+        texte = texte[reihenfolge]
+        anzahlLeistungen = texte.size
+
+        # Zweiter Durchgang: Paare (Leistung, Fall) fuer die Posting Listen
+        # und (Fall, TARMED Leistung) fuer die Pakete, pro Stueck sortiert
+        zeilen = {
+            name: np.memmap(str(temp / ('zeilen_' + name + '.bin')),
+                            dtype=dtype, mode='r')
+            for name, dtype in [('fall', np.int64), ('leistung', np.int32),
+                                ('tarmed', np.bool_)]
+            }
+        postingLaeufe, paketLaeufe = [], []
+        for start in range(0, anzahlZeilen, chunkGroesse):
+            stueck = slice(start, start + chunkGroesse)
+            fall = np.searchsorted(faelle, zeilen['fall'][stueck])
+            leistung = neueID[zeilen['leistung'][stueck]].astype(np.int64)
+            tarmed = np.asarray(zeilen['tarmed'][stueck])
+            for laeufe, name, paare in [
+                    (postingLaeufe, 'postings',
+                     leistung * anzahlFaelle + fall),
+                    (paketLaeufe, 'pakete',
+                     fall[tarmed] * anzahlLeistungen + leistung[tarmed])]:
+                lauf = temp / '{}_{}.bin'.format(name, len(laeufe))
+                anhaengen(lauf, np.unique(paare))
+                laeufe.append(lauf)
+        del zeilen
+
+        # Posting Listen: Leistung -> Faelle
+        paare = eindeutigMischen(
+            postingLaeufe, temp / 'postings.bin', chunkGroesse)
+        postingOffsets, postings = csrErstellen(
+            paare, anzahlLeistungen, anzahlFaelle,
+            ordner / 'postings.faelle.npy', chunkGroesse)
+        del paare, postings
+
+        # Pakete: Faelle mit der gleichen Menge von TARMED Leistungen
+        paare = eindeutigMischen(paketLaeufe, temp / 'pakete.bin', chunkGroesse)
+        fallOffsets, fallLeistungen = csrErstellen(
+            paare, anzahlFaelle, anzahlLeistungen,
+            temp / 'fallLeistungen.npy', chunkGroesse)
+        del paare
+        paketID, paketKeys, paketAnzahl = paketeBerechnen(
+            fallOffsets, fallLeistungen, texte, chunkGroesse)
+        del fallLeistungen
+
+        def speichern(name, array):
+            np.save(str(ordner / (name + '.npy')), array, allow_pickle=False)
+        speichern('faelle', faelle)
+        del faelle
+        speichern('fallPaket', paketID.astype(np.int32))
+        speichern('postings.offsets', postingOffsets)
+        speichern('pakete.anzahl', paketAnzahl.astype(np.int64))
+        for name, werte in [('leistungen', texte), ('pakete.keys', paketKeys)]:
+            offsets, puffer = textTabelle(werte)
+            speichern(name + '.offsets', offsets)
+            speichern(name + '.text', puffer)
+
+        manifest = {
+            'format': INDEX_FORMAT,
+            'version': INDEX_VERSION,
+            'quelle': str(quelle),
+            'anzahlZeilen': int(anzahlZeilen),
+            'anzahlFaelle': int(anzahlFaelle),
+            'anzahlLeistungen': int(anzahlLeistungen),
+            'anzahlPakete': int(paketAnzahl.size),
+            }
+        with open(str(ordner / 'index.json'), 'w', encoding='utf-8') as datei:
+            json.dump(manifest, datei, indent=1)
+    finally:
+        shutil.rmtree(str(temp), ignore_errors=True)
+
+    return LeistungsIndex(ordner)
+
+def paketeBerechnen(fallOffsets, fallLeistungen, texte,
+                    chunkGroesse=CHUNK_GROESSE):
+    """Teilt die Faelle anhand ihrer TARMED Leistungen in Pakete ein
+
+    Faelle mit der gleichen Menge von Leistungen werden ueber einen Hash der
+    Menge (Summe von Zufallszahlen pro Leistung, 2x64 bit) gefunden. Nur fuer
+    einen Fall pro Paket wird der Key als Text erstellt.
+
+    :fallOffsets: CSR Offsets Fall -> Leistungen
+    :fallLeistungen: CSR Werte, die Leistungen sortiert, z.B. eine memmap
+    :texte: Sortierte Leistungen als Texte
+    :chunkGroesse: Anzahl Faelle, deren Hash auf einmal berechnet wird
+    :returns: Tupel (paketID pro Fall, Keys, Anzahl Faelle pro Paket)
+    """
+    zufall = np.random.RandomState(0).randint(
+        0, 2**63, size=(2, texte.size), dtype=np.int64).astype(np.uint64)
+    anzahlFaelle = fallOffsets.size - 1
+    hashes = np.empty((anzahlFaelle, 2), dtype=np.uint64)
+    for start in range(0, anzahlFaelle, chunkGroesse):
+        offsets = fallOffsets[start:start + chunkGroesse + 1]
+        leistungen = np.asarray(fallLeistungen[offsets[0]:offsets[-1]])
+        offsets = offsets - offsets[0]
+        for i in range(2):
+            summe = np.zeros(leistungen.size + 1, dtype=np.uint64)
+            np.cumsum(zufall[i][leistungen], out=summe[1:])
+            hashes[start:start + offsets.size - 1, i] = (
+                summe[offsets[1:]] - summe[offsets[:-1]])
+
+    _, vertreter, gruppe = np.unique(
+        hashes, axis=0, return_index=True, return_inverse=True)
+    gruppe = gruppe.reshape(-1)
+    keys = np.empty(vertreter.size, dtype=object)
+    keys[:] = [
+        ','.join(texte[fallLeistungen[fallOffsets[f]:fallOffsets[f + 1]]])
+        for f in vertreter.tolist()
+        ]
+
+    # Wie bei createPakete ist die paketID der Rang des Keys
+    reihenfolge = np.argsort(keys, kind='mergesort')
+    rang = np.empty_like(reihenfolge)
+    rang[reihenfolge] = np.arange(reihenfolge.size)
+    paketID = rang[gruppe]
+    anzahl = np.bincount(paketID, minlength=keys.size)
+    return paketID, keys[reihenfolge], anzahl
+
+class LeistungsIndex:
+    """Ein geoeffneter Index, siehe indexErstellen
+
+    Alle Arrays sind schreibgeschuetzte memmaps, Texte werden erst beim
+    ersten Zugriff dekodiert.
+    """
+
+    def __init__(self, ordner):
+        self._ordner = pathlib.Path(ordner)
+        try:
+            with open(str(self._ordner / 'index.json'), encoding='utf-8') as datei:
+                manifest = json.load(datei)
+        except (OSError, ValueError):
+            raise UIError("Der Ordner enthält keinen gültigen Index")
+        if manifest.get('format') != INDEX_FORMAT:
+            raise UIError("Der Ordner enthält keinen gültigen Index")
+        if manifest.get('version', 0) > INDEX_VERSION:
+            raise UIError(
+                "Der Index wurde mit einer neueren Version erstellt")
+        self._manifest = manifest
+        self._arrays = {}
+        self._texte = {}
+
+    def array(self, name):
+        """Mappt eine .npy Datei des Index"""
+        if name not in self._arrays:
+            self._arrays[name] = np.load(
+                str(self._ordner / (name + '.npy')), mmap_mode='r')
+        return self._arrays[name]
+
+    def texte(self, name):
+        """Dekodiert eine Texttabelle des Index"""
+        if name not in self._texte:
+            self._texte[name] = textTabelleLesen(
+                self.array(name + '.offsets'), self.array(name + '.text'))
+        return self._texte[name]
+
+    @property
+    def ordner(self):
+        """Ordner des Index"""
+        return self._ordner
+
+    @property
+    def anzahlZeilen(self):
+        """Anzahl Zeilen der Rohdaten"""
+        return self._manifest['anzahlZeilen']
+
+    @property
+    def anzahlFaelle(self):
+        """Anzahl Falldaten"""
+        return self._manifest['anzahlFaelle']
+
+    @property
+    def anzahlPakete(self):
+        """Anzahl Pakete"""
+        return self._manifest['anzahlPakete']
+
+    def getLeistungen(self):
+        """Gibt alle Leistungen sortiert zurueck"""
+        return self.texte('leistungen')
+
+    def leistungID(self, leistung):
+        """Gibt die ID einer Leistung zurueck oder None"""
+        leistungen = self.getLeistungen()
+        i = np.searchsorted(leistungen, leistung)
+        if i < leistungen.size and leistungen[i] == leistung:
+            return int(i)
+        return None
+
+    def faelleMitLeistung(self, leistung):
+        """Gibt eine Maske der Faelle zurueck, die eine Leistung enthalten
+
+        Wie bei Regel.erfuellt zaehlt eine Leistung als enthalten, wenn sie
+        Teil einer Leistung des Falls ist.
+
+        :returns: numpy array mit einem bool pro Fall
+        """
+        offsets = self.array('postings.offsets')
+        postings = self.array('postings.faelle')
+        maske = np.zeros(self.anzahlFaelle, dtype=bool)
+        for i, text in enumerate(self.getLeistungen()):
+            if leistung in text:
+                maske[postings[offsets[i]:offsets[i + 1]]] = True
+        return maske
+
+    def regelErfuellt(self, bedingungen):
+        """Wertet eine Regel auf dem Index aus
+
+        :bedingungen: Dict wie von Regel.getDict
+        :returns: numpy array mit einem bool pro Fall
+        """
+        erfuellt = np.ones(self.anzahlFaelle, dtype=bool)
+        for leistung in bedingungen[Regel.UND]:
+            erfuellt &= self.faelleMitLeistung(leistung)
+        if bedingungen[Regel.ODER]:
+            oder = np.zeros(self.anzahlFaelle, dtype=bool)
+            for leistung in bedingungen[Regel.ODER]:
+                oder |= self.faelleMitLeistung(leistung)
+            erfuellt &= oder
+        for leistung in bedingungen[Regel.NICHT]:
+            erfuellt &= ~self.faelleMitLeistung(leistung)
+        return erfuellt
+
+    def regelFalldaten(self, bedingungen):
+        """Gibt die Falldaten zurueck, die eine Regel erfuellen
+
+        :bedingungen: Dict wie von Regel.getDict
+        :returns: numpy array mit den Werten von FallDatum, sortiert
+        """
+        return self.falldaten(self.regelErfuellt(bedingungen))
+
+    def falldaten(self, maske=None):
+        """Gibt die FallDatum Werte der Faelle zurueck
+
+        :maske: Optional, bool pro Fall
+        """
+        faelle = self.array('faelle')
+        if maske is None:
+            return np.asarray(faelle)
+        return faelle[maske]
+
+    def paketStatistik(self):
+        """Gibt eine Tabelle mit allen Paketen zurueck
+
+        :returns: Pandas objekt mit den Spalten paketID, key und Anzahl
+        """
+        return pd.DataFrame({
+            'paketID': np.arange(self.anzahlPakete),
+            'key': self.texte('pakete.keys'),
+            'Anzahl': np.asarray(self.array('pakete.anzahl')),
+            })
+
+def indexOeffnen(ordner):
+    """Oeffnet einen mit indexErstellen erstellten Index"""
+    return LeistungsIndex(ordner)
@@ -0,0 +1,195 @@
+"""Zentrale Ausfuehrung von laengeren Aufgaben im Hintergrund
+
+Einlesen, Pakete berechnen, Regeln auswerten und Exporte laufen als Job in
+einem Threadpool. Jobs derselben Gruppe (z.B. alle Jobs, die neue Daten
+laden) werden nacheinander ausgefuehrt, Jobs verschiedener Gruppen
+gleichzeitig. Die Warteschlange ist die des Threadpools, Jobs einer
+belegten Gruppe warten im Scheduler.
+
+Ein Job meldet seinen Fortschritt ueber setFortschritt und kann mit
+abbrechen abgebrochen werden. Der Abbruch wird beim naechsten Aufruf von
+setFortschritt wirksam, wartende Jobs werden gar nicht erst gestartet.
+Threads koennen nicht von aussen beendet werden: Steckt ein Job in einem
+langen Aufruf einer Bibliothek, z.B. pd.read_excel, einem Export oder einer
+Abfrage an einen Dienst, laeuft er bis zum Ende dieses Aufrufs weiter.
+Mit einer Messung (siehe Messung) werden die Schritte des Jobs gemessen.
+
+Das Modul braucht kein Qt. Die GUI registriert sich als Observer der Jobs
+und leitet die Meldungen in den GUI Thread weiter.
+"""
+
+import collections
+import contextlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .ExcelCalc import ObserverSubject
+
+class JobAbgebrochen(Exception):
+    """Wird ausgeloest, wenn ein laufender Job abgebrochen wurde"""
+    pass
+
+class Job(ObserverSubject):
+    """Eine Aufgabe fuer den JobScheduler
+
+    Die Funktion wird als funktion(job, *args, **kwargs) aufgerufen und kann
+    job.setFortschritt verwenden. Die Observer werden bei jeder Aenderung von
+    Status oder Fortschritt benachrichtigt, aus dem Thread des Jobs.
+    """
+
+    WARTEND = 'wartend'
+    LAEUFT = 'läuft'
+    FERTIG = 'fertig'
+    FEHLER = 'Fehler'
+    ABGEBROCHEN = 'abgebrochen'
+
+    def __init__(self, name, funktion, *args, gruppe=None, messung=None,
+                 **kwargs):
+        """
+        :name: Name des Jobs fuer die Anzeige
+        :funktion: Funktion, die der Job ausfuehrt
+        :gruppe: Optional, Jobs der gleichen Gruppe laufen nacheinander
+        :messung: Optional, Messung Objekt, das waehrend des Jobs aktiv ist
+        """
+        super().__init__()
+        self.name = name
+        self.gruppe = gruppe
+        self.messung = messung
+        self._funktion = funktion
+        self._args = args
+        self._kwargs = kwargs
+        self._abbruch = threading.Event()
+        self._fertig = threading.Event()
+        self.status = Job.WARTEND
+        self.fortschritt = 0.0
+        self.resultat = None
+        self.fehler = None
+
+    def setFortschritt(self, anteil):
+        """Meldet den Fortschritt des Jobs
+
+        :anteil: Erledigter Anteil von 0 bis 1
+        :raises JobAbgebrochen: Wenn der Job abgebrochen wurde
+        """
+        if self._abbruch.is_set():
+            raise JobAbgebrochen()
+        self.fortschritt = min(max(float(anteil), 0.0), 1.0)
+        self.notifyObserver()
+
+    def abbrechen(self):
+        """Bricht den Job ab, sobald er das naechste Mal Fortschritt meldet"""
+        self._abbruch.set()
+
+    def istAbgebrochen(self):
+        """Gibt True zurueck, wenn abbrechen aufgerufen wurde"""
+        return self._abbruch.is_set()
+
+    def istFertig(self):
+        """Gibt True zurueck, wenn der Job nicht mehr wartet oder laeuft"""
+        return self.status in [Job.FERTIG, Job.FEHLER, Job.ABGEBROCHEN]
+
+    def warten(self, timeout=None):
+        """Wartet, bis der Job fertig ist
+
+        :timeout: Maximale Wartezeit in Sekunden, unbeschraenkt wenn None
+        :returns: True, wenn der Job fertig ist
+        """
+        return self._fertig.wait(timeout)
+
+    def ausfuehren(self):
+        """Fuehrt den Job im aktuellen Thread aus"""
+        try:
+            if self._abbruch.is_set():
+                self.status = Job.ABGEBROCHEN
+                return
+            self.status = Job.LAEUFT
+            self.notifyObserver()
+            with self.messung or contextlib.nullcontext():
+                self.resultat = self._funktion(self, *self._args,
+                                               **self._kwargs)
+            self.fortschritt = 1.0
+            self.status = Job.FERTIG
+        except JobAbgebrochen:
+            self.status = Job.ABGEBROCHEN
+        except Exception as error:
+            self.fehler = error
+            self.status = Job.FEHLER
+        finally:
+            self._fertig.set()
+            self.notifyObserver()
+
+class JobScheduler:
+    """Fuehrt Jobs in einem Threadpool aus"""
+
+    def __init__(self, maxWorkers=None):
+        """
+        :maxWorkers: Anzahl Threads, Standard ist die Anzahl CPUs, hoechstens 4
+        """
+        maxWorkers = maxWorkers or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=maxWorkers,
+                                            thread_name_prefix='Job')
+        self._lock = threading.Lock()
+        self._jobs = []
+        # Gruppe -> Warteschlange der Jobs, die auf die Gruppe warten
+        self._gruppen = {}
+
+    def starten(self, job):
+        """Startet einen Job oder reiht ihn hinter die Jobs seiner Gruppe ein
+
+        :job: Job Objekt
+        :returns: Der Job
+        """
+        with self._lock:
+            self._jobs.append(job)
+            if job.gruppe is not None:
+                if job.gruppe in self._gruppen:
+                    self._gruppen[job.gruppe].append(job)
+                    return job
+                self._gruppen[job.gruppe] = collections.deque()
+            self._executor.submit(self.jobAusfuehren, job)
+        return job
+
+    def jobAusfuehren(self, job):
+        """Fuehrt einen Job aus und startet danach den naechsten seiner
+        Gruppe. Laeuft in einem Thread des Pools."""
+        try:
+            job.ausfuehren()
+        finally:
+            with self._lock:
+                self._jobs.remove(job)
+                if job.gruppe is not None:
+                    wartend = self._gruppen[job.gruppe]
+                    if wartend:
+                        self._executor.submit(self.jobAusfuehren,
+                                              wartend.popleft())
+                    else:
+                        del self._gruppen[job.gruppe]
+
+    def getJobs(self):
+        """Gibt die Jobs zurueck, die warten oder laufen"""
+        with self._lock:
+            return list(self._jobs)
+
+    def alleAbbrechen(self):
+        """Bricht alle wartenden und laufenden Jobs ab"""
+        for job in self.getJobs():
+            job.abbrechen()
+
+    def beenden(self, abbrechen=True):
+        """Wartet, bis alle Jobs fertig sind, und beendet den Threadpool.
+        Auch abgebrochene Jobs werden erst beim naechsten setFortschritt
+        fertig, das kann lange dauern, siehe oben.
+
+        :abbrechen: Wenn True, werden alle Jobs vorher abgebrochen
+        """
+        if abbrechen:
+            self.alleAbbrechen()
+        # Jobs einer Gruppe werden erst gestartet, wenn der vorherige fertig
+        # ist, deshalb warten, bis keine Jobs mehr uebrig sind
+        while True:
+            jobs = self.getJobs()
+            if not jobs:
+                break
+            for job in jobs:
+                job.warten()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,401 @@
+"""Programmierschnittstelle ohne Qt
+
+Die Berechnung besteht aus vier Teilen, die ohne PyQt5 verwendet werden
+koennen, z.B. aus einem Notebook, von der Kommandozeile oder in einem
+Prozess eines Pools:
+
+ * Datensatz: Rohdaten oder berechnete Pakete mit den Kategorien
+ * PaketEngine: Berechnet die Pakete eines Datensatzes
+ * RegelEngine: Wertet Regeln auf einem Datensatz aus
+ * Exporter: Schreibt Pakete und Regelergebnisse in die Exportformate
+
+Beispiel:
+
+    from Paketmanager.Kern import Datensatz, PaketEngine, RegelEngine
+    from Paketmanager.Kern import Exporter
+
+    datensatz = PaketEngine().berechnen(Datensatz.einlesen(['rohdaten.csv']))
+    ergebnis = RegelEngine.ausDatei('regeln.json').auswerten(datensatz)
+    ergebnis.anzahlen()
+    Exporter().pakete(datensatz, 'pakete.parquet', ergebnis)
+
+Datensatz und Regelergebnis sind unveraenderlich. Ein Datensatz teilt das
+Pandas objekt, statt es zu kopieren; es wird nach dem Erstellen nie mehr
+veraendert, jede Aenderung ergibt einen neuen Datensatz. Ein Datensatz kann
+deshalb ohne Kopie an einen Thread weitergegeben werden, waehrend der
+Aufrufer schon mit neuen Daten arbeitet. ExcelDaten.getDatensatz gibt den
+aktuellen Stand der GUI als Datensatz zurueck.
+
+Fehler, die dem Benutzer gemeldet werden sollen, sind UIError mit der
+Meldung als Text.
+"""
+
+import pathlib
+from .ExcelCalc import UIError, createPakete, datenEinlesen, paketVertreter
+from .ExcelCalc import paketTabellen, regelnErstellen, regelnLaden
+from .ExcelCalc import regelDefinitionen, bedingungsliste, statistikBerechnen
+from .Export import paketeExportieren, bedingungenExportieren
+from .LazyImport import lazyImport
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+
+def rohdatenLesen(dateinamen):
+    """Liest eine oder mehrere Rohdaten ein und fasst sie zusammen
+
+    :dateinamen: Liste mit Dateinamen
+    :returns: Tupel (Pandas objekt, Liste mit Kategorien oder None)
+    """
+    datenListe = []
+    kategorien = None
+    for dateiname in dateinamen:
+        daten, dateiKategorien = datenEinlesen(str(dateiname))
+        datenListe.append(daten)
+        if dateiKategorien is not None:
+            kategorien = list(kategorien or [])
+            kategorien += [k for k in dateiKategorien if k not in kategorien]
+    if len(datenListe) == 1:
+        return datenListe[0], kategorien
+    return pd.concat(datenListe, ignore_index=True), kategorien
+
+def nurLesen(array):
+    """Schuetzt ein numpy array vor Aenderungen und gibt es zurueck"""
+    array.flags.writeable = False
+    return array
+
+class Datensatz:
+    """Unveraenderlicher Stand der Daten: das Pandas objekt oder ein Index,
+    siehe ExcelDaten.setIndex, und die Kategorien
+
+    Was pro Datensatz berechnet wird (Keys, Leistungen, Kennzahlen), wird
+    beim ersten Aufruf berechnet und mit den Datensaetzen geteilt, die mit
+    mitKategorien daraus erstellt werden.
+    """
+
+    __slots__ = ('_daten', '_kategorien', '_index', '_cache')
+
+    def __init__(self, daten=None, kategorien=None, index=None,
+                 keyCodes=None):
+        """
+        :daten: Pandas objekt mit den Rohdaten oder den Paketen. Es wird nicht
+        kopiert und darf danach nicht mehr veraendert werden.
+        :kategorien: Liste mit den Kategorien oder None. Ohne Kategorien
+        enthalten die Exporte keine Tabellen pro Kategorie.
+        :index: Optional, LeistungsIndex, Datenbank oder DienstIndex, wird
+        verwendet, wenn daten None ist
+        :keyCodes: Optional, bereits berechnetes Resultat von getKeyCodes
+        """
+        object.__setattr__(self, '_daten', daten)
+        if kategorien is not None:
+            kategorien = tuple(kategorien)
+        object.__setattr__(self, '_kategorien', kategorien)
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_cache', {})
+        if keyCodes is not None:
+            self._cache['keyCodes'] = keyCodes
+
+    def __setattr__(self, name, wert):
+        raise AttributeError("Ein Datensatz kann nicht veraendert werden")
+
+    def __reduce__(self):
+        # Ohne Cache an andere Prozesse weitergeben
+        return (Datensatz, (self._daten, self._kategorien, self._index))
+
+    @classmethod
+    def einlesen(cls, dateinamen, kategorien=None):
+        """Liest Rohdaten ein, ohne die Pakete zu berechnen
+
+        :dateinamen: Dateiname oder Liste mit Dateinamen, siehe rohdatenLesen
+        :kategorien: Optional, ersetzt die Kategorien aus den Rohdaten
+        :returns: Datensatz
+        """
+        if isinstance(dateinamen, (str, pathlib.PurePath)):
+            dateinamen = [dateinamen]
+        daten, dateiKategorien = rohdatenLesen(dateinamen)
+        if kategorien is None:
+            kategorien = dateiKategorien
+        return cls(daten, kategorien)
+
+    @classmethod
+    def laden(cls, dateiname, backend='pandas', ordner=None):
+        """Liest Rohdaten ein und berechnet die Pakete mit einem Backend,
+        siehe Datenbank.datenLaden
+
+        :returns: Datensatz mit Paketen
+        """
+        from .Datenbank import datenLaden
+        return datenLaden(str(dateiname), backend, ordner).getDatensatz()
+
+    @property
+    def daten(self):
+        """Pandas objekt oder None, wenn die Daten in einem Index sind"""
+        return self._daten
+
+    @property
+    def dataframe(self):
+        """Wie daten, damit Regel Objekte auf einem Datensatz ausgewertet
+        werden koennen"""
+        return self._daten
+
+    @property
+    def kategorien(self):
+        """Tupel mit den Kategorien oder None"""
+        return self._kategorien
+
+    @property
+    def index(self):
+        """Index oder None"""
+        return self._index
+
+    @property
+    def hatPakete(self):
+        """True, wenn die Pakete berechnet sind"""
+        if self._daten is None:
+            return self._index is not None
+        return 'paketID' in self._daten.columns
+
+    def getIndex(self):
+        """Gibt den Index zurueck oder None"""
+        return self._index
+
+    def kategorienListe(self):
+        """Gibt die Kategorien als neue Liste zurueck oder None"""
+        if self._kategorien is None:
+            return None
+        return list(self._kategorien)
+
+    def mitKategorien(self, kategorien):
+        """Gibt einen Datensatz mit den gleichen Daten und anderen Kategorien
+        zurueck
+
+        :kategorien: Liste mit den Kategorien oder None
+        """
+        datensatz = Datensatz(self._daten, kategorien, self._index)
+        object.__setattr__(datensatz, '_cache', self._cache)
+        return datensatz
+
+    def getKeyCodes(self):
+        """Gibt die Spalte keyAlle als Codes und die verschiedenen Keys
+        zurueck, siehe ExcelDaten.getKeyCodes"""
+        if 'keyCodes' not in self._cache:
+            codes, keys = pd.factorize(self._daten['keyAlle'])
+            self._cache['keyCodes'] = (nurLesen(codes),
+                                       nurLesen(np.asarray(keys)))
+        return self._cache['keyCodes']
+
+    def leistungen(self):
+        """Gibt die verschiedenen Leistungen zurueck
+
+        :returns: numpy array in der Reihenfolge, in der sie vorkommen
+        """
+        if 'leistungen' not in self._cache:
+            if self._daten is not None:
+                leistungen = self._daten['Leistung'].unique()
+            elif self._index is not None:
+                leistungen = np.array(self._index.getLeistungen(),
+                                      dtype=object)
+            else:
+                leistungen = np.array([], dtype=object)
+            self._cache['leistungen'] = nurLesen(leistungen)
+        return self._cache['leistungen']
+
+    def statistik(self):
+        """Gibt die Kennzahlen zurueck, siehe ExcelCalc.statistikBerechnen
+
+        :returns: Dict, zusaetzlich mit anzahlLeistungen
+        """
+        if 'statistik' not in self._cache:
+            statistik = statistikBerechnen(self._daten, self._index)
+            statistik['anzahlLeistungen'] = len(self.leistungen())
+            self._cache['statistik'] = statistik
+        return dict(self._cache['statistik'])
+
+    def tabelle(self):
+        """Gibt alle Zeilen als Pandas objekt zurueck. Mit einer Datenbank
+        werden sie aus der Datenbank gelesen.
+
+        :raises UIError: Wenn der Index die Zeilen nicht enthaelt
+        """
+        if self._daten is not None:
+            return self._daten
+        if 'tabelle' not in self._cache:
+            if self._index is None or not hasattr(self._index, 'dataframe'):
+                raise UIError("Die Rohdaten sind in diesem Datensatz nicht "
+                              "vorhanden")
+            self._cache['tabelle'] = self._index.dataframe()
+        return self._cache['tabelle']
+
+class PaketEngine:
+    """Berechnet die Pakete eines Datensatzes und die Tabellen der Exporte"""
+
+    def __init__(self, workers=None):
+        """
+        :workers: Anzahl Threads fuer die Tabellen, siehe paketTabellen
+        """
+        self.workers = workers
+
+    def berechnen(self, datensatz, fortschritt=None):
+        """Berechnet die Pakete, siehe ExcelCalc.createPakete
+
+        :datensatz: Datensatz mit Rohdaten
+        :fortschritt: Optional, siehe createPakete
+        :returns: Neuer Datensatz mit den Spalten key, keyAlle, paketID und
+        Anzahl
+        """
+        if datensatz.daten is None:
+            raise UIError("Keine Daten vorhanden")
+        daten = createPakete(datensatz.daten, datensatz.kategorien,
+                             fortschritt)
+        return Datensatz(daten, datensatz.kategorien)
+
+    def vertreter(self, datensatz):
+        """Gibt ein Falldatum pro Paket zurueck, siehe paketVertreter"""
+        return paketVertreter(datensatz.tabelle())
+
+    def tabellen(self, datensatz):
+        """Gibt die Tabellen eines Exports zurueck, siehe paketTabellen
+
+        :returns: Generator mit Tupeln (Name der Tabelle, Daten)
+        """
+        kategorien = datensatz.kategorienListe()
+        return paketTabellen(datensatz.tabelle(), kategorien, self.workers)
+
+class Regelergebnis:
+    """Unveraenderliches Resultat von RegelEngine.auswerten"""
+
+    def __init__(self, datensatz, definitionen, regeln):
+        self._datensatz = datensatz
+        self._definitionen = definitionen
+        self._regeln = tuple(regeln)
+
+    @property
+    def datensatz(self):
+        """Datensatz, auf dem die Regeln ausgewertet wurden"""
+        return self._datensatz
+
+    @property
+    def namen(self):
+        """Liste mit den Namen der Regeln"""
+        return [regel.name for regel in self._regeln]
+
+    @property
+    def regeln(self):
+        """Tupel mit den ausgewerteten Regel Objekten, z.B. fuer
+        Export.paketeExportieren. Sie duerfen nicht veraendert werden."""
+        return self._regeln
+
+    def anzahlen(self):
+        """Gibt die Anzahl Falldaten pro Regel zurueck
+
+        :returns: Dict Name der Regel -> Anzahl oder None ohne Daten
+        """
+        anzahlen = {}
+        for regel in self._regeln:
+            anzahl = regel.getAnzahlErfuellt()
+            anzahlen[regel.name] = None if anzahl == '-' else int(anzahl)
+        return anzahlen
+
+    def falldaten(self, name):
+        """Gibt die Falldaten zurueck, die eine Regel erfuellen
+
+        :name: Name der Regel
+        :returns: numpy array mit den Werten von FallDatum
+        """
+        for regel in self._regeln:
+            if regel.name == name:
+                return nurLesen(np.array(regel.getErfuellteFalldaten()))
+        raise KeyError(name)
+
+    def bedingungsliste(self):
+        """Gibt die Falldaten zurueck, die die Regeln erfuellen, siehe
+        ExcelCalc.bedingungsliste. Wurden die Regeln auf einem Index
+        ausgewertet, werden sie dafuer auf den Zeilen neu ausgewertet.
+
+        :returns: Pandas Dataframe mit der zusaetzlichen Spalte Regel
+        """
+        if not self._regeln:
+            raise UIError("Keine Regeln definiert")
+        regeln = self._regeln
+        if self._datensatz.daten is None:
+            datensatz = Datensatz(self._datensatz.tabelle(),
+                                  self._datensatz.kategorien)
+            regeln = regelnErstellen(self._definitionen, datensatz)
+        return bedingungsliste(regeln)
+
+class RegelEngine:
+    """Wertet eine feste Liste von Regeln auf Datensaetzen aus"""
+
+    def __init__(self, definitionen):
+        """
+        :definitionen: Liste mit Dicts mit den Eintraegen Name, UND, ODER und
+        NICHT, siehe ExcelCalc.regelDefinitionen
+        """
+        self._definitionen = [
+            {
+                'Name': definition['Name'],
+                'UND': list(definition.get('UND', [])),
+                'ODER': list(definition.get('ODER', [])),
+                'NICHT': list(definition.get('NICHT', [])),
+            }
+            for definition in definitionen
+            ]
+
+    @classmethod
+    def ausDatei(cls, dateiname):
+        """Erstellt die Engine aus einem Regelfile, siehe regelnLaden"""
+        return cls(regelnLaden(dateiname))
+
+    @classmethod
+    def ausRegeln(cls, regeln):
+        """Erstellt die Engine aus Regel Objekten, z.B. denen der GUI"""
+        return cls(regelDefinitionen(regeln))
+
+    @property
+    def definitionen(self):
+        """Kopie der Definitionen der Regeln"""
+        return [dict(definition) for definition in self._definitionen]
+
+    def auswerten(self, datensatz):
+        """Wertet die Regeln aus
+
+        :datensatz: Datensatz mit Paketen
+        :returns: Regelergebnis
+        """
+        return Regelergebnis(datensatz, self._definitionen,
+                             regelnErstellen(self._definitionen, datensatz))
+
+class Exporter:
+    """Schreibt Pakete und Regelergebnisse, das Format folgt jeweils aus der
+    Endung des Dateinamens, siehe Export.paketeExportieren"""
+
+    def __init__(self, faerben=True, proKategorie=False):
+        """
+        :faerben: Pakete im Excel abwechselnd einfaerben
+        :proKategorie: Ein Excel pro Kategorie schreiben
+        """
+        self.faerben = faerben
+        self.proKategorie = proKategorie
+
+    def pakete(self, datensatz, dateiname, ergebnis=None, fortschritt=None):
+        """Exportiert die Pakete
+
+        :datensatz: Datensatz mit Paketen
+        :dateiname: Name der Exportdatei
+        :ergebnis: Optional, Regelergebnis. Wird nur in SQLite gespeichert.
+        :fortschritt: Optional, siehe Export.paketeExportieren
+        :returns: pathlib.Path der geschriebenen Datei oder des Ordners
+        """
+        kategorien = datensatz.kategorienListe()
+        regeln = list(ergebnis.regeln) if ergebnis is not None else None
+        return paketeExportieren(datensatz.tabelle(), kategorien, dateiname,
+                                 self.faerben, regeln, self.proKategorie,
+                                 fortschritt)
+
+    def bedingungen(self, ergebnis, dateiname, fortschritt=None):
+        """Exportiert die Falldaten, die die Regeln erfuellen
+
+        :ergebnis: Regelergebnis
+        :returns: pathlib.Path der geschriebenen Datei oder des Ordners
+        """
+        return bedingungenExportieren(ergebnis.bedingungsliste(), dateiname,
+                                      fortschritt)
@@ -0,0 +1,382 @@
+"""Berechnung der Pakete ohne GUI
+
+Liest Rohdaten ein, berechnet die Pakete, wertet Regeln aus und exportiert
+das Resultat, ohne PyQt5 zu importieren. Aufruf:
+
+    python -m Paketmanager rohdaten.csv -o pakete.xlsx -r regeln.json
+
+Mehrere Rohdaten werden zu einem Datensatz zusammengefasst. Die Kategorien
+stammen aus dem zweiten Sheet der Rohdaten oder aus --kategorie bzw.
+--kategorien. Mit --zusammenfassung werden die wichtigsten Kennzahlen als
+JSON geschrieben. Mit --messung werden Laufzeit, CPU Zeit, Spitzenspeicher
+und Zeilen pro Schritt gemessen, siehe Messung.
+
+Mit --batch ZIELORDNER wird jede Rohdatei einzeln verarbeitet, siehe Batch,
+mit --beobachten zusaetzlich laufend aktualisiert, siehe Beobachten. Mit
+--dienst werden die Rohdaten einmal geladen und ueber HTTP abgefragt, siehe
+Dienst.
+"""
+
+import argparse
+import contextlib
+import json
+import pathlib
+import sys
+import time
+from .ExcelCalc import UIError, ExcelDaten, convertLeistung
+from .Export import FORMATE, SQLITE_ENDUNGEN, formatVonDateiname, istSQLite
+from .Datenbank import BACKENDS, datenLaden
+from .Kern import Datensatz, PaketEngine, RegelEngine, Exporter
+from .Messung import Messung
+
+# Wert von --format -> Dateiendung
+AUSGABE_FORMATE = {
+    'xlsx': '.xlsx',
+    'parquet': '.parquet',
+    'csv': '.csv.gz',
+    'arrow': '.arrow',
+    'sqlite': '.sqlite',
+}
+
+def ausgabeDateiname(dateiname, format=None):
+    """Ergaenzt die Endung der Ausgabe passend zum Format
+
+    :dateiname: Name der Ausgabe, wie auf der Kommandozeile angegeben
+    :format: Schluessel von AUSGABE_FORMATE oder None, dann bestimmt die
+    Endung des Dateinamens das Format und Excel ist der Standard
+    :returns: pathlib.Path mit Endung
+    """
+    path = pathlib.Path(dateiname)
+    if format is not None:
+        endung = AUSGABE_FORMATE[format]
+        if path.name.endswith(endung):
+            return path
+        return path.with_name(path.name + endung)
+    if path.suffix in ['.xls', '.xlsx'] or formatVonDateiname(path)[0]:
+        return path
+    if istSQLite(path):
+        return path
+    return path.with_name(path.name + '.xlsx')
+
+def kategorienLesen(dateiname):
+    """Liest Kategorien aus einer Textdatei, eine Leistung pro Zeile"""
+    with open(str(dateiname), encoding='utf-8') as datei:
+        return [zeile.strip() for zeile in datei if zeile.strip()]
+
+class Protokoll:
+    """Schreibt die Schritte mit ihrer Dauer auf stderr"""
+
+    def __init__(self, still=False):
+        self._still = still
+        self._start = time.perf_counter()
+        self.dauer = {}
+
+    def schritt(self, name):
+        """Beendet den vorherigen Schritt und schreibt ihn ins Protokoll"""
+        jetzt = time.perf_counter()
+        self.dauer[name] = jetzt - self._start
+        self._start = jetzt
+        if not self._still:
+            print('{:<20} {:8.2f} s'.format(name, self.dauer[name]),
+                  file=sys.stderr)
+
+def pipeline(rohdaten, ausgabe=None, regelDatei=None, kategorien=None,
+             regelAusgabe=None, backend='pandas', ordner=None, faerben=True,
+             proKategorie=False, protokoll=None):
+    """Liest Rohdaten ein, berechnet die Pakete, wertet die Regeln aus und
+    exportiert die Resultate
+
+    :rohdaten: Liste mit Dateinamen der Rohdaten
+    :ausgabe: Optional, Dateiname fuer den Export der Pakete, siehe
+    Export.paketeExportieren
+    :regelDatei: Optional, Regelfile, siehe ExcelCalc.regelnLaden
+    :kategorien: Optional, Liste mit Kategorien. Ersetzt die Kategorien aus
+    den Rohdaten
+    :regelAusgabe: Optional, Dateiname fuer den Export der Falldaten, die die
+    Regeln erfuellen
+    :backend: 'pandas', 'index' oder 'sqlite', siehe Datenbank.datenLaden
+    :ordner: Ordner fuer den Index oder die Datenbank
+    :faerben: Pakete im Excel abwechselnd einfaerben
+    :proKategorie: Ein Excel pro Kategorie schreiben
+    :protokoll: Optional, Protokoll Objekt
+    :returns: Dict mit der Zusammenfassung
+    """
+    protokoll = protokoll or Protokoll(still=True)
+    exportieren = ausgabe is not None or regelAusgabe is not None
+    if exportieren and backend == 'index':
+        # Aus dem Index koennen die Rohdaten nicht mehr gelesen werden
+        raise UIError("Mit dem Backend 'index' kann nur die Zusammenfassung "
+                      "geschrieben werden")
+    excelDaten, kategorien = paketeLaden(rohdaten, kategorien, backend,
+                                         ordner, protokoll)
+    return auswerten(excelDaten, kategorien, rohdaten, ausgabe, regelDatei,
+                     regelAusgabe, backend, faerben, proKategorie, protokoll)
+
+def paketeLaden(rohdaten, kategorien=None, backend='pandas', ordner=None,
+                protokoll=None):
+    """Liest die Rohdaten ein und berechnet die Pakete, siehe pipeline
+
+    :returns: Tupel (ExcelDaten Objekt mit den Kategorien, Liste mit den
+    Kategorien oder None)
+    """
+    protokoll = protokoll or Protokoll(still=True)
+    if backend == 'pandas':
+        datensatz = Datensatz.einlesen(rohdaten, kategorien)
+        protokoll.schritt('Einlesen')
+        kategorien = datensatz.kategorienListe()
+        excelDaten = ExcelDaten()
+        excelDaten.dataframe = PaketEngine().berechnen(datensatz).daten
+        protokoll.schritt('Pakete')
+    else:
+        if len(rohdaten) != 1:
+            raise UIError(
+                "Das Backend '{}' unterstützt nur eine Datei".format(backend))
+        excelDaten = datenLaden(str(rohdaten[0]), backend, ordner)
+        protokoll.schritt('Einlesen und Pakete')
+        if kategorien is None:
+            kategorien = excelDaten.getDatensatz().kategorienListe() or None
+    if kategorien is not None:
+        kategorien = [convertLeistung(k) for k in kategorien]
+        for kategorie in kategorien:
+            excelDaten.addKategorie(kategorie)
+    return excelDaten, kategorien
+
+def auswerten(excelDaten, kategorien, rohdaten, ausgabe=None,
+              regelDatei=None, regelAusgabe=None, backend='pandas',
+              faerben=True, proKategorie=False, protokoll=None):
+    """Wertet die Regeln auf berechneten Paketen aus und exportiert die
+    Resultate, siehe pipeline
+
+    :excelDaten: ExcelDaten Objekt, z.B. von paketeLaden
+    :returns: Dict mit der Zusammenfassung
+    """
+    protokoll = protokoll or Protokoll(still=True)
+    datensatz = excelDaten.getDatensatz().mitKategorien(kategorien)
+    ergebnis = None
+    if regelDatei is not None:
+        ergebnis = RegelEngine.ausDatei(regelDatei).auswerten(datensatz)
+        protokoll.schritt('Regeln')
+
+    statistik = excelDaten.getStatistik()
+    zusammenfassung = {
+        'rohdaten': [str(r) for r in rohdaten],
+        'backend': backend,
+        'anzahlZeilen': int(statistik['anzahlZeilen']),
+        'anzahlFalldaten': int(statistik['anzahlFalldaten']),
+        'anzahlPakete': int(statistik['anzahlPakete']),
+        'kategorien': list(kategorien or []),
+        'regeln': ergebnis.anzahlen() if ergebnis is not None else {},
+        'dateien': [],
+        }
+
+    exporter = Exporter(faerben, proKategorie)
+    if ausgabe is not None:
+        ziel = exporter.pakete(datensatz, ausgabe, ergebnis)
+        zusammenfassung['dateien'].append(str(ziel))
+        protokoll.schritt('Export Pakete')
+    if regelAusgabe is not None:
+        if ergebnis is None:
+            raise UIError("Keine Regeln definiert")
+        ziel = exporter.bedingungen(ergebnis, regelAusgabe)
+        zusammenfassung['dateien'].append(str(ziel))
+        protokoll.schritt('Export Regeln')
+
+    zusammenfassung['dauer'] = dict(protokoll.dauer)
+    return zusammenfassung
+
+def argumenteParser():
+    """Erstellt den Parser fuer die Argumente der Kommandozeile"""
+    parser = argparse.ArgumentParser(
+        prog='python -m Paketmanager',
+        description='Berechnet die Pakete aus Rohdaten, wertet Regeln aus '
+                    'und exportiert das Resultat, ohne GUI.')
+    parser.add_argument('rohdaten', nargs='+', type=pathlib.Path,
+        help='Rohdaten als Excel, CSV oder Parquet, mehrere Dateien werden '
+             'zusammengefasst. Mit --batch auch Ordner oder Muster wie '
+             '"daten/*.csv"')
+    parser.add_argument('-o', '--ausgabe',
+        help='Exportdatei fuer die Pakete, das Format folgt aus der Endung '
+             '(.xlsx, {}) oder aus --format'.format(
+                 ', '.join(list(FORMATE) + SQLITE_ENDUNGEN)))
+    parser.add_argument('-f', '--format', choices=list(AUSGABE_FORMATE),
+        help='Format der Exporte, ergaenzt die Endung')
+    parser.add_argument('-r', '--regeln', type=pathlib.Path,
+        help='Regelfile (.json oder Excel)')
+    parser.add_argument('--regel-ausgabe',
+        help='Exportdatei fuer die Falldaten, die die Regeln erfuellen')
+    parser.add_argument('-k', '--kategorie', action='append', default=None,
+        help='Kategorie, kann mehrmals angegeben werden. Ersetzt die '
+             'Kategorien aus den Rohdaten')
+    parser.add_argument('--kategorien', type=pathlib.Path,
+        help='Textdatei mit einer Kategorie pro Zeile')
+    parser.add_argument('--backend', choices=BACKENDS, default='pandas',
+        help='Berechnung im Speicher (pandas), mit einem Index auf der '
+             'Festplatte (index) oder in SQLite (sqlite)')
+    parser.add_argument('--ordner', type=pathlib.Path,
+        help='Ordner fuer den Index oder die Datenbank, Standard ist der '
+             'Ordner der Rohdaten')
+    parser.add_argument('--nicht-faerben', action='store_true',
+        help='Pakete im Excel nicht abwechselnd einfaerben')
+    parser.add_argument('--pro-kategorie', action='store_true',
+        help='Ein Excel pro Kategorie schreiben')
+    parser.add_argument('--zusammenfassung', type=pathlib.Path,
+        help='Schreibt Anzahl Zeilen, Falldaten, Pakete und erfuellte '
+             'Falldaten pro Regel als JSON')
+    parser.add_argument('--messung', type=pathlib.Path, metavar='DATEI',
+        help='Misst Zeit, CPU Zeit, Spitzenspeicher und Zeilen pro Schritt, '
+             'gibt sie aus und haengt sie als eine Zeile JSON an DATEI an')
+    parser.add_argument('-q', '--still', action='store_true',
+        help='Keine Ausgabe auf stderr')
+    batch = parser.add_argument_group('Batch',
+        'Verarbeitet jede Rohdatei einzeln und schreibt einen Bericht pro '
+        'Datei und eine gemeinsame Zusammenfassung in den Zielordner')
+    batch.add_argument('-b', '--batch', type=pathlib.Path,
+        metavar='ZIELORDNER', help='Zielordner der Berichte')
+    batch.add_argument('-j', '--prozesse', type=int,
+        help='Anzahl Prozesse, Standard ist die Anzahl CPUs')
+    batch.add_argument('--neu', action='store_true',
+        help='Auch bereits verarbeitete Dateien neu verarbeiten')
+    batch.add_argument('-w', '--beobachten', action='store_true',
+        help='Laeuft weiter und aktualisiert die Berichte, sobald Rohdaten '
+             'oder Regelfile sich aendern')
+    batch.add_argument('--intervall', type=float, default=2.0,
+        help='Sekunden zwischen zwei Pruefungen mit --beobachten')
+    dienst = parser.add_argument_group('Dienst',
+        'Laedt die Rohdaten einmal und beantwortet Abfragen ueber HTTP/JSON, '
+        'siehe Dienst')
+    dienst.add_argument('--dienst', action='store_true',
+        help='Startet den Abfragedienst, bis er mit Ctrl-C beendet wird')
+    dienst.add_argument('--host', default=None,
+        help='Adresse des Dienstes, Standard ist nur lokal (127.0.0.1)')
+    dienst.add_argument('--port', type=int, default=None,
+        help='Port des Dienstes, Standard ist 8765')
+    return parser
+
+def dienstAusfuehren(parser, args, kategorien, ordner):
+    """Laedt die Daten und startet den Abfragedienst"""
+    from .Dienst import Abfragen, dienstStarten, DIENST_HOST, DIENST_PORT
+    if args.ausgabe is not None or args.regel_ausgabe is not None:
+        parser.error('--dienst schreibt keine Exporte')
+    protokoll = Protokoll(args.still)
+    try:
+        with messungStarten('Dienst vorbereiten', args) as messung:
+            excelDaten, kategorien = paketeLaden(
+                args.rohdaten, kategorien, args.backend, ordner, protokoll)
+            abfragen = Abfragen(excelDaten, kategorien)
+        protokoll.schritt('Vorbereiten')
+    except (UIError, OSError) as error:
+        print('Fehler: {}'.format(error), file=sys.stderr)
+        return 1
+    messungAusgeben(messung, args)
+
+    def gestartet(port):
+        if not args.still:
+            print('Dienst laeuft auf http://{}:{}'.format(host, port),
+                  file=sys.stderr)
+    host = args.host or DIENST_HOST
+    port = DIENST_PORT if args.port is None else args.port
+    dienstStarten(abfragen, host, port, gestartet=gestartet)
+    return 0
+
+def messungStarten(name, args):
+    """Gibt eine Messung zurueck, wenn --messung angegeben ist, sonst einen
+    Context Manager ohne Messung"""
+    if args.messung is None:
+        return contextlib.nullcontext()
+    return Messung(name, args.messung)
+
+def messungAusgeben(messung, args):
+    """Schreibt die Messung auf stderr, wenn --messung angegeben ist"""
+    if messung is not None and not args.still:
+        print(messung.text(), file=sys.stderr)
+
+def batchAusfuehren(parser, args, kategorien):
+    """Fuehrt den Batch mit den Argumenten der Kommandozeile aus
+
+    :returns: Exit Code, 1 wenn eine Datei nicht verarbeitet werden konnte
+    """
+    from .Batch import batch, FEHLER, ZUSAMMENFASSUNG_CSV
+    if args.messung is not None:
+        parser.error('--messung ist mit --batch nicht möglich')
+    if args.ausgabe is not None or args.regel_ausgabe is not None:
+        parser.error('--batch schreibt die Berichte in den Zielordner, '
+                     '-o und --regel-ausgabe sind nicht möglich')
+    if args.backend == 'index':
+        parser.error("--batch unterstützt das Backend 'index' nicht")
+    endung = AUSGABE_FORMATE[args.format or 'xlsx']
+    if args.beobachten:
+        from .Beobachten import beobachten
+        if args.backend != 'pandas':
+            parser.error('--beobachten unterstützt nur das Backend pandas')
+        beobachten(args.rohdaten, args.batch, endung, args.regeln, kategorien,
+                   not args.nicht_faerben, args.pro_kategorie, args.prozesse,
+                   args.intervall, neu=args.neu, still=args.still)
+        return 0
+    try:
+        tabelle = batch(
+            args.rohdaten, args.batch, endung, args.regeln, kategorien,
+            args.backend, not args.nicht_faerben, args.pro_kategorie,
+            args.prozesse, args.neu, args.still)
+    except (UIError, OSError) as error:
+        print('Fehler: {}'.format(error), file=sys.stderr)
+        return 1
+    anzahlFehler = int((tabelle['Status'] == FEHLER).sum())
+    if not args.still:
+        print('{} Dateien, {} Fehler, Zusammenfassung in {}'.format(
+            tabelle.shape[0], anzahlFehler,
+            args.batch / ZUSAMMENFASSUNG_CSV), file=sys.stderr)
+    return 1 if anzahlFehler else 0
+
+def main(argumente=None):
+    """Fuehrt die Pipeline mit den Argumenten der Kommandozeile aus
+
+    :argumente: Liste mit Argumenten, Standard ist sys.argv
+    :returns: Exit Code
+    """
+    parser = argumenteParser()
+    args = parser.parse_args(argumente)
+
+    kategorien = args.kategorie
+    if args.kategorien is not None:
+        kategorien = (kategorien or []) + kategorienLesen(args.kategorien)
+    if args.batch is not None:
+        return batchAusfuehren(parser, args, kategorien)
+    ausgabe = args.ausgabe
+    if ausgabe is not None:
+        ausgabe = ausgabeDateiname(ausgabe, args.format)
+    regelAusgabe = args.regel_ausgabe
+    if regelAusgabe is not None:
+        format = args.format if args.format != 'sqlite' else None
+        regelAusgabe = ausgabeDateiname(regelAusgabe, format)
+        if istSQLite(regelAusgabe):
+            parser.error('--regel-ausgabe unterstützt kein SQLite')
+    if args.regel_ausgabe is not None and args.regeln is None:
+        parser.error('--regel-ausgabe benötigt --regeln')
+    ordner = args.ordner
+    if ordner is None and args.backend != 'pandas':
+        ordner = args.rohdaten[0].parent / (args.rohdaten[0].stem + '_index')
+
+    if args.dienst:
+        return dienstAusfuehren(parser, args, kategorien, ordner)
+    try:
+        with messungStarten('Kommandozeile', args) as messung:
+            zusammenfassung = pipeline(
+                args.rohdaten, ausgabe, args.regeln, kategorien, regelAusgabe,
+                args.backend, ordner, not args.nicht_faerben,
+                args.pro_kategorie, Protokoll(args.still))
+    except (UIError, OSError) as error:
+        print('Fehler: {}'.format(error), file=sys.stderr)
+        return 1
+    messungAusgeben(messung, args)
+
+    if args.zusammenfassung is not None:
+        with open(str(args.zusammenfassung), 'w', encoding='utf-8') as datei:
+            json.dump(zusammenfassung, datei, indent=1, ensure_ascii=False)
+    if not args.still:
+        print('{anzahlZeilen} Zeilen, {anzahlFalldaten} Falldaten, '
+              '{anzahlPakete} Pakete'.format(**zusammenfassung),
+              file=sys.stderr)
+        for name, anzahl in zusammenfassung['regeln'].items():
+            print('Regel {}: {} Falldaten'.format(name, anzahl),
+                  file=sys.stderr)
+    return 0
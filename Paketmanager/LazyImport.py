@@ -0,0 +1,53 @@
+"""Verzoegerter Import von grossen Modulen
+
+pandas, numpy und xlsxwriter brauchen zusammen fast eine Sekunde zum
+Importieren. Damit das Hauptfenster sofort erscheint, werden sie mit
+lazyImport erst beim ersten Zugriff importiert, oder mit vorladen im
+Hintergrund, sobald das Fenster angezeigt wird.
+"""
+
+import importlib
+import threading
+
+# Module, die mit vorladen im Hintergrund importiert werden
+GROSSE_MODULE = ['numpy', 'pandas', 'xlsxwriter']
+
+class LazyModule:
+    """Platzhalter fuer ein Modul, das beim ersten Zugriff importiert wird"""
+
+    def __init__(self, name):
+        self._name = name
+        self._modul = None
+
+    def __getattr__(self, attribut):
+        # Wird nur fuer Attribute aufgerufen, die der Platzhalter nicht hat
+        if self._modul is None:
+            self._modul = importlib.import_module(self._name)
+        return getattr(self._modul, attribut)
+
+    def __repr__(self):
+        return '<LazyModule {}>'.format(self._name)
+
+def lazyImport(name):
+    """Gibt einen Platzhalter fuer das Modul zurueck, ohne es zu importieren
+
+    :name: Name des Moduls, z.B. 'pandas'
+    :returns: LazyModule Objekt, das wie das Modul verwendet werden kann
+    """
+    return LazyModule(name)
+
+def vorladen(namen=GROSSE_MODULE):
+    """Importiert Module in einem Hintergrund-Thread
+
+    Greift ein anderer Thread waehrenddessen auf ein Modul zu, wartet er, bis
+    der Import fertig ist.
+
+    :namen: Liste mit den Namen der Module
+    :returns: Der gestartete Thread
+    """
+    def importieren():
+        for name in namen:
+            importlib.import_module(name)
+    thread = threading.Thread(target=importieren, name='vorladen', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,303 @@
+"""Messung von Laufzeit und Speicher der einzelnen Schritte
+
+Die Schritte der Berechnung (Einlesen, Keys bilden, Pakete zuordnen,
+Kategorien, Regeln, Export) sind mit schritt markiert:
+
+    with schritt('Keys', zeilen=daten.shape[0]):
+        ...
+
+Ist fuer den aktuellen Thread keine Messung aktiv, macht schritt nichts und
+kostet praktisch keine Zeit. Eine Messung umfasst eine ganze Operation, z.B.
+"Rohdaten laden", und wird so aktiviert:
+
+    with Messung('Rohdaten laden', protokollDatei='messung.jsonl') as messung:
+        daten, kategorien = datenEinlesen(dateiname)
+        ...
+    print(messung.text())
+
+Pro Schritt werden die Zeit, die CPU Zeit, der Spitzenspeicher (hoechstes
+RSS waehrend des Schritts) und die Anzahl verarbeiteter Zeilen erfasst.
+Schritte koennen verschachtelt werden. CPU Zeit und Speicher gelten fuer den
+ganzen Prozess, laufen mehrere Operationen gleichzeitig, enthalten sie auch
+die der anderen. Mit protokollDatei wird pro Messung eine Zeile JSON an die
+Datei angehaengt.
+
+Der Spitzenspeicher pro Schritt braucht Linux: Dort wird das hoechste RSS
+zu Beginn jedes Schritts ueber /proc/self/clear_refs zurueckgesetzt. Das
+gilt fuer den ganzen Prozess, deshalb wird nur zurueckgesetzt, solange genau
+eine Messung aktiv ist. Laufen mehrere Messungen gleichzeitig, ist die
+Spitze jedes Schritts das hoechste RSS des Prozesses seit dem letzten
+Zuruecksetzen. Auf anderen Unix Systemen ist es immer das hoechste RSS seit
+dem Start des Prozesses, unter Windows ist die Spitze None.
+
+Das Modul braucht kein Qt und kein pandas.
+"""
+
+import datetime
+import json
+import sys
+import threading
+import time
+
+MESSUNG_FORMAT = 'Paketmanager-Messung'
+MESSUNG_VERSION = 1
+
+# Aktive Messung pro Thread
+_lokal = threading.local()
+
+# Anzahl aktiver Messungen in allen Threads
+_anzahlAktiv = 0
+_anzahlLock = threading.Lock()
+
+def speicherStatus():
+    """Gibt das aktuelle und das hoechste RSS des Prozesses in Bytes zurueck.
+    Die Werte sind None, wenn sie nicht bestimmt werden koennen, z.B. unter
+    Windows."""
+    try:
+        werte = {}
+        with open('/proc/self/status') as status:
+            for zeile in status:
+                name, _, wert = zeile.partition(':')
+                if name in ['VmRSS', 'VmHWM']:
+                    werte[name] = int(wert.split()[0]) * 1024
+        return werte['VmRSS'], werte['VmHWM']
+    except (OSError, KeyError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    spitze = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        spitze *= 1024
+    return None, spitze
+
+def spitzeZuruecksetzen():
+    """Setzt das hoechste RSS auf das aktuelle zurueck (nur Linux). Das gilt
+    fuer den ganzen Prozess, auch fuer Messungen in anderen Threads.
+
+    :returns: True, wenn es zurueckgesetzt werden konnte
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as datei:
+            datei.write('5')
+        return True
+    except OSError:
+        return False
+
+class Schritt:
+    """Ein gemessener Schritt, siehe schritt
+
+    Die Anzahl Zeilen kann auch erst im Schritt gesetzt werden, wenn sie
+    vorher nicht bekannt ist:
+
+        with schritt('Einlesen') as s:
+            daten = ...
+            s.zeilen = daten.shape[0]
+    """
+
+    def __init__(self, messung, name, zeilen=None):
+        self._messung = messung
+        self.name = name
+        self.zeilen = zeilen
+        self.tiefe = 0
+        self.start = None
+        self.zeit = None
+        self.cpu = None
+        self.spitze = None
+
+    def __enter__(self):
+        self._messung._schrittStarten(self)
+        return self
+
+    def __exit__(self, typ, wert, traceback):
+        self._messung._schrittBeenden(self)
+        return False
+
+    def alsDict(self):
+        """Gibt den Schritt als Dict fuer das JSON Protokoll zurueck"""
+        return {
+            'name': self.name,
+            'tiefe': self.tiefe,
+            'start': self.start,
+            'zeit': self.zeit,
+            'cpu': self.cpu,
+            'spitze': self.spitze,
+            'zeilen': None if self.zeilen is None else int(self.zeilen),
+            }
+
+class _KeinSchritt:
+    """Ersatz fuer Schritt, wenn keine Messung aktiv ist"""
+
+    zeilen = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ, wert, traceback):
+        return False
+
+    def __setattr__(self, name, wert):
+        # zeilen setzen ist ohne Messung erlaubt, wird aber nicht gespeichert
+        pass
+
+_KEIN_SCHRITT = _KeinSchritt()
+
+def schritt(name, zeilen=None):
+    """Markiert einen Schritt fuer die Messung des aktuellen Threads
+
+    :name: Name des Schritts
+    :zeilen: Optional, Anzahl verarbeiteter Zeilen
+    :returns: Context Manager, Schritt oder ein leerer Ersatz ohne Messung
+    """
+    messung = getattr(_lokal, 'messung', None)
+    if messung is None:
+        return _KEIN_SCHRITT
+    return Schritt(messung, name, zeilen)
+
+def _maximum(a, b):
+    """max, das None ignoriert"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+def aktiveMessung():
+    """Gibt die Messung des aktuellen Threads zurueck oder None"""
+    return getattr(_lokal, 'messung', None)
+
+class Messung:
+    """Misst eine Operation und ihre Schritte im aktuellen Thread"""
+
+    def __init__(self, name, protokollDatei=None):
+        """
+        :name: Name der Operation, z.B. 'Rohdaten laden'
+        :protokollDatei: Optional, Datei, an die das Resultat als eine Zeile
+        JSON angehaengt wird
+        """
+        self.name = name
+        self.protokollDatei = protokollDatei
+        self.schritte = []
+        self.zeitpunkt = None
+        self.zeit = None
+        self.cpu = None
+        self.spitze = None
+        self.fehler = None
+        self._vorherige = None
+        self._offen = []
+        self._start = None
+        self._startCpu = None
+        self._spitzen = []
+
+    def __enter__(self):
+        global _anzahlAktiv
+        with _anzahlLock:
+            _anzahlAktiv += 1
+        self._vorherige = getattr(_lokal, 'messung', None)
+        _lokal.messung = self
+        self.zeitpunkt = datetime.datetime.now().isoformat(timespec='seconds')
+        self._spitzen = [self._spitzeBeginnen()]
+        self._start = time.perf_counter()
+        self._startCpu = time.process_time()
+        return self
+
+    def __exit__(self, typ, wert, traceback):
+        global _anzahlAktiv
+        self.zeit = time.perf_counter() - self._start
+        self.cpu = time.process_time() - self._startCpu
+        self.spitze = self._spitzeBeenden()
+        if wert is not None:
+            self.fehler = '{}: {}'.format(typ.__name__, wert)
+        _lokal.messung = self._vorherige
+        with _anzahlLock:
+            _anzahlAktiv -= 1
+        if self.protokollDatei is not None:
+            self.protokollieren(self.protokollDatei)
+        return False
+
+    def _spitzeBeginnen(self):
+        """Uebergibt das bisherige hoechste RSS an den uebergeordneten
+        Schritt und setzt es fuer den neuen Schritt zurueck, wenn keine
+        andere Messung aktiv ist
+
+        :returns: Hoechstes RSS des neuen Schritts bis jetzt
+        """
+        _, spitze = speicherStatus()
+        if self._spitzen:
+            self._spitzen[-1] = _maximum(self._spitzen[-1], spitze)
+        if _anzahlAktiv == 1 and spitzeZuruecksetzen():
+            _, spitze = speicherStatus()
+        return spitze
+
+    def _spitzeBeenden(self):
+        """Gibt das hoechste RSS des innersten Schritts zurueck und
+        uebergibt es an den uebergeordneten Schritt"""
+        _, spitze = speicherStatus()
+        spitze = _maximum(self._spitzen.pop(), spitze)
+        if self._spitzen:
+            self._spitzen[-1] = _maximum(self._spitzen[-1], spitze)
+        return spitze
+
+    def _schrittStarten(self, schritt):
+        schritt.tiefe = len(self._offen)
+        self.schritte.append(schritt)
+        self._offen.append(schritt)
+        self._spitzen.append(self._spitzeBeginnen())
+        schritt.start = time.perf_counter() - self._start
+        schritt._startCpu = time.process_time()
+
+    def _schrittBeenden(self, schritt):
+        schritt.zeit = time.perf_counter() - self._start - schritt.start
+        schritt.cpu = time.process_time() - schritt._startCpu
+        schritt.spitze = self._spitzeBeenden()
+        self._offen.remove(schritt)
+
+    def alsDict(self):
+        """Gibt die Messung als Dict fuer das JSON Protokoll zurueck"""
+        return {
+            'format': MESSUNG_FORMAT,
+            'version': MESSUNG_VERSION,
+            'operation': self.name,
+            'zeitpunkt': self.zeitpunkt,
+            'zeit': self.zeit,
+            'cpu': self.cpu,
+            'spitze': self.spitze,
+            'fehler': self.fehler,
+            'schritte': [s.alsDict() for s in self.schritte],
+            }
+
+    def protokollieren(self, dateiname):
+        """Haengt die Messung als eine Zeile JSON an eine Datei an"""
+        zeile = json.dumps(self.alsDict(), ensure_ascii=False)
+        with open(str(dateiname), 'a', encoding='utf-8') as datei:
+            datei.write(zeile + '\n')
+
+    def zeilen(self):
+        """Gibt die Zeilen fuer eine Anzeige zurueck, die Operation zuerst
+
+        :returns: Liste mit Tupeln (Name, Tiefe, Zeit, CPU Zeit, Spitze in
+        Bytes oder None, Zeilen, Zeilen pro Sekunde oder None)
+        """
+        zeilen = [(self.name, 0, self.zeit, self.cpu, self.spitze, None,
+                   None)]
+        for s in self.schritte:
+            rate = None
+            if s.zeilen is not None and s.zeit:
+                rate = s.zeilen / s.zeit
+            zeilen.append((s.name, s.tiefe + 1, s.zeit, s.cpu, s.spitze,
+                           s.zeilen, rate))
+        return zeilen
+
+    def text(self):
+        """Gibt die Messung als Tabelle fuer die Kommandozeile zurueck"""
+        zeilen = ['{:<32} {:>9} {:>9} {:>10} {:>11} {:>12}'.format(
+            'Schritt', 'Zeit s', 'CPU s', 'Spitze MB', 'Zeilen', 'Zeilen/s')]
+        for name, tiefe, zeit, cpu, spitze, anzahl, rate in self.zeilen():
+            zeilen.append('{:<32} {:>9.3f} {:>9.3f} {:>10} {:>11} {:>12}'
+                .format('  ' * tiefe + name, zeit, cpu,
+                        '-' if spitze is None
+                        else '{:.1f}'.format(spitze / 1024**2),
+                        '' if anzahl is None else anzahl,
+                        '' if rate is None else '{:.0f}'.format(rate)))
+        return '\n'.join(zeilen)
@@ -0,0 +1,247 @@
+"""Projektdateien des Paketmanagers
+
+Ein Projekt speichert die Daten mit den berechneten Paketen, die Kategorien
+und die Regeln, damit eine Sitzung ohne erneutes Einlesen der Rohdaten und
+ohne createPakete wieder geoeffnet werden kann.
+
+Die Projektdatei ist ein unkomprimiertes Zip mit
+ * projekt.json: Version, Spalten, Kategorien und Regeln
+ * spalten/: eine .npy Datei pro Spalte. Textspalten werden als Codes und
+   einer Tabelle der verschiedenen Texte (UTF-8 und Offsets) gespeichert.
+ * indizes/: vorberechnete Indizes, z.B. die Zeilen jedes Pakets
+
+Weil die Dateien im Zip nicht komprimiert sind, koennen sie direkt aus der
+Projektdatei gemappt werden. Spalten und Indizes werden erst beim ersten
+Zugriff gelesen.
+"""
+
+import json
+import pathlib
+import struct
+import zipfile
+from .ExcelCalc import UIError, regelDefinitionen
+from .LazyImport import lazyImport
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
+
+PROJEKT_FORMAT = 'Paketmanager-Projekt'
+PROJEKT_VERSION = 1
+PROJEKT_ENDUNG = '.tpm'
+
+# Groesse des Local File Headers eines Zip-Eintrags ohne Name und Extra
+ZIP_HEADER_GROESSE = 30
+
+def paketIndizes(daten):
+    """Berechnet die Indizes, die im Projekt gespeichert werden
+
+    :daten: Pandas objekt mit den Paketen
+    :returns: Dict Name -> numpy array. paketZeilen enthaelt die Zeilen
+    sortiert nach paketID, die Zeilen des Pakets paketIDs[i] sind
+    paketZeilen[paketGrenzen[i]:paketGrenzen[i+1]].
+    """
+    paketID = daten['paketID'].values
+    zeilen = np.argsort(paketID, kind='mergesort')
+    ids, grenzen = np.unique(paketID[zeilen], return_index=True)
+    anzahl = daten['Anzahl'].values[zeilen[grenzen]]
+    return {
+        'paketZeilen': zeilen.astype(np.int64),
+        'paketGrenzen': np.append(grenzen, paketID.size).astype(np.int64),
+        'paketIDs': ids,
+        'paketAnzahl': anzahl,
+        }
+
+def textTabelle(werte):
+    """Kodiert Texte als UTF-8 Puffer mit Offsets
+
+    :werte: Liste mit Strings
+    :returns: Tupel (offsets, puffer) mit zwei numpy arrays
+    """
+    kodiert = [str(w).encode('utf-8') for w in werte]
+    offsets = np.zeros(len(kodiert) + 1, dtype=np.int64)
+    np.cumsum([len(k) for k in kodiert], out=offsets[1:])
+    puffer = np.frombuffer(b''.join(kodiert), dtype=np.uint8)
+    return offsets, puffer
+
+def textTabelleLesen(offsets, puffer):
+    """Dekodiert eine mit textTabelle erstellte Tabelle
+
+    :returns: numpy array mit den Strings
+    """
+    puffer = puffer.tobytes()
+    werte = np.empty(len(offsets) - 1, dtype=object)
+    werte[:] = [
+        puffer[start:ende].decode('utf-8')
+        for start, ende in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+    return werte
+
+def arraySchreiben(zipDatei, name, array):
+    """Schreibt ein numpy array als .npy Datei ins Zip"""
+    with zipDatei.open(name, 'w', force_zip64=True) as datei:
+        np.lib.format.write_array(datei, np.ascontiguousarray(array),
+                                  allow_pickle=False)
+
+def projektSpeichern(dateiname, daten, kategorien, regeln, excelName='',
+                     fortschritt=None):
+    """Speichert ein Projekt
+
+    :dateiname: Name der Projektdatei
+    :daten: Pandas objekt mit den Paketen, wie von createPakete
+    :kategorien: Liste mit den Kategorien
+    :regeln: Liste mit Regel Objekten
+    :excelName: Name des Excels mit den Rohdaten
+    :fortschritt: Optional, Funktion, die nach jeder Spalte mit dem
+    erledigten Anteil (0 bis 1) aufgerufen wird
+    """
+    if daten is None:
+        raise UIError("Keine Daten vorhanden")
+
+    path = pathlib.Path(dateiname)
+    spalten = []
+    with zipfile.ZipFile(str(path), 'w', zipfile.ZIP_STORED) as zipDatei:
+        for i, name in enumerate(daten.columns):
+            spalte = daten[name]
+            prefix = 'spalten/{}'.format(i)
+            if spalte.dtype.kind in 'biufM':
+                arraySchreiben(zipDatei, prefix + '.npy', spalte.values)
+                spalten.append({'name': str(name), 'art': 'array'})
+            else:
+                codes, werte = pd.factorize(spalte)
+                offsets, puffer = textTabelle(werte)
+                codes = codes.astype(np.int32)
+                arraySchreiben(zipDatei, prefix + '.npy', codes)
+                arraySchreiben(zipDatei, prefix + '.offsets.npy', offsets)
+                arraySchreiben(zipDatei, prefix + '.text.npy', puffer)
+                spalten.append({'name': str(name), 'art': 'text'})
+            if fortschritt:
+                fortschritt((i + 1) / (daten.shape[1] + 1))
+
+        indizes = paketIndizes(daten)
+        for name, index in indizes.items():
+            arraySchreiben(zipDatei, 'indizes/{}.npy'.format(name), index)
+
+        manifest = {
+            'format': PROJEKT_FORMAT,
+            'version': PROJEKT_VERSION,
+            'excelName': excelName,
+            'anzahlZeilen': int(daten.shape[0]),
+            'spalten': spalten,
+            'indizes': list(indizes),
+            'kategorien': [str(k) for k in kategorien],
+            'regeln': regelDefinitionen(regeln),
+            }
+        zipDatei.writestr('projekt.json', json.dumps(manifest, indent=1))
+
+class Projekt:
+    """Eine geoeffnete Projektdatei
+
+    Die Arrays werden erst beim ersten Zugriff aus der Datei gemappt.
+    """
+
+    def __init__(self, dateiname):
+        self._dateiname = str(dateiname)
+        self._arrays = {}
+        try:
+            with zipfile.ZipFile(self._dateiname) as zipDatei:
+                self._eintraege = {i.filename: i for i in zipDatei.infolist()}
+                manifest = json.loads(zipDatei.read('projekt.json'))
+        except (zipfile.BadZipFile, KeyError, ValueError):
+            raise UIError("Die Datei ist keine gültige Projektdatei")
+
+        if manifest.get('format') != PROJEKT_FORMAT:
+            raise UIError("Die Datei ist keine gültige Projektdatei")
+        if manifest.get('version', 0) > PROJEKT_VERSION:
+            raise UIError(
+                "Die Projektdatei wurde mit einer neueren Version gespeichert")
+        self._manifest = manifest
+
+    @property
+    def excelName(self):
+        """Name des Excels mit den Rohdaten"""
+        return self._manifest['excelName']
+
+    @property
+    def kategorien(self):
+        """Liste mit den Kategorien"""
+        return list(self._manifest['kategorien'])
+
+    @property
+    def regeln(self):
+        """Liste mit den Regeln als Dicts, siehe regelDefinitionen"""
+        return list(self._manifest['regeln'])
+
+    def array(self, name):
+        """Mappt eine .npy Datei aus dem Projekt, ohne sie zu lesen
+
+        :name: Name der Datei im Zip
+        :returns: Schreibgeschuetztes numpy.memmap
+        """
+        if name in self._arrays:
+            return self._arrays[name]
+
+        info = self._eintraege[name]
+        with open(self._dateiname, 'rb') as datei:
+            datei.seek(info.header_offset)
+            header = datei.read(ZIP_HEADER_GROESSE)
+            laengeName, laengeExtra = struct.unpack('<HH', header[26:30])
+            datei.seek(laengeName + laengeExtra, 1)
+            version = np.lib.format.read_magic(datei)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(datei)
+            else:
+                header = np.lib.format.read_array_header_2_0(datei)
+            shape, fortran, dtype = header
+            offset = datei.tell()
+
+        if 0 in shape:
+            array = np.empty(shape, dtype=dtype)
+        else:
+            array = np.memmap(self._dateiname, dtype=dtype, mode='r',
+                              offset=offset, shape=shape,
+                              order='F' if fortran else 'C')
+        self._arrays[name] = array
+        return array
+
+    def index(self, name):
+        """Gibt einen gespeicherten Index zurueck, siehe paketIndizes"""
+        if name not in self._manifest['indizes']:
+            raise KeyError(name)
+        return self.array('indizes/{}.npy'.format(name))
+
+    def spalte(self, name):
+        """Liest eine Spalte der Daten
+
+        :name: Name der Spalte
+        :returns: numpy array
+        """
+        for i, spalte in enumerate(self._manifest['spalten']):
+            if spalte['name'] == name:
+                break
+        else:
+            raise KeyError(name)
+
+        prefix = 'spalten/{}'.format(i)
+        werte = self.array(prefix + '.npy')
+        if spalte['art'] == 'array':
+            return np.array(werte)
+
+        texte = textTabelleLesen(self.array(prefix + '.offsets.npy'),
+                                 self.array(prefix + '.text.npy'))
+        texte = np.append(texte, np.nan)
+        # Fehlende Werte haben den Code -1 und zeigen auf das np.nan am Ende
+        return texte[werte]
+
+    def dataframe(self):
+        """Erstellt das Pandas objekt mit allen Daten"""
+        namen = [spalte['name'] for spalte in self._manifest['spalten']]
+        return pd.DataFrame({name: self.spalte(name) for name in namen},
+                            columns=namen)
+
+def projektLaden(dateiname):
+    """Oeffnet eine Projektdatei
+
+    :dateiname: Name der Projektdatei
+    :returns: Projekt Objekt
+    """
+    return Projekt(dateiname)
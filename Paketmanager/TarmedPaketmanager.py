@@ -3,12 +3,27 @@
 import sys
 import os
 import pathlib
-import pickle
-import pandas as pd
+import difflib
+import shutil
+import time
 from PyQt5 import QtCore, QtGui, QtWidgets
-from .ExcelCalc import datenEinlesen, createPakete, writePaketeToExcel
-from .ExcelCalc import Regeln, ExcelDaten, Regel, UIError
-from .UI import MainWindow, LeistungswahldialogUI, Ueber
+from .ExcelCalc import datenEinlesen, createPakete
+from .ExcelCalc import Regeln, ExcelDaten, Regel, UIError, regelnErstellen
+from .ExcelCalc import regelnBerechnen
+from .ExcelCalc import REGEL_ENDUNG, regelnLaden, getKategorie
+from .Export import FORMATE, formatVonDateiname, exportZiel
+from .Export import SQLITE_ENDUNGEN, istSQLite
+from .Projekt import PROJEKT_ENDUNG, projektLaden, projektSpeichern
+from .Projekt import paketIndizes
+from .Jobs import Job, JobScheduler, JobAbgebrochen
+from .Kern import RegelEngine, Exporter
+from .Messung import Messung
+from .Verfolgung import Verfolgung
+from .LazyImport import lazyImport, vorladen
+from .UI import MainWindow, LeistungswahldialogUI, Ueber, Paketbrowser
+
+np = lazyImport('numpy')
+pd = lazyImport('pandas')
 
 VERSION = "0.9.1"
 BESCHREIBUNG = """
@@ -25,6 +40,46 @@ Der obige Urheberrechtsvermerk und dieser Erlaubnisvermerk sind in allen Kopien
 DIE SOFTWARE WIRD OHNE JEDE AUSDRÜCKLICHE ODER IMPLIZIERTE GARANTIE BEREITGESTELLT, EINSCHLIESSLICH DER GARANTIE ZUR BENUTZUNG FÜR DEN VORGESEHENEN ODER EINEM BESTIMMTEN ZWECK SOWIE JEGLICHER RECHTSVERLETZUNG, JEDOCH NICHT DARAUF BESCHRÄNKT. IN KEINEM FALL SIND DIE AUTOREN ODER COPYRIGHTINHABER FÜR JEGLICHEN SCHADEN ODER SONSTIGE ANSPRÜCHE HAFTBAR ZU MACHEN, OB INFOLGE DER ERFÜLLUNG EINES VERTRAGES, EINES DELIKTES ODER ANDERS IM ZUSAMMENHANG MIT DER SOFTWARE ODER SONSTIGER VERWENDUNG DER SOFTWARE ENTSTANDEN.
 """.format(VERSION)
 
+EXPORT_FILTER = ";;".join([
+    "Excel Files (*.xlsx *.xls)",
+    "Parquet (*.parquet)",
+    "CSV komprimiert (*.csv.gz)",
+    "Arrow IPC (*.arrow)",
+])
+
+REGEL_FILTER = ";;".join([
+    "Regeln (*{})".format(REGEL_ENDUNG),
+    "Excel Files (*.xlsx *.xls)",
+])
+
+PAKET_EXPORT_FILTER = ";;".join([
+    EXPORT_FILTER,
+    "SQLite Datenbank (*.sqlite *.db)",
+])
+
+# Dateien im protokollOrdner
+MESSUNG_PROTOKOLL = 'messungen.jsonl'
+VERFOLGUNG_PROTOKOLL = 'benachrichtigungen.jsonl'
+# Sekunden, die beim Schliessen auf abgebrochene Jobs gewartet wird
+SCHLIESSEN_WARTEZEIT = 1
+
+def exportDateiname(fileName, dateiFilter):
+    """Ergaenzt die Endung eines Exportfiles passend zum gewaehlten Filter
+
+    :fileName: Dateiname aus dem Dialog
+    :dateiFilter: Im Dialog gewaehlter Filter
+    :returns: pathlib.Path mit Endung
+    """
+    path = pathlib.Path(fileName)
+    if path.suffix in ['.xls', '.xlsx'] or formatVonDateiname(path)[0]:
+        return path
+    if istSQLite(path):
+        return path
+    for endung in list(FORMATE) + SQLITE_ENDUNGEN:
+        if endung in dateiFilter:
+            return path.with_name(path.name + endung)
+    return path.with_suffix('.xlsx')
+
 class UeberDialog(QtWidgets.QDialog):
     def __init__(self, parent):
         super().__init__(parent)
@@ -38,77 +93,335 @@ class UeberDialog(QtWidgets.QDialog):
         dialog.open()
 
 
-class ExcelReader(QtCore.QThread):
-    """Thread, um ein Excel einzulesen"""
-
-    signal = QtCore.pyqtSignal(dict)
-
-    def __init__(self, parent, fname):
-        super().__init__()
-        self._fname = fname
-        self.start()
-
-    def run(self):
-        returnValue = {}
-        try:
-            result = datenEinlesen(self._fname)
-            if result is not None:
-                daten, kategorien = result
-                daten = createPakete(daten, kategorien)
-                returnValue['success'] = True
-                returnValue['data'] = (daten, kategorien)
-            else:
-                returnValue['success'] = False
+def teilergebnisLoeschen(pfad):
+    """Loescht eine Datei oder einen Ordner, den ein abgebrochener Job nur
+    teilweise geschrieben hat"""
+    pfad = pathlib.Path(pfad)
+    if pfad.is_dir():
+        shutil.rmtree(str(pfad), ignore_errors=True)
+    elif pfad.exists():
+        pfad.unlink()
 
-        except UIError as error:
+def excelLesen(job, fname):
+    """Job, um ein Excel einzulesen und die Pakete zu berechnen"""
+    returnValue = {}
+    try:
+        start = time.perf_counter()
+        result = datenEinlesen(fname)
+        if result is not None:
+            eingelesen = time.perf_counter()
+            job.setFortschritt(0.3)
+            daten, kategorien = result
+            daten = createPakete(daten, kategorien,
+                lambda anteil: job.setFortschritt(0.3 + 0.7 * anteil))
+            returnValue['success'] = True
+            returnValue['data'] = (daten, kategorien)
+            returnValue['ladezeiten'] = {
+                'Einlesen': eingelesen - start,
+                'Pakete': time.perf_counter() - eingelesen,
+                }
+        else:
             returnValue['success'] = False
-            returnValue['errMsg'] = '{}'.format(error)
 
-        self.signal.emit(returnValue)
+    except UIError as error:
+        returnValue['success'] = False
+        returnValue['errMsg'] = '{}'.format(error)
 
-class ExcelPaketWriter(QtCore.QThread):
-    """Thread, um ein Excel zu speichern"""
+    return returnValue
 
-    signal = QtCore.pyqtSignal(dict)
-
-    def __init__(self, parent, fname, excelDaten):
+def projektLesen(job, fname):
+    """Job, um ein Projekt zu laden"""
+    returnValue = {'success': False}
+    try:
+        start = time.perf_counter()
+        projekt = projektLaden(fname)
+        job.setFortschritt(0.5)
+        returnValue['data'] = (projekt.dataframe(), projekt.kategorien)
+        returnValue['ladezeiten'] = {
+            'Projekt laden': time.perf_counter() - start}
+        returnValue['regeln'] = projekt.regeln
+        returnValue['excelName'] = projekt.excelName
+        returnValue['success'] = True
+    except UIError as error:
+        returnValue['errMsg'] = str(error)
+    return returnValue
+
+def projektSchreiben(job, fname, datensatz, definitionen, excelName):
+    """Job, um ein Projekt zu speichern
+
+    :datensatz: Kern.Datensatz
+    :definitionen: Definitionen der Regeln, siehe Regeln.getDefinitionen
+    """
+    returnValue = {'success': False, 'filename': fname}
+    try:
+        regeln = regelnErstellen(definitionen, datensatz, auswerten=False)
+        projektSpeichern(fname, datensatz.daten, datensatz.kategorien, regeln,
+                         excelName, fortschritt=job.setFortschritt)
+        returnValue['success'] = True
+    except (UIError, OSError) as error:
+        returnValue['errMsg'] = str(error)
+    except JobAbgebrochen:
+        teilergebnisLoeschen(fname)
+        raise
+    return returnValue
+
+def paketeSchreiben(job, fname, datensatz, definitionen, faerben=True,
+                    proKategorie=False):
+    """Job, um die Pakete zu exportieren
+
+    :datensatz: Kern.Datensatz
+    :definitionen: Definitionen der Regeln, siehe Regeln.getDefinitionen
+    """
+    returnValue = {'success':False, 'filename': fname}
+    try:
+        ergebnis = None
+        if istSQLite(fname):
+            # Nur SQLite speichert die Regeln mit den Paketen
+            ergebnis = RegelEngine(definitionen).auswerten(datensatz)
+        exporter = Exporter(faerben, proKategorie)
+        returnValue['filename'] = exporter.pakete(datensatz, fname, ergebnis,
+            fortschritt=job.setFortschritt)
+        returnValue['success'] = True
+    except UIError as error:
+        returnValue['errMsg'] = str(error)
+    except JobAbgebrochen:
+        teilergebnisLoeschen(exportZiel(fname))
+        raise
+    return returnValue
+
+def bedingungenSchreiben(job, fname, datensatz, definitionen):
+    """Job, um die Falldaten, die die Regeln erfuellen, zu exportieren
+
+    :datensatz: Kern.Datensatz
+    :definitionen: Definitionen der Regeln, siehe Regeln.getDefinitionen
+    """
+    returnValue = {'success':False, 'filename': fname}
+    try:
+        ergebnis = RegelEngine(definitionen).auswerten(datensatz)
+        job.setFortschritt(0.2)
+        returnValue['filename'] = Exporter().bedingungen(ergebnis, fname,
+            lambda anteil: job.setFortschritt(0.2 + 0.8 * anteil))
+        returnValue['success'] = True
+    except UIError as error:
+        returnValue['errMsg'] = str(error)
+    except JobAbgebrochen:
+        teilergebnisLoeschen(exportZiel(fname))
+        raise
+    return returnValue
+
+def dienstVerbinden(job, url):
+    """Job, um sich mit einem Abfragedienst zu verbinden"""
+    from .Dienst import DienstIndex
+    returnValue = {'success': False, 'url': url}
+    try:
+        start = time.perf_counter()
+        index = DienstIndex(url)
+        job.setFortschritt(0.5)
+        index.getLeistungen()
+        returnValue['index'] = index
+        returnValue['ladezeiten'] = {
+            'Verbinden': time.perf_counter() - start}
+        returnValue['success'] = True
+    except UIError as error:
+        returnValue['errMsg'] = str(error)
+    return returnValue
+
+def regelnBerechnenJob(job, datensatz, bedingungen):
+    """Job, um Regeln auf einem Datensatz auszuwerten, siehe
+    Regeln.setHintergrund. Auf einem Dienst ist das eine Abfrage fuer alle
+    Regeln."""
+    returnValue = {'success': False}
+    try:
+        returnValue['regeln'] = regelnBerechnen(datensatz, bedingungen)
+        returnValue['success'] = True
+    except (UIError, OSError) as error:
+        returnValue['errMsg'] = str(error)
+    return returnValue
+
+def protokollOrdner():
+    """Gibt den Ordner zurueck, in den die GUI Messungen und verfolgte
+    Benachrichtigungen schreibt"""
+    ordner = QtCore.QStandardPaths.writableLocation(
+        QtCore.QStandardPaths.GenericDataLocation)
+    return pathlib.Path(ordner) / 'Paketmanager'
+
+class JobSignal(QtCore.QObject):
+    """Observer eines Jobs, der die Meldungen als Qt Signal in den GUI
+    Thread weiterleitet"""
+
+    geaendert = QtCore.pyqtSignal(object)
+
+    def __init__(self, job):
         super().__init__()
-        self._parent = parent
-        self._fname = fname
-        self._kategorien = excelDaten.getKategorien()
-        self._daten = excelDaten.dataframe
-        self.start()
-
-    def run(self):
-        returnValue = {'success':False, 'filename': self._fname}
-        try:
-            writePaketeToExcel(self._daten, self._kategorien, self._fname)
-            returnValue['success'] = True
-        except UIError as error:
-            returnValue['errMsg'] = str(error)
-        self.signal.emit(returnValue)
-
-class ExcelRegelWriter(QtCore.QThread):
-    """Thread, um ein Excel zu speichern"""
+        self._job = job
+        job.registerObserver(self)
 
-    signal = QtCore.pyqtSignal(dict)
+    def update(self):
+        # Wird im Thread des Jobs aufgerufen, das Signal wird in den GUI
+        # Thread eingereiht
+        self.geaendert.emit(self._job)
 
-    def __init__(self, parent, fname, regeln):
-        super().__init__()
-        self._parent = parent
-        self._fname = fname
-        self._regeln = regeln
-        self.start()
+class JobAnzeige(QtWidgets.QWidget):
+    """Zeigt die laufenden Jobs mit Fortschritt und Abbrechen Knopf in der
+    Statusleiste an"""
 
-    def run(self):
-        returnValue = {'success':False, 'filename': self._fname}
-        try:
-            bedingungen = self._regeln.getBedingungsliste()
-            bedingungen.to_excel(self._fname, index=False)
-            returnValue['success'] = True
-        except UIError as error:
-            returnValue['errMsg'] = str(error)
-        self.signal.emit(returnValue)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._layout = QtWidgets.QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._zeilen = {}
+
+    def jobHinzufuegen(self, job):
+        """Fuegt eine Zeile fuer den Job hinzu"""
+        zeile = QtWidgets.QWidget(self)
+        layout = QtWidgets.QHBoxLayout(zeile)
+        layout.setContentsMargins(0, 0, 0, 0)
+        label = QtWidgets.QLabel(job.name, zeile)
+        balken = QtWidgets.QProgressBar(zeile)
+        balken.setRange(0, 100)
+        balken.setMaximumWidth(120)
+        knopf = QtWidgets.QToolButton(zeile)
+        knopf.setText('Abbrechen')
+        knopf.clicked.connect(job.abbrechen)
+        layout.addWidget(label)
+        layout.addWidget(balken)
+        layout.addWidget(knopf)
+        self._layout.addWidget(zeile)
+        self._zeilen[job] = (zeile, balken)
+
+    def jobAktualisieren(self, job):
+        """Zeigt den aktuellen Fortschritt des Jobs an"""
+        if job in self._zeilen:
+            self._zeilen[job][1].setValue(int(job.fortschritt * 100))
+
+    def jobEntfernen(self, job):
+        """Entfernt die Zeile des Jobs"""
+        zeile, _ = self._zeilen.pop(job, (None, None))
+        if zeile is not None:
+            self._layout.removeWidget(zeile)
+            zeile.deleteLater()
+
+class MessungPanel(QtWidgets.QDockWidget):
+    """Zeigt die Messungen der letzten Jobs mit ihren Schritten an, siehe
+    Messung"""
+
+    SPALTEN = ['Schritt', 'Zeit', 'CPU', 'Spitze', 'Zeilen', 'Zeilen/s']
+
+    # Anzahl Messungen, die angezeigt werden
+    MAX_MESSUNGEN = 20
+
+    def __init__(self, parent, protokollDatei):
+        super().__init__('Performance', parent)
+        self.setObjectName('messungPanel')
+        inhalt = QtWidgets.QWidget(self)
+        layout = QtWidgets.QVBoxLayout(inhalt)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._baum = QtWidgets.QTreeWidget(inhalt)
+        self._baum.setHeaderLabels(self.SPALTEN)
+        self._baum.setRootIsDecorated(True)
+        layout.addWidget(self._baum)
+        label = QtWidgets.QLabel('Protokoll: {}'.format(protokollDatei), inhalt)
+        label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        layout.addWidget(label)
+        self.setWidget(inhalt)
+
+    def messungHinzufuegen(self, messung):
+        """Zeigt eine Messung zuoberst an, die Schritte darunter"""
+        eltern = []
+        for i, zeile in enumerate(messung.zeilen()):
+            name, tiefe, zeit, cpu, spitze, anzahl, rate = zeile
+            if i == 0 and messung.fehler:
+                name = '{} ({})'.format(name, messung.fehler)
+            item = QtWidgets.QTreeWidgetItem([
+                name,
+                '{:.3f} s'.format(zeit),
+                '{:.3f} s'.format(cpu),
+                speicherText(spitze),
+                '' if anzahl is None else str(anzahl),
+                '' if rate is None else '{:.0f}'.format(rate),
+                ])
+            for spalte in range(1, len(self.SPALTEN)):
+                item.setTextAlignment(spalte,
+                    QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            del eltern[tiefe:]
+            if eltern:
+                eltern[-1].addChild(item)
+            else:
+                self._baum.insertTopLevelItem(0, item)
+            eltern.append(item)
+        while self._baum.topLevelItemCount() > self.MAX_MESSUNGEN:
+            self._baum.takeTopLevelItem(self.MAX_MESSUNGEN)
+        # Nur die neuste Messung aufgeklappt anzeigen
+        self._baum.collapseAll()
+        offen = [self._baum.topLevelItem(0)]
+        while offen:
+            item = offen.pop()
+            item.setExpanded(True)
+            offen.extend(item.child(i) for i in range(item.childCount()))
+        for spalte in range(len(self.SPALTEN)):
+            self._baum.resizeColumnToContents(spalte)
+
+class VerfolgungPanel(QtWidgets.QDockWidget):
+    """Zeigt die verfolgten Aktionen mit ihren Benachrichtigungen an,
+    siehe Verfolgung"""
+
+    SPALTEN = ['Aufruf', 'Observer', 'Redundant', 'Zeit', 'Eigenzeit']
+
+    # Anzahl Aktionen, die angezeigt werden
+    MAX_AKTIONEN = 50
+
+    def __init__(self, parent, protokollDatei):
+        super().__init__('Benachrichtigungen', parent)
+        self.setObjectName('verfolgungPanel')
+        inhalt = QtWidgets.QWidget(self)
+        layout = QtWidgets.QVBoxLayout(inhalt)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._baum = QtWidgets.QTreeWidget(inhalt)
+        self._baum.setHeaderLabels(self.SPALTEN)
+        layout.addWidget(self._baum)
+        label = QtWidgets.QLabel('Protokoll: {}'.format(protokollDatei), inhalt)
+        label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        layout.addWidget(label)
+        self.setWidget(inhalt)
+
+    @staticmethod
+    def millisekunden(sekunden):
+        return '{:.1f} ms'.format(sekunden * 1000)
+
+    def benachrichtigungEinfuegen(self, eltern, benachrichtigung):
+        """Fuegt eine Benachrichtigung mit ihren Updates unter eltern ein"""
+        item = QtWidgets.QTreeWidgetItem(eltern, [
+            '{} ({})'.format(benachrichtigung.quelle,
+                             benachrichtigung.ausloeser),
+            str(benachrichtigung.fanOut), '',
+            self.millisekunden(benachrichtigung.zeit), ''])
+        for update in benachrichtigung.updates:
+            kind = QtWidgets.QTreeWidgetItem(item, [
+                '{}.update'.format(update.observer), '', '',
+                self.millisekunden(update.zeit),
+                self.millisekunden(update.eigenzeit)])
+            for verschachtelt in update.benachrichtigungen:
+                self.benachrichtigungEinfuegen(kind, verschachtelt)
+
+    def aktionHinzufuegen(self, aktion):
+        """Zeigt eine Aktion zuoberst an, redundante Updates rot"""
+        redundant = aktion.redundant()['updates']
+        item = QtWidgets.QTreeWidgetItem([
+            '{} ({} Benachrichtigungen)'.format(
+                aktion.name, aktion.anzahlBenachrichtigungen()),
+            str(aktion.anzahlUpdates()),
+            ', '.join('{} {}x'.format(name, anzahl)
+                      for name, anzahl in sorted(redundant.items())),
+            self.millisekunden(aktion.zeit()), ''])
+        if redundant:
+            item.setForeground(2, QtGui.QBrush(QtGui.QColor(200, 0, 0)))
+        for benachrichtigung in aktion.benachrichtigungen:
+            self.benachrichtigungEinfuegen(item, benachrichtigung)
+        self._baum.insertTopLevelItem(0, item)
+        while self._baum.topLevelItemCount() > self.MAX_AKTIONEN:
+            self._baum.takeTopLevelItem(self.MAX_AKTIONEN)
+        for spalte in range(len(self.SPALTEN)):
+            self._baum.resizeColumnToContents(spalte)
 
 class InfoTable:
     def __init__(self):
@@ -126,16 +439,69 @@ class InfoTable:
         self._getFuncs.append(valueFunc)
 
         item0 = QtGui.QStandardItem(name)
-        item1 = QtGui.QStandardItem(valueFunc())
+        item1 = QtGui.QStandardItem(str(valueFunc()))
         item1.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
         self.model.appendRow([item0,item1])
 
     def update(self):
         for i, func in enumerate(self._getFuncs):
-            self.model.item(i,1).setText(str(func()))
+            item = self.model.item(i,1)
+            text = str(func())
+            if item.text() != text:
+                item.setText(text)
+
+def speicherText(anzahlBytes):
+    """Formatiert eine Anzahl Bytes fuer die InfoTable"""
+    if anzahlBytes is None:
+        return '-'
+    return '{:.1f} MB'.format(anzahlBytes / 1024**2)
+
+def ladezeitText(ladezeiten):
+    """Formatiert die Ladezeiten fuer die InfoTable"""
+    if not ladezeiten:
+        return '-'
+    total = '{:.1f} s'.format(sum(ladezeiten.values()))
+    if len(ladezeiten) == 1:
+        return total
+    schritte = ', '.join(
+        '{} {:.1f} s'.format(name, sekunden)
+        for name, sekunden in ladezeiten.items())
+    return '{} ({})'.format(total, schritte)
+
+
+class LeistungenModel(QtCore.QAbstractListModel):
+    """Liste mit den Leistungen, die einen Suchtext enthalten
+
+    Das Model zeigt die Treffer einer LeistungsSuche an. Beim Filtern werden
+    nur die Positionen der Treffer ersetzt, die Texte werden erst gelesen,
+    wenn die Liste sie anzeigt.
+    """
+
+    def __init__(self, leistungsSuche):
+        super().__init__()
+        self._suche = leistungsSuche
+        self._treffer = leistungsSuche.suchen('')
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._treffer.size
 
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return self._suche.leistungen[self._treffer[index.row()]]
+
+    def setFilter(self, text):
+        """Zeigt nur noch die Leistungen an, die den Text enthalten"""
+        self.beginResetModel()
+        self._treffer = self._suche.suchen(text)
+        self.endResetModel()
 
 class Leistungswahldialog(QtWidgets.QDialog):
+    # Wartezeit nach einer Eingabe, bevor die Vorschlaege gefiltert werden
+    FILTER_VERZOEGERUNG_MS = 120
+
     def __init__(self, parent, excelDaten, typ):
         super().__init__(parent)
         self._uInterface = LeistungswahldialogUI.Ui_Dialog()
@@ -157,8 +523,12 @@ class Leistungswahldialog(QtWidgets.QDialog):
             self._radioButtons[typ].setChecked(True)
 
         self.ok = False
+        self._model = LeistungenModel(excelDaten.getLeistungsSuche())
+        self._uInterface.listView_Vorschlaege.setModel(self._model)
+        self._filterTimer = QtCore.QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(self.FILTER_VERZOEGERUNG_MS)
         self.setupSlots()
-        self.setupListView()
         self._neueLeistung.setFocus()
 
     def clickOnLeistung(self, index):
@@ -172,18 +542,17 @@ class Leistungswahldialog(QtWidgets.QDialog):
         self.okClicked()
 
     def setupListView(self):
-        filterLeistung = self._neueLeistung.text()
-        leistungen = self._excelDaten.getLeistungen(filterLeistung)
-        model = QtGui.QStandardItemModel()
-        for leistung in leistungen:
-            model.appendRow(QtGui.QStandardItem(leistung))
-        self._uInterface.listView_Vorschlaege.setModel(model)
+        """Filtert die Vorschlaege mit dem Text im Textfeld"""
+        self._filterTimer.stop()
+        self._model.setFilter(self._neueLeistung.text())
 
     def setupSlots(self):
         uInter = self._uInterface
         uInter.buttonBox.accepted.connect(self.okClicked)
         uInter.buttonBox.rejected.connect(self.cancelClicked)
-        self._neueLeistung.textEdited.connect(self.setupListView)
+        self._neueLeistung.textEdited.connect(
+                lambda _: self._filterTimer.start())
+        self._filterTimer.timeout.connect(self.setupListView)
         uInter.listView_Vorschlaege.clicked.connect(self.clickOnLeistung)
         uInter.listView_Vorschlaege.doubleClicked.connect(self.doubleClickOnLeistung)
 
@@ -206,6 +575,184 @@ class Leistungswahldialog(QtWidgets.QDialog):
         values = rows or [self._neueLeistung.text()]
         return values, typ, self.ok
 
+class LazyTableModel(QtCore.QAbstractTableModel):
+    """Tabelle, deren Zeilen erst beim Scrollen an die View gegeben werden
+
+    Unterklassen geben die Werte mit wert(zeile, spalte) zurueck und setzen
+    die Anzahl Zeilen mit setAnzahl.
+    """
+
+    ZEILEN_PRO_SCHRITT = 1000
+
+    def __init__(self, spalten):
+        super().__init__()
+        self._spalten = spalten
+        self._anzahl = 0
+        self._geladen = 0
+
+    def setAnzahl(self, anzahl):
+        """Setzt die Anzahl Zeilen und laedt den ersten Schritt"""
+        self.beginResetModel()
+        self._anzahl = anzahl
+        self._geladen = min(anzahl, self.ZEILEN_PRO_SCHRITT)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._geladen
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._spalten)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._spalten[section]
+        return None
+
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return self._geladen < self._anzahl
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        neu = min(self.ZEILEN_PRO_SCHRITT, self._anzahl - self._geladen)
+        if neu <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             self._geladen, self._geladen + neu - 1)
+        self._geladen += neu
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return self.wert(index.row(), index.column())
+
+    def wert(self, zeile, spalte):
+        raise NotImplementedError
+
+class PaketTableModel(LazyTableModel):
+    """Tabelle mit einer Zeile pro Paket
+
+    Die Pakete werden einmal mit paketIndizes gruppiert. Die Reihenfolge nach
+    paketID und nach Anzahl wird im Voraus berechnet, die nach Kategorie und
+    Leistungen beim ersten Sortieren. Danach wird nur die Reihenfolge
+    gewechselt.
+    """
+
+    SPALTEN = ['paketID', 'Anzahl', 'Kategorie', 'Leistungen']
+
+    def __init__(self, daten, kategorien):
+        super().__init__(self.SPALTEN)
+        indizes = paketIndizes(daten)
+        self._zeilen = indizes['paketZeilen']
+        self._grenzen = indizes['paketGrenzen']
+        self._ids = indizes['paketIDs']
+        self._anzahlFaelle = indizes['paketAnzahl']
+        self._keys = daten['key'].values[self._zeilen[self._grenzen[:-1]]]
+        self._kategorien = list(kategorien)
+
+        anzahlPakete = self._ids.size
+        self._reihenfolgen = {
+            0: np.arange(anzahlPakete),
+            1: np.lexsort((self._ids, self._anzahlFaelle)),
+            }
+        self._reihenfolge = self._reihenfolgen[0]
+        self.setAnzahl(anzahlPakete)
+
+    @property
+    def anzahlPakete(self):
+        return self._ids.size
+
+    def sort(self, spalte, order=QtCore.Qt.AscendingOrder):
+        """Ueberschrieben von QAbstractTableModel"""
+        if spalte not in self._reihenfolgen:
+            if spalte == 2:
+                werte = np.empty(self._keys.size, dtype=object)
+                werte[:] = [getKategorie(key, self._kategorien)
+                            for key in self._keys]
+            else:
+                werte = self._keys
+            self._reihenfolgen[spalte] = np.argsort(werte, kind='mergesort')
+        reihenfolge = self._reihenfolgen[spalte]
+        if order == QtCore.Qt.DescendingOrder:
+            reihenfolge = reihenfolge[::-1]
+        self._reihenfolge = reihenfolge
+        self.setAnzahl(self.anzahlPakete)
+
+    def wert(self, zeile, spalte):
+        paket = self._reihenfolge[zeile]
+        if spalte == 0:
+            return int(self._ids[paket])
+        if spalte == 1:
+            return int(self._anzahlFaelle[paket])
+        if spalte == 2:
+            return getKategorie(self._keys[paket], self._kategorien)
+        return self._keys[paket]
+
+    def paketZeilen(self, zeile):
+        """Gibt die Zeilen der Daten zurueck, die zum Paket gehoeren"""
+        paket = self._reihenfolge[zeile]
+        return self._zeilen[self._grenzen[paket]:self._grenzen[paket + 1]]
+
+class FallTableModel(LazyTableModel):
+    """Tabelle mit den Zeilen der Daten, die zu einem Paket gehoeren"""
+
+    SPALTEN = ['FallNr', 'Datumsfeld', 'Tarifgruppe', 'Leistung']
+
+    def __init__(self, daten):
+        super().__init__(self.SPALTEN)
+        self._werte = [daten[spalte].values for spalte in self.SPALTEN]
+        self._zeilen = np.array([], dtype=np.int64)
+
+    def setZeilen(self, zeilen):
+        """Zeigt die angegebenen Zeilen der Daten an"""
+        self._zeilen = zeilen
+        self.setAnzahl(zeilen.size)
+
+    def wert(self, zeile, spalte):
+        wert = self._werte[spalte][self._zeilen[zeile]]
+        if pd.isna(wert):
+            return ''
+        if spalte == 1:
+            return pd.Timestamp(wert).strftime('%d.%m.%Y')
+        return str(wert)
+
+class PaketbrowserDialog(QtWidgets.QDialog):
+    """Zeigt die Pakete an, mit den Falldaten des ausgewaehlten Pakets"""
+
+    def __init__(self, parent, excelDaten):
+        super().__init__(parent)
+        self._uInterface = Paketbrowser.Ui_Dialog()
+        self._uInterface.setupUi(self)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        daten = excelDaten.dataframe
+        self._paketModel = PaketTableModel(daten, excelDaten.getKategorien())
+        self._fallModel = FallTableModel(daten)
+
+        pakete = self._uInterface.tableView_Pakete
+        pakete.setModel(self._paketModel)
+        pakete.sortByColumn(1, QtCore.Qt.DescendingOrder)
+        pakete.selectionModel().currentRowChanged.connect(self.showFaelle)
+        self._uInterface.tableView_Faelle.setModel(self._fallModel)
+        self._uInterface.label_Pakete.setText(
+            "{} Pakete".format(self._paketModel.anzahlPakete))
+
+    def showFaelle(self, current, previous):
+        """Zeigt die Falldaten des ausgewaehlten Pakets an"""
+        if not current.isValid():
+            return
+        zeilen = self._paketModel.paketZeilen(current.row())
+        self._fallModel.setZeilen(zeilen)
+        self._uInterface.label_Faelle.setText(
+            "Falldaten des Pakets ({} Zeilen)".format(zeilen.size))
+
 class KategorieModel(QtCore.QObject):
     neueKategorie = QtCore.pyqtSignal()
     """Schreibt die Kategorien in die Liste"""
@@ -265,6 +812,15 @@ class RegelListe(QtCore.QAbstractListModel):
         self._redBrush = QtGui.QBrush()
         self._redBrush.setColor(QtGui.QColor(255,150,150))
 
+        # Die Bedingungslisten behalten ihr Model, es werden nur Zeilen
+        # eingefuegt und geloescht
+        self._bedingungsModels = {}
+        for typ, view in listViews.items():
+            self._bedingungsModels[typ] = QtGui.QStandardItemModel()
+            view.setModel(self._bedingungsModels[typ])
+        self._angezeigteRegel = None
+        self._angezeigteLeistungen = None
+
         self._regelListView.setModel(self)
         self._regelListView.installEventFilter(self)
         self._regelListView.selectionModel().currentChanged.connect(
@@ -290,21 +846,54 @@ class RegelListe(QtCore.QAbstractListModel):
         self._regeln.setAktiv(current.row())
 
     def update(self):
-        """Updated die Bedingungslisten"""
-        if self._regeln._aktiveRegel:
-            bedingungen = self._regeln._aktiveRegel.getDict()
-            for typ in [Regel.UND, Regel.ODER, Regel.NICHT]:
-                model = QtGui.QStandardItemModel()
-                for leistung in bedingungen[typ]:
-                    item = QtGui.QStandardItem(leistung)
-                    if not self._excelDaten.checkItem(leistung):
-                        item.setForeground(self._redBrush)
-                    model.appendRow(item)
-                self._bedingungsListViews[typ].setModel(model)
+        """Updated die Bedingungslisten
+
+        Ist die gleiche Regel aktiv wie beim letzten Update, werden nur die
+        geaenderten Zeilen eingefuegt oder geloescht. Die Markierung der
+        Leistungen, die nicht in den Daten sind, wird nur bei neuen Daten fuer
+        alle Zeilen neu berechnet.
+        """
+        regel = self._regeln.getAktiv()
+        leistungen = self._excelDaten.getLeistungenSet()
+        neueRegel = regel is not self._angezeigteRegel
+        neueDaten = leistungen is not self._angezeigteLeistungen
+        self._angezeigteRegel = regel
+        self._angezeigteLeistungen = leistungen
+
+        for typ, model in self._bedingungsModels.items():
+            bedingungen = regel.getLeistungen(typ) if regel else []
+            if neueRegel:
+                model.removeRows(0, model.rowCount())
+                self.bedingungenEinfuegen(model, 0, bedingungen)
+                continue
+
+            angezeigt = [model.item(i).text() for i in range(model.rowCount())]
+            matcher = difflib.SequenceMatcher(None, angezeigt, bedingungen,
+                                              autojunk=False)
+            # Von hinten, damit die Zeilennummern davor gueltig bleiben
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                model.removeRows(i1, i2 - i1)
+                self.bedingungenEinfuegen(model, i1, bedingungen[j1:j2])
+
+            if neueDaten:
+                for i in range(model.rowCount()):
+                    self.markieren(model.item(i))
+
+    def bedingungenEinfuegen(self, model, zeile, bedingungen):
+        """Fuegt Leistungen ab der Zeile in eine Bedingungsliste ein"""
+        for i, leistung in enumerate(bedingungen):
+            item = QtGui.QStandardItem(leistung)
+            self.markieren(item)
+            model.insertRow(zeile + i, item)
+
+    def markieren(self, item):
+        """Markiert eine Leistung rot, wenn sie nicht in den Daten ist"""
+        if self._excelDaten.checkItem(item.text()):
+            item.setData(None, QtCore.Qt.ForegroundRole)
         else:
-            for typ in [Regel.UND, Regel.ODER, Regel.NICHT]:
-                model = QtGui.QStandardItemModel()
-                self._bedingungsListViews[typ].setModel(model)
+            item.setForeground(self._redBrush)
 
 
     def addRegel(self, name):
@@ -367,27 +956,25 @@ class RegelListe(QtCore.QAbstractListModel):
         self.update()
 
     def loadRegelnFromFile(self, filename):
-        try:
-            regelnDF = pd.read_excel(filename, dtype=object)
-            regeln = []
-            for name, lists in regelnDF.groupby('Name'):
-                neueRegel = Regel(name, self._regeln._excelDaten)
-                for leistung in lists['UND'].dropna().values:
-                    neueRegel.addLeistung(str(leistung), Regel.UND)
-                for leistung in lists['ODER'].dropna().values:
-                    neueRegel.addLeistung(str(leistung), Regel.ODER)
-                for leistung in lists['NICHT'].dropna().values:
-                    neueRegel.addLeistung(str(leistung), Regel.NICHT)
-                regeln.append(neueRegel)
-
-            self.clearRegeln()
-            self.beginInsertRows(QtCore.QModelIndex(), 0, len(regeln))
-            self._regeln.regeln = regeln
-            self.endInsertRows()
-        except AttributeError:
-            raise UIError("Fehler beim Laden der Regeln, ungültiges File")
-        except KeyError:
-            raise UIError("Fehler beim Laden der Regeln, ungültiges File")
+        """Laedt die Regeln aus einem JSON oder Excel"""
+        self.setRegeln(regelnLaden(filename))
+
+    def setRegeln(self, definitionen):
+        """Ersetzt alle Regeln
+
+        :definitionen: Liste mit Dicts mit den Eintraegen Name, UND, ODER
+        und NICHT
+        """
+        regeln = regelnErstellen(definitionen, self._excelDaten,
+                                 auswerten=False)
+        self.beginResetModel()
+        self._regeln.setRegeln(regeln, auswerten=True)
+        self.endResetModel()
+
+    def setHintergrund(self, hintergrund):
+        """Setzt die Auswertung im Hintergrund, siehe
+        Regeln.setHintergrund"""
+        self._regeln.setHintergrund(hintergrund)
 
     def saveRegelnToFile(self, fileName):
         """Speichert die Regeln in ein File"""
@@ -408,12 +995,22 @@ class RegelListe(QtCore.QAbstractListModel):
         """Gibt die Bedingungsliste zurueck"""
         return self._regeln.getBedingungsliste()
 
+    def getDefinitionen(self):
+        """Gibt die Definitionen der Regeln zurueck, siehe
+        Regeln.getDefinitionen"""
+        return self._regeln.getDefinitionen()
+
 
 class TarmedPaketManagerApp(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
 
-        self._workerThread = None
+        self._paketbrowser = None
+        self._scheduler = JobScheduler()
+        # True, wenn das Fenster schliessen soll, sobald alle Jobs fertig sind
+        self._schliessen = False
+        # Job -> (JobSignal, Funktion, die mit dem Resultat aufgerufen wird)
+        self._jobs = {}
 
         self.uInterface = MainWindow.Ui_MainWindow()
         self.uInterface.setupUi(self)
@@ -430,6 +1027,7 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
 
         self._regelListe = RegelListe(self.uInterface.listView_regeln, 
             self._excelDaten, listViews)
+        self._regelListe.setHintergrund(self.regelnImHintergrund)
 
         self._kategorieModel = KategorieModel(self._excelDaten, 
                 self.uInterface.listView_kategorien)
@@ -437,10 +1035,27 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         self._infoTable = InfoTable()
         self.uInterface.infoTableView.setModel(self._infoTable.model)
 
+        self._jobAnzeige = JobAnzeige(self)
+        self.uInterface.statusbar.addPermanentWidget(self._jobAnzeige)
+
+        self._protokollOrdner = protokollOrdner()
+        self._messungPanel = MessungPanel(
+            self, self._protokollOrdner / MESSUNG_PROTOKOLL)
+        self.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self._messungPanel)
+        self._messungPanel.hide()
+        self._verfolgung = None
+        self._verfolgungPanel = VerfolgungPanel(
+            self, self._protokollOrdner / VERFOLGUNG_PROTOKOLL)
+        self.addDockWidget(QtCore.Qt.BottomDockWidgetArea,
+                           self._verfolgungPanel)
+        self._verfolgungPanel.hide()
+
         self.setupSlots()
         self.setupInfoTable()
 
         self.show()
+        # pandas und numpy erst importieren, wenn das Fenster angezeigt wird
+        QtCore.QTimer.singleShot(0, vorladen)
 
     def setupInfoTable(self):
         """Baut die InfoTable auf"""
@@ -454,10 +1069,19 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         # Rows
         tableInfo = self._infoTable
         tableInfo.addInfo('Aktuelles Excel', self.getExcelName)
+        statistik = self._excelDaten.getStatistik
+        tableInfo.addInfo('Anzahl Zeilen',
+                lambda : statistik()['anzahlZeilen'] or '-')
         tableInfo.addInfo('Anzahl Falldaten',
-                lambda : self._excelDaten.getAnzahlFalldaten() or '-')
+                lambda : statistik()['anzahlFalldaten'] or '-')
         tableInfo.addInfo('Anzahl verschiedene Leistungen', 
-                lambda : len(self._excelDaten.getLeistungen()) or '-')
+                lambda : statistik()['anzahlLeistungen'] or '-')
+        tableInfo.addInfo('Anzahl Pakete',
+                lambda : statistik()['anzahlPakete'] or '-')
+        tableInfo.addInfo('Speicherbedarf',
+                lambda : speicherText(statistik()['speicher']))
+        tableInfo.addInfo('Ladezeit',
+                lambda : ladezeitText(statistik()['ladezeiten']))
         tableInfo.addInfo('Anzahl Falldaten in aktiver Regel', 
                 self._regelListe.getErfuelltAktiveRegel)
 
@@ -468,6 +1092,14 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         """Definiert die slot Funktionen der Menu Eintraege"""
         uInter = self.uInterface
         uInter.actionRohdaten_laden.triggered.connect(self.openExcel)
+        uInter.actionProjekt_oeffnen.triggered.connect(self.openProjekt)
+        uInter.actionProjekt_speichern.triggered.connect(self.saveProjekt)
+        uInter.actionPakete_anzeigen.triggered.connect(self.showPakete)
+        uInter.actionDienst_verbinden.triggered.connect(self.connectDienst)
+        uInter.actionLaufzeiten_messen.toggled.connect(
+            self._messungPanel.setVisible)
+        uInter.actionBenachrichtigungen_verfolgen.toggled.connect(
+            self.verfolgen)
         uInter.actionNeue_Kategorie.triggered.connect(self.addKategorie)
         uInter.actionKategorien_l_schen.triggered.connect(self._excelDaten.clearKategorien)
         uInter.actionNeue_Regel.triggered.connect(self.addRegel)
@@ -488,6 +1120,149 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         """Oeffnet den UeberDialog"""
         UeberDialog.show(self)
 
+    def showPakete(self):
+        """Oeffnet den Paketbrowser"""
+        if self._excelDaten.dataframe is None:
+            errMsg = "Keine Daten vorhanden"
+            box = QtWidgets.QMessageBox.warning(self, "Warnung", errMsg,
+                QtWidgets.QMessageBox.Ok,)
+            return
+        self.closePaketbrowser()
+        self._paketbrowser = PaketbrowserDialog(self, self._excelDaten)
+        self._paketbrowser.finished.connect(self.paketbrowserClosed)
+        self._paketbrowser.show()
+
+    def closePaketbrowser(self):
+        """Schliesst den Paketbrowser, z.B. wenn neue Daten geladen werden"""
+        if self._paketbrowser is not None:
+            self._paketbrowser.close()
+
+    def paketbrowserClosed(self):
+        """Vergisst den Paketbrowser, wenn er geschlossen wurde"""
+        self._paketbrowser = None
+
+    def jobStarten(self, name, funktion, *args, fertig=None, gruppe=None):
+        """Startet eine Funktion als Job im Hintergrund
+
+        :name: Name fuer die Anzeige in der Statusleiste
+        :funktion: Funktion, die als funktion(job, *args) aufgerufen wird
+        :fertig: Optional, wird im GUI Thread mit dem Resultat aufgerufen
+        :gruppe: Optional, Jobs der gleichen Gruppe laufen nacheinander
+        :returns: Job Objekt
+        """
+        messung = None
+        if self.uInterface.actionLaufzeiten_messen.isChecked():
+            messung = Messung(name, self.protokollDatei(MESSUNG_PROTOKOLL))
+        job = Job(name, funktion, *args, gruppe=gruppe, messung=messung)
+        signal = JobSignal(job)
+        signal.geaendert.connect(self.jobGeaendert)
+        self._jobs[job] = (signal, fertig)
+        self._jobAnzeige.jobHinzufuegen(job)
+        return self._scheduler.starten(job)
+
+    def jobGeaendert(self, job):
+        """Aktualisiert die Anzeige eines Jobs und ruft nach dem Ende die
+        fertig Funktion auf"""
+        if job not in self._jobs:
+            return
+        if not job.istFertig():
+            self._jobAnzeige.jobAktualisieren(job)
+            return
+
+        _, fertig = self._jobs.pop(job)
+        self._jobAnzeige.jobEntfernen(job)
+        if self._schliessen:
+            if not self._jobs:
+                self.close()
+            return
+        if job.messung is not None and job.messung.zeit is not None:
+            # Nicht gestartete Jobs haben keine Messung
+            self._messungPanel.messungHinzufuegen(job.messung)
+            self._messungPanel.show()
+        if job.status == Job.FERTIG:
+            if fertig is not None:
+                fertig(job.resultat)
+        elif job.status == Job.FEHLER:
+            QtWidgets.QMessageBox.warning(self, "Warnung",
+                "{}: {}".format(job.name, job.fehler),
+                QtWidgets.QMessageBox.Ok,)
+        else:
+            self.uInterface.statusbar.showMessage(
+                "{} abgebrochen".format(job.name), 5000)
+
+    def protokollDatei(self, name):
+        """Erstellt den Ordner der Protokolle, siehe protokollOrdner
+
+        :name: Name der Datei im Ordner
+        :returns: Dateiname des Protokolls oder None, wenn der Ordner nicht
+        erstellt werden kann
+        """
+        try:
+            self._protokollOrdner.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        return self._protokollOrdner / name
+
+    def verfolgen(self, aktiv):
+        """Startet oder beendet die Verfolgung der Benachrichtigungen, siehe
+        Verfolgung. Jeder Klick ist eine Aktion, sie endet, sobald die
+        Ereignisschleife wieder laeuft."""
+        if not aktiv:
+            if self._verfolgung is not None:
+                self._verfolgung.beenden()
+                self._verfolgung = None
+            return
+        verfolgung = Verfolgung(self.protokollDatei(VERFOLGUNG_PROTOKOLL))
+        verfolgung.aktionGeoeffnet = lambda: QtCore.QTimer.singleShot(
+            0, verfolgung.aktionBeenden)
+        verfolgung.aktionBeendet = self._verfolgungPanel.aktionHinzufuegen
+        verfolgung.starten()
+        self._verfolgung = verfolgung
+        self._verfolgungPanel.show()
+
+    def closeEvent(self, event):
+        """Bricht beim Schliessen alle laufenden Jobs ab
+
+        Jobs in einem langen Aufruf, z.B. pd.read_excel oder einer Abfrage an
+        einen Dienst, koennen nicht sofort abgebrochen werden. Laufen sie
+        nach einer kurzen Wartezeit noch, kann der Benutzer warten, das
+        Fenster schliesst sich dann, sobald sie fertig sind, oder das
+        Programm sofort beenden.
+        """
+        self._scheduler.alleAbbrechen()
+        frist = time.monotonic() + SCHLIESSEN_WARTEZEIT
+        jobs = self._scheduler.getJobs()
+        while jobs and jobs[0].warten(max(0, frist - time.monotonic())):
+            jobs = self._scheduler.getJobs()
+        if jobs and not self._schliessen:
+            frage = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Question,
+                "Beenden", "Diese Jobs laufen noch und können erst nach "
+                "dem aktuellen Schritt abgebrochen werden:\n\n{}\n\n"
+                "Sofort beenden? Teilweise geschriebene Exporte bleiben "
+                "dann liegen.".format('\n'.join(job.name for job in jobs)),
+                parent=self)
+            warten = frage.addButton("Warten",
+                                     QtWidgets.QMessageBox.RejectRole)
+            sofort = frage.addButton("Sofort beenden",
+                                     QtWidgets.QMessageBox.DestructiveRole)
+            frage.setDefaultButton(warten)
+            frage.exec_()
+            if frage.clickedButton() != sofort:
+                self._schliessen = True
+                self.uInterface.statusbar.showMessage(
+                    "Wird geschlossen, sobald die Jobs fertig sind")
+            else:
+                self.verfolgen(False)
+                # Der Threadpool wartet beim Beenden von Python auf die
+                # laufenden Jobs
+                os._exit(0)
+        if jobs:
+            event.ignore()
+            return
+        self._scheduler.beenden()
+        self.verfolgen(False)
+        super().closeEvent(event)
+
     def getExcelName(self):
         """Gibt den Namen des aktuellen Excels zurueck
         :returns: Name des aktuellen Excels
@@ -520,18 +1295,20 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
 
         options = QtWidgets.QFileDialog.Options()
         options |= QtWidgets.QFileDialog.DontUseNativeDialog
-        fileName, _ = QtWidgets.QFileDialog.getSaveFileName(
+        fileName, dateiFilter = QtWidgets.QFileDialog.getSaveFileName(
             self,
-            "Excel speichern",
-            "","Excel Files (*.xlsx *.xls)",
+            "Pakete exportieren",
+            "", PAKET_EXPORT_FILTER,
             options=options
         )
         if fileName:
-            if not fileName.endswith('.xls'):
-                fileName = pathlib.Path(fileName).with_suffix('.xlsx')
-            self._workerThread = ExcelPaketWriter(self, fileName, self._excelDaten)
-            self._workerThread.signal.connect(self.finishWrite)
-            self.disableWindow()
+            fileName = exportDateiname(fileName, dateiFilter)
+            faerben = self.uInterface.actionZeilen_faerben.isChecked()
+            proKategorie = self.uInterface.actionDatei_pro_Kategorie.isChecked()
+            self.jobStarten("Pakete exportieren", paketeSchreiben, fileName,
+                self._excelDaten.getDatensatz(),
+                self._regelListe.getDefinitionen(), faerben, proKategorie,
+                fertig=self.finishWrite)
 
     def writeRegelExcel(self):
         """Schreibt die Bedingungen in ein Excel"""
@@ -543,19 +1320,22 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
 
         options = QtWidgets.QFileDialog.Options()
         options |= QtWidgets.QFileDialog.DontUseNativeDialog
-        fileName, _ = QtWidgets.QFileDialog.getSaveFileName(
+        fileName, dateiFilter = QtWidgets.QFileDialog.getSaveFileName(
             self,
-            "Excel speichern",
-            "","Excel Files (*.xlsx *.xls)",
+            "Regeln exportieren",
+            "", EXPORT_FILTER,
             options=options
         )
         if fileName:
-            path = pathlib.Path(fileName)
-            if not path.suffix in ['.xls', 'xlsx']:
-                path = path.with_suffix('.xlsx')
-            self._workerThread = ExcelRegelWriter(self, path, self._regelListe)
-            self._workerThread.signal.connect(self.finishWrite)
-            self.disableWindow()
+            path = exportDateiname(fileName, dateiFilter)
+            definitionen = self._regelListe.getDefinitionen()
+            if not definitionen:
+                QtWidgets.QMessageBox.warning(self, "Warnung",
+                    "Keine Regeln vorhanden", QtWidgets.QMessageBox.Ok,)
+                return
+            self.jobStarten("Regeln exportieren", bedingungenSchreiben, path,
+                self._excelDaten.getDatensatz(), definitionen,
+                fertig=self.finishWrite)
 
     def finishWrite(self, result):
         """Funktion, die nach dem Schreiben einer Datei aufgerufen wird
@@ -573,23 +1353,22 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
             except AttributeError: # os.startfile gibt es in Linux nicht
                 pass
 
-        self._workerThread = None
-        self.enableWindow()
-
     def writeRegeln(self):
         """Schreibt die Regeln"""
         options = QtWidgets.QFileDialog.Options()
         options |= QtWidgets.QFileDialog.DontUseNativeDialog
-        fileName, _ = QtWidgets.QFileDialog.getSaveFileName(
+        fileName, dateiFilter = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Speichern unter",
-            "","Excel Files (*.xlsx *.xls)",
+            "", REGEL_FILTER,
             options=options
         )
         if fileName:
             try:
                 path = pathlib.Path(fileName)
-                if not '.xls' in path.suffix:
+                if REGEL_ENDUNG in dateiFilter or path.suffix == REGEL_ENDUNG:
+                    path = path.with_suffix(REGEL_ENDUNG)
+                elif not '.xls' in path.suffix:
                     path = path.with_suffix('.xlsx')
                 self._regelListe.saveRegelnToFile(path)
             except RuntimeError as error:
@@ -605,7 +1384,7 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         fileName, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Regeln laden",
-            "","Excel Files (*.xlsx *.xls)",
+            "","Regeln (*{} *.xlsx *.xls)".format(REGEL_ENDUNG),
             options=options
         )
         if fileName:
@@ -641,14 +1420,122 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         fileName, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Rohdaten laden",
-            "","Excel oder CSV Files (*.xlsx *.xls *.csv)",
+            "","Rohdaten (*.xlsx *.xls *.csv *.parquet)",
+            options=options
+        )
+        if fileName:
+            excelName = pathlib.Path(fileName).stem
+            def fertig(result):
+                if result['success']:
+                    self._excelName = excelName
+                self.finishReadExcel(result)
+            self.jobStarten("Rohdaten laden", excelLesen, fileName,
+                fertig=fertig, gruppe='daten')
+
+    def openProjekt(self):
+        """Oeffnet ein gespeichertes Projekt"""
+        options = QtWidgets.QFileDialog.Options()
+        options |= QtWidgets.QFileDialog.DontUseNativeDialog
+        fileName, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "Projekt öffnen",
+            "","Projekte (*{})".format(PROJEKT_ENDUNG),
+            options=options
+        )
+        if fileName:
+            self.jobStarten("Projekt laden", projektLesen, fileName,
+                fertig=self.finishReadProjekt, gruppe='daten')
+
+    def finishReadProjekt(self, result):
+        """Funktion, die nach dem Laden eines Projekts aufgerufen wird
+
+        :result: Dict mit dem Signal des Thread
+        """
+        if result['success']:
+            self._excelName = result['excelName']
+        self.finishReadExcel(result)
+        if result['success']:
+            self._regelListe.setRegeln(result['regeln'])
+
+    def saveProjekt(self):
+        """Speichert Daten, Kategorien und Regeln als Projekt"""
+        if self._excelDaten.dataframe is None:
+            errMsg = "Keine Daten vorhanden"
+            box = QtWidgets.QMessageBox.warning(self, "Warnung", errMsg,
+                QtWidgets.QMessageBox.Ok,)
+            return
+
+        options = QtWidgets.QFileDialog.Options()
+        options |= QtWidgets.QFileDialog.DontUseNativeDialog
+        fileName, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Projekt speichern",
+            "","Projekte (*{})".format(PROJEKT_ENDUNG),
             options=options
         )
         if fileName:
-            self._workerThread = ExcelReader(self, fileName)
-            self._workerThread.signal.connect(self.finishReadExcel)
-            self.disableWindow()
-            self._excelName = pathlib.Path(fileName).stem
+            path = pathlib.Path(fileName).with_suffix(PROJEKT_ENDUNG)
+            self.jobStarten("Projekt speichern", projektSchreiben, path,
+                self._excelDaten.getDatensatz(),
+                self._regelListe.getDefinitionen(), self._excelName,
+                fertig=self.finishSaveProjekt)
+
+    def finishSaveProjekt(self, result):
+        """Funktion, die nach dem Speichern eines Projekts aufgerufen wird
+
+        :result: Dict, das vom Writer zurueck gegeben wird
+        """
+        if not result['success']:
+            errMsg = result.get('errMsg', 'Es ist ein Fehler aufgetreten')
+            QtWidgets.QMessageBox.warning(
+                self, "Warnung", errMsg, QtWidgets.QMessageBox.Ok,
+                )
+
+    def connectDienst(self):
+        """Verwendet die Daten eines laufenden Abfragedienstes, siehe Dienst.
+        Regeln werden dann vom Dienst ausgewertet."""
+        # Dienst importiert asyncio und urllib, erst wenn es gebraucht wird
+        from .Dienst import DIENST_HOST, DIENST_PORT
+        url, ok = QtWidgets.QInputDialog.getText(self, "Mit Dienst verbinden",
+            "Adresse des Dienstes:", QtWidgets.QLineEdit.Normal,
+            "http://{}:{}".format(DIENST_HOST, DIENST_PORT))
+        if ok and url:
+            self.jobStarten("Mit Dienst verbinden", dienstVerbinden, url,
+                fertig=self.finishConnectDienst, gruppe='daten')
+
+    def finishConnectDienst(self, result):
+        """Funktion, die nach dem Verbinden mit einem Dienst aufgerufen wird
+
+        :result: Dict, das vom Job zurueck gegeben wird
+        """
+        if not result['success']:
+            QtWidgets.QMessageBox.warning(self, "Warnung",
+                result.get('errMsg', 'Es ist ein Fehler aufgetreten'),
+                QtWidgets.QMessageBox.Ok,)
+            return
+        self.closePaketbrowser()
+        index = result['index']
+        self._excelName = result['url']
+        self._excelDaten.indexVerwenden(index)
+        self._excelDaten.setLadezeiten(result['ladezeiten'])
+        self._excelDaten.clearKategorien()
+        for kategorie in index.getKategorien():
+            self._excelDaten.addKategorie(kategorie)
+        self._infoTable.update()
+
+    def regelnImHintergrund(self, datensatz, bedingungen, fertig):
+        """Wertet Regeln als Job aus, damit die GUI nicht auf die Auswertung
+        oder das Netzwerk wartet, siehe Regeln.setHintergrund"""
+        def regelnFertig(result):
+            if not result['success']:
+                QtWidgets.QMessageBox.warning(self, "Warnung",
+                    result.get('errMsg', 'Es ist ein Fehler aufgetreten'),
+                    QtWidgets.QMessageBox.Ok,)
+                fertig(None)
+                return
+            fertig(result['regeln'])
+        self.jobStarten("Regeln auswerten", regelnBerechnenJob, datensatz,
+            bedingungen, fertig=regelnFertig, gruppe='regeln')
 
     def finishReadExcel(self, result):
         """ Funktion, die nach dem Lesen eines Excels aufgerufen wird
@@ -656,7 +1543,9 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
         :result: Dict mit dem Signal des Thread
         """
         if result['success']:
-            self._excelDaten.dataframe = result['data'][0]
+            self.closePaketbrowser()
+            self._excelDaten.datenSetzen(result['data'][0])
+            self._excelDaten.setLadezeiten(result.get('ladezeiten', {}))
             self._excelDaten.clearKategorien()
             kategorien = result['data'][1]
             if kategorien is not None:
@@ -673,17 +1562,6 @@ class TarmedPaketManagerApp(QtWidgets.QMainWindow):
                 )
 
         self._infoTable.update()
-        self.enableWindow()
-
-    def disableWindow(self):
-        """Schaltet das Fenster in den Wartemodus"""
-        QtWidgets.QApplication.setOverrideCursor(QtGui.QCursor(QtCore.Qt.WaitCursor))
-        self.setEnabled(False)
-
-    def enableWindow(self):
-        """Schaltet den Wartemodus aus"""
-        self.setEnabled(True)
-        QtWidgets.QApplication.restoreOverrideCursor()
 
 
 if __name__ == '__main__':
@@ -216,9 +216,43 @@ class Ui_MainWindow(object):
         self.actionRegeln_loeschen = QtWidgets.QAction(MainWindow)
         self.actionRegeln_loeschen.setIcon(icon4)
         self.actionRegeln_loeschen.setObjectName("actionRegeln_loeschen")
+        self.actionZeilen_faerben = QtWidgets.QAction(MainWindow)
+        self.actionZeilen_faerben.setCheckable(True)
+        self.actionZeilen_faerben.setChecked(True)
+        self.actionZeilen_faerben.setObjectName("actionZeilen_faerben")
+        self.actionDatei_pro_Kategorie = QtWidgets.QAction(MainWindow)
+        self.actionDatei_pro_Kategorie.setCheckable(True)
+        self.actionDatei_pro_Kategorie.setObjectName("actionDatei_pro_Kategorie")
+        self.actionProjekt_oeffnen = QtWidgets.QAction(MainWindow)
+        self.actionProjekt_oeffnen.setIcon(icon2)
+        self.actionProjekt_oeffnen.setObjectName("actionProjekt_oeffnen")
+        self.actionProjekt_speichern = QtWidgets.QAction(MainWindow)
+        self.actionProjekt_speichern.setIcon(icon3)
+        self.actionProjekt_speichern.setObjectName("actionProjekt_speichern")
+        self.actionPakete_anzeigen = QtWidgets.QAction(MainWindow)
+        self.actionPakete_anzeigen.setObjectName("actionPakete_anzeigen")
+        self.actionDienst_verbinden = QtWidgets.QAction(MainWindow)
+        self.actionDienst_verbinden.setObjectName("actionDienst_verbinden")
+        self.actionLaufzeiten_messen = QtWidgets.QAction(MainWindow)
+        self.actionLaufzeiten_messen.setCheckable(True)
+        self.actionLaufzeiten_messen.setObjectName("actionLaufzeiten_messen")
+        self.actionBenachrichtigungen_verfolgen = QtWidgets.QAction(MainWindow)
+        self.actionBenachrichtigungen_verfolgen.setCheckable(True)
+        self.actionBenachrichtigungen_verfolgen.setObjectName("actionBenachrichtigungen_verfolgen")
         self.menuRohdaten_laden.addAction(self.actionRohdaten_laden)
         self.menuRohdaten_laden.addSeparator()
+        self.menuRohdaten_laden.addAction(self.actionProjekt_oeffnen)
+        self.menuRohdaten_laden.addAction(self.actionProjekt_speichern)
+        self.menuRohdaten_laden.addSeparator()
+        self.menuRohdaten_laden.addAction(self.actionPakete_anzeigen)
+        self.menuRohdaten_laden.addAction(self.actionDienst_verbinden)
+        self.menuRohdaten_laden.addSeparator()
         self.menuRohdaten_laden.addAction(self.actionExcel_exportieren)
+        self.menuRohdaten_laden.addAction(self.actionZeilen_faerben)
+        self.menuRohdaten_laden.addAction(self.actionDatei_pro_Kategorie)
+        self.menuRohdaten_laden.addSeparator()
+        self.menuRohdaten_laden.addAction(self.actionLaufzeiten_messen)
+        self.menuRohdaten_laden.addAction(self.actionBenachrichtigungen_verfolgen)
         self.menuRohdaten_laden.addSeparator()
         self.menuRohdaten_laden.addAction(self.action_Exit)
         self.menuRegeln.addAction(self.actionNeue_Regel)
@@ -280,5 +314,21 @@ class Ui_MainWindow(object):
         self.actionNeue_Bedingung.setText(_translate("MainWindow", "Neue Bedingung"))
         self.actionNeue_Bedingung.setToolTip(_translate("MainWindow", "Neue Bedingung für die aktuelle Regel"))
         self.actionRegeln_loeschen.setText(_translate("MainWindow", "Regeln löschen"))
+        self.actionZeilen_faerben.setText(_translate("MainWindow", "Pakete im Excel &einfärben"))
+        self.actionZeilen_faerben.setToolTip(_translate("MainWindow", "Zeilen im exportierten Excel nach Paket abwechselnd grau einfärben"))
+        self.actionDatei_pro_Kategorie.setText(_translate("MainWindow", "Eine Excel-Datei pro &Kategorie"))
+        self.actionDatei_pro_Kategorie.setToolTip(_translate("MainWindow", "Jede Kategorie in ein eigenes Excel exportieren"))
+        self.actionProjekt_oeffnen.setText(_translate("MainWindow", "&Projekt öffnen"))
+        self.actionProjekt_oeffnen.setToolTip(_translate("MainWindow", "Gespeichertes Projekt mit Daten, Kategorien und Regeln öffnen"))
+        self.actionProjekt_speichern.setText(_translate("MainWindow", "Projekt s&peichern"))
+        self.actionProjekt_speichern.setToolTip(_translate("MainWindow", "Daten, Pakete, Kategorien und Regeln als Projekt speichern"))
+        self.actionPakete_anzeigen.setText(_translate("MainWindow", "P&akete anzeigen"))
+        self.actionPakete_anzeigen.setToolTip(_translate("MainWindow", "Berechnete Pakete und ihre Falldaten anzeigen"))
+        self.actionDienst_verbinden.setText(_translate("MainWindow", "Mit &Dienst verbinden..."))
+        self.actionDienst_verbinden.setToolTip(_translate("MainWindow", "Regeln auf den Daten eines laufenden Abfragedienstes auswerten"))
+        self.actionLaufzeiten_messen.setText(_translate("MainWindow", "&Laufzeiten messen"))
+        self.actionLaufzeiten_messen.setToolTip(_translate("MainWindow", "Zeit, CPU Zeit, Speicher und Zeilen pro Schritt messen und anzeigen"))
+        self.actionBenachrichtigungen_verfolgen.setText(_translate("MainWindow", "&Benachrichtigungen verfolgen"))
+        self.actionBenachrichtigungen_verfolgen.setToolTip(_translate("MainWindow", "Benachrichtigungen zwischen Daten, Regeln und Anzeige pro Aktion aufzeichnen und anzeigen"))
 
 import icons_rc
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'Paketbrowser.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(900, 650)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_Pakete = QtWidgets.QLabel(Dialog)
+        self.label_Pakete.setObjectName("label_Pakete")
+        self.verticalLayout.addWidget(self.label_Pakete)
+        self.splitter = QtWidgets.QSplitter(Dialog)
+        self.splitter.setOrientation(QtCore.Qt.Vertical)
+        self.splitter.setObjectName("splitter")
+        self.tableView_Pakete = QtWidgets.QTableView(self.splitter)
+        self.tableView_Pakete.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableView_Pakete.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tableView_Pakete.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableView_Pakete.setSortingEnabled(True)
+        self.tableView_Pakete.setObjectName("tableView_Pakete")
+        self.tableView_Pakete.horizontalHeader().setStretchLastSection(True)
+        self.tableView_Pakete.verticalHeader().setVisible(False)
+        self.layoutWidget = QtWidgets.QWidget(self.splitter)
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.verticalLayout_Faelle = QtWidgets.QVBoxLayout(self.layoutWidget)
+        self.verticalLayout_Faelle.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_Faelle.setObjectName("verticalLayout_Faelle")
+        self.label_Faelle = QtWidgets.QLabel(self.layoutWidget)
+        self.label_Faelle.setObjectName("label_Faelle")
+        self.verticalLayout_Faelle.addWidget(self.label_Faelle)
+        self.tableView_Faelle = QtWidgets.QTableView(self.layoutWidget)
+        self.tableView_Faelle.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableView_Faelle.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableView_Faelle.setObjectName("tableView_Faelle")
+        self.tableView_Faelle.horizontalHeader().setStretchLastSection(True)
+        self.tableView_Faelle.verticalHeader().setVisible(False)
+        self.verticalLayout_Faelle.addWidget(self.tableView_Faelle)
+        self.verticalLayout.addWidget(self.splitter)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Pakete"))
+        self.label_Pakete.setText(_translate("Dialog", "Pakete"))
+        self.label_Faelle.setText(_translate("Dialog", "Falldaten des Pakets"))
@@ -5,7 +5,12 @@ do
     pyuic5 $i -o ${i/.ui/.py}
 done
 
+# Die Icons werden als binaere Ressource (.rcc) geladen, icons_rc.py laedt
+# nur noch diese Datei
 for i in $(ls *qrc)
 do
-    pyrcc5 $i -o ${i/.qrc/_rc.py}
+    temp=$(mktemp --suffix=_rc.py)
+    pyrcc5 $i -o $temp
+    python rccErstellen.py $temp ${i/.qrc/.rcc}
+    rm $temp
 done
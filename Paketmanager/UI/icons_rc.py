@@ -1,7994 +1,20 @@
 # -*- coding: utf-8 -*-
 
-# Resource object code
+# Laedt die Icons aus der binaeren Ressource icons.rcc
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.2)
-#
-# WARNING! All changes made in this file will be lost!
+# icons.rcc wird von convertUIFiles.sh aus icons.qrc erstellt. Qt mappt die
+# Datei nur, die Icons werden erst gelesen, wenn sie angezeigt werden. Das
+# ist viel schneller als der Import der Python Datei von pyrcc5.
 
+import os
 from PyQt5 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x02\x0c\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x38\x20\x30\x2e\x37\x32\x32\x36\x35\x36\x32\x35\
-\x20\x4c\x20\x33\x2e\x36\x31\x37\x31\x38\x37\x35\x20\x37\x2e\x30\
-\x32\x39\x32\x39\x36\x39\x20\x4c\x20\x35\x2e\x39\x39\x32\x31\x38\
-\x37\x35\x20\x37\x2e\x30\x32\x39\x32\x39\x36\x39\x20\x4c\x20\x36\
-\x2e\x30\x30\x31\x39\x35\x33\x31\x20\x31\x33\x20\x4c\x20\x31\x30\
-\x20\x31\x33\x20\x4c\x20\x39\x2e\x39\x39\x30\x32\x33\x34\x34\x20\
-\x37\x2e\x30\x32\x39\x32\x39\x36\x39\x20\x4c\x20\x31\x32\x2e\x33\
-\x33\x32\x30\x33\x31\x20\x37\x2e\x30\x32\x39\x32\x39\x36\x39\x20\
-\x4c\x20\x38\x20\x30\x2e\x37\x32\x32\x36\x35\x36\x32\x35\x20\x7a\
-\x20\x4d\x20\x31\x20\x31\x34\x2e\x30\x33\x31\x32\x35\x20\x4c\x20\
-\x31\x20\x31\x36\x20\x4c\x20\x31\x35\x2e\x30\x30\x35\x38\x35\x39\
-\x20\x31\x36\x20\x4c\x20\x31\x35\x20\x31\x34\x2e\x30\x33\x31\x32\
-\x35\x20\x4c\x20\x31\x20\x31\x34\x2e\x30\x33\x31\x32\x35\x20\x7a\
-\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\xcc\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x33\x20\x31\x20\x43\x20\x31\x2e\x38\x39\x32\x20\
-\x30\x2e\x39\x39\x39\x39\x38\x20\x31\x20\x31\x2e\x38\x39\x32\x20\
-\x31\x20\x33\x20\x4c\x20\x31\x20\x35\x2e\x39\x39\x34\x31\x34\x30\
-\x36\x20\x4c\x20\x33\x20\x36\x20\x4c\x20\x33\x20\x33\x20\x4c\x20\
-\x31\x33\x20\x33\x20\x4c\x20\x31\x33\x20\x31\x33\x20\x4c\x20\x33\
-\x20\x31\x33\x20\x4c\x20\x33\x20\x31\x30\x20\x4c\x20\x31\x20\x39\
-\x2e\x39\x39\x34\x31\x34\x30\x36\x20\x4c\x20\x31\x20\x31\x33\x20\
-\x43\x20\x31\x20\x31\x34\x2e\x31\x30\x38\x20\x31\x2e\x38\x39\x32\
-\x20\x31\x35\x20\x33\x20\x31\x35\x20\x4c\x20\x31\x33\x20\x31\x35\
-\x20\x43\x20\x31\x34\x2e\x31\x30\x38\x20\x31\x35\x20\x31\x35\x20\
-\x31\x34\x2e\x31\x30\x38\x20\x31\x35\x20\x31\x33\x20\x4c\x20\x31\
-\x35\x20\x33\x20\x43\x20\x31\x35\x20\x31\x2e\x38\x39\x32\x20\x31\
-\x34\x2e\x31\x30\x38\x20\x31\x20\x31\x33\x20\x31\x20\x4c\x20\x33\
-\x20\x31\x20\x7a\x20\x4d\x20\x37\x2e\x32\x31\x30\x39\x33\x37\x35\
-\x20\x34\x20\x4c\x20\x35\x2e\x38\x32\x34\x32\x31\x38\x38\x20\x35\
-\x2e\x33\x38\x36\x37\x31\x38\x38\x20\x4c\x20\x37\x2e\x34\x35\x38\
-\x39\x38\x34\x34\x20\x37\x2e\x30\x32\x31\x34\x38\x34\x34\x20\x4c\
-\x20\x2d\x30\x2e\x30\x30\x31\x39\x35\x33\x31\x32\x35\x20\x37\x20\
-\x4c\x20\x2d\x30\x2e\x30\x30\x31\x39\x35\x33\x31\x32\x35\x20\x39\
-\x20\x4c\x20\x37\x2e\x34\x35\x38\x39\x38\x34\x34\x20\x39\x2e\x30\
-\x32\x31\x34\x38\x34\x34\x20\x4c\x20\x35\x2e\x38\x32\x34\x32\x31\
-\x38\x38\x20\x31\x30\x2e\x36\x35\x34\x32\x39\x37\x20\x4c\x20\x37\
-\x2e\x32\x31\x30\x39\x33\x37\x35\x20\x31\x32\x2e\x30\x34\x31\x30\
-\x31\x36\x20\x4c\x20\x31\x31\x2e\x32\x31\x30\x39\x33\x38\x20\x38\
-\x20\x4c\x20\x37\x2e\x32\x31\x30\x39\x33\x37\x35\x20\x34\x20\x7a\
-\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x0e\x9f\
-\x00\
-\x00\x42\x6d\x78\x9c\xed\x5b\x6b\x6f\xe3\xd6\x11\xfd\xbe\xbf\x82\
-\xd5\x7e\xc9\xa2\x22\x75\xdf\x0f\xc5\xde\x00\x6d\x90\x36\x40\x8b\
-\x02\x4d\xd2\x7e\xa6\x25\xda\x56\x57\x96\x0c\x49\x5e\xdb\xf9\xf5\
-\x3d\x33\x97\x94\x48\x89\xb2\xbd\x8e\xb3\x8d\xb7\xb1\x13\xac\x78\
-\xdf\x77\xe6\xcc\xcc\x19\x7a\x74\xf2\xcd\xdd\xd5\x3c\xfb\x58\xad\
-\xd6\xb3\xe5\xe2\x74\x20\x0b\x31\xc8\xaa\xc5\x64\x39\x9d\x2d\x2e\
-\x4e\x07\x3f\xfd\xf8\x5d\x1e\x06\xd9\x7a\x53\x2e\xa6\xe5\x7c\xb9\
-\xa8\x4e\x07\x8b\xe5\xe0\x9b\xf7\x6f\x4e\xfe\x90\xe7\xd9\x9f\x57\
-\x55\xb9\xa9\xa6\xd9\xed\x6c\x73\x99\x7d\xbf\xf8\xb0\x9e\x94\xd7\
-\x55\xf6\xd5\xe5\x66\x73\x3d\x1e\x8d\x6e\x6f\x6f\x8b\x59\xdd\x58\
-\x2c\x57\x17\xa3\x77\x59\x9e\xbf\x7f\xf3\xe6\x64\xfd\xf1\xe2\x4d\
-\x96\x65\xd8\x77\xb1\x1e\x2f\xd7\x67\xa7\x83\xd6\x8c\xe5\x75\xb5\
-\x58\xdf\x96\x9b\xc9\xe5\xd9\x72\xf9\x81\xe7\xdd\xac\x66\x23\x25\
-\x44\x1c\x61\xec\x60\x37\x73\x3a\xd9\x4e\xbc\xbe\x59\xcd\x79\xe8\
-\x74\x32\xaa\xe6\xd5\x55\xb5\xd8\xac\x47\xb2\x90\xa3\xd6\xf0\xc9\
-\x6e\xf8\x84\xce\x3d\xfb\x58\x4d\x96\x57\x57\xcb\xc5\x9a\x67\x2e\
-\xd6\x6f\x5b\x83\x57\xd3\xf3\xce\xa9\x6e\x35\x0f\x92\x31\xc6\x91\
-\x50\x23\xa5\x72\x8c\xc8\xd7\xf7\x8b\x4d\x79\x97\x77\xa7\xe2\x76\
-\x7d\x53\x71\x01\x31\x42\xdf\x6e\xe4\xd3\x46\x8d\xef\xe6\x10\xe2\
-\xd1\xc3\x70\x6f\x7b\x77\x28\xee\x1a\xff\x6f\x27\x34\x0d\xc5\x7a\
-\x79\xb3\x9a\x54\xe7\x98\x59\x15\x8b\x6a\x33\xfa\xf6\xc7\x6f\xb7\
-\x9d\xb9\x28\xa6\x9b\x69\x6b\x99\x46\x6f\x9d\x7d\x3b\xca\x5c\x94\
-\x57\xd5\xfa\xba\x9c\x54\xeb\x51\xd3\xce\xf3\x6f\x67\xd3\xcd\x25\
-\x70\xa4\x02\x3f\x5e\x56\xb3\x8b\xcb\xcd\xee\xf9\xe3\xac\xba\xfd\
-\xd3\xf2\xee\x74\x20\x32\x91\x69\x5d\x04\x47\x3f\xdb\x4f\xf5\xa0\
-\x1d\x1a\x25\x37\xcc\xa6\xa7\x03\x48\x25\xf5\x36\xdb\x8d\xb7\xc3\
-\x44\x11\x55\xa1\x32\x3b\xd1\x55\x10\xd3\x61\xa6\x84\xf4\xb9\x08\
-\xb9\x70\x3c\xa1\xb9\xe5\x78\xba\x9c\xd0\xb1\x4f\x07\xe5\xf5\xf5\
-\x7c\x36\x01\x06\x96\x8b\x7c\x53\x9e\xcd\xab\x82\x64\xfe\x1e\x83\
-\x4f\xa6\xd5\xf9\x9a\x26\xa5\x4d\xe9\x49\x71\x07\xba\x20\xea\xaa\
-\x5c\xfd\x65\x55\x4e\x67\x00\x58\x1a\x94\x86\x75\x7b\x64\xd0\xa2\
-\x9e\x83\x59\xeb\xcd\xf2\xba\x19\x5b\xdf\x04\x2d\x32\xa8\x74\xb8\
-\xf4\xb3\xde\xdc\xcf\xab\xd4\x93\x4f\x96\xf3\xe5\x6a\xfc\x76\x1a\
-\xe9\xf7\x6b\x6e\x5a\x42\xd0\xb3\xcd\xfd\x58\xb6\xa6\x2c\xcf\xcf\
-\xd7\x15\x24\x0b\x7b\x1d\x3d\xbe\x59\x78\x78\xb3\x73\xfe\xd9\xdb\
-\xec\xeb\x9e\xdd\xe4\x76\xb7\x93\x51\xf7\xd6\x0f\x0a\x09\x96\x3b\
-\xbe\x2e\x67\x0b\xac\xb0\x5e\xce\x67\xd3\xc1\x71\xe9\xb9\x18\xfc\
-\x63\xd2\xc3\x18\xdb\x2b\x8a\x07\x2f\xe9\xfd\x54\x9d\x9f\x1d\x5c\
-\xf2\x59\x17\xda\x82\x10\x6b\xcf\xab\x09\x36\x2f\xe7\xb7\xe5\xfd\
-\xfa\x81\x8b\x19\x7f\x1c\x16\x3d\xa7\x95\xd1\x49\x1d\x9e\xa2\xff\
-\x43\xf9\x60\x2b\x75\x1c\x16\x3d\x9b\x69\x60\xd6\x3e\x61\x33\xd9\
-\xbf\x99\x79\x9e\x10\xef\xd5\xe9\x40\xc1\xf4\xbd\x08\x6a\xa7\xcf\
-\x3b\xb4\x1a\x57\x44\xaf\x44\xd8\xc1\xf6\x5e\xd2\x58\x55\x38\x13\
-\xa3\xda\x8d\x45\x6b\xee\x8a\x60\x6c\xf4\x62\xb7\xc4\x45\xbd\xd1\
-\x8f\xab\x72\xb1\x86\xcb\xbb\x3a\x1d\x5c\x95\x9b\xd5\xec\xee\x2b\
-\x51\x90\x8b\x85\x64\xfd\x50\xd0\x6f\x21\xa3\xb1\x5a\x0a\x3b\x34\
-\xb6\x08\x4a\x1b\xeb\x86\x4a\x87\x22\x58\xa9\xec\xbb\x83\x05\x7f\
-\x5a\xcc\x36\x70\xdc\x37\xeb\x6a\xf5\x03\x39\xbf\x7f\x2c\x7e\x5a\
-\x57\x0f\xe9\xdc\x49\xb3\x3b\x2c\xf9\xea\xf1\xe5\xaa\x42\x6c\x79\
-\xdb\x83\x8d\x47\xb1\xb5\x15\xf2\x33\x31\xf9\xc0\x01\xd8\x67\x3d\
-\xe0\xd2\xac\xd0\x79\xe8\x88\x5d\x45\x88\x52\x1b\x6f\xba\x2a\x72\
-\xba\xb0\x4a\x69\xdf\x55\x67\x61\x83\xd1\x4a\xc5\x41\x47\xf5\xd1\
-\x15\xd2\x05\x13\x3f\x51\xcc\xc7\xb5\x0b\xf6\x22\xa4\x30\x21\x29\
-\x37\x3d\xe9\xa0\xf1\xc9\xda\x28\x85\x74\x43\x44\x3a\xe5\x6c\x70\
-\x80\xd2\xbb\x5a\x9e\x27\x23\xf2\xf2\xfc\x69\x1b\x29\x28\x4c\x4c\
-\x29\x56\xed\x42\xc1\x59\xb9\x3d\xc2\x75\x79\x51\xb1\xe1\x40\x8c\
-\xc9\x73\xd6\x1d\x67\xcb\xd5\xb4\x5a\x35\x5d\x1c\xda\x5c\xa7\xab\
-\xb6\xad\xc4\xb3\xde\x74\xb5\x46\xab\x6e\xfb\x45\x7f\xff\xfa\xb2\
-\x9c\x2e\x6f\x21\xba\xfd\xce\x9f\x97\xcb\x2b\x5a\xd5\xec\x77\x4c\
-\x10\x6b\x8d\x81\xd9\x18\x65\xc2\x41\x27\x76\xd2\xb2\xf0\x32\x7a\
-\xe9\xf6\x3b\x11\x2d\x6f\x88\x49\xe5\x37\x49\x1b\x57\x57\x07\xd3\
-\x6f\x56\x2b\x1a\x30\x2f\xef\x2b\x5c\x98\xff\x69\x3c\xc4\xfa\x72\
-\x79\x7b\xb1\x22\xc1\x9d\x97\xf3\xad\xe4\xea\xa5\xae\xef\xf6\x97\
-\xba\x9d\x2d\x70\xb1\xbc\x61\x0f\x4e\x1c\x5c\xbf\x1e\xd1\x10\x8a\
-\x20\x0f\xae\x5a\x8f\xb8\xdb\xf9\xc4\xfd\xae\xfb\xe3\x5d\x57\xe5\
-\xdd\xec\x6a\xf6\x73\x35\xdd\x39\x39\xbe\xc2\xcd\x6c\x5a\xad\x9b\
-\x4b\xd4\x80\xb9\xaa\x36\xe5\xb4\xdc\x94\x3b\x70\x34\x2d\xb6\xe1\
-\x0a\xa0\x87\xe3\x7f\x7e\xfb\xdd\xd6\x03\x4f\x26\xe3\x7f\x2f\x57\
-\x1f\x76\xde\x93\x06\x94\x67\xcb\x1b\x5c\x65\x1b\x14\x88\x7e\x4c\
-\xc6\x84\xe8\x72\xf3\x7e\x76\x05\x7d\x13\x17\xfc\x23\x28\x19\x30\
-\xba\xed\xe8\x0c\xde\xdc\x5f\x57\xbb\x45\xd3\xb2\xab\x2a\x71\xbd\
-\x5e\x7a\x3c\x9d\x5c\xcd\x68\xd2\xe8\x87\xcd\x6c\x3e\xff\x9e\x36\
-\x69\x45\x8a\x7a\xd1\xd9\x66\x5e\xb5\xc2\xc7\xa8\x3e\x7d\xe3\xe2\
-\x5b\x97\x3b\x19\x35\x57\xe7\xa7\x8b\x3d\xe1\xce\xcb\xb3\x6a\x7e\
-\x3a\xf8\x1b\x21\x23\x93\xfb\xa2\xbf\x58\x2d\x6f\xae\xaf\x96\xd3\
-\xaa\xc6\xce\x60\x27\xd0\x0e\x96\x36\x3b\x43\xe7\x8f\x73\x64\x1d\
-\x5f\x89\x61\x4e\xce\x46\x6a\x4d\xa6\x5c\x1f\xed\xba\xdc\x5c\x36\
-\x57\xa9\xc3\x5c\x13\xce\x60\xf8\xf6\xeb\x73\xdc\x79\xfc\x56\xf0\
-\x0f\x3f\xb4\x88\xc0\x7a\xb3\x5a\x7e\xa8\xc6\x0b\x64\x39\xf5\xe7\
-\x04\xc7\xb1\x2c\x82\x47\xd4\x89\x21\x34\xed\x10\x61\xb5\x9a\x03\
-\x2f\x9b\xb1\x69\xda\xa6\x25\x8c\x73\xb5\x2a\xef\x3b\x2b\x1c\x06\
-\x53\x5c\xee\xef\x19\x1c\x9f\x41\xb4\x81\x43\x52\xce\x14\x12\x9f\
-\x42\xf6\xaf\x8c\x1c\xa2\xd7\xd6\x64\x7f\xcd\xb4\xc0\xa6\x4a\xe2\
-\xf3\xc7\x2c\x97\xa1\xd0\xd9\x24\x83\xef\x12\xc6\x27\x27\x16\xb4\
-\xd4\xd4\x40\x4e\xcd\xea\x61\x0e\x0f\xe7\xad\x56\xd4\xa4\xa5\x32\
-\x11\x83\x54\xa1\xb1\xa0\xa3\x26\x25\x8d\x09\x34\xcd\x3b\xaf\xb9\
-\xc5\x5a\x65\x5c\xa4\x79\x26\xea\x68\xa8\x29\x5a\x67\xa4\xa2\x79\
-\x32\x44\x65\x79\x14\xdc\xb3\x97\xbc\x5f\x88\x1e\x07\x29\x74\x14\
-\xda\xf2\x34\xa7\x35\xa6\x61\x30\x7c\x1c\x8d\xc1\xa7\x08\x17\x43\
-\xd3\x8c\x17\x91\xb7\x33\xca\x4b\x49\xd3\x4c\x08\x4a\xa4\xed\x8c\
-\x74\x91\xe6\xc1\xe9\x98\xc0\xf3\x70\x01\x61\x68\x94\x52\x52\xd2\
-\xc9\xf1\x49\x48\xa3\xb3\xd4\x47\x21\x19\x9f\x6c\x74\x11\xf7\x43\
-\xa2\x60\xa2\xa4\x0d\x75\xe1\x82\x14\x9e\xaf\x6c\x75\x12\x0b\xe4\
-\xc8\x0d\x48\x26\xa4\x33\xd4\x02\xbe\x40\x2b\xe1\xe4\x38\x4c\x7d\
-\x17\x23\x0c\xdf\x58\x7b\x01\x8a\x41\x4d\xd0\x86\x96\x3c\x51\x58\
-\xe3\x39\x4a\x18\xe1\x74\x3a\x94\x45\x04\xa1\xd1\x42\x39\x5e\xdc\
-\xe0\xe6\x26\x52\x93\x70\xbc\x4e\xb0\x22\x2a\xde\x5f\x44\x1b\x68\
-\x12\x36\xd7\x81\xf7\x87\x6e\x9d\xcc\x7e\xee\xc4\x56\x42\xa9\x15\
-\x4a\xe7\xa6\x2f\xe6\x2f\x16\x88\xdd\xcb\x55\x0e\xef\xfa\xb1\xdc\
-\xdc\xac\xaa\x36\xc7\xdb\x45\x28\x98\x0d\xd9\x31\x7c\xd3\x04\x3f\
-\xe5\x7a\x82\xdf\xf5\x64\xb2\x23\x09\x1d\x5b\x78\x74\xda\xa7\x1e\
-\xa4\xb9\x87\x41\x28\x6d\x31\x03\xf2\x85\x1d\x74\x83\x0e\x44\x1f\
-\x81\x62\xe2\x6e\x52\x29\xf5\x34\x70\xab\xf8\x99\xd1\x4d\xa0\x7c\
-\x1c\xde\xfe\x00\xde\xea\x00\xde\xfe\x10\xdd\xf6\x10\xdd\xea\xc5\
-\xd0\x6d\x7e\x43\xe8\xde\xf3\xb9\x32\x39\x5c\x84\x9f\xaf\xf6\xf9\
-\x26\x13\xca\x77\x47\x7c\xf0\xdb\x20\xe8\xb7\xeb\x86\xe9\x8c\xfc\
-\x23\x7f\x89\x1b\xde\x9a\xc7\x45\x1b\xc9\x17\xd0\xcd\x8e\xb2\xf6\
-\xc6\x9b\xdc\x48\xa8\x44\x78\xc7\xf8\x80\x6a\x42\xb0\xe1\xdd\x2e\
-\xa1\x5b\xc1\x58\x76\x91\xf8\x9e\xa8\xb0\x07\xed\x75\x71\x67\xe4\
-\x20\xc3\xa7\x03\x0b\xe0\x39\x29\x75\x3b\x95\x6a\x48\x0d\x70\x03\
-\x44\x29\xa1\x5a\x7d\x35\x25\xb2\x00\x35\x80\x61\xdb\xab\xd1\xc9\
-\x69\x5b\x80\xbc\x9d\x0e\xf7\x2b\xe1\x6d\x79\x4e\xbf\xfb\x12\xe7\
-\xc7\xd5\xcd\xbc\x1a\x57\x1f\x2b\x78\x87\xe9\xf1\x38\x48\x48\x04\
-\x3a\x84\x57\x4d\x3b\xe9\x14\xce\x62\x8c\x38\xbe\x98\xb6\x1b\xff\
-\xb3\x9c\x2d\xc6\x67\x58\x71\xfe\x12\xba\x3a\x90\xee\x17\x73\xc3\
-\x5e\x5d\xfa\xa7\x69\xff\x21\xd0\x10\xce\x7c\x21\xbd\x96\x31\x0e\
-\x8e\xa0\xf2\xff\x53\xba\x26\xbc\x8c\x74\x7b\xac\x98\xa4\xeb\x29\
-\x04\x44\xab\x8e\x4b\xb7\x33\xaa\x57\x63\xf6\x25\x3d\x83\xed\x79\
-\x29\xb6\xaf\xd9\xa8\x26\xa0\x77\xaf\x49\xb3\x2d\xe9\xb6\x69\xce\
-\x71\xa2\xd3\x62\x38\x4f\xe7\x38\x1d\x39\xb6\x25\x9f\x58\x8e\x2e\
-\xbc\x0d\x5e\xa8\x61\xa3\x4f\x9d\x51\x53\x44\x42\x32\x24\x89\x80\
-\x14\x64\x48\xae\x5d\x94\x88\xf1\x60\x27\xc2\x23\xc4\x7f\xa4\x26\
-\x44\xe8\x98\x5d\x66\x39\x54\xa7\x02\xc8\x43\x2b\x82\x7e\x99\x4a\
-\xea\x31\x01\x5b\x38\xa7\xbd\xfb\x0c\xc1\xd1\xf6\xbc\x69\x7f\xfd\
-\xce\xed\x53\xdd\xf7\xeb\xc3\x4f\xaf\x2e\x5f\xc8\x7d\x1f\x09\x8e\
-\x5b\x54\x3e\x03\xbb\x8d\x3f\xf8\x74\xf7\x2d\xac\xb2\x9d\xd5\x76\
-\xf7\x75\x5f\xba\xfb\xbe\x38\xb8\xde\x43\x97\xea\x1c\xdb\x14\x42\
-\x0b\x83\xb4\xae\x4d\x98\x36\x7d\xaf\xfc\x29\xff\xf1\x51\xd6\xaf\
-\xfc\x91\xc6\x45\x9a\x39\x0c\x60\x42\x4a\x2b\xa4\x85\x4a\xf9\x02\
-\x69\xaa\x35\xef\xf6\xb4\x70\x61\xa2\xd7\xed\x17\x74\x5d\x34\x24\
-\x3c\x08\x8f\x94\x2c\x58\x3d\x68\x77\xdc\xd1\x6b\xcc\x58\x40\xb7\
-\x2e\x76\x3a\xb6\x7f\x12\x45\x16\xe1\x83\x33\xb6\xd3\x5b\xa3\x42\
-\x21\xbf\xb5\x5e\x75\x67\xee\x60\xe1\xbb\x93\x7e\x2d\x60\x20\xac\
-\xa9\x80\xcc\x48\x85\xcf\x0e\x8c\x1e\x51\x7f\x31\xb7\x3c\xa2\x53\
-\xff\x64\x20\x3c\x0c\x21\x42\x5e\xb4\x94\xac\xca\xee\x5e\x1d\xac\
-\x3e\x28\xea\xd6\xc8\x83\xb5\x15\x8e\xa4\x84\xe8\x78\xe2\xa7\xa3\
-\x5a\xfa\x8e\x13\xec\x08\x20\x7e\xe9\xa0\x3e\x19\x5d\xfc\x6a\x8e\
-\xaf\xf6\x56\x41\xfe\x72\x67\xa8\xe9\x8d\xb7\x35\xe6\xdd\x43\x8e\
-\xef\x8b\x51\x4f\x3f\x18\x83\x7e\x41\x6b\xec\x8d\x03\xcf\xb2\xc6\
-\xc3\x18\xd3\x6b\xe9\x2f\x11\x63\xc2\xef\x31\xe6\x15\xdf\xf2\x88\
-\x4e\x8f\xc5\x98\x03\xb7\xfc\x28\xa8\xfb\xc3\x40\x27\x70\x7c\x1e\
-\xc7\xf7\x5c\x27\x67\xc1\xc9\x8d\xf1\x3d\x8c\x2f\xc4\xdf\x1e\xe3\
-\x8b\xf2\x77\x6b\x7c\xbd\xb7\x3c\xa2\xd3\x97\x8c\x31\xaf\x91\xf1\
-\xc5\x2f\x3e\xc4\xb4\x1d\xdf\xe1\x8b\x84\x48\x7f\x4b\x13\xfa\x73\
-\xfc\x85\xa8\xf3\xaa\xe3\xf7\x97\x60\xaf\xe6\x86\x87\xba\xb4\x42\
-\xc8\xa7\x69\xff\x99\x2f\xc1\xb6\xa8\x7c\xf0\x25\x58\x3f\x76\x7f\
-\x85\x97\x60\xb8\xaf\x7e\x1c\xbb\xaf\x4f\xb3\xbb\x92\xd9\x8b\x4f\
-\xa8\xd8\x58\xd3\x7f\xcf\xae\xd6\x90\xda\xda\xfd\x6a\x0d\x25\x0b\
-\xad\x82\x00\x3b\x52\x8e\xf4\x10\x95\xcb\x26\x99\x28\x84\x74\x5a\
-\x83\x3c\x09\xe5\x74\x56\xbb\xa4\x88\xe7\x08\x06\xa6\xd0\xe0\x95\
-\x27\x86\x45\x45\x13\x21\x38\x34\x18\x2b\x6d\xb0\x54\x76\x29\x95\
-\x36\x19\x15\x5c\x05\x1b\x86\x9a\x4a\x79\xb5\xe3\x67\xa1\x5d\x1c\
-\x22\x50\xd9\x10\x2c\x6d\x81\x25\x14\xd7\x11\x44\x23\x64\x66\x0a\
-\x17\x85\x95\x5c\xf0\xa1\xa3\x0d\x3a\x03\x42\xa5\x14\x86\xfe\x9e\
-\x12\x88\xf8\x71\x99\x88\xac\x8b\x18\x30\x5b\xa7\xba\x91\x90\xea\
-\x1c\x44\x10\x3c\x42\x2a\x2b\xd3\xb2\xc1\x29\xae\x48\x82\x56\xa9\
-\xae\x83\x2a\x4a\xb0\x0c\x8f\x09\xca\xa7\x32\x07\x65\xa2\xb4\xa9\
-\x60\x42\x3a\xc3\x65\x0d\xc6\x28\xc5\x2b\x59\xc4\x0d\xc1\x6b\x3b\
-\x61\x2c\x17\xa0\x28\xbd\x2d\x87\x08\xc6\x36\x55\x15\x82\x97\x72\
-\x81\x87\x98\xe8\x5c\x3a\x91\xb1\xc2\x70\xdd\x94\x75\x11\xdb\x70\
-\x25\x8b\x12\x54\x25\xa5\x10\x6a\x3d\xf8\x38\x15\x7f\xe0\xdf\xba\
-\x44\xc4\x48\x9c\x6b\x58\x17\x8b\x38\x2e\x11\x09\x2e\x2a\xc3\x85\
-\x24\x2a\x5a\x43\x25\x22\x51\x46\x12\x49\x4e\xa6\xa6\x7d\x38\x5e\
-\x7e\xc1\x3c\x98\x2a\x26\xd4\xf3\x0a\xdf\x5e\xb8\xe2\xe2\x81\xe2\
-\xbc\xc6\x8a\xeb\xef\x21\x7c\xf6\xaa\x90\x7d\x83\xc0\x7a\x91\x4b\
-\xf3\x22\x11\x9b\xda\x1c\xac\x09\x6c\x0e\x26\x92\x39\x68\xaa\xf8\
-\xa1\xea\x18\xef\xc9\x3c\x80\x5c\x29\x0d\x59\x03\xcc\x85\xb0\x0d\
-\xca\xa1\x04\x4d\x88\x16\x6a\x26\xf4\x47\x05\x33\x80\x39\x28\x19\
-\x04\x19\x90\x0a\xc6\xd8\xa1\x29\x02\xfc\x76\x9a\x10\xa3\x4a\xc0\
-\x56\x3a\xb3\x85\xb4\xd1\x0a\x46\xba\xd7\x1e\xe6\xe1\xc9\x4e\x8d\
-\xa0\x72\xe6\xa0\x4c\xaa\x0d\x12\x58\x35\x61\xdf\x8a\x84\x6b\xb2\
-\xa9\x54\xbe\x13\x15\x0f\x91\x46\xd7\xa5\x41\xe4\xed\x19\xa0\x70\
-\xa9\xde\xf1\x34\xeb\xa9\xf4\x90\x0a\x5a\xc8\xe0\x18\x7a\x42\x6b\
-\xcf\xb5\x41\x64\x33\x2a\x61\x36\x28\xe9\x9a\xd2\x27\x6f\x0f\x6a\
-\x9f\x8c\x6c\x4a\xfb\x9a\xe2\x27\x2b\x5d\x53\xfc\xc4\xa3\xa4\x77\
-\x7c\x50\x7c\xb2\x3e\xf0\x28\x58\x71\x50\x3c\xca\x44\x4d\x15\x59\
-\xc0\xb3\x74\xb8\x34\x21\xdb\x5a\x48\xab\xa7\x6c\xce\x00\xf2\x79\
-\x6f\xa9\xfc\xb3\xca\xe6\xd8\x99\x1e\x96\x04\x6d\xbf\x21\xd1\xcd\
-\x3d\xa1\xaf\xe8\x5b\xa4\x7d\xbb\xfb\x36\x05\xcd\x27\xd5\x02\xe8\
-\xa3\x42\xe3\x3c\xe2\x5e\xca\xc0\x7e\x9f\x30\x9e\xa2\x71\x61\x20\
-\x2d\x27\xfc\xe1\xf0\xba\x8a\xf6\xcf\xe5\x75\x99\xc9\x8e\x48\x52\
-\x99\x6c\x6e\xf2\xdd\xa1\xfa\xd2\x61\x5a\x57\x51\xf9\x5b\x4a\x87\
-\xe1\x35\x94\x0b\x90\x33\x7d\xf9\x42\x5b\x47\x78\x91\x90\x3e\xc2\
-\xb9\xd0\xad\x92\xa6\xc3\x4c\xfd\x31\x89\x74\x4e\xa5\x73\x67\xf3\
-\x36\xb9\x78\xe4\x42\xc7\x0a\x7d\x0b\x23\x11\x61\x14\x07\x1f\x10\
-\x0e\xda\x33\xbe\xeb\x09\x9f\xaf\x57\x7d\xcf\x54\x9e\x2b\xe0\x6b\
-\xd4\x56\x79\x2a\xfa\x97\x55\xde\xff\x40\x75\xa9\x18\x4f\xb4\xbe\
-\xe2\x73\xbc\x18\xcf\x05\x6f\x5c\x2a\xc6\x53\x2a\xf8\x36\x72\xf7\
-\x8a\x42\x9e\x5a\x95\x48\x5f\xd7\x39\xa8\x49\xfc\x24\x0e\x29\xa2\
-\xf6\x76\x9f\x40\x9e\xdd\x6c\x36\x07\xfc\x91\xc3\xd4\xcb\x64\x06\
-\x1c\xb5\x2c\xa1\x21\x68\x21\x87\xf4\xf7\x69\x90\x0c\xcb\x9c\x0c\
-\x54\x28\x5a\x92\x7e\x08\x5c\x02\x0a\x32\x1d\x87\xd2\x17\x4e\x53\
-\x98\xca\x3b\x23\xa8\x28\x15\xd9\x3c\xbd\x45\x30\x1c\x0a\x3c\xe8\
-\x13\x85\x2e\x21\x08\x70\x92\xbe\xc6\x23\x23\x55\xeb\x82\x84\x08\
-\x2f\x52\x0d\xaa\x09\xd2\xda\x8c\x5e\x1d\x78\xa7\x39\xa8\xc4\x60\
-\x42\xcc\xb0\x92\x8f\x4e\xfa\x58\xd7\xd3\x06\xd5\x29\x73\xd9\x15\
-\x10\x4b\xd5\x07\xb4\x47\x6b\x73\x8e\xfb\xf4\xc9\x27\xd7\x07\xad\
-\x99\x57\xf3\x4f\x7a\xa8\x1b\x9e\x5f\x35\xc4\x57\x8b\xc2\x1f\xa8\
-\x09\xc4\x0f\x7c\xcf\xf9\x21\x38\x37\x62\xa0\x92\x26\x55\x3f\x1b\
-\xaf\x35\xe2\x28\x09\x3b\x15\x2c\x13\x2b\x74\x6c\x37\x22\xd5\xd0\
-\x2b\x60\x8b\x19\x08\x02\x7c\x36\xe7\x39\x01\x4c\x41\x27\xc6\x0d\
-\xf1\xf2\x3a\x20\xf1\x4a\xd1\x3c\x6b\xbd\x68\xea\x9c\x35\xf6\x83\
-\x9d\x48\x5d\xd3\x5a\x1b\xc0\x88\xd1\x82\x08\x1f\x13\x41\x36\x54\
-\x75\x4c\xd4\x19\xb4\x98\x1b\x90\xc4\x91\xd5\x2a\xaa\xe3\x4e\xc4\
-\x42\x04\xd7\x6e\x10\x92\x8f\xc3\x1f\x2d\x93\x5b\x46\x19\x13\x0c\
-\x11\xe9\x1b\x76\x4c\xec\xd3\x58\xed\x8c\x4b\xfc\x9b\x0e\x9f\xa7\
-\xdc\xc0\xe9\x54\xc3\x2c\x1a\xda\xac\xeb\x6a\x6f\x09\x47\x11\xea\
-\x2b\xe2\x3c\x26\x81\x2a\x34\xdf\x2e\x40\x9e\xa6\x58\x50\x21\x5d\
-\xd9\x21\x15\xb1\x0c\x61\x29\x99\x6d\x8b\x34\x8b\xae\xa5\x4c\xb7\
-\x01\x92\xcf\x04\xd3\x38\x41\xf6\x81\x7c\x28\xb2\x77\xc2\x12\x81\
-\x92\x9a\xc8\x04\x87\x0a\xce\x25\x67\x39\x46\x5b\x2a\x09\xa7\xba\
-\x6a\x42\x70\x3d\xc2\xf3\x57\xca\x94\x8b\x9d\x06\x0f\xba\x54\x2f\
-\x9e\x2a\xcc\x75\x20\x4f\x4d\x8b\x5b\x1d\x52\x2d\x35\x56\x77\x34\
-\xd6\x29\x21\xd3\x6d\x14\x81\x81\x8a\xde\x5d\x53\x6f\xdd\x8c\x81\
-\xb7\x94\xdd\x16\x8f\x65\x78\x03\x64\x28\x59\x12\x33\xdf\x0a\x0a\
-\x25\x4e\x4a\x11\x9c\xe5\xe0\x29\xfd\x82\x9e\xc0\xdb\x92\x58\xe8\
-\xa0\x0e\x5c\x4c\xf0\x70\xc5\xd9\x97\x8b\x8e\xd8\x24\x6b\x87\xfa\
-\x85\x73\x8d\x58\x05\xf1\x41\xe8\xaa\x86\x23\x1e\x71\x5e\x97\x68\
-\xa5\x64\xc1\x41\xe5\x8e\x89\x20\xe8\x22\x4d\x06\x7b\x04\xee\x48\
-\x79\x21\xa0\x29\x83\xcc\x9d\x74\x94\x16\x51\x0d\x3d\xe7\x87\xc2\
-\x10\x60\x38\x3f\x53\x46\xf3\xf1\x41\x3a\x39\x05\x53\x9e\x13\x44\
-\x24\x7b\x3a\x95\xa3\x03\xd6\x92\xe7\x48\x6f\xb8\x41\xa4\x5d\x4d\
-\xb0\x72\x77\x61\x1c\x49\x12\x26\xa5\x76\xac\x1b\x84\x18\x1b\xf8\
-\xd9\x42\x96\xa4\x76\xa7\xf4\x50\x41\x12\xa0\xa6\xf4\x1c\xe1\x9a\
-\x3c\x35\x38\xca\xdd\x68\x79\x15\x39\x36\xc1\x32\x32\x2e\x82\x07\
-\x47\x66\x89\x78\x96\x98\x41\x80\xf5\x69\xbf\x8c\xbe\xb4\x80\x04\
-\x97\x2d\xd0\xf0\x71\x23\x78\x79\x0a\x6d\x86\x73\x82\x18\x35\x08\
-\x43\x5a\x4e\xb2\xdb\x8c\xe9\xec\x35\x79\x86\xba\x92\xcb\xf4\xd1\
-\x3a\xc6\x43\x04\xe1\xd2\x0c\x79\x58\x3f\x04\xcd\x90\x8f\x06\x79\
-\xb5\xe1\x46\xba\x2f\x2d\x2c\xe1\xa3\xa9\x01\x1a\x8a\x29\x3b\x07\
-\x2a\x93\x59\x48\x4a\x8b\x79\x88\x66\xf1\xd3\xd7\x06\x3a\x0d\x5e\
-\x68\x52\x7f\x3a\x88\x95\xb5\x39\xa6\xac\x56\x28\x9d\x72\x04\xe5\
-\xa4\x49\x0d\x48\xf6\x7b\xaa\x11\x1f\x4f\xcf\x9a\x77\xad\xfb\xd1\
-\x9d\xff\x39\xa1\x2f\xb2\xbd\x7f\xf3\x5f\xf8\x0c\xef\xff\
-\x00\x00\x03\x35\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x33\x20\x33\x20\x4c\x20\x33\x20\x35\x20\x4c\x20\
-\x31\x33\x20\x35\x20\x4c\x20\x31\x33\x20\x33\x20\x4c\x20\x33\x20\
-\x33\x20\x7a\x20\x4d\x20\x33\x20\x37\x20\x4c\x20\x33\x20\x39\x20\
-\x4c\x20\x39\x2e\x36\x38\x37\x35\x20\x39\x20\x43\x20\x31\x30\x2e\
-\x34\x35\x37\x35\x32\x20\x38\x2e\x33\x38\x33\x36\x31\x20\x31\x31\
-\x2e\x34\x33\x36\x39\x20\x38\x20\x31\x32\x2e\x35\x20\x38\x20\x43\
-\x20\x31\x32\x2e\x36\x37\x31\x37\x38\x20\x38\x20\x31\x32\x2e\x38\
-\x33\x33\x32\x33\x20\x38\x2e\x30\x34\x33\x38\x20\x31\x33\x20\x38\
-\x2e\x30\x36\x32\x35\x20\x4c\x20\x31\x33\x20\x37\x20\x4c\x20\x33\
-\x20\x37\x20\x7a\x20\x4d\x20\x33\x20\x31\x31\x20\x4c\x20\x33\x20\
-\x31\x33\x20\x4c\x20\x38\x2e\x30\x36\x32\x35\x20\x31\x33\x20\x43\
-\x20\x38\x2e\x30\x34\x33\x38\x20\x31\x32\x2e\x38\x33\x33\x32\x33\
-\x20\x38\x20\x31\x32\x2e\x36\x37\x31\x37\x38\x20\x38\x20\x31\x32\
-\x2e\x35\x20\x43\x20\x38\x20\x31\x31\x2e\x39\x36\x39\x35\x37\x20\
-\x38\x2e\x31\x31\x32\x37\x31\x20\x31\x31\x2e\x34\x37\x32\x36\x20\
-\x38\x2e\x32\x38\x31\x32\x35\x20\x31\x31\x20\x4c\x20\x33\x20\x31\
-\x31\x20\x7a\x22\x2f\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\
-\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\
-\x74\x43\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\
-\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\
-\x69\x67\x68\x74\x22\x20\x64\x3d\x22\x4d\x20\x31\x32\x2e\x35\x20\
-\x39\x20\x43\x20\x31\x30\x2e\x35\x36\x37\x20\x39\x20\x39\x20\x31\
-\x30\x2e\x35\x36\x37\x20\x39\x20\x31\x32\x2e\x35\x20\x43\x20\x39\
-\x20\x31\x34\x2e\x34\x33\x33\x20\x31\x30\x2e\x35\x36\x37\x20\x31\
-\x36\x20\x31\x32\x2e\x35\x20\x31\x36\x20\x43\x20\x31\x34\x2e\x34\
-\x33\x33\x20\x31\x36\x20\x31\x36\x20\x31\x34\x2e\x34\x33\x33\x20\
-\x31\x36\x20\x31\x32\x2e\x35\x20\x43\x20\x31\x36\x20\x31\x30\x2e\
-\x35\x36\x37\x20\x31\x34\x2e\x34\x33\x33\x20\x39\x20\x31\x32\x2e\
-\x35\x20\x39\x20\x7a\x20\x4d\x20\x31\x30\x20\x31\x32\x20\x4c\x20\
-\x31\x32\x2e\x35\x20\x31\x32\x20\x4c\x20\x31\x35\x20\x31\x32\x20\
-\x4c\x20\x31\x35\x20\x31\x33\x20\x4c\x20\x31\x30\x20\x31\x33\x20\
-\x4c\x20\x31\x30\x20\x31\x32\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0a\
-\x00\x00\x03\xe5\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x33\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x31\x20\
-\x43\x20\x30\x2e\x37\x35\x33\x39\x30\x36\x32\x35\x20\x31\x20\x31\
-\x2e\x30\x30\x33\x39\x30\x36\x33\x20\x33\x20\x31\x2e\x30\x30\x33\
-\x39\x30\x36\x32\x20\x33\x20\x4c\x20\x31\x2e\x30\x30\x33\x39\x30\
-\x36\x32\x20\x31\x35\x20\x4c\x20\x37\x20\x31\x35\x20\x4c\x20\x37\
-\x20\x31\x33\x20\x4c\x20\x33\x2e\x30\x30\x33\x39\x30\x36\x32\x20\
-\x31\x33\x20\x4c\x20\x33\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x33\
-\x20\x4c\x20\x31\x33\x2e\x30\x30\x33\x39\x30\x36\x20\x33\x20\x4c\
-\x20\x31\x33\x2e\x30\x30\x33\x39\x30\x36\x20\x37\x20\x4c\x20\x31\
-\x35\x20\x37\x20\x4c\x20\x31\x35\x2e\x30\x30\x33\x39\x30\x36\x20\
-\x33\x20\x43\x20\x31\x35\x2e\x30\x30\x33\x39\x30\x36\x20\x31\x20\
-\x31\x33\x2e\x30\x30\x33\x39\x30\x36\x20\x31\x20\x31\x33\x2e\x30\
-\x30\x33\x39\x30\x36\x20\x31\x20\x4c\x20\x33\x2e\x30\x30\x33\x39\
-\x30\x36\x32\x20\x31\x20\x7a\x20\x4d\x20\x34\x2e\x30\x30\x33\x39\
-\x30\x36\x32\x20\x34\x20\x4c\x20\x34\x2e\x30\x30\x33\x39\x30\x36\
-\x32\x20\x36\x20\x4c\x20\x36\x2e\x30\x30\x33\x39\x30\x36\x32\x20\
-\x36\x20\x4c\x20\x36\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x34\x20\
-\x4c\x20\x34\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x34\x20\x7a\x20\
-\x4d\x20\x37\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x34\x20\x4c\x20\
-\x37\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x36\x20\x4c\x20\x39\x2e\
-\x30\x30\x33\x39\x30\x36\x32\x20\x36\x20\x4c\x20\x39\x2e\x30\x30\
-\x33\x39\x30\x36\x32\x20\x34\x20\x4c\x20\x37\x2e\x30\x30\x33\x39\
-\x30\x36\x32\x20\x34\x20\x7a\x20\x4d\x20\x31\x30\x2e\x30\x30\x33\
-\x39\x30\x36\x20\x34\x20\x4c\x20\x31\x30\x2e\x30\x30\x33\x39\x30\
-\x36\x20\x36\x20\x4c\x20\x31\x32\x2e\x30\x30\x33\x39\x30\x36\x20\
-\x36\x20\x4c\x20\x31\x32\x2e\x30\x30\x33\x39\x30\x36\x20\x34\x20\
-\x4c\x20\x31\x30\x2e\x30\x30\x33\x39\x30\x36\x20\x34\x20\x7a\x20\
-\x4d\x20\x34\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x37\x20\x4c\x20\
-\x34\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x39\x20\x4c\x20\x36\x2e\
-\x30\x30\x33\x39\x30\x36\x32\x20\x39\x20\x4c\x20\x36\x2e\x30\x30\
-\x33\x39\x30\x36\x32\x20\x37\x20\x4c\x20\x34\x2e\x30\x30\x33\x39\
-\x30\x36\x32\x20\x37\x20\x7a\x20\x4d\x20\x31\x31\x20\x39\x20\x4c\
-\x20\x31\x31\x20\x31\x31\x20\x4c\x20\x39\x20\x31\x31\x20\x4c\x20\
-\x39\x20\x31\x33\x20\x4c\x20\x31\x31\x20\x31\x33\x20\x4c\x20\x31\
-\x31\x20\x31\x35\x20\x4c\x20\x31\x33\x20\x31\x35\x20\x4c\x20\x31\
-\x33\x20\x31\x33\x20\x4c\x20\x31\x35\x20\x31\x33\x20\x4c\x20\x31\
-\x35\x20\x31\x31\x20\x4c\x20\x31\x33\x20\x31\x31\x20\x4c\x20\x31\
-\x33\x20\x39\x20\x4c\x20\x31\x31\x20\x39\x20\x7a\x20\x4d\x20\x34\
-\x2e\x30\x30\x33\x39\x30\x36\x32\x20\x31\x30\x20\x4c\x20\x34\x2e\
-\x30\x30\x33\x39\x30\x36\x32\x20\x31\x32\x20\x4c\x20\x36\x2e\x30\
-\x30\x33\x39\x30\x36\x32\x20\x31\x32\x20\x4c\x20\x36\x2e\x30\x30\
-\x33\x39\x30\x36\x32\x20\x31\x30\x20\x4c\x20\x34\x2e\x30\x30\x33\
-\x39\x30\x36\x32\x20\x31\x30\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0a\
-\x00\x00\x01\x91\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x37\x20\x33\x20\x4c\x20\x37\x20\x37\x20\x4c\x20\
-\x33\x20\x37\x20\x4c\x20\x33\x20\x39\x20\x4c\x20\x37\x20\x39\x20\
-\x4c\x20\x37\x20\x31\x33\x20\x4c\x20\x39\x20\x31\x33\x20\x4c\x20\
-\x39\x20\x39\x20\x4c\x20\x31\x33\x20\x39\x20\x4c\x20\x31\x33\x20\
-\x37\x20\x4c\x20\x39\x20\x37\x20\x4c\x20\x39\x20\x33\x20\x4c\x20\
-\x37\x20\x33\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x01\xc6\xe6\
-\x00\
-\x00\x01\x00\x05\x00\x00\x00\x00\x00\x01\x00\x20\x00\x30\x67\x00\
-\x00\x56\x00\x00\x00\x80\x80\x00\x00\x01\x00\x20\x00\x28\x08\x01\
-\x00\x86\x67\x00\x00\x40\x40\x00\x00\x01\x00\x20\x00\x28\x42\x00\
-\x00\xae\x6f\x01\x00\x20\x20\x00\x00\x01\x00\x20\x00\xa8\x10\x00\
-\x00\xd6\xb1\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\
-\x00\x7e\xc2\x01\x00\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\
-\x0d\x49\x48\x44\x52\x00\x00\x01\x00\x00\x00\x01\x00\x10\x06\x00\
-\x00\x00\x0c\xe2\x74\x25\x00\x00\x66\xf7\x49\x44\x41\x54\x78\xda\
-\xed\xdd\x77\x7c\x14\xc5\xff\xc7\xf1\xd7\x6c\x7a\x48\x42\x6f\xa1\
-\x85\xd0\x7b\xef\xbd\x37\xa5\x0a\x28\x48\x17\x50\x9a\x60\xc1\x2e\
-\x8a\x82\x0a\x02\x0a\xa8\x28\x5d\x11\xe9\xbd\xf7\xde\x7b\xef\xbd\
-\x27\x81\x84\x90\x7a\x77\xbb\xbf\x3f\x66\xcf\xef\x2f\x08\x4a\x4b\
-\xf6\x92\xcc\xf3\xf1\xf8\x3e\xde\xdf\x1c\x97\xbb\xcf\xad\xb9\x9d\
-\xd9\xd9\xdd\x19\x81\xa2\x28\x49\xc6\x30\x0c\xc3\x30\x9c\x3f\xe5\
-\x18\x2f\xb3\x69\x07\x99\xe2\xf3\x47\xff\x96\xfd\x0d\x99\x75\x7f\
-\x90\xd9\x71\xaa\xd5\x9f\xe3\xdf\xfd\xd9\x4d\xe6\x86\x81\x13\x56\
-\xcd\xce\xbe\xe6\x82\xfb\xa4\x09\x05\x66\x4d\x5a\xfb\x17\xe8\xbe\
-\x46\x17\x63\x23\x88\xc6\x54\xa7\xb4\xf1\x95\x7c\xde\x8a\x3f\x65\
-\x5e\xef\x77\xe4\xc8\xe2\xc5\xa3\x46\x59\x5d\xbf\xa2\xa4\x0e\xc2\
-\xea\x02\x14\x25\x39\x49\xd8\x80\x67\x5e\x21\x33\x4d\x39\xf3\x81\
-\x26\x32\xc4\x26\x99\x7d\x62\x65\x16\xf8\x4d\xa6\xe3\x63\xf3\x55\
-\xcc\x06\x3d\xdb\x62\x99\xd5\xbe\x35\x7f\xff\x0d\xab\x3f\xdf\x8b\
-\xf6\x6b\xed\xd9\x23\xd7\x56\x81\x5f\xd6\xcc\xaa\xbb\xa6\x0b\xe8\
-\xa1\x46\x43\x63\x1e\x88\x26\xd4\xa0\x34\x93\xe4\xb3\xb6\x7f\x28\
-\xf3\x56\x0b\x99\xda\x0c\x99\xb6\xe9\x32\xc7\x0e\x90\x79\xb5\xa0\
-\xf9\xef\x31\xe6\xcb\xaf\x94\x11\xb5\x5f\x66\x48\x53\xd5\x81\x50\
-\x94\x27\xa7\x3a\x00\x4a\xaa\x56\xb2\x64\x8b\x16\xef\xbe\xfb\xf7\
-\x8f\xc3\xc3\x02\xc3\xf3\x45\x7e\x45\x95\x42\x55\xf2\x6e\x0a\xec\
-\xe0\x75\xa2\xc1\xaa\xaa\x01\x25\xff\x6c\x13\xd4\x7d\x64\x9b\xcc\
-\xf5\xda\xa5\x9d\x9b\xa5\x5a\x86\x39\x01\xcb\xf4\x66\xf2\xe9\x1d\
-\x73\xcb\x2c\xf5\xb3\x4c\x87\xa7\xf9\x3a\x95\x65\xf8\x17\x92\xe9\
-\x5e\xcd\xea\xcf\x69\x95\x31\x6d\xa6\x37\x5c\x36\x11\xa6\x7e\xb7\
-\x70\xdb\xa6\xf1\x40\x5e\x72\x92\x1f\x44\x59\x8a\x92\xf7\x3f\x7f\
-\x7d\xb0\x8c\xfb\x0d\x65\x3a\xfa\x99\x8f\xd7\x94\xe1\x16\x2f\xf3\
-\x70\x1f\x99\x7f\x5e\x91\xa9\x2d\x97\x19\xd1\x56\xe6\xfc\x4b\x32\
-\xe3\x8a\x9a\xbf\xbf\xd3\xcc\x8f\x55\x87\x41\x49\xcd\x54\x07\x40\
-\x49\x15\x12\x36\xf4\x5e\xe6\x91\x65\x50\x56\x99\xc6\x38\x99\x2d\
-\x3b\x12\x49\x14\x31\x8d\xde\x64\x2a\x5f\xd3\x53\xf4\xca\xb2\x2d\
-\x63\x9b\xb4\x3f\x56\xae\x5e\xad\x7b\xd9\x74\x85\xc3\x7d\x5a\x34\
-\xdd\x50\x33\x73\x99\xfe\x50\x64\x4f\x70\x97\x1c\xa5\xc1\x3f\x67\
-\x1a\xcd\x67\x3b\xf0\x3e\x9d\x79\xd9\xea\x4f\xe9\x7a\x3e\xae\x39\
-\xe6\xfb\x99\xf3\x60\xd1\xbe\x75\xef\xec\x69\x05\x1e\x05\x3d\x5a\
-\xbb\x7f\x08\x18\xe6\xff\x12\x55\x8c\x39\xc2\xb2\x6b\x9b\x4c\xc3\
-\x1c\x89\x59\x3d\x41\xe6\x22\xf3\xd4\x83\xe8\x2f\xf3\xd2\x6d\x99\
-\x71\x5d\x54\xc7\x40\x49\x0d\x54\x07\x40\x49\xd6\x12\x36\xec\xa2\
-\x95\x4c\x6d\x88\xf9\x40\x66\x19\xad\x5e\x93\x99\xf7\x9c\xcc\xac\
-\x45\x64\xbe\x61\x1e\x31\xba\xdf\x97\xe9\x39\x18\x81\x00\x8f\x77\
-\x88\x21\x0e\x1b\xe8\xbd\xf4\x99\xc6\x5d\x10\x8b\xc5\xcf\x7c\x00\
-\x01\xef\xf8\x05\xfa\xce\x81\x72\xf9\x8a\x55\x0e\x6e\x0d\x4d\xc7\
-\xd5\x3c\x5b\xf6\x2d\xa8\x58\xbc\xe4\x9f\xf9\x1b\x40\xfa\x01\x01\
-\xb3\xd2\x0c\xb5\x7a\xab\xb8\x8e\x89\x3f\xcd\xdd\xb0\xbe\x20\x4c\
-\xe9\xbb\x60\xfc\x86\xe9\x10\xf5\x5a\x74\xd3\xd8\x3c\x60\x6c\x35\
-\x1e\x50\x0c\xc4\x2f\xe2\x55\x91\x1e\xc4\x17\xa2\x2f\x6d\x01\x3b\
-\x0e\x1c\x89\x5d\x95\x6d\xb4\xcc\xf8\x11\x32\xed\x01\x32\x27\x35\
-\x95\x79\xe9\x03\x99\xb3\xb6\xcb\xbc\xeb\x65\xfe\xe2\x09\x19\xfa\
-\x87\xaa\x83\xa0\xa4\x04\xaa\x03\xa0\x24\x2b\x09\x1b\xfc\xb4\x6d\
-\x64\x06\x85\xca\xac\x98\x41\x66\x57\x73\xd7\x6c\xac\x95\x59\xb4\
-\xab\xcc\xf4\x9e\x4f\xf0\x16\x8f\x16\x43\x2c\xf1\x60\xfc\x60\xcc\
-\x60\x39\x18\x4b\x8d\x0b\x46\x30\xf8\xbd\x92\xa6\x87\x77\x07\x28\
-\x3a\x21\x5f\x86\x9c\x0b\xa1\x71\x70\xf5\x95\xa5\xf3\x41\xd5\xeb\
-\x65\xb6\x15\x12\x90\x6d\x4f\x26\xef\x74\x5e\xe0\x76\xc6\xad\xa6\
-\xf6\x8d\xd5\x5b\x2f\xe9\x3d\x78\x33\xfa\xe3\xd8\xdf\xe0\xa4\xc7\
-\xf9\x1e\xd7\xe7\xc0\x86\xf0\xdd\x83\x8f\xae\x82\xad\xdf\xec\xf7\
-\x3c\xd5\x18\x6e\x7c\x71\x67\xd6\xdd\x9a\x60\x8b\xb1\xed\x70\xac\
-\x00\x6d\xb9\x36\x50\x14\x02\xf2\x92\x83\x2c\x80\x8e\x9e\xf8\x23\
-\x05\x0f\x73\x5c\x97\x79\xd8\xd9\x51\xd8\x20\x73\x7f\xb0\xcc\x29\
-\x9d\x64\x86\x99\x1d\x82\xcb\x9f\xa8\x0e\x81\x92\x1c\xa9\x0e\x80\
-\xe2\x92\x12\x36\xf4\x6e\x77\x65\x6a\x7f\xc9\x6c\x60\x5e\x6c\xd7\
-\x29\x8f\xcc\xd6\xe6\x8e\x59\x33\x47\x00\xdc\xc7\x24\x5a\x61\x42\
-\x8e\x11\x10\x47\x3c\x36\x30\x62\x8c\xbc\xc6\xcb\x60\xc4\x1b\xf9\
-\x78\x09\xdc\x3b\xb9\xcf\xd1\x42\xa0\x60\xaf\xa0\xe2\x81\xeb\xa0\
-\xf6\x2b\x15\xbe\x2c\x36\x08\x6a\x0d\xad\x38\xa7\xe8\x48\x28\x74\
-\x33\xef\xf8\x40\x1f\x70\xab\xa9\xad\xd6\x4a\x01\x85\xc9\x47\x4e\
-\xab\xb7\x76\xd2\xd1\xdd\xf4\x6f\x75\x07\x5c\xae\x70\x23\x5d\x68\
-\x59\xd8\xd0\x7b\xf7\x92\x63\x95\x60\x6d\xd1\x1d\xe9\x8f\x04\xc3\
-\xd9\x3d\x97\x26\xdc\xbc\x0e\x71\xa5\x6c\x2d\x6c\x6f\x82\xf6\x8b\
-\xe8\x20\xd2\x81\x38\x2d\x56\x88\x1f\x01\x07\x3a\xba\x65\xd5\x9b\
-\xa7\x14\x74\x73\x64\xe9\x90\x87\xcc\x15\xc5\x64\xee\xfb\x54\xe6\
-\xaa\xfc\xe6\xf3\xcc\x91\x27\x47\x06\xd5\x41\x50\x5c\x91\xea\x00\
-\x28\x2e\x21\x61\x83\x9f\xcb\xbc\xc8\x2b\xd7\x1f\x32\x5b\x64\x93\
-\xd9\x28\x52\x66\x8e\x12\x32\x33\xdd\xb0\xba\xee\x7f\x30\x87\xb0\
-\xf5\x42\xfa\xbb\xc6\x36\x70\x8f\x74\x6f\xae\x4d\x80\x2c\xb3\x32\
-\x56\x4a\x5b\x06\xca\xf9\x16\xdb\x13\x1c\x0e\x8d\x46\x54\x9b\x58\
-\xba\x37\x14\xfb\xb4\xc0\xe7\xb9\xea\x41\xc6\xdf\xd2\xce\xf2\x7f\
-\x1f\xc4\x5b\xa2\x34\x91\x56\x7f\x88\xa4\xa3\xcf\x35\xd2\x1a\x83\
-\xe1\x4e\xee\xb0\xb1\x11\x7d\x60\x73\xd1\xbd\x65\x4f\x44\xc0\xb2\
-\xf3\x9b\x96\xef\x8f\x87\xd3\xb9\x2e\x36\xbb\x71\x02\x62\x4a\xc6\
-\xae\x8b\x1f\x00\x62\xbf\x36\x4c\x54\x04\x51\x87\x4a\x14\x03\xbc\
-\xf0\xc0\x9d\x24\xb8\x9e\xe0\x49\x84\x06\xca\xbc\x7e\x54\xe6\x1a\
-\xbb\xcc\x3f\xf2\xc9\x3c\x66\x5e\x94\x68\x4c\x53\x1d\x02\xc5\x15\
-\xa8\x0e\x80\x92\xa4\xcc\x86\xde\xfc\xbb\xf3\x5e\x24\xd3\x23\x87\
-\xcc\x4e\x3f\xc8\xec\xb8\x45\x66\x15\xf3\x62\x2d\x66\xcb\x10\xd3\
-\xac\xae\xff\x89\xb9\xe3\x8e\x1b\x18\xe3\x8d\x3f\x59\x05\xc6\x78\
-\x63\x9f\x91\x06\xd9\x41\x88\x87\x34\x83\x7d\xe7\x7a\x2d\x83\xe2\
-\xbf\x17\x58\x92\xbb\x12\xd4\xda\x5e\xfe\x60\xd1\x8a\x50\x2b\xaa\
-\x62\xbe\xa2\xd5\x21\x67\xaf\xac\xa7\x32\x1e\x00\x6d\x90\x96\x55\
-\x4c\xb7\xfa\xc3\x24\xbd\x90\xdf\xef\xe5\xbf\xbf\x0e\xb6\xe7\x38\
-\x50\xff\xf4\x0f\xb0\x3a\x60\x5b\xad\x43\x3d\xe1\xc0\x99\x13\x3b\
-\x2f\xf6\x86\xe8\x25\x31\x6d\xe3\x82\x40\x6c\x15\x33\xf8\x0a\x44\
-\x0e\x71\x57\xac\x07\xe2\xb1\x61\xb7\xba\xfa\x87\xdd\x30\x47\xa8\
-\xe6\x99\x77\x35\x9c\x2d\x25\x73\xba\x79\x4a\xca\x66\x9e\x72\x88\
-\x6d\x69\x76\x0c\x5c\xa2\x3b\xa3\xa4\x7c\xaa\x03\xa0\x24\xaa\x84\
-\x47\xf6\xa5\xcc\xfb\xbc\xb3\x9b\xb7\x6d\xf5\x34\xcf\xd9\x97\xfc\
-\x48\x66\x0e\xb3\xe1\xf7\x89\xb3\xba\xee\x44\xe3\x8d\x17\x1e\x60\
-\x8c\x36\xa6\xb2\x14\xf4\xbd\x46\xb0\xfe\x0d\x78\x7d\xe2\x31\xc8\
-\xa3\x37\x04\xae\xc9\x3a\x34\xfd\x25\x78\xbb\xc1\xeb\x8b\x9b\xce\
-\x80\xfa\xd1\x55\xeb\x97\xec\x6e\x75\xd1\x16\xca\x46\x2d\xfa\x42\
-\xf8\xb1\xc8\xca\xd1\x47\x61\xb7\xf7\x91\x2d\x67\x5f\x81\x65\xaf\
-\x6e\xec\xbf\xff\x27\xd8\x57\xe1\x58\xbb\xf3\x05\xe1\x81\x23\xfa\
-\x56\xac\x3b\x88\xb7\xb5\x0a\x22\x06\x44\x6d\x2a\x52\x0c\xd0\xcc\
-\x53\x36\x2e\x25\xc6\xbc\xa8\xf0\xba\x39\xd2\x75\x74\xaf\xcc\x71\
-\x83\x64\xee\xfc\x45\x66\xec\x6d\x35\x52\xa0\x24\x26\x97\xfb\x6a\
-\x28\xc9\x53\xc2\x86\xde\xfd\x9a\xcc\xec\x9b\x65\xf6\x33\xaf\xbe\
-\x7f\xc5\xec\x00\x04\x9b\x47\x40\xec\x36\xb3\x92\xd5\xf5\x5b\xcd\
-\x28\x66\x34\x37\x06\x81\xd8\x23\xfe\x10\x1f\xc2\x9b\xa7\x5f\xad\
-\xd4\xd0\x0b\xde\x72\x7b\xf5\xdb\x86\x93\xac\xae\xce\xf5\x44\x8c\
-\x78\xa0\x45\xaf\x83\xad\xc7\xf6\xf5\x3f\x79\x0c\xe6\x34\x5f\xb5\
-\x74\xe7\x66\x38\x76\xf8\x6c\xcc\x95\xee\x10\xdf\xce\x56\xcb\x5e\
-\x0c\xdc\x6a\x68\x17\xb4\xa1\x40\x10\x39\xc8\x0c\x18\x18\xae\x7b\
-\x7c\x1d\x6b\xce\x1b\xb1\xc0\x3c\x95\x70\xcd\xbc\x2b\x61\xbc\x39\
-\x42\x76\xb3\x96\x4c\x7b\x4e\xd5\x31\x50\x5e\x04\x37\xab\x0b\x50\
-\x92\xb7\x84\x0d\x7f\xf1\x5c\x32\x7b\xa5\x93\xf9\xb3\x79\x15\x7e\
-\x43\xb3\xc1\xcf\xd8\xf4\xa1\x5f\x4f\x45\x97\xbf\xfd\x3b\xb1\x4d\
-\xac\x16\x0b\x40\xdf\x69\x3c\x30\xca\x42\xe1\x55\xc1\xd7\x72\x94\
-\x80\x6a\x25\xcb\xf6\x2c\x5c\xd2\xea\xea\x5c\x8f\x77\x35\xcf\x21\
-\x1e\xc1\x50\x20\x7d\x9e\xaa\x81\x5d\xa0\xe6\xe2\xf2\x81\x45\xbc\
-\x20\xfd\xb8\x80\xbc\x7e\xab\xe1\x6e\xbd\x88\x1e\x0f\xae\x42\x58\
-\xa5\xf0\x26\x0f\x66\x00\xc7\xb9\x6f\x8c\x01\x11\x2a\xce\x8a\xdd\
-\x80\x8f\x1c\x89\x71\x2d\xee\xe6\x7c\x04\x25\xba\xca\xac\x6c\xde\
-\x65\xd0\xde\x39\xe3\xe4\x03\x99\x61\xc7\xb3\x66\x2d\x5c\xb8\x6a\
-\xd5\x3b\xf7\x6f\xdf\x3e\x7d\x7a\xe7\xce\xa7\x7a\x13\x45\xf9\x9b\
-\x1a\x01\x50\x9e\x48\xc2\x86\xde\xc3\x9c\xb2\x36\xbb\x39\x65\x6b\
-\x3f\xf3\xea\xfc\x96\xde\x32\x0b\x34\xb6\xba\xde\xe4\xca\x96\xdb\
-\x7e\xcd\xb1\x16\x5a\xcc\xac\x97\xa1\x42\x07\xf8\xc6\x7f\xd0\x9a\
-\x0e\x1f\x58\x5d\x55\x32\x92\x95\xf2\x0c\x82\x8b\x39\xae\xd5\xba\
-\x73\x00\x16\x2d\x5c\xff\xde\xde\xdb\xb0\xa2\xcc\xe6\xf3\x07\x04\
-\xdc\x5c\x14\x3a\xec\xde\x0c\xd0\x32\x68\x6b\xb4\x3e\x20\xba\xd3\
-\x86\xba\xfc\x7d\x57\x47\xf2\x70\x76\x95\xcc\x45\xe6\x54\xd3\xe3\
-\xcd\xbb\x0d\x6e\xbe\x2e\xd3\x36\x49\x8d\x10\x28\x4f\x42\xb3\xba\
-\x00\xc5\xb5\x25\x6c\xf8\x8b\xce\x97\xf9\xa1\x39\xf7\xfd\xae\xd6\
-\x32\x07\x15\x96\xa9\x1a\xfe\xe7\xe6\x8b\x37\x5e\x20\x4a\x52\x88\
-\x3c\x56\x17\x93\x0c\xdd\x66\x1f\x63\x20\xef\x81\x9c\xa3\xb2\x6c\
-\x86\x01\x41\xaf\xaf\x6f\x52\x12\xbe\xd9\xfe\x6e\x97\x8e\xfe\x50\
-\x6d\x7d\x99\x4f\x0a\x77\x03\xf7\x1b\x6e\x4d\xb5\x69\xa0\x2f\x33\
-\x6e\x19\x79\x81\x28\xa2\x89\xe5\x7f\xb7\x79\xba\x34\xe7\xf7\xcc\
-\xf9\xbd\x73\x7e\x0f\x9d\xdf\xcb\xa2\xf3\x1f\x9a\xe2\x5a\x51\x1e\
-\xc9\xe5\xff\xd4\x95\xa4\xf1\xd0\x39\xfc\x8d\x32\x73\x9e\x92\xd9\
-\x67\xa1\xcc\xe6\x4b\x65\x16\x7a\xf6\x09\x75\x94\x7f\x65\x2b\x6c\
-\x0f\x75\x6c\x81\x96\x7b\xea\x95\xa9\xf0\x0e\x0c\xbf\x38\x68\x5c\
-\x87\x57\xad\xae\x2a\xe5\x08\x19\x7f\x37\xe2\xfe\x06\xf8\x7d\xf5\
-\xe2\x53\x9b\xc3\x60\xf1\xfe\xf5\x85\xf7\x2e\x82\x7b\x23\x22\xd3\
-\x47\x65\x00\x6d\xb0\xa8\x21\xe2\x80\xcc\xa4\x27\xc0\xea\x6a\x9f\
-\xd5\x69\x73\x8d\x84\x25\xe6\xe4\xd4\x3f\x9b\xf3\x63\x5c\x33\x3b\
-\x0c\xf6\x3a\x6a\x84\x40\x01\xd5\x01\x48\xb5\x1e\x7d\x84\x50\xd8\
-\x5c\x6d\xad\x9d\x79\x15\xfe\x5b\xe6\x94\xba\x99\xda\xcb\x74\xf7\
-\xb5\xba\xee\x94\x4e\x75\x00\x92\x46\x5c\x40\x7c\x0f\xdb\x2a\xd8\
-\xb8\x6c\xcf\xba\xe3\xe1\x30\xad\xef\x82\x6f\x36\x06\xc1\xf1\x85\
-\xe7\x47\x5d\xdb\x01\x22\x9c\xdd\x62\x06\x88\xde\xa2\x3d\x0d\x48\
-\xa2\x29\x8a\x5f\x34\x7b\xb4\xcc\x50\xf3\x36\xda\x5f\xcc\x49\xaa\
-\xe7\x98\xb7\x1d\x9e\xfa\xfb\xa4\x87\xea\x10\xa4\x4e\xea\x14\x40\
-\x2a\x93\xb0\xe1\xf7\xcf\x24\xf3\x5b\x73\x5d\xfa\x45\x6b\x64\x7e\
-\x79\x49\x66\x36\x73\x5d\x77\xd5\xf0\x2b\x29\x8b\xd7\x7d\xcf\xc9\
-\x1e\x8d\xa1\x71\x44\xf5\x09\xa5\x4b\xc3\xd0\x3a\x03\xb6\xbd\xda\
-\x04\x1a\x16\xad\xda\xa6\x64\x05\x70\x73\xb8\x8d\xd5\xee\x82\xf1\
-\xb9\x31\x96\xd9\x80\x86\x96\xfc\x0e\x97\x9c\xdf\x5b\xe7\xf7\xf8\
-\xcb\x8b\x32\xa7\x9b\x23\x79\x95\xd7\xc9\xf4\xaf\xab\x4e\x19\xa4\
-\x4e\xc9\xee\x4f\x5a\x79\x32\x0f\x7d\xa1\xab\xcb\xd0\x76\xc8\x6c\
-\x60\x0e\x05\xbe\x5e\x45\x66\x87\x23\xe6\xbf\xef\xb1\xba\xee\xd4\
-\x4e\x8d\x00\x58\x2b\x2c\x30\xfc\xf5\xc8\x85\x30\x7a\xe6\xf4\x99\
-\xcb\xee\xc3\xf2\x3f\x36\x75\x3c\xf0\x23\xe8\x1d\xf4\xb1\x46\x34\
-\x88\xf7\xc5\x1b\x34\x07\x1c\x38\xac\x9b\x92\xf8\xb9\x65\x91\x11\
-\x6b\x5e\x44\x38\xaf\x83\xcc\x19\xab\x65\xae\xbe\xe4\x7c\xa2\x1a\
-\x19\x48\xd9\xd4\x08\x40\xaa\x50\xc0\x3c\x17\xb8\xd0\x3c\xe2\xff\
-\x63\xab\xcc\xd7\xcd\x3b\xcc\x55\xc3\xef\x32\xde\xa1\x1b\x4d\x21\
-\xce\x88\xcf\x60\xef\x0f\xf6\x8d\x8e\x37\xf4\xba\x56\x17\x95\x7a\
-\x64\xbc\x91\x6e\x86\x7f\x2b\xe8\x5f\xae\xe3\xf1\x26\xaf\x42\xad\
-\xaf\x2a\xfc\x52\x74\x15\x18\x45\x69\x69\x0c\x04\x0e\x72\x82\x8b\
-\x56\x57\xf9\xdc\xee\xc8\xf0\x36\x57\xc1\x7c\xdd\x9c\x71\xf3\x77\
-\x73\x2d\x83\xce\x51\x32\x03\x4b\xaa\x91\x81\x94\xcd\xdd\xea\x02\
-\x94\xe7\xf3\xd0\x72\xb8\x66\x83\x9e\xe6\x1d\x99\x9d\x22\x64\x76\
-\xde\x24\xb3\xf2\x6d\xab\xeb\x55\xfe\x9d\x38\x2e\x96\x88\xd1\x10\
-\x79\x2f\xaa\x7e\xcc\xab\xf0\x20\x20\xfa\x76\x6c\x28\xa4\xc3\x9f\
-\xe4\x74\x1e\x26\xfc\x74\x64\x9b\xe8\x26\x70\x71\xed\xb5\x42\x77\
-\x2e\x43\xde\x83\x39\x97\x65\x9e\x0b\xe9\x6a\xf9\x0f\x49\x13\x02\
-\x74\xa6\x0d\xb5\xad\xae\xf2\xf1\xb2\xf9\x67\x2a\x92\xce\x0b\x06\
-\xee\xee\x52\xbe\xd9\x65\x88\x09\x8c\xab\x16\x5f\x1d\x76\x5e\x3f\
-\x74\xe8\x8c\x1b\x08\x5f\xb1\x57\x2c\xfc\x7f\x6b\x12\x58\xb2\x6a\
-\xe1\x8b\x96\xa5\x87\xcc\x69\xe6\xd4\xc5\xbb\xcd\x09\x88\xfe\x30\
-\x3b\x02\x53\xcc\x79\x3c\x62\xbf\x55\x23\x03\x29\x83\x1a\x01\x48\
-\x51\x9a\x9b\x53\x88\x6e\x35\xaf\xd2\x1f\x6d\x5e\xbc\x57\xb9\xb6\
-\xd5\x95\x29\x4f\xc8\xc3\x5c\x43\x60\x31\x1b\xd9\x0b\xac\x64\x1b\
-\x07\xad\x2e\xea\xe9\xdd\x6f\xf0\x60\x77\x74\x19\x18\x57\x62\xc6\
-\xc7\x2b\xb3\xc0\xc0\x37\xbf\x39\x36\x6d\x3b\x2c\x19\xbf\xc1\xb1\
-\xaf\x2d\x84\x0d\x0e\x1f\x19\x79\x12\x18\xcd\x3c\x16\x5a\x5d\xed\
-\xe3\xe5\xad\x9f\x63\x5f\x96\x0a\xf0\xc1\xc9\x37\xfc\x5b\x4e\x80\
-\x4a\x19\x4b\x0e\x2c\x70\x02\x98\x6b\x2c\x61\x0b\x70\x83\x3b\xdc\
-\xb3\xba\xca\x17\x4d\x5c\x90\x59\xd9\x1c\x29\xfc\xa1\x9d\xcc\xaf\
-\xcf\xca\x2c\xd1\x54\x76\x08\x44\x55\xab\x2b\x55\x9e\x8f\x9a\x09\
-\x30\x99\x71\x1e\xf1\xcb\x99\xc0\x82\xcc\x21\xfd\x4f\xcc\x8b\x7c\
-\x3e\xac\x27\xb3\xc0\x3c\x99\xee\x6d\xad\xae\x57\x79\x3a\x7a\x55\
-\x43\x33\x0e\x42\xae\xb4\xd9\xc9\x94\x0e\x1a\x5e\xad\x16\x56\x2a\
-\x16\xbc\x6b\x7a\xf5\xf1\x18\x68\x75\x75\x4f\x2e\x22\xee\x41\x6c\
-\x74\x06\x58\x3a\x7b\xe3\xf9\xfd\x4b\xe0\xd0\xfd\x93\x3e\x97\xae\
-\xc0\x8e\x8d\x07\x6f\x9c\xfe\x0e\x8e\xcd\x3d\xeb\x7f\x75\x2c\x3c\
-\xe8\x17\x1d\x13\xfb\x35\x64\x4e\x9b\x61\x65\x40\x43\xf0\x3b\xe6\
-\x7b\xdf\xfb\x3c\x50\x82\xc2\xae\x34\x0f\x42\x86\xa2\x69\xeb\xfa\
-\x35\x85\xc0\xd9\x59\xae\xa7\x0f\x86\xad\x5e\x07\x6a\x9f\x1a\x0b\
-\x31\xfe\xb1\xdf\xc7\x6d\x00\x71\x45\x1c\x11\x9b\xad\xae\x32\xb1\
-\xb8\x99\x6b\x16\x54\x35\x3b\x02\xcd\xcb\xca\xcc\x1e\x2e\xf7\x43\
-\x67\x4f\xc9\x0c\x8f\x56\x33\x13\x26\x2f\x6a\x04\x20\x99\x48\x38\
-\xd4\x9f\xe7\x7d\x99\x13\xa7\xc9\x7c\xcf\xbc\x8a\x3f\xb0\xbf\xd5\
-\x75\x2a\x0a\x00\x69\x49\x83\x0f\x88\xca\xc2\x4b\x1c\x06\x2d\x58\
-\x3b\x20\x06\x40\xfc\x55\xfb\x26\xc7\xaf\xb0\xab\xe3\xa1\xce\x67\
-\x4a\xc0\xa8\xac\x53\x4b\x2d\x0d\x82\x0f\x4e\x7e\xff\xca\x0c\x3b\
-\x2c\x2d\xb9\x69\xe0\xfe\x0f\x21\xb2\x74\xd4\x80\x98\x6b\x56\x7f\
-\x88\x7f\x2a\xd1\xb5\xe0\xb7\xb9\xd7\x43\xb5\xad\x65\x06\x15\xaa\
-\x02\xfa\x10\x63\x9d\x61\xf0\xf7\x22\x4f\xa9\x43\x8e\x22\x32\xdf\
-\xfb\x46\xa6\x73\x3f\x94\xe7\x7d\x75\xcd\x40\xf2\xa2\x3a\x00\x2e\
-\xca\xf9\x45\x92\xe9\x69\x2e\x70\xfa\x76\x4f\x99\xb3\xcd\x41\xd3\
-\xfa\xcd\xac\xae\x53\x51\x1e\xc5\xf0\x37\x4a\xd3\x11\x8c\x68\x23\
-\x97\xd1\x0c\xf0\x37\x3b\x04\xe5\x28\x4a\x30\xb8\x5d\x73\x7b\x5b\
-\xbb\x07\xb6\xe6\x76\x7f\xc7\x55\x38\x30\xf7\xc4\xce\x8b\x2d\xe1\
-\xeb\x9a\xbf\x5c\x9a\xf7\x23\x7c\xa6\x8f\xdd\x38\xbb\x12\x6c\xfa\
-\x65\xcf\xad\x13\xbe\x60\xf3\xb5\xc5\x39\xfc\xad\xfe\x54\xe0\x65\
-\xf3\x5c\xe7\xf1\x16\x34\x6c\x52\xad\x4a\xa9\xda\x90\x7e\x6d\x40\
-\xbc\x5f\x31\xd0\xe7\x19\x57\x8d\x5c\x90\x1c\xe6\x11\x7c\xf1\x9c\
-\xfb\x21\xe7\x7e\xe9\xed\x9e\xce\xfd\x96\xea\x10\xb8\x36\xd5\x01\
-\x70\x31\x09\xbf\x30\xe5\xcc\x06\x7f\x58\x09\x99\xdf\x99\xb7\xed\
-\x55\x3a\x6b\x75\x9d\x4a\x22\x31\xcc\x8b\xc9\x72\x92\x8d\x8c\x40\
-\x76\xb2\x90\xde\xea\xa2\x9e\xde\x83\x6e\x51\x55\x63\xda\xc2\xfd\
-\x72\x0f\x2a\x45\x0f\x03\x71\x99\x4d\x62\xe2\xff\x7b\x82\x8e\x8e\
-\x0e\x62\x8a\x18\xc6\x5b\xa0\x65\xd0\x36\x8a\x9e\x10\xf3\x53\xec\
-\x39\x5b\x73\x58\xf7\xfa\xce\xbb\x47\x46\xc2\x67\x57\xc6\xbe\x39\
-\x2b\x2d\x0c\x2b\xf1\xeb\xa7\xf3\xaf\xc1\xe9\x9a\x17\xbf\xbb\xf1\
-\x11\xf0\x06\x83\xf9\xc3\xba\xcf\x57\x36\xa8\x68\xbd\xe0\x25\x50\
-\xaa\x5e\xe1\x3b\x79\x26\x81\x11\x6a\x64\x36\xea\x01\xd1\xc4\x10\
-\x6f\xf1\xc6\xb7\x8c\x73\xbf\xf4\xdd\x38\x99\x9f\x56\x93\xe9\x31\
-\x53\x75\x04\x5c\x93\xba\x06\xc0\x62\x09\xcf\xe9\x3b\x1f\x6d\x60\
-\x2e\xaa\x33\xd3\xbc\x4f\xb7\xc9\x31\x99\xee\x65\xac\xae\x57\x49\
-\x5c\xfa\x50\xa3\x96\x01\x64\xff\x36\x73\x91\xf4\xb7\xa1\xbe\x6f\
-\x95\x4e\x25\x4a\x81\x6f\x15\x9f\x6c\x5e\xad\xac\xae\xee\xc9\xdd\
-\x98\x78\x67\xcf\xbd\x96\xb0\x32\x64\xeb\x90\x83\x93\x21\x7a\x70\
-\xec\x4f\x71\xdd\x41\xfc\x29\xd2\x88\xb0\x47\xfc\x82\x0d\x3b\x0e\
-\x10\xdb\xc5\x5a\x4a\x82\xb6\x45\xf8\x89\xf3\x10\x1b\x1f\x57\x37\
-\xfe\x17\x38\x31\xea\xc2\xcc\xeb\xd3\xe0\xd0\xf7\x27\x33\x5d\xca\
-\x06\x3e\xeb\xbc\x37\x78\x76\x83\x3c\xbd\x03\x2b\x66\x6e\x09\xee\
-\x2d\xdc\x03\xdd\x5e\x4b\xba\xcf\xe7\x95\xd5\xd3\xdb\xfd\x4d\x88\
-\x8f\xb1\x9d\x75\x74\x82\x1d\x7e\x87\xe6\x9f\xd9\x00\x8e\xee\xfa\
-\x4d\x3d\x04\xc4\x1f\xe4\x26\x9b\xd5\xff\x15\xac\xe2\x6e\xde\x5d\
-\xe6\xbc\x88\xb0\x6c\x5e\x99\x61\xb7\xe5\x7e\xee\xc2\x55\xe7\xfe\
-\x4e\x5d\x33\x60\x2d\x35\x02\x60\x91\x84\x3d\xe2\x1c\x19\x65\xbe\
-\x65\x5e\x64\x33\x31\x54\x66\xae\xc3\x56\xd7\xa9\x24\x2d\xf1\xa7\
-\xf8\x8e\xfe\x10\x7d\x26\x76\x42\x5c\x7b\x88\x59\x1d\xd7\x32\x3e\
-\x39\xde\xbc\x99\x97\x5c\x64\x05\xf2\x93\x87\xec\x3c\xf9\x6d\x72\
-\x86\xf9\xac\x74\x04\xe0\x0b\xe2\x8e\xd8\x2e\x26\x81\xd6\x5c\x64\
-\x13\x97\xe1\x4c\xdf\x4b\x03\x6f\xae\x81\x6f\x3e\xf9\x75\xf7\xc2\
-\xb7\xe0\xe7\x25\x7f\xfd\xb8\xfa\x0c\x84\x7c\x73\xf7\xcc\xfd\xa9\
-\x49\xff\x31\xab\x06\x94\x09\x2b\x94\x19\xf2\x7b\xe6\x6e\x9b\xad\
-\x3d\x18\x6e\x46\x71\xa3\x5d\xd2\xd7\xe1\x9a\xbc\xa6\xcb\x6c\x61\
-\xae\x52\x38\xc5\x9c\x5f\xa0\x7e\x57\xab\x2b\x53\x24\xd5\x01\x48\
-\x62\x09\x1b\xfe\xec\xe6\x1c\x6f\x13\xcc\x23\xfc\x9f\xcd\x39\xbb\
-\xf3\xa4\xb1\xba\x4e\xc5\x22\x01\xf2\x5c\xb9\x51\xc8\x68\x61\x0c\
-\x06\xa3\x8a\xd1\xd9\x18\x6a\x75\x51\x16\x72\x76\x1a\xb2\x92\x91\
-\xb4\xa0\x2d\xd0\x06\x8a\x20\x88\xda\x13\xf3\x7d\x6c\x5f\xf8\xe3\
-\xe4\x92\x6a\x5b\xd2\xc3\x77\x63\x27\x35\x5f\x64\x87\x9b\x9f\x85\
-\xbc\x11\x9e\x84\x4b\x55\xf9\x35\xf1\xfd\xd9\x6b\x1c\xe4\xba\x94\
-\x6d\x5c\xa6\x37\x80\x8a\x46\x1b\xd4\xf2\xcd\x8f\x91\xf3\x90\xcc\
-\x29\x1d\x65\x4e\xbc\x23\xf7\x87\x81\x36\x75\x8a\xc0\x1a\xaa\x03\
-\x90\xc8\x12\x5e\xcc\xe7\x6e\xf6\x84\xdb\x76\x96\x39\x75\x8e\xcc\
-\x97\x52\xed\x60\xa1\xf2\x0f\xf2\x18\xd8\x0f\x5f\xe1\x0d\xa4\xc1\
-\x07\x2f\xab\x4b\x72\x01\xce\x91\x01\x4f\x3c\x70\x07\x61\x13\x47\
-\xc5\x2c\x70\xcc\x71\x54\xd4\x8f\xc3\xda\xaf\x77\x7c\x7a\x24\x0f\
-\x8c\xe8\x36\xf9\xdc\xe2\x20\xb8\x13\x10\xf6\x4b\xc4\xbc\xc4\x2f\
-\xcb\x56\xd2\x76\xcc\x31\x19\x22\xde\x8a\xfc\x2a\xca\x0f\xe8\x4f\
-\x17\x5e\xb6\x7a\x63\xb9\xba\x5c\xf5\x65\xbe\x91\x59\xe6\x44\x73\
-\x26\xc2\xec\xe9\x12\xee\x2f\xad\xae\x33\xe5\x53\x1d\x80\x44\x92\
-\xf0\x0f\xd8\xd3\xbc\x32\xf8\x5d\x73\x15\xae\xe9\x6f\xc9\x6c\x94\
-\xec\xd6\x17\x53\x14\x97\x10\x47\x3c\x36\x10\xd3\xc4\x70\xfa\x80\
-\x5e\xce\xf8\xca\x38\x04\xbb\x62\x0e\x67\x3e\xd3\x11\x2e\xef\xbf\
-\xb9\x3c\x74\x4e\xe2\x97\x61\x3f\xee\xf8\xda\x51\x01\xee\x0f\x8b\
-\x5a\x1d\x13\x0b\x74\x11\x2d\x5c\x79\x86\x43\xd7\xd4\xb4\x9f\xcc\
-\xdf\xde\x94\x99\xfd\x9c\xd5\x15\xa5\x16\xaa\x03\xf0\x82\x25\x6c\
-\xf8\xb5\x3a\x32\x07\x85\xcb\x1c\x6a\xde\xaf\xef\x53\xd9\xea\x3a\
-\x15\x25\x51\x1d\xe3\x2c\x57\x81\xc3\x9c\xe2\x12\xe0\x86\xdb\x0b\
-\xdd\xdb\x98\x23\x23\x86\xc3\x28\x60\xb4\x06\x8f\xbb\xee\x65\xdd\
-\x5a\x42\xab\x65\xf5\xab\x57\xac\x0d\x85\xb2\xe7\x35\x02\x9b\x26\
-\xc1\xe7\x8c\x32\xaf\xfa\x3f\xcf\x55\xe3\x0e\xa9\xf4\x36\xc0\x17\
-\xe5\x25\x73\x5e\x81\xe9\xe6\x88\x40\xc7\x9a\xe6\xc8\x69\x05\x35\
-\x22\x90\x38\x54\x07\xe0\x05\x49\xf8\x07\xea\x61\x2e\xab\x3b\x78\
-\xa3\xcc\x21\xe6\x90\x97\x67\x51\xab\xeb\x54\x5c\x9c\x6e\x0e\x76\
-\x07\x9a\xb7\x01\x66\x23\x0b\x19\xac\x2e\xea\xe9\x3d\xe8\x16\xd3\
-\x2c\xb6\x21\x44\x36\x89\xea\x1e\x33\x0a\xc4\x41\xe6\x8b\xef\x5e\
-\xc0\x0b\x9b\x1d\x09\x63\x8f\x61\x33\x4a\x81\xc7\x1f\x1e\x07\xdc\
-\xf7\x40\xfb\x33\x4d\xde\xaa\xd6\x08\x7a\xa7\x6f\x3f\xa9\x81\x1d\
-\x02\xfc\xd2\x2c\xf7\xe9\x9a\xf8\x9f\x33\xae\x6c\x7c\x53\xfb\x17\
-\x70\xc7\x16\x36\xec\xfe\xbb\x20\x7e\x63\xa8\xe8\x9d\xf8\xef\x9b\
-\xb2\x35\x18\x29\x73\x62\x8c\xcc\xf7\xf6\xca\xf4\x58\xa3\x3a\x02\
-\x2f\x96\xea\x00\x3c\xa7\x87\x8e\xf8\x2f\xc9\x7c\xe7\x57\x99\x43\
-\xcd\xeb\x81\x7d\xd4\x6a\x7b\xca\x93\x29\x43\x09\x0a\x80\xc3\xee\
-\xa8\xe7\x58\x07\x8e\x9a\xfa\x10\x3d\xec\xf9\x5f\x36\xa9\xc5\xf9\
-\xc6\xe7\xb2\xbd\x03\xb1\x6f\xc4\xff\x60\xf3\x00\xf1\xa9\x78\x8b\
-\x67\xb9\x8d\x51\x43\x43\x80\xb1\x8a\x2d\x1c\x02\x3d\x87\xde\xcb\
-\x58\x0b\x69\x7b\xfb\x1f\x49\xd3\x0f\xba\xd5\x69\x95\xab\xce\x6c\
-\x78\x6b\xf7\xab\x01\x0d\xf3\x40\xda\x5e\x7e\x47\x7d\xeb\x25\xdd\
-\xe7\xd4\x0f\xe8\x45\xf5\xb1\x10\x47\x7c\x90\xad\x1b\x50\x96\x22\
-\x04\x25\xdd\xfb\xa7\x6c\xce\xfd\xa6\x73\x3f\xea\xdc\xaf\x6a\x97\
-\x54\x47\xe0\xc5\x50\x1d\x80\x67\xf4\xd0\x11\x7f\x6e\x99\x83\x37\
-\xc8\x1c\x62\xfe\xe1\x7a\xcc\xb6\xba\x4e\x25\x79\x11\x77\xc4\x0e\
-\x31\x0d\xee\xcf\x78\x70\x38\xba\x24\x44\x5e\x78\x70\x2e\x26\x39\
-\x4e\x31\x9b\x87\xec\x64\x01\x11\x4c\x0e\xb2\xf2\xf4\xab\xe5\x99\
-\xcf\x37\xbe\x30\xc6\x31\x0f\x44\x61\x4a\x90\x0e\x8a\xc5\x17\x68\
-\x93\xeb\x18\x7c\x9e\xb3\x4f\x8d\x57\x46\x43\xcf\xc3\xed\x26\xd7\
-\xcf\x01\x01\x53\xfd\x4a\xfb\x6c\x4a\xfa\x8f\x79\x7a\xfb\xa5\xa3\
-\x37\x07\x83\xed\x90\xfd\x77\xc7\xb7\x40\x3e\x91\x8a\xef\xff\x4f\
-\x2c\xce\xfd\xa8\x73\xbf\xea\xdc\xcf\x7a\xe4\x56\x1d\x81\xe7\xa3\
-\x3a\x00\x4f\x28\xe1\xd5\xa9\xa2\x97\x7c\xd4\xf7\x96\xcc\x41\xe6\
-\x2a\x7c\x43\xd7\xcb\xf4\xb9\x62\x75\xbd\x4a\x32\x55\x9a\xc2\x04\
-\x81\xc3\x5f\x1f\x65\xf8\x81\xde\x42\xdf\x6a\x54\xb2\xba\xa8\x24\
-\x60\x5e\xdd\x6f\x74\x31\x3e\x64\x3c\x38\xfa\xeb\x87\xf4\xc6\xe0\
-\x37\xc2\x77\x81\xd7\x6c\x68\x59\xa1\xde\xc2\x0a\xc3\x60\xd8\xad\
-\x81\xbe\xaf\x69\xd0\xe0\xa3\xaa\x93\x4b\xbe\x0e\x5e\xd9\x3d\x74\
-\xf7\x59\x49\x5f\x6e\xf8\xb1\xc8\x8e\xd1\x85\x60\xf1\xb5\xf5\x2f\
-\xed\xd9\x03\x31\xed\xe2\x96\xc6\x17\x03\x51\x8f\xca\x94\xb0\x7a\
-\x63\xa6\x54\xce\xfd\xaa\x73\x3f\x3b\x68\xb1\x4c\xb7\xd5\xaa\x23\
-\xf0\x6c\x54\x07\xe0\x99\xd4\xf8\x58\xe6\xb6\x55\x32\x3f\x37\x2f\
-\x37\xf2\x98\x61\x75\x65\x4a\x32\xe7\xc0\x81\x0e\x54\xa0\x04\xf9\
-\x80\xd2\x29\x74\x48\x59\x98\x97\xcb\x1d\xe5\x0c\x57\x40\xff\xd1\
-\xd8\x67\x78\x83\x67\x55\xcf\x57\xdc\x0b\x40\x95\x0f\x4a\x7d\x5e\
-\x30\x16\xbe\xa8\xda\x2f\xac\x5d\x18\x7c\x98\xbf\xa7\x77\xab\xb9\
-\x90\xef\x70\xae\x3b\x59\xe3\xac\x2e\x1e\xb6\x7e\xbf\xaf\xc1\xc9\
-\x08\xd8\x5d\xff\xb0\xc7\xd9\x93\x20\x26\xf0\x15\x6f\x01\x69\xf1\
-\xc7\xc7\xea\xea\x52\x3a\xe7\x7e\xf6\x8b\x99\x32\x07\x9b\xfb\x5f\
-\xf7\x66\xaa\x23\xf0\x74\xdc\xad\x2e\xc0\x55\x3d\xfa\x0f\xa9\x46\
-\x4e\x99\x53\x6f\xc8\x0c\xee\x62\x75\x9d\x8a\x92\x2c\xb8\xa1\xa1\
-\x01\x97\xb8\x41\x08\xe8\x91\x7a\x03\x63\x1a\x68\x4d\xb5\x6c\x62\
-\x28\xe4\x13\xb9\x3c\xb3\xf6\x82\xf6\xd5\x9a\xac\xaa\xda\x00\x1a\
-\xae\xaf\xd6\xb8\xf4\x60\xc8\x58\x3b\x5d\x4e\xbf\xed\xe6\x6b\x34\
-\xb1\xfa\x43\x40\x48\x97\xbb\xfb\xef\xcf\x84\xb9\x37\x57\x8f\xda\
-\x71\x05\xa2\x5f\x8b\xad\x1f\xdf\x01\xb4\xe5\xda\x3a\x91\x9f\xff\
-\xcd\x57\xa0\x24\x01\x9f\x11\x32\xbf\x34\x47\x02\x1c\xe6\x0c\x0c\
-\xbf\x16\x90\xfb\xef\xfb\x69\xe5\xcf\xc6\x97\x47\x8e\x2c\x5e\x3c\
-\x6a\x94\xd5\xf5\xba\x1e\xd5\x01\x78\x22\x35\xcc\x09\x7c\xa6\x99\
-\x73\xf4\x07\x57\xb1\xba\x22\x45\x71\x69\xe6\x11\xbe\x71\x8a\x8b\
-\x5c\x07\x8a\x1b\x05\x8c\x7a\x20\x0a\x0b\x0f\xb1\x06\xf2\x04\x06\
-\xbe\x9e\x29\x02\xea\x06\x55\x9e\x5f\xa2\x01\xbc\x5c\xaa\x4e\xa3\
-\xf2\xbb\x20\x5f\x64\xee\xa3\x59\x5f\x01\xcd\x57\xe4\x14\xdb\x9f\
-\xbb\x8a\x17\x6e\x5d\xab\x9d\x05\x8f\xae\x84\xe3\xbe\xe7\xb4\x6b\
-\xa7\x40\xa4\x17\x59\xc5\x79\x60\x21\xb6\x14\x39\x52\x93\x2c\x78\
-\x9c\x96\xf9\xa5\xb9\x5f\x6e\x65\x2e\x57\xdc\xd4\x7c\xfc\x9e\xd5\
-\x05\xba\x2c\xd5\x01\x30\x3d\xe6\x88\x7f\x8a\xcc\x69\x6f\xc8\x0c\
-\x56\x13\xf7\x28\x89\x4b\xc7\x40\x07\xf2\x10\x48\x26\xe0\x06\x59\
-\xb1\x5b\x5d\xd4\xd3\xbb\xb7\x33\x62\x4a\xd4\x77\x60\xe4\x34\xda\
-\x1b\xfd\x20\xb3\x67\x86\x3d\x69\xdf\x80\x46\x33\xaa\x0f\x28\x5d\
-\x18\x5a\x0c\xab\x1b\x55\xfe\x34\xe4\xaf\x9a\xe7\x6c\xf6\xfb\xe0\
-\xee\xeb\xf6\xb1\xb6\x1b\x80\x0d\x56\xd7\xfe\x28\xa7\x17\x5f\x3c\
-\x76\x63\x25\x2c\x38\xb7\xf6\xd0\xee\x5d\x10\xff\x7d\x7c\x37\xfb\
-\x3c\xd0\x32\x6a\xad\xc5\x9b\x80\xbb\x5a\x58\xcd\x7a\xde\xe6\xb2\
-\x42\x65\x2e\xc9\xec\xf9\xb3\xcc\x31\xd9\xe4\xfe\xdd\x36\x55\x8d\
-\x04\x24\xa4\x3a\x00\x8f\x54\x7d\xb0\xcc\x69\xe6\x9c\xfc\xaa\xe1\
-\x57\x92\x86\x08\x22\x07\x99\x41\x1f\xa7\x37\xd1\x57\x82\x5e\xc2\
-\x78\xdb\xc8\x0e\xc0\xcf\x56\xd7\xf6\x24\x8c\x19\xc6\x49\xf2\x80\
-\xe6\xa7\xcd\x13\xfb\xa1\xcd\xb4\x06\x3f\x57\xee\x08\x2d\x0b\xd7\
-\xff\xb8\xc2\x4f\x50\xa2\x4f\xc1\x5e\xb9\x33\x83\xfb\x2a\x37\x87\
-\x5b\x10\x00\x53\x39\x69\x75\xd5\x8f\x77\xa1\xf5\xd5\x49\xb7\x97\
-\xc1\xf7\x59\xa6\xe4\x5c\x12\x0f\x67\xa6\x5c\x1a\x71\xa3\x02\x68\
-\xfe\x9a\xaf\xa8\x0e\xb8\x93\x4d\x35\xfd\xae\xc6\x2b\x48\xe6\xd0\
-\x9f\x64\x6a\xe6\x7c\x2c\x23\x0e\xcb\x8e\x80\x7e\x40\x75\x04\xa4\
-\x54\x3f\x6b\x55\xc2\x23\x7f\xf7\xc9\x32\x7f\xfb\x54\x66\xb7\x1b\
-\x56\xd7\xa7\xa4\x2e\xc6\x72\xb6\x70\x00\xdc\xb7\xb9\x05\x69\x43\
-\x61\x4c\xfe\x0f\x47\x76\xbd\x02\xb5\xca\x57\xa8\x57\xb4\x83\xd5\
-\xd5\x3d\x81\x62\x34\xe2\x1d\x08\xdf\x14\x59\x28\xfa\x04\x78\xb7\
-\xf1\x6c\xec\x71\x05\xbc\xb7\x78\x35\xf5\x38\x61\x75\x71\x4f\xee\
-\xfc\xc7\x57\x6e\xdc\xce\x07\x23\x22\x26\x7f\xb2\xf8\x32\xec\x1c\
-\x79\x78\xcd\x99\xc6\xc0\x3d\x62\x89\x01\xf1\x12\xb5\x28\xcb\xd3\
-\xdf\xde\xa8\x58\x20\xd6\x79\x1b\xa1\x79\x4d\xc0\x98\xc2\x32\x6d\
-\x79\x53\x7b\x47\x20\xd5\xde\x05\x90\xb0\xe1\x17\x11\x32\xdf\x33\
-\xd7\xaf\xee\x98\x0c\xa7\x5e\x51\x52\x02\xd1\x92\xba\x54\x04\x5b\
-\x36\xfb\x1d\xc7\x1a\xb0\x7f\x65\xaf\xe7\x48\x4e\x47\x98\xc7\x59\
-\xcd\x68\x48\x97\xd9\x7f\xac\xef\xaa\xe4\xd7\xf0\x5f\x88\xbe\x56\
-\xe8\x4e\x30\x7c\xfb\xc9\xa4\x3a\x8b\x6e\xc2\xce\x23\x87\xf2\x9c\
-\xde\x07\xdc\x26\x92\x48\x10\x2f\x53\x9b\x72\xa8\x86\x3f\x59\xf1\
-\x6e\x2f\xf3\xab\x16\x32\xdf\xfd\x52\xa6\x88\x48\xed\x77\x0d\xa4\
-\xba\x0e\xc0\x43\x8b\xf4\x98\x39\xb8\xbb\xcc\xcf\x5b\x9b\x8f\xbb\
-\xc0\x8d\x46\x4a\xaa\x64\xc3\x8e\x1d\xc4\x2b\x34\xa0\x32\xf0\xb2\
-\x90\x0d\x8e\x92\x28\x8c\x95\xc6\x03\x0a\xc3\xc9\x65\x17\xb2\x5e\
-\x6f\x0a\xdf\xfa\x4c\xbc\xb4\x70\x22\xec\x69\x79\xa4\xd2\xd9\x0f\
-\x80\x99\xe2\x07\x31\x08\x44\x2b\xea\x51\x91\xff\xdd\xa6\xa9\x24\
-\x43\xce\xfd\xba\x73\x3f\xef\xdc\xef\x7b\xa6\xda\xd5\x07\x53\x4d\
-\x07\xe0\xa1\x29\x7b\x9b\xcb\x1c\xe4\x9c\x58\xc2\x3c\xbf\xea\xa3\
-\x16\xf2\x54\x94\x54\x20\xe6\x97\xb8\xa0\xf8\x6d\xb0\xa8\xd7\xfa\
-\x36\x7b\x32\xc2\x47\x11\xa3\xdb\xff\x39\x14\x76\x95\x3a\xd4\xef\
-\x8c\x2f\x18\x93\x59\xc2\x26\x10\x2d\xa9\x4f\x45\xe4\xed\x7d\xea\
-\x88\x3f\x85\x70\xee\xe7\x9d\xfb\x7d\x67\x3b\xa0\x35\x4f\x6d\x1d\
-\x81\x14\xdf\x01\x78\x68\xca\xde\xf9\x32\x07\x6f\x93\x39\xa4\x99\
-\x4c\xcf\x2c\x56\xd7\xa9\x28\x4a\x22\x7a\x87\x91\xcc\x84\xeb\xc7\
-\xee\x04\xde\xbd\x03\x3f\xf6\xf8\xfd\xd8\x8a\x70\x18\xd9\x7f\xf2\
-\x82\x25\x67\xe1\xc2\x37\x57\x7d\x6f\x47\x81\x78\x20\x8e\x88\x3f\
-\xff\xdf\x50\xbf\x1d\x3b\xea\x12\xe0\x14\xca\xb9\xdf\xff\xa2\x81\
-\xcc\x8e\x3d\xad\xae\x28\xa9\xa5\xd8\x0e\xc0\x43\x47\xfc\x0f\x64\
-\xbe\x63\xf6\xf8\x86\x9a\x53\x8a\xf8\x1c\xb1\xba\x4e\x45\x51\x12\
-\x8f\xf1\x99\xb1\xd2\x88\x87\x5d\x63\x0e\xb5\x3e\xe3\x0b\x1f\xfd\
-\x30\xda\x73\x66\x69\xf8\xeb\xeb\xe5\x7f\x6c\xbb\x03\x0f\x3e\x8d\
-\xee\x12\xf3\x0b\x08\x21\x4e\x88\x25\x40\x00\x7e\x6a\x26\xbf\xd4\
-\xc6\xfb\x94\xcc\x8e\xfe\x32\xb3\xb5\x4b\x2d\x23\x01\x29\xb6\x03\
-\x90\x50\x5b\x73\xca\xde\x21\xeb\x64\xaa\x29\x7b\x15\x17\x67\x2e\
-\x0b\x6c\x7c\xa8\xcf\x37\x3c\x9f\xff\xe5\x52\x8d\xdc\xb4\xa4\x1b\
-\x5c\xed\x72\x2b\x28\xac\x2c\xfc\x34\x60\x66\xd5\xd5\x1b\xe1\xf3\
-\x15\xe3\x0b\xcc\xe9\x0f\x07\xb7\x9c\xf8\xf0\xa2\x0d\x98\xc3\x52\
-\x8e\x80\x28\x2a\x1c\x62\x17\x7f\xaf\x3a\xa8\x86\xfa\x53\xb3\x46\
-\xb5\x64\x4e\xac\x2a\x33\xf0\x54\x4a\xef\x08\xa4\xb8\x0e\x40\xc2\
-\xff\x60\xd9\x3a\xc9\xec\x52\x53\xa6\xea\xda\x2b\xc9\x83\x71\x9b\
-\x30\x22\x20\x74\x42\xf8\xe2\x07\xe5\xad\xae\xc6\x85\x6d\xe1\x10\
-\x27\xe1\xfe\xcc\x07\x97\x63\x46\xc3\x02\xb1\x36\xf7\xee\xfa\xf0\
-\x7e\xd7\x91\x8d\xff\xc8\x06\x13\x23\xe6\xde\x5b\x57\x16\x6e\xe6\
-\x0b\x29\x75\xef\x3d\xd0\x74\x6d\x81\x68\x0f\x78\xe1\x89\x3b\xaa\
-\xc1\x57\x1e\xe1\xa5\xb7\x65\x4e\x34\xef\xbf\xc9\xd6\x3f\xa5\x76\
-\x04\x52\x4c\x07\x20\xe1\x7f\xa0\x40\x73\x68\x7f\xe2\x74\x99\x4d\
-\x32\x5b\x5d\x9f\xa2\x3c\x95\x48\xa2\x88\x81\xa8\x22\x31\x31\xb1\
-\x3b\x80\xa6\xf4\x65\x9c\xd5\x45\xb9\x8e\x98\x45\x71\xc5\xe3\x8f\
-\xc1\xb6\x97\xf7\x3b\x4e\xb5\x81\x8f\xa7\x8d\x39\x39\xd3\x80\xef\
-\x96\x4f\x2a\xbc\x78\x01\x1c\xbb\x74\x76\xe3\x95\x77\x80\x46\xf4\
-\xe2\x4b\xd0\xda\x89\x20\x71\x0d\x48\x83\x2f\xde\x56\x57\xaf\x24\
-\x0f\x4d\xf3\xcb\xfc\x7a\x97\xd5\x95\x24\x96\x64\x3f\x13\xe0\xa3\
-\x7b\x66\x2d\x7c\x65\xbe\x94\xea\x27\x3a\x52\x92\x99\x34\xf8\xe0\
-\x05\xb4\x34\xba\x30\x12\xb8\x6a\xb4\x64\x37\x50\x86\x77\x28\x6b\
-\x75\x71\xd6\xb1\xf7\x77\xe4\x77\xdc\x81\xb3\x51\x97\xce\xde\xcc\
-\x0c\xf3\x76\xae\x5e\xb7\xeb\x16\xac\x9f\xb6\x3b\xf8\x58\x38\x84\
-\xad\xbb\xb7\x3b\x72\x15\x88\x9f\x44\x04\x73\xc0\x6d\x8f\x56\x5c\
-\xfb\x16\xf0\xc3\x81\x37\xea\x48\x5f\x79\x0e\x8d\xf6\xca\xac\xff\
-\x8b\x6c\x6f\xd6\xbd\xe5\xfc\x97\xe4\x3e\x91\x50\xb2\xef\x00\x24\
-\xd4\x20\x8f\xcc\x8f\xd2\x59\x5d\x89\xa2\xfc\x2b\xe7\x72\xb8\xb7\
-\x09\x25\x02\x8c\x56\x46\x7f\x63\x04\x18\x8b\x8c\x9b\x04\x81\xcf\
-\x64\xef\xcb\x9e\xbd\x21\xe3\xee\xf4\xc5\xfc\x57\x00\x5f\x70\x82\
-\xdf\xac\x2e\x3a\xe9\xd8\x77\x3b\xbe\xd1\xf3\xc1\xa9\x8f\x2e\xec\
-\xba\xb6\x07\x56\x66\xdf\xb2\xfa\x50\x01\x58\xbb\x6c\xc7\xd7\x87\
-\xe7\xc0\xed\x1a\x61\xe7\x22\x76\x83\x9e\xcd\xc8\x66\xf4\x05\x6d\
-\x8f\x36\x54\x44\x02\xf1\xd8\x18\x66\x75\xf5\x4a\xca\x92\xd3\xec\
-\x3a\x4e\x31\x27\x88\xeb\xf1\xad\xcc\xb5\x97\xad\xae\xec\x79\x25\
-\xdb\x0e\x40\xc2\x23\xff\x0a\x17\x64\x4e\xca\x2d\x33\x57\x72\x9a\
-\x3b\x4d\x49\x4d\xbc\xf1\xc2\x03\x0c\x7f\xa3\x8c\xd1\x19\x8c\x08\
-\x23\x3d\x15\xc0\xef\x9a\x6f\x0d\xef\xf3\x50\x7c\x79\xc1\x7a\xb9\
-\x2e\x43\xcb\x3e\xf5\xfc\x2b\x16\x87\x1a\x1b\xca\xdf\x2e\xf2\x86\
-\xd5\x45\x27\x3e\x7b\x7a\xfb\x61\xc7\x7c\x38\x5b\xfc\x72\xe6\x9b\
-\xd5\x61\x49\xed\x8d\x1b\xf6\x2d\x82\x4d\x45\xf6\xf8\x1e\xf7\x86\
-\x6b\x85\x6e\x65\xba\xdb\x12\xc4\x4a\x71\x1e\x3b\xf0\x97\xd8\x28\
-\xf6\x80\x56\x5b\x54\x10\x45\x01\x3b\x36\x35\x41\x8f\x92\xb8\x72\
-\x65\x94\xd9\xe7\x13\x99\x9b\x0b\xcb\x76\x28\xbe\x66\x72\x1d\x09\
-\x48\x76\x43\xe4\x09\x1b\x7e\x37\x73\x8e\xe7\xe1\x33\x65\x0e\x5e\
-\x64\x75\x7d\x8a\x92\x80\x73\x59\xdc\x36\xc6\xdb\x8c\x02\x63\xb7\
-\x11\x67\x14\x83\xb4\x9a\xff\x06\xdf\x00\xa8\xf4\x52\xa9\x9f\x0a\
-\x14\x86\x97\x6e\xd7\x4e\x57\xee\x32\x94\x79\xab\x48\xff\xbc\x37\
-\x21\xdd\x2e\xff\x72\xbe\xbf\x03\x2f\x51\x3f\x25\xce\x04\xe8\xc8\
-\xe0\xd8\xa1\xb7\x85\x93\xd3\x2f\x5c\xbd\x7e\x15\x56\x54\xdf\x72\
-\xe9\xc0\x0f\xb0\x56\xdb\x71\xf6\xc8\x79\xb8\xbd\x2e\x74\x70\xc4\
-\x60\x30\xde\x35\xd6\x19\x71\xa0\xa5\xd7\xd6\x89\x6e\xa8\x29\x78\
-\x15\x17\x10\x1f\x2a\xf3\xbb\x7c\x32\x87\x9a\xf3\x09\xd8\xcf\x25\
-\xb7\x8e\x40\xb2\x19\x01\x48\xd8\xf0\x7b\x99\x4b\x86\x7e\x18\x2d\
-\x73\xd0\x05\xab\xeb\x53\x14\x40\xde\x4e\xa6\x01\x77\x89\x20\x12\
-\x1c\x97\xf5\x4a\xfa\x58\xf0\xbe\xea\xd5\xc5\x73\x07\x94\xbe\x50\
-\xe8\x58\x9e\xed\xd0\x4e\x6b\xa2\x55\xfd\x09\xaa\xbe\x56\xe6\xed\
-\xc2\x9f\x81\x9f\xbf\x6f\xa0\xd7\xdd\xff\xf7\x3a\x2f\x59\xfd\x41\
-\x5e\x90\x48\xa2\x89\x87\x98\xab\x71\x6d\xe3\x6f\xc2\x99\xaf\x2e\
-\x4e\xb9\x59\x16\x56\x4e\xda\xba\xe3\x60\x15\xd8\xcc\x5e\x8f\x13\
-\x77\xe1\xda\x86\xdb\x9f\x85\xcd\x06\x31\x99\x11\xf4\x01\xb1\x5a\
-\xb4\x12\xd5\x41\x94\x14\x85\x44\x6e\x54\xc3\xaf\xb8\x10\xcf\x4c\
-\x32\x3f\x8a\x91\x79\xaf\x9b\xcc\x31\x9f\x58\x5d\xd9\xd3\x72\xf9\
-\x11\x80\x47\x5f\xe4\x57\xdf\x9c\xb8\x61\xf9\x02\x99\x9e\x1f\x59\
-\x5d\xa7\x92\x4a\xb9\xe1\x86\x06\xc6\x62\xd6\xb1\x0f\x8c\x77\xf4\
-\xa5\xc6\x7d\x70\x5b\xaa\x55\xd5\x4e\x40\xc1\x21\x79\xbb\x64\xbf\
-\x0d\xad\xcb\x36\x78\xa5\xd2\x71\x68\xb8\xa0\xda\xf2\x52\xdb\x21\
-\x43\xab\xb4\x1d\xfd\xea\x00\x8d\xa9\x93\x12\x2f\xee\x8b\x6a\x10\
-\x53\x25\xae\x24\x1c\xba\x72\xf2\xc3\x8b\x8b\x61\xe5\x80\xad\xfb\
-\x0f\xbd\x03\xdb\x0a\x1c\x18\x7b\x6a\x3f\xdc\x8d\x09\x3f\xf0\x40\
-\x80\xf1\x8a\x31\xdd\xb8\x0a\x5a\x90\xb6\x5b\xf4\x03\x7c\xf1\x46\
-\xcd\x7b\xa0\x24\x2b\x3b\xcc\x45\x86\x5e\xfd\x5a\xe6\xd5\x92\xce\
-\x7f\x71\xf5\x11\x81\x64\x33\x02\x20\xe5\x36\x8f\xfc\x3f\x30\xa7\
-\xf4\xf5\xfc\xd8\xea\x8a\x94\x54\xca\x0b\x4f\x3c\xc0\x68\x6c\xf4\
-\x34\x86\x81\xd6\x46\xbb\xaa\xe5\x87\xc0\x8e\xd9\x57\x66\x98\x03\
-\xcd\xea\xd6\x72\x2f\xd7\x12\x9a\x87\xd6\xdd\x59\xfe\x4d\xc8\x39\
-\x29\x6b\x9d\x0c\x63\x40\xcc\x15\x93\x44\x65\xab\x8b\x4f\x3c\xb6\
-\xd7\xed\x35\x1d\x95\xe0\xd7\x7e\xb3\xc7\xae\xad\x03\x8b\xdf\x59\
-\xcf\xde\x4a\x70\xb7\xc3\xfd\xd1\x0f\xbe\x02\xf1\x13\x8b\xc5\x12\
-\x10\xe3\x44\x67\xba\x81\x28\x26\x32\x8b\xf4\x80\x81\xb7\x3a\xc2\
-\x57\x92\xa7\xaa\x8b\x65\x4e\x19\x2e\xb3\x87\xd9\x4e\x5d\xa9\x6b\
-\x75\x65\xff\xc5\x65\x47\x00\x1e\x7d\xe4\x3f\xd2\x9c\xa1\xe9\xbd\
-\xed\x56\xd7\xa7\xa4\x32\x1e\xb8\xe3\x06\xc6\x2c\x56\xb0\x03\xf4\
-\xdc\x7a\x3f\x7d\x03\x04\x2c\x4c\xf3\x85\x6f\x06\x68\xb2\xa7\xe6\
-\xc8\xd2\x73\xa0\xfd\x9a\x26\xa1\xd5\x3e\x87\xfc\xc7\x72\xfb\x65\
-\x3b\x0e\x9a\xa1\x7d\x23\xa2\xad\x2e\x3e\xe9\xc4\x94\x8c\x5d\x19\
-\xdf\x15\xde\x6e\x3b\x3c\x70\xea\x05\xd8\xb1\xf6\xa0\xfb\xe9\x9a\
-\xe0\x76\xd1\xad\x9f\x16\x06\x64\x24\x1d\x7e\xa8\xdb\xf2\x94\x14\
-\xec\xfb\x6a\x32\xdf\xdf\xe1\x7c\xc4\x55\x47\x02\x5c\x6e\x04\xe0\
-\xd1\x0d\x7f\x73\xb3\xe1\xef\xa8\x06\x07\x95\xa4\xe5\xbc\x88\xaf\
-\x95\xd1\x9f\x51\xa0\x0d\xd1\x22\x45\x71\x28\xb2\x36\xff\xb4\x5c\
-\xe9\xe1\xf5\xc6\x2f\xb7\xad\x99\x11\xea\x57\xa8\x3a\xa5\xc4\x4d\
-\xf0\x39\xea\x75\xd9\x73\xaf\xd5\x45\x5b\x28\x27\xd9\xc8\x08\xda\
-\x66\xed\x63\xe1\x05\x62\x90\xb6\x59\x44\x03\x5f\x50\x9f\x34\xa8\
-\x86\x5f\x49\x05\x5e\xfb\x55\xe6\x8c\x1e\x32\x0f\xef\xb1\xba\xa2\
-\xc7\x71\xf1\x99\x00\xd3\x44\xc9\xfc\x22\x9d\xcc\xec\x1b\xad\xae\
-\x48\x49\xe1\x9c\xf7\xe7\x9f\xe4\x02\xd7\x41\x2f\xad\x0f\x36\xb6\
-\x41\x9a\xdc\xbe\x83\xbd\x3a\x41\xab\x5a\xf5\xc7\x56\x1c\x01\xdf\
-\x55\x7a\x77\x68\xc7\x5b\xf0\xf2\xd7\x75\x0a\x96\x3b\x00\x3e\xfd\
-\xbd\x2e\x7b\x76\xb7\xba\x78\x17\xe0\x3c\xc2\x1f\x44\x67\xf3\x42\
-\x46\xe1\xba\xe3\x8c\x8a\x92\x18\x72\x14\x97\xf9\x7a\x1b\x99\x9e\
-\x4d\x5d\x75\x2a\x61\x97\x1b\x01\x48\xa8\x5b\x36\x99\x25\x36\x58\
-\x5d\x89\x92\xc2\x39\x1b\xfe\x0b\x5c\xe5\x36\x18\x8d\x8c\x5e\xc6\
-\x77\x50\xa4\x5b\xbe\x5b\x39\x32\x43\xd7\xee\xad\x42\x6b\x2f\x80\
-\x5a\x65\x2b\x0c\x28\x36\x14\xd2\x2c\xf5\x59\xed\x65\x2e\x2a\x8d\
-\x9f\xd5\xc5\xbb\x0e\x23\xca\xc8\x6b\x34\x87\xf8\x5d\xb6\x49\xf6\
-\x4d\x40\x31\xe2\xb0\x99\xff\xa8\xc6\xef\x94\x54\x65\xa0\x79\x0d\
-\xc0\x65\xf3\xe2\xc0\xf1\x56\x17\xf4\x0f\x2e\x33\x02\x90\xb0\x87\
-\x94\xaf\xbe\xcc\x0e\x9d\x65\xba\xab\xe5\x50\x94\xc4\x61\xae\x02\
-\x67\x8c\x31\xa6\xb1\x0c\x8c\xae\xc6\xc7\xc6\x58\xa8\x10\x54\xe2\
-\x7e\xfe\xf9\x30\x74\x5c\xff\x5a\xed\xa3\xa1\xe9\xf9\x9a\xe7\xcb\
-\x76\x84\x34\x73\xff\x5f\xc3\xaf\xfc\x83\xbd\x8d\x23\x44\xff\x11\
-\xee\x04\xdd\x9d\x73\xff\x1b\xe0\x86\x11\xc2\xdd\xe7\x7e\x59\x45\
-\x49\x86\x9c\xed\xd6\x6b\xe6\xc8\x75\x60\xbc\xab\x8d\x04\xb8\x4c\
-\x07\xc0\x2c\x27\x56\xe6\xa8\x5e\x32\xab\xb8\x5e\x97\x49\x49\x19\
-\x9c\x0d\xff\x87\xc6\x68\x66\x82\xd6\x56\x2b\xce\x61\x68\xbc\xa1\
-\xc6\xf8\xd2\x5e\x30\xa4\x66\x5f\xdf\xb6\xf5\xa1\xf0\xbc\xe0\x0c\
-\x39\x32\x5a\x5d\x6c\x32\xd2\x99\xc1\xc6\x04\xb0\xd7\xb4\xef\x72\
-\x8c\x03\x6c\xd8\xd5\x0c\x7d\x4a\xea\x56\xe9\xb8\xcc\xfa\xa3\xad\
-\xae\xe4\x61\x96\x75\x00\x9c\x3d\x21\x33\x3b\xca\x47\x5b\x0f\x90\
-\x59\x7d\xa0\xd5\x1b\x46\x49\xa1\x9c\xb7\xef\x5d\x34\x02\x8c\x3a\
-\xe0\xf3\xad\x77\x5e\x8f\x15\xd0\x6e\x5b\x93\x3b\xd5\x2a\xc2\xe0\
-\x4b\x3d\x4a\xb4\xf0\x81\xdc\x6d\xb3\x0f\xcc\x54\xc2\xea\x62\x93\
-\x21\x6f\xb9\x7d\x45\x49\x51\x98\xdc\xb8\xf0\x7d\x46\x8a\x92\x54\
-\xdc\xcc\x91\xec\xd1\xf7\x65\x36\xc5\x55\x46\x02\x5c\x64\x04\x20\
-\x7f\x6b\x99\x63\xdb\xcb\xcc\x78\xdd\xea\x8a\x94\x14\xc6\xdd\x9c\
-\xb0\xa7\x8b\xf1\x11\x3f\x81\x6f\x1b\x9f\x39\x5e\x47\xa0\xc7\xf4\
-\x36\x77\xea\xed\x84\xb7\xbf\xe8\x94\xa5\x69\x36\xc8\xf4\x20\xfd\
-\x8f\x01\x56\xd7\xaa\x28\x4a\x0a\x94\xd1\x5c\xa6\xaa\xdd\x21\x99\
-\xbe\x7d\xac\xee\x08\xb8\x48\x07\xa0\x67\x69\x99\xd9\x77\x5b\x5d\
-\x89\x92\x32\x19\x93\x8c\x79\x6c\x00\x11\x22\x0e\xf1\x0b\xbc\xbc\
-\xa7\xf6\xfc\xf2\x1f\x41\xa7\x49\xcd\x6d\x35\x05\xa4\x99\xe5\x73\
-\xd5\x6b\x95\xd5\x55\x2a\x8a\x92\xf2\xb5\x33\x6f\x0b\x2c\x3d\xd1\
-\xea\x4a\x92\xbc\x03\x90\xb0\xc7\x53\xa4\x8f\xcc\xe6\x0d\xcc\x07\
-\xd4\x94\xbe\xca\x8b\x65\xce\xcd\x6f\xf4\x33\x66\x1b\xe1\x50\xb6\
-\x5b\xd1\x26\xc1\xf3\xa0\x5b\xba\xd6\x7b\xea\x14\x03\x9f\xb1\xde\
-\x81\x9e\xbd\xad\x2e\xf2\x11\xa2\x89\x21\x0e\x62\x6b\xc6\xad\xb7\
-\x55\x07\xe3\x1b\x63\x17\xde\x56\x17\xa5\x28\xca\xf3\xf3\xe9\x29\
-\xf3\xc7\x9a\x32\x8b\x64\xb0\x6a\x24\x20\xc9\x3a\x00\x09\x3f\x60\
-\xe6\x3f\x64\x4e\x69\x2a\xb3\xf0\xf9\xa4\xff\xe8\x4a\x8a\x66\x36\
-\xfc\xfa\x72\x23\xc4\xc8\x03\xd9\x82\x33\xbd\x9c\x2e\x33\xf4\x5e\
-\xd3\xfe\xd3\x06\xdb\x20\x70\x6b\x96\x21\xe9\x8f\x59\x5d\xe4\x3f\
-\x45\x1f\x8c\x7d\x33\x3e\x3b\x6c\x38\xb1\xfb\x83\x63\x93\xe1\xf7\
-\x6b\x8b\xe7\x6d\xda\x02\x71\x63\xe3\xd7\xd8\xec\x56\x57\xf7\xdf\
-\x1c\xc2\x31\x54\x07\x8c\xa2\x46\x73\x06\x01\x69\xf0\xc5\xcb\xea\
-\xaa\x14\xc5\x15\x95\x5f\x27\xb3\xcd\x5c\xe7\x23\x49\xdd\x11\xb0\
-\xe8\x14\x40\x13\xf3\xf6\x88\x32\xfe\xd6\xbc\xbf\x92\xd2\x19\x4d\
-\x8d\x5e\xc6\x70\xf0\x59\xe2\xd5\xda\x73\x1f\x74\xb9\xd7\x2a\x5f\
-\xad\x21\x50\x21\xbe\xc4\xbe\x7c\x13\xac\xae\xee\x7f\xf4\xf9\x46\
-\x80\xf1\x01\xec\x3b\x76\xbc\xd4\x85\x4a\x30\xfc\xd8\xaf\xf6\x05\
-\xe9\xe1\xe3\x5e\xa3\x3f\x9c\x79\x16\xf6\x7b\x1c\x0f\xbf\x30\x07\
-\x0c\x87\x11\x64\x34\xb3\xba\xda\xff\x76\x27\xe4\x5e\x87\x48\x4f\
-\x88\xcf\x65\xcb\x60\xcf\x0e\xb4\x12\xf5\xa8\x68\x75\x55\x8a\xe2\
-\xca\xfa\x9a\x37\xca\x06\xd5\x4e\xea\x77\x4e\xf4\x0e\x40\xc2\x1e\
-\x4d\x5a\xf3\x83\x76\x35\xa7\x06\xf1\xaa\x99\xd4\x1f\x58\x49\x1d\
-\x8c\x1e\x7c\xc6\x2f\x50\xf9\xcf\x52\x91\x05\x3a\x43\xf3\x46\x75\
-\xb6\x56\x98\x0c\x6e\x7d\xb5\x43\x5a\x1b\xab\xab\x83\xdb\xf9\xc2\
-\xbc\x22\x72\xc1\x84\x6a\xb3\x26\xac\xf9\x04\x3e\xfe\x69\xf4\xe6\
-\x99\xa7\x61\x71\xee\x0d\x1b\xf7\xbe\x0c\x51\x71\x31\x2b\xe2\xe6\
-\x40\x4c\x86\xd8\x81\xf1\x65\x40\x1f\x6e\x6c\x36\xd2\x58\x5d\xf5\
-\x7f\xb3\x75\xb3\x55\xb2\x77\x04\x7d\x80\x31\xc7\xb0\x01\x99\xc9\
-\x80\xba\xaa\x52\x51\xfe\x45\x36\xf3\x80\xb8\xef\xf2\xa4\x7e\xe7\
-\x24\x1e\x01\x68\xf6\x8e\xcc\x3a\xd9\x92\xfa\x83\x2a\xa9\x84\xb9\
-\x6e\xbc\xc8\x24\x6e\x8a\x15\x50\xd5\x28\x73\xad\x50\x34\x04\xf4\
-\xf7\x2b\xe0\x33\xf7\xf9\x5f\xfe\x59\xd9\xeb\x3b\xfc\x1c\xc7\x61\
-\xd7\xf6\xc3\xb3\xce\x76\x80\xcf\x9b\x8d\xdd\x3a\xbb\x14\xfc\x1a\
-\x32\xbb\xc2\xda\x08\xb8\x59\x34\x44\xbb\xd7\x1c\xb4\x76\x22\xbb\
-\xb8\x0b\x74\xa3\x0d\xb5\x21\xe4\xab\x7b\x97\x22\xdf\x00\xc7\x28\
-\x47\x2e\x3d\xc9\x77\x0f\xcf\xa0\x18\xf9\xc9\x09\xf8\xe1\x8b\x37\
-\x60\x98\xff\x53\x14\xe5\x71\x82\x64\xbc\x64\x4e\x18\x54\xbc\x47\
-\x52\x9d\x0a\x48\xb4\x0e\xc0\x43\x1f\xe0\x80\x8c\xbc\xe6\xfd\x90\
-\x64\x4e\xfc\x8f\xa6\xa4\x46\xfa\x4a\x23\xc4\xc8\x0f\x59\xe2\x33\
-\x0c\x0b\x98\x0f\xc5\x9b\x16\xc8\x9d\xfb\x4b\xeb\xea\xb9\x63\xdc\
-\x7d\xfd\x7e\x5b\xf8\xe9\xc3\x99\x69\x57\x7f\x04\x1f\x15\x1e\x33\
-\xe0\xcf\x19\xb0\x73\xd5\xa1\xe9\xa7\xdf\x05\x2a\xd1\x8e\x0f\x41\
-\x9b\xa4\x75\x16\x59\x80\x6c\x64\x22\x2d\x7f\x77\x64\x68\x4a\x1f\
-\xe3\x1b\xe0\x32\x37\x8d\x50\xab\xb7\xae\xa2\x28\x89\xa7\xb0\x79\
-\x92\xaf\x85\x39\x2f\x0e\x07\x12\xbb\x23\x90\x44\x23\x00\xb9\x72\
-\xc8\xec\x7b\x3c\x69\xde\x4f\x49\x75\xcc\xa3\x4c\xfd\x98\x5e\xd8\
-\xf8\x0e\x0a\x36\x0b\x1a\x1f\x98\x05\x72\xd5\xc8\x7e\x30\xe3\xf4\
-\xa4\x2f\xe7\xe2\x3b\xd7\x76\xde\x99\x04\xdf\x5c\xfa\xed\xec\xc2\
-\x5b\x30\x6d\xc7\xc2\x3c\x1b\xe7\x43\x68\xff\xbb\x8b\x22\xab\x83\
-\x88\x13\x27\xc5\x1c\xa0\x10\x79\x09\xfc\x97\x17\x72\x93\x33\x16\
-\xaa\x09\x75\x14\x25\xb5\x70\xb6\x93\xce\x76\x33\xf1\x24\x51\x07\
-\xe0\xed\xe6\x32\xb3\xf7\x4b\x9a\xf7\x53\x52\x1b\x63\xba\xb1\x88\
-\x4d\xe0\x79\xce\x23\xdc\x3d\x12\xca\xcc\x2a\xf2\x7b\xde\x1a\x90\
-\xb6\x86\xdf\x7c\xdf\x22\x49\xf0\xfe\xcd\x8d\xdf\x8c\x4b\x70\xf4\
-\xaf\xb3\x6e\x57\x16\xc3\x57\x6f\xfc\x52\x7c\x5e\x27\x58\x7f\x71\
-\xe7\xa2\xa3\x77\xc1\x31\x50\xbf\x66\xb4\x04\xed\xb4\x36\x4a\x54\
-\x07\xd2\x11\x40\x1a\xfe\x77\xa4\x9f\x52\xa4\x31\x87\xfe\xdd\xe4\
-\xc4\x4b\x8a\xa2\x3c\x2d\x67\x3b\xe9\x6c\x37\x13\xcf\x0b\xff\x8a\
-\x26\x1c\xb2\x28\x69\x1e\xb7\xbc\x3c\x3c\xb1\x3f\x88\x92\xca\xb5\
-\xa1\xbf\x31\x12\xfc\x7d\xd3\x04\x78\x6f\x85\x72\x07\x8a\x79\x04\
-\x17\x4b\xba\xb7\xbf\x98\xed\xfa\x67\x77\xce\xc2\xd7\x73\x7e\x69\
-\x3b\x7f\x02\xec\x29\x7a\x74\xd8\x39\x37\xa0\x98\x28\x4d\x20\x88\
-\x5a\x94\xa7\x28\x60\xc7\x91\x92\xe7\xc6\x37\x66\x1a\x17\x8d\xec\
-\xc0\x54\x63\x21\x9b\x00\x0f\xdc\x5d\x7d\xcd\x51\x45\x71\x4d\xce\
-\x76\xb3\xa4\x48\xac\x53\x01\x2f\xac\x03\x90\xb0\x40\xf1\x85\xcc\
-\xe6\x3b\x65\x16\xac\x9b\x68\xdb\x48\x51\x00\x63\x1f\xc7\xb8\x00\
-\xee\x77\xdd\x9a\xbb\x4d\x80\xb4\x47\xfc\x3f\xf0\xdd\x99\xf8\xef\
-\x1b\xe3\x1f\xbb\x22\xbe\x33\x4c\xfd\x70\xc1\xe7\x9b\xba\xc2\xc9\
-\xb2\xe7\x7b\x5d\x9b\x07\x6e\x79\xb5\x7d\xda\xdb\x20\x1a\x52\x85\
-\x52\xa4\xbc\x23\xfd\xc7\xb8\x5b\x3b\xa2\xe2\x83\x62\x60\x4b\x63\
-\xbf\x68\x5f\x02\xa2\x3e\x55\x50\x6b\x2a\x28\xca\x33\x70\xb6\x9b\
-\xce\x76\x54\x7c\xf1\xa2\x3b\x02\x89\x34\x48\x97\x33\xb7\xcc\xde\
-\xa7\x13\x6f\xe3\x28\xca\xff\x88\x06\x54\xa5\x24\xd8\x36\xdb\x7f\
-\xb3\x8f\x80\xd0\x4a\xf7\x7a\x45\x3e\x48\xfc\xf7\xbd\x73\xf6\x5e\
-\xd7\xfb\x37\xe1\x78\xf6\x73\xde\x57\xbb\x83\xbe\x4c\xf7\x37\x86\
-\x22\x87\xf8\x7d\x9f\xe3\x85\xb3\x89\xcc\xa4\x03\xbd\x9c\xfe\xa1\
-\x71\x1c\xe2\x46\xc5\x0f\xb3\x1f\x4c\xa2\x8d\xf9\x1c\x1c\x4b\x1d\
-\xb5\xf5\x7d\x60\x64\x32\xaa\xd1\x1d\xf0\x37\x4f\x09\x28\x8a\xf2\
-\x8c\x9c\xed\xa8\xb3\x5d\x7d\x71\x12\xa9\x03\xd0\xff\x77\xb3\xe0\
-\xce\xcf\xf7\x3a\x8a\xf2\x84\xaa\x53\x8e\xc2\x60\xfb\xc0\x9e\xc7\
-\x11\x01\xf7\xae\xdd\xef\xfa\xe0\xc3\xc4\x7f\xdb\x9c\x69\xb3\xbe\
-\x91\x61\x05\xd4\x5b\x5f\xd9\xab\xc4\x24\xf0\xbc\xee\xe1\xe6\x7e\
-\x19\x8c\xdf\x8c\xd9\xac\x43\x2e\x42\xe4\xf6\x0c\x2f\xdc\x92\x7a\
-\x54\x80\xf8\xe2\xb6\x20\x7b\x30\x84\xe4\xbd\xf7\xdd\xfd\xc2\x49\
-\xbd\x51\x9f\x41\x45\x51\x9c\xfc\x40\x5a\xe1\x87\x2f\x60\xa4\x86\
-\x71\x0f\x45\x49\x4c\xce\x76\xd4\xd9\xae\xbe\x38\xcf\xdd\x01\x78\
-\xe8\x9c\xbf\xd9\xd7\x6f\x9d\x1c\xee\x58\x56\x52\x92\x97\xa8\x23\
-\xca\x83\xed\x65\x5b\x1e\x47\x36\x08\x19\x12\xf6\x5b\x44\xfd\xc4\
-\x7f\x5b\x37\x1f\x6d\xb8\xe6\x01\xaf\x4e\x6f\x7a\xbd\xea\x4e\x68\
-\x90\xa7\x5a\xcb\x92\x1f\x00\xeb\xd8\xcb\x51\x30\xa6\xb2\x80\x8d\
-\xcf\xf0\xc2\x3e\x78\xe1\x09\xc6\xab\xbc\xc7\x18\xd0\xff\xd4\xd3\
-\x18\x03\x92\x7a\xa3\x2a\x8a\xe2\x3a\x02\xf3\xcb\x74\x5f\xf6\xa2\
-\x4e\x05\x3c\x73\x07\xe0\xa1\x73\xfe\x66\xcf\xa4\xd5\x40\x99\xf9\
-\x9e\x67\xf0\x53\x51\x9e\x9a\x68\x25\xea\x53\x11\xe2\x8e\xd8\x0e\
-\xdb\x42\xe1\xd6\xd2\xb0\x41\x11\x53\x92\xee\xfd\x33\xce\x4d\xf7\
-\x81\x7f\x10\xf4\x2f\xf3\x3a\x4d\x0a\x40\xad\xb4\x15\x3b\x16\x6d\
-\x07\x46\x76\xa3\x96\xd1\x0b\x8c\xe6\x46\x1f\x63\x04\x72\x8d\x82\
-\x27\xb9\xa5\xcf\x39\x81\x8e\x2f\xde\x78\x01\x05\xc8\x8d\x9a\x3e\
-\x4b\x51\x52\xb1\x36\x5b\x64\xd6\xf8\xdc\xf9\xc8\xf3\x76\x04\x5e\
-\xd0\x29\x80\x34\x53\x65\xbe\xda\xc3\xaa\x4d\xa3\xa4\x72\xf9\x65\
-\x03\xa9\x47\xe9\x2d\x8d\xa9\x10\x72\xf8\xee\x67\xf7\xb7\x80\xed\
-\x07\xfb\x48\x47\x87\xa4\x2b\x23\xe7\xf8\xac\x57\x32\xfa\xc1\x87\
-\x99\x7b\x7a\xb7\xec\x05\xed\xd3\x37\xa9\x53\xed\x5d\xf0\xc5\xa7\
-\x8d\xd7\x62\xd0\x3f\x32\x56\x1b\xf1\x80\x3f\x69\xf0\xb1\x7a\xa3\
-\x29\x8a\x92\x7c\x78\x9b\xd7\x02\xf4\xfb\x55\xa6\x57\xb9\xe7\x7d\
-\xc5\x17\xd4\x01\xa8\x6c\xee\xca\x32\xa5\xb5\x62\xb3\x28\x0a\x86\
-\x3c\xdb\xec\x36\x53\xab\xa6\x6d\x87\xe3\x69\xce\x1d\xb9\xda\x0c\
-\xce\x1d\xb8\xf2\xd1\xad\xdb\x49\x5f\x4e\x8e\xb6\x59\x4e\x66\xa8\
-\x0d\xef\x35\xef\x96\xf5\xe5\x72\xd0\x7f\x7e\xc7\x4f\x9a\x4c\x87\
-\x2c\xee\x19\x06\xa4\x9d\x0c\x8e\x2f\xf4\x9b\x7a\x6b\x30\xc6\x1b\
-\x7f\xb2\x12\xf0\xc4\x23\x45\xdc\x2e\x77\x99\x1b\x84\x02\xb1\x46\
-\x1c\x36\x40\xa8\x29\x8c\x14\xe5\xc5\x2a\x66\xde\x1e\xe8\xf9\xda\
-\xf3\xbe\xd2\x0b\xea\x00\x34\x36\x57\x54\xcf\xa4\xa6\xf8\x55\x2c\
-\xa5\xfd\xa5\xf5\x12\xb9\xe0\x5a\xc7\x5b\x1b\xc2\x56\xc2\xaa\xd0\
-\xad\x03\x0e\x6d\x02\xfb\x31\xc7\x38\xbd\x52\xd2\xd7\xe3\xbd\xc2\
-\xeb\x4d\x8f\x0d\xd0\xbe\x72\xd3\xef\xab\x8e\x86\xcf\xfb\xf7\x99\
-\xf9\x8a\x0f\x94\x9e\x59\xb8\x48\xd0\x49\xd0\x82\xb5\x03\x62\x10\
-\x18\xf7\x8d\x3c\x46\x53\xfe\x7f\x47\x40\x5e\x3c\xe7\x9c\x58\xa7\
-\x08\xf9\xc8\x65\xf5\xd6\xfd\x6f\x77\xbf\x89\xc8\xf4\xc0\x03\x6c\
-\xb9\xed\xc7\xed\x7f\x01\x75\xa9\x22\x4a\x5a\x5d\x95\xa2\xa4\x24\
-\xc1\xe6\xc9\xc0\x2e\x55\x9f\xf7\x95\x9e\xba\x03\x90\xf0\x9c\x43\
-\xa0\xb9\xa2\x7a\xc5\x0c\x56\x6f\x12\x45\x01\xe4\x22\x34\x5e\xa0\
-\xef\x35\xa2\x8c\x6a\xb0\xb2\xf4\x96\x91\x07\x42\xe0\x58\xd3\x33\
-\x35\xae\xdc\xb2\xae\x2c\xf7\x29\x6e\xa1\x6e\xc1\x50\xeb\x7a\x85\
-\xcb\x45\x43\x60\x44\x9d\xf7\xda\x77\xda\x0f\xaf\x6f\x6f\x5e\xb3\
-\xe6\x47\x90\xa1\x68\xda\x3c\x7e\x55\x41\xaf\xa4\x7f\x66\xec\x01\
-\x3e\x37\x7e\x62\x36\x18\x57\x8c\x34\x46\x05\xb0\xdf\x73\x7c\xeb\
-\xc8\x63\xf5\xc6\xfd\x6f\x51\x83\xa2\x73\xc7\xde\x05\xc7\x0e\xbd\
-\xa6\xbe\x11\x28\x41\x41\x92\x41\xdd\x8a\x92\x7c\x78\xfc\x2c\x33\
-\xdf\xfb\xce\x47\x9e\xf5\x5a\x80\xe7\x1c\x01\x08\x9e\x2d\xb3\xea\
-\x76\xab\x37\x89\xa2\x00\xa0\xcb\x53\x01\x5a\x25\xe1\x25\x0e\xc1\
-\xcd\x41\xa1\x95\xc2\xe7\xc1\xa2\xe8\xf5\xf3\xf7\x0c\x82\xd8\x51\
-\x71\xf1\xb6\x96\x56\x17\x09\x81\x9d\xb2\xd4\x4c\x3f\x0a\xfa\x7f\
-\xd1\xb1\x6b\xe3\x45\x30\x2c\x62\xe0\xa5\x0e\x9e\x50\xe5\x78\xe9\
-\xad\x05\x3d\xc1\x2d\x9d\xdb\x17\x5a\x20\xd8\x46\xd9\xde\xb7\xf7\
-\x80\x88\x45\x91\x8d\xa2\x2f\x59\x5d\xf5\x13\x28\x40\x1e\xb2\xf0\
-\xbf\x8b\x17\x0d\x75\x23\xa0\xa2\x24\x8e\x76\x31\x32\x4b\x5e\x7b\
-\xd6\x57\x78\xe2\xb3\x8e\x0f\x5d\xf5\x6f\x1e\xf9\xbf\x5c\x40\xa6\
-\x9b\xa7\xd5\x9b\x42\x51\x12\x28\x41\x41\x72\x83\xa8\x49\x5e\x8a\
-\xc1\x86\xfd\xbb\x33\x1c\xab\x02\x75\xef\x55\x5e\x55\x22\x14\x6a\
-\x52\xbe\x79\x12\x2c\x11\xf0\x9f\xbc\x4e\x78\x4e\xf5\xa8\x06\xd5\
-\x28\x4b\x21\x1d\x0a\xf4\xcd\x63\xcb\x66\xc0\xc2\xe6\xeb\xbf\xd8\
-\x9b\x0d\xd6\xf5\xdc\xb9\xf3\x48\x0e\x70\xf4\xd1\xed\xba\xfc\xb6\
-\x0d\xb4\xba\xe6\xff\xa4\xce\xfa\x2b\x4a\x12\x08\xdc\x2f\xb3\x63\
-\xbc\xcc\xa3\xc7\x64\x3b\x6d\x14\x3f\x72\x64\xf1\xe2\x51\xa3\xfe\
-\xfb\x15\x9e\x71\x04\xa0\xa0\x79\xf5\x61\x9b\x13\x56\x6f\x02\x45\
-\x79\x24\x87\x9c\x73\x5f\xa4\x15\xd7\xc4\x72\xb8\x37\x35\xa2\x5d\
-\x54\x5b\xf8\xa5\xeb\x5f\x41\xab\x7d\xe0\xf8\xc6\x73\x7b\xae\xc6\
-\x5b\x5d\xe4\x3f\x65\xf9\x29\xa3\x47\x5a\x01\x3d\x6a\xb5\x3e\x54\
-\x67\x36\x7c\x97\xe7\x9d\xde\x1d\xcb\x43\x81\x90\xdc\x07\xb3\x27\
-\xc1\xfa\xe0\x8a\xa2\x24\x37\x0d\x86\xc9\xf4\x1c\xff\xb4\xbf\xf9\
-\x8c\x1d\x80\x57\x37\xc9\xcc\x57\xda\xea\x8f\xae\x28\xff\x2a\x86\
-\x58\xe2\x41\x1b\xad\xb5\x10\x7e\x70\xec\xe5\xb3\x99\xaf\x6e\x85\
-\x31\x7f\x4c\xef\xbe\x2c\x1a\xae\x4c\xbc\xd9\x2e\x74\x85\xd5\x45\
-\xfe\x93\x7b\x88\x7b\x0e\xb7\xda\x10\xfc\x20\xd7\x3b\x59\x9b\x42\
-\xae\x0d\xd9\x03\x32\xde\xb0\xba\x2a\x45\x51\x5c\x4f\x90\x39\xf1\
-\x5e\xc3\xa7\xbe\xb1\xf8\x3f\x3b\x00\x09\x87\xfe\x9d\xf7\xfb\x17\
-\xec\x66\xf5\x47\x56\x94\xa7\x12\x4c\x2e\xb2\x80\x36\x4e\x6b\x21\
-\xb2\xc2\xde\x56\x47\xbf\x3d\x7f\x06\x46\x4e\x98\xac\x2f\x69\x09\
-\x57\xb7\xdd\xaa\x11\x36\xda\xea\x22\x53\x80\x16\xd4\xa5\x3c\x90\
-\x85\x8c\x04\xa0\xa6\x02\x56\x94\x44\x97\x7e\x9f\xcc\x72\x45\x9f\
-\xf6\x37\x9f\x72\x04\xa0\xd0\x19\x99\xaf\xa8\x45\x7e\x94\xe4\xc5\
-\x79\x31\x5a\x5e\x72\x92\x05\x0c\xdd\x28\x4b\x3b\xd8\xb2\x76\xdf\
-\x4f\x27\x42\x60\xf4\x3b\x53\xbf\x59\xea\x03\x77\x5a\x87\x5d\x88\
-\xd8\x6c\x75\xb1\xc9\x57\x44\xe5\x07\x73\x62\x8a\x80\xfd\xa2\x7d\
-\xb4\xa3\x0e\x50\x59\x94\xa2\x80\xd5\x55\x29\x4a\x6a\xd0\xac\x94\
-\xcc\x5c\xc3\x9f\xf4\xae\x80\xa7\xec\x00\x94\x3b\x25\xd3\x2d\xd6\
-\xea\x8f\xaa\x28\xcf\xc4\x5c\x96\x57\x0c\x15\xfd\x69\x0f\x46\x18\
-\x79\x69\x06\x1b\xdf\xdd\xb3\xeb\xf8\x3e\x18\x7e\xe0\xd7\x0c\x0b\
-\xfc\xe0\xcc\x47\x97\x26\xde\xac\x09\xfc\xc5\x1a\x76\x58\x5d\x74\
-\xf2\x71\xbf\x6c\xe4\xf0\xe8\x86\x60\xbf\xe0\xf8\x5a\x6f\x0c\xa2\
-\x0a\xa5\x55\x07\x40\x51\x92\x42\x49\x73\xa6\x93\xcc\x91\x4f\xfa\
-\x1b\x4f\xd8\x01\x70\x33\xd7\x23\xee\x52\xd9\xfc\x59\x5d\xf5\xaf\
-\x24\x6f\x76\x1c\x38\x40\xb4\xa3\x31\x55\x40\xaf\x68\x7c\x61\x9c\
-\x83\x0d\x37\x76\xf7\x3d\x76\x12\x3e\x8e\x1f\x53\x65\x66\x61\xd8\
-\x9c\x6f\x6f\xdd\x13\x31\xe0\xa8\xe0\xd8\xae\xbf\x63\x75\xd1\xae\
-\xcf\x58\xc6\x5a\x8e\x00\x21\x84\xf2\x00\x39\x13\xa0\xba\x2b\x40\
-\x51\x92\x80\xa7\x2e\xb3\xbb\x39\x42\x2f\x9a\xff\xd7\x6f\x3c\xb6\
-\x03\x90\x70\x08\xa1\x44\x7f\x99\xd9\xff\xf3\x05\x15\x25\x59\x71\
-\x8e\x08\xb4\xa6\x01\x15\x41\xe4\x10\xb7\xc5\x4e\x38\xa5\x5d\x2c\
-\x77\xbd\x3a\x7c\x35\xee\x97\x4c\xf3\x2e\xc2\xac\x33\x2b\x26\x6e\
-\xbf\x08\xd1\x85\x62\x6c\x71\xf3\xad\x2e\xda\x85\x39\x67\x2e\x74\
-\xc3\x2d\xb1\x16\x1b\x57\x14\xe5\xdf\x94\x36\x47\x02\xb4\x8f\xfe\
-\xeb\x99\x4f\xf8\x15\xad\xdf\x52\x66\x70\x72\x58\x91\x5c\x51\x9e\
-\x9e\x39\x81\x10\x01\xf8\xe1\x03\x6e\xab\xb5\xc6\xda\x11\xb8\xb3\
-\x2c\xac\x45\x44\x76\x18\x9b\x63\xc6\xef\x2b\xfa\xc1\xe8\x6c\xd3\
-\xf3\x2f\x5b\x0a\x57\xae\xdc\x9c\x17\x7a\x0f\x18\xc5\x54\x96\x58\
-\x5d\xbc\xa2\x28\x8a\x93\xaf\x79\xb1\x7e\xfa\x6b\xff\x75\x2d\xc0\
-\x3f\x3a\x00\x8f\xfe\x05\xa1\x56\x22\x57\x52\x17\x73\xe0\x5a\xe4\
-\x13\x51\x62\x0b\xc4\x64\x89\x1d\x1e\x9f\x15\xe6\x6a\xab\xea\xee\
-\x0c\x82\xf7\xef\x8f\xbc\xfa\xc7\x3e\x58\x69\xdb\x3a\xe4\x60\x36\
-\x88\x9d\x10\x77\xc7\xd6\xd1\xea\xa2\x15\x45\x51\xca\x9c\x94\xd9\
-\x21\xfa\xbf\x9e\xf9\x1f\x23\x00\xb9\x26\xc8\xec\x9a\xd3\xea\x8f\
-\xa4\x28\x96\xb0\x61\xc7\x01\x22\x5c\xec\x16\xd3\x80\xe3\x9c\xe6\
-\x2a\x9c\x58\x73\xee\x8d\x6b\x53\xe0\x6b\xbf\x5f\x66\xcf\xbf\x01\
-\xa3\x66\x4f\xbd\xb4\xf4\x00\x5c\x0c\xbe\xf6\xf9\x9d\x77\xc1\xb1\
-\x5b\x6f\xa3\x5f\xb6\xba\x78\x45\x51\x52\xaf\xdc\xbf\xcb\xd4\x6e\
-\x3e\x6e\x24\xe0\x3f\x3a\x00\x7e\xef\xc9\xcc\x53\xc5\xea\x8f\xa2\
-\x28\x96\x72\xde\xcf\x9e\x9d\x2c\xa4\x07\xed\x2f\xad\xbb\xc8\x03\
-\xf7\xdb\x46\x0d\x8e\x09\x81\x39\xa1\xab\xbe\xd9\x51\x17\x06\x7d\
-\xfa\x6d\xd0\xb4\x77\x61\xf1\x81\xf5\x1d\xf7\x9e\x84\x98\x2c\xb1\
-\xbb\xe2\x5f\xb6\xba\xf8\xc4\xe7\x38\xa2\x77\xd1\xaf\x40\xcc\xc7\
-\xb1\x7e\x71\x33\x80\x06\x54\xa1\x24\xea\x5a\x00\x45\xb1\xcc\x1b\
-\x57\x64\x16\x98\xfe\xb8\x67\xfc\xc7\x57\x33\x68\xa8\x4c\x77\xb5\
-\xd8\x8f\xa2\xfc\x7f\xf1\xd8\xb0\x83\xd6\x48\x64\x12\x67\x00\x07\
-\x36\x3c\xe1\x7c\xae\xab\x83\x6f\x8f\x87\x11\x75\x26\x6f\x5b\x9c\
-\x1b\x86\x34\x1c\x3f\x67\x4e\x3c\xec\xcb\x7b\x6c\xe4\xf9\xcd\x10\
-\x37\x31\xfe\x94\x3d\xa3\xd5\xc5\xbf\x78\xb6\x97\x6d\xc5\x1c\xe5\
-\xc0\x6d\x82\xdb\x6d\xb7\x57\x41\xbc\x25\x8a\x89\x10\x30\xda\x18\
-\x6f\xa3\x26\x58\x52\x14\x0b\xb8\x07\xcb\xd4\xbe\x7e\xdc\x33\x1e\
-\xd7\x01\xb8\x2d\x63\x40\xa8\x4c\xaf\x27\xbe\xaf\x50\x51\x52\x15\
-\xe7\x04\x43\x1e\xb8\xe3\x06\xda\x87\xa2\x96\x70\x40\x74\xfd\x98\
-\xe8\xb8\x9b\xb0\x32\xc3\x96\x9e\x07\x05\xbc\x9f\x6d\x64\xf6\x3f\
-\xd6\xc0\xd8\xb4\x33\xde\x5a\xd1\x11\xce\x77\xbc\xe2\xb8\x5d\x07\
-\x8c\x3f\x8d\xf3\x04\x5a\xfd\x21\x9e\x9f\xf7\x65\xaf\xc1\x1e\x21\
-\xd0\x65\x56\xcb\x95\xb5\xfa\x43\xdb\xfa\x8d\x3c\x2b\x77\x85\xb4\
-\x41\xfe\xcb\x7c\x7d\xc0\xb1\x49\xcf\xa2\x7f\x01\x46\x33\xa3\xb7\
-\x31\x0c\xb9\x6c\xb3\xb7\xd5\x55\x2b\x4a\x4a\xe6\x9c\x19\xf8\xe5\
-\xdf\x1e\xf7\x8c\x7f\xdc\xa1\x6b\x9e\x2b\x30\x97\x49\x59\x6d\x76\
-\x10\x1a\xba\x59\xfd\x51\x14\x25\x59\xf2\xc1\x0b\x4f\x30\xdc\x8c\
-\xa2\x46\x7b\x10\x7d\x45\x11\x11\x0e\x79\x73\xe7\x0c\xcf\x5a\x1f\
-\x5e\xa9\xdd\xf0\x95\x4a\x93\xa0\xb1\xa3\xc6\x57\x65\xde\x84\x4c\
-\x46\xfa\x31\xfe\x31\x56\x17\xfd\xfc\x62\xcb\xc4\x4d\xb6\x65\x86\
-\x3d\x1c\xed\x7b\x76\x3f\xfc\x55\x6f\x79\x99\xed\xfb\x60\xdf\xbe\
-\x63\xb5\xce\x5f\x87\xd8\x22\x71\xaf\xd9\x16\x81\xb6\x50\xeb\x27\
-\x82\x81\x6c\x64\x22\x1d\x6a\xf9\x60\x45\x79\xe1\xd6\x38\x64\x36\
-\xd2\xcd\x55\x02\xff\x9e\xc7\xe7\xef\x0e\x40\xc2\x8b\x04\x6a\xd4\
-\x97\x39\x6b\xb7\xcc\xc0\xfb\x56\x7f\x04\x45\x49\xd6\xdc\xd0\xd0\
-\xc0\x98\xc9\x72\xb6\x81\x31\x43\x3f\x63\x64\x01\xaf\xcd\x9e\x5b\
-\xdd\x3f\x84\x32\x79\x8a\x0e\xcc\x9b\x11\x5a\x1e\xaa\xd7\xb0\x62\
-\x1f\xa8\xbd\xb2\x62\xdb\x62\x6d\x20\xcd\x04\x9f\x1b\x5e\xe9\x81\
-\x61\xf4\xa5\xbd\xd5\x1f\xe2\xd9\xdd\x0d\x8d\x38\x18\x95\x11\x56\
-\x9d\xdb\x36\xf8\xe0\xd7\x30\xb7\xf8\xaa\x8e\x3b\x8b\xc2\xf9\xb7\
-\xae\x88\x5b\x79\x80\xb5\x6c\xe7\x34\x88\x3c\x22\x5c\x6c\x02\x62\
-\x89\xc7\x66\x75\xd5\x8a\x92\x12\x6c\x34\x17\x0b\x6a\x62\x5e\x96\
-\x1c\xd7\xd7\xb9\x5c\xf0\x63\x4e\x01\x14\x2b\x2f\x53\x35\xfc\x8a\
-\xf2\x42\x38\xd0\xd1\x41\xb4\xa7\x09\x55\x41\x5b\xa1\x0d\x12\x05\
-\x21\xfe\x57\x7b\x57\xc7\x20\xd8\x59\xfd\x50\xda\x33\xc7\xe1\xeb\
-\x8b\xbf\x34\x9b\xbf\x0f\x06\xbf\x3c\xb2\xc0\x1f\xa5\x61\xe3\xec\
-\xdd\xbe\xc7\x1a\x42\xf4\xa8\xd8\x0a\xf1\x99\xad\xfe\x10\xcf\x2e\
-\x43\xa6\xb4\x65\xd2\x84\xc1\x6b\x15\x9a\x5d\xae\xbe\x0e\x46\x2e\
-\x7f\x7f\x5b\xa7\xab\xd0\x6a\x49\xfd\xb8\x8a\x9e\x90\x66\xb2\xef\
-\x1e\xef\xbd\xa0\xf7\xd2\xff\x32\xee\x02\x27\x38\xc7\x35\x40\x43\
-\x53\x33\x09\x2a\xca\xf3\xa8\xde\x5d\x66\x9b\xa0\x87\xff\xc5\xfd\
-\xd1\xb7\x07\xf8\xa5\xb3\xba\x64\x45\x49\xd1\x9c\x1d\x82\x0e\xbc\
-\x4c\x35\x70\x8b\xd3\xe2\xb5\x4d\x10\xf5\x4a\x8c\x2d\xf6\x14\x6c\
-\x79\xb0\x2f\xe4\xe4\x4b\x70\xb0\xc5\xc9\xfa\x97\x42\xe0\xad\x0f\
-\x5e\x6d\xd3\x30\x17\x74\x7a\xb7\x05\x35\xad\xae\xfd\x39\x08\x37\
-\xce\x30\x1f\xf2\xb7\xcf\x4d\x36\xe0\xc3\xed\x3d\x6f\xb4\x9a\x0f\
-\x65\xfb\x15\x0d\x0e\xb6\xc1\xf4\x5a\x8b\xc4\xa6\x61\x70\xee\xfb\
-\x2b\xd3\x6f\xe7\x01\x16\xb1\xc6\xd8\x0b\x22\x46\x1c\x16\x33\xf8\
-\x7b\x79\x67\x45\x51\x9e\x94\x87\x79\x4d\x5f\xc0\x3f\x66\x06\x7c\
-\x68\x04\x20\x67\x2b\x99\xfd\x6a\x5b\x5d\xb2\xa2\xa4\x0a\xce\x33\
-\xde\x9e\x78\xe0\x0e\xe2\x90\x58\x24\x46\x82\x76\x55\xfb\x45\xd4\
-\x83\x7b\xdf\xdf\xef\xfa\xa0\x05\x5c\xd8\x7c\xcd\x76\x7b\xfa\x73\
-\xbe\x97\x0b\xf2\x19\xeb\x1d\xe8\xd9\x06\x9a\x6f\xaa\xd7\xaa\xc2\
-\x26\xf8\xfe\xd4\xe0\x79\x9d\x2f\x43\xab\xb3\xf5\x33\x57\x2c\x06\
-\xbe\x93\x7c\xe2\xbd\xdc\x40\x7f\xcf\x58\x66\x44\x03\xa1\xdc\xe3\
-\x3e\xa0\xa9\x35\x06\x14\xe5\x79\x3d\xd4\x01\x70\x37\xcf\x11\x04\
-\x4c\xb6\xba\x30\x45\x49\xd5\xe2\x88\xc7\x0e\x22\xab\xb8\x23\xd6\
-\x80\xb6\x44\xeb\x23\x52\xf0\x44\xdc\x22\x0f\x91\x6c\x86\xe0\x5d\
-\xb9\xda\x65\x2d\x07\x83\xdf\x78\x63\x45\x8b\xfa\x30\xf0\x5e\xe7\
-\xee\xcd\x6e\x43\x60\x58\xe6\x05\xe9\xdb\x81\xbe\xcf\x88\x31\x4a\
-\x02\x57\xb8\x45\xa8\xd5\x55\x2b\x4a\x72\xd2\xc1\x3c\xc0\xcf\xb8\
-\xcd\x39\xf2\xaf\xa6\xe8\x50\x14\x57\xb6\x90\xf1\xbc\x0b\x0f\xda\
-\x46\x17\x8b\x7b\x05\x6c\xbd\xed\x0d\x1c\x9d\xad\x2e\x2a\xf1\xa5\
-\x29\xed\xf3\xa6\xd7\x70\x68\x7b\xa7\x71\xcb\x2a\x59\xe1\xcb\x25\
-\xfd\x1a\xb6\x6f\x00\x25\x7e\x28\xf0\x5b\x6e\x3b\xe8\x55\xf5\xaf\
-\x8c\x43\x60\x7c\x6b\x4c\x64\x21\x7f\x5f\x64\xa9\x28\xca\xe3\x14\
-\x9f\x24\xd3\xff\xef\xa9\xfd\xd5\x57\x46\x51\x5c\x98\xf8\x43\x7c\
-\x23\xfa\x43\x74\xd1\x98\xe8\xb8\x3d\x10\x9b\x39\xae\x97\x6d\xad\
-\xd5\x55\x25\x1d\xb7\xa6\xda\x7e\xad\x10\x54\x5e\x5e\x9a\x02\x51\
-\xf0\x59\xfe\x3e\x6f\xbe\xb2\x1f\x6a\x7d\x53\x71\x6c\xd1\x01\xe0\
-\x7e\xd6\xbd\x96\x36\x12\x8c\x5e\xc6\x17\xfc\xc6\xdf\xa7\x52\x14\
-\x45\xf9\x6f\x0f\x75\x00\x6a\x95\x93\xe9\xfb\xaa\xd5\x85\x29\x8a\
-\x02\xd8\x71\xe0\x00\xea\x53\x85\x12\x40\x59\x8a\x90\xd7\xea\xa2\
-\xac\x53\xa4\x67\xf0\xae\x1c\x7f\xc0\xe7\x45\xfb\xd4\x6a\x3b\x17\
-\xda\x7e\xd3\x48\x54\x59\x0e\x9e\x07\x3d\x8e\xba\x9d\x07\x43\x33\
-\x8a\x1b\xed\x50\x53\x10\x2b\xca\x13\x78\xe8\x2b\xd2\xfc\x57\x99\
-\x5e\x75\xad\x2e\x4c\x51\x14\xe5\x71\xb2\x68\x19\xde\x0d\x58\x01\
-\x7d\xfb\x74\xf8\xae\xb1\x17\xb4\xfb\xad\x71\x68\xd5\x01\xe0\x75\
-\xd9\x73\xa5\xc7\x2f\x60\xfc\x60\x4c\x67\x05\xea\x62\x41\x45\xf9\
-\x9b\x7b\x2f\x99\x39\xae\x3a\x1f\x51\x7d\x64\x45\x51\x92\xad\x80\
-\xcf\xfc\x5e\xf2\xf9\x19\xde\x7c\xfd\x55\xdf\x86\xe1\xd0\xe8\x93\
-\xea\xcd\x4a\x9f\x05\xb1\x51\xcc\x65\x00\x18\x3f\x19\x33\x59\x8d\
-\x5c\xde\x59\x75\x04\x94\x54\xcd\xdf\x9c\xdf\x67\xc0\x8f\xce\x47\
-\x54\x07\x40\x51\x92\x03\x67\x03\xa6\x1a\xb2\x47\x0a\xf8\xc3\xaf\
-\xa7\xcf\x72\xe8\x3b\xb6\xc3\xf9\x46\xef\x40\x83\x8a\xd5\x06\x95\
-\x6c\x0d\x9c\xe4\x22\x97\x80\x1b\xdc\xe1\x9e\xd5\x55\x2a\x8a\x2b\
-\x70\xff\xfb\x14\xbf\x79\xb9\x4c\xc5\x35\x32\x4b\x06\x98\x8f\xab\
-\xc5\x7f\x14\xc5\x55\x08\x20\x96\x18\xa2\x81\x78\xe2\x88\xb3\xba\
-\x20\xd7\x95\xfd\x6c\xe6\x69\xe9\x9b\xc3\xc0\x22\x9d\x2e\x34\x5b\
-\x03\xa1\xe2\xee\xf5\xc8\x26\x70\x20\xe4\x44\xa6\x0b\x0d\x41\x64\
-\x16\x76\xb1\x13\x70\x97\x8b\x37\x29\x4a\x6a\x66\x8e\x00\x94\x5e\
-\x22\x33\xbf\x6a\xf8\x15\xc5\x85\x88\xf7\xe8\x4e\x0b\x88\x6d\x1a\
-\x3f\x34\x7e\x35\xd8\x3a\xd9\xeb\xda\x0b\x58\x5d\x95\xeb\xcb\x79\
-\x32\x5b\x70\xc6\x86\xf0\xe6\xc5\x57\xfb\x36\xf8\x06\x32\x6f\xcd\
-\xd0\x33\xed\x78\xd0\x4b\xe8\x1f\x18\xbb\x40\x8d\xa2\x28\xa9\x57\
-\xd6\xc1\x32\x03\xff\x50\xa7\x00\x14\xc5\x95\x8d\x10\xef\xf0\x1a\
-\xc4\x9c\x88\x1d\x18\xef\x0b\x71\x2d\xe2\x3f\xb2\xfd\x69\x75\x51\
-\xff\x14\x73\x30\xae\x5d\xfc\x2d\x88\x18\xff\x20\x5b\xf4\x6a\x20\
-\x8e\x18\x62\xad\xae\x0a\xca\xd7\x28\x7e\x2f\x5f\x28\xd4\xbf\x51\
-\xc5\xa3\x44\x43\x10\x2d\x45\x16\x71\x02\x88\x51\x8b\x0d\x29\xa9\
-\x55\xb5\x91\x32\x9b\x35\x55\x1d\x00\x45\x71\x6d\x72\xaa\x60\x37\
-\xdc\x84\x3b\xa0\xb9\xe6\xed\x6d\x57\xc2\x6f\x4c\x08\x5d\x0c\x63\
-\x26\x4f\xab\xba\x6c\x3e\xec\x9a\x7a\xb8\xfd\xd9\x7e\x60\x0f\xb4\
-\x5f\x77\xec\xb2\xae\x2e\xf7\x35\x6e\x57\xdd\x2a\x42\x9b\x2d\x0d\
-\xd7\x55\x5e\x0e\x39\x8b\x67\xbb\x94\x21\x04\x8c\x5b\x46\x06\xa3\
-\x3e\xe0\xee\x9a\xdb\x53\x51\x12\x9f\x18\x62\xfe\xe9\x07\x34\xb0\
-\xba\x14\x45\x51\x92\x2f\x47\x01\xfd\x07\xdd\x17\xb6\x2d\x3e\x50\
-\xe2\x54\x77\xf8\xa4\xea\x0f\x4d\xff\x72\x83\x3f\x3b\x2f\x3b\xb1\
-\xed\x33\x88\xb2\xc5\x6c\x89\x9b\x63\x5d\x7d\xf9\xef\xe6\xee\x98\
-\xcd\x0f\x5a\xb8\xd7\xeb\x54\x31\x1b\xb8\x57\x73\xfb\xd4\xed\x1c\
-\x18\x23\x8d\xa9\x2c\xb1\x7a\xeb\x29\x8a\x35\xcc\x0e\xc0\xa7\x05\
-\xad\x2e\x44\x51\x94\xe4\x4b\xbc\xc1\x2b\xd4\x07\x6d\xac\x78\x4d\
-\xf8\xc3\xad\x3c\xa1\x84\x5f\x81\x9f\x7c\x66\xee\x59\x95\x17\xc6\
-\x04\x4c\x8b\x58\xb6\x06\xae\x37\xbe\xfd\xd7\xdd\xa1\x49\x5f\x9f\
-\x36\x53\x2b\x2d\xd6\x42\xb3\xf9\x35\xaf\x96\x39\x09\xb9\xb3\x04\
-\xf6\xca\x94\x07\xf4\xd3\x46\x29\x7d\x8c\xd5\x5b\x4f\x51\xac\x61\
-\x76\x00\xd2\xa6\xe0\x65\x46\x14\x45\x49\x6c\xfa\xc7\xc6\x5a\xc3\
-\x0e\xfa\x4d\xa3\x8e\xf1\x1b\x68\x7e\xda\x4a\xd1\x0d\x62\xaf\xc6\
-\x05\xc5\x0f\x83\xf9\x73\xd6\x2e\xdc\xbd\x06\x86\x0e\xf8\xa5\xf3\
-\xbc\x8d\x70\xfa\xe4\xa5\x5c\x37\xee\x24\x7d\x9d\x81\x35\xb2\x06\
-\x67\x18\x07\x05\xeb\x06\xe5\x0b\xec\x03\xe2\x34\xcb\xc5\x28\xab\
-\xb7\x9e\xa2\x58\x43\x9d\xfd\x52\x14\x57\xe6\x40\x47\x07\x8a\x93\
-\x9f\x9c\x40\x10\x81\x22\xb3\xd5\x45\xfd\x53\x54\xf3\xe8\x4a\x71\
-\x35\x21\x5c\xbf\xff\x5b\x54\x77\x10\x61\x62\xa7\x98\x02\xe2\xb0\
-\x58\x24\x46\x81\xc3\xcf\xf1\x83\x9e\x06\xb6\xef\x3c\xe0\x75\xaa\
-\x3b\x7c\x5b\xef\xb7\xd7\x17\xc6\xc0\xf9\x11\x57\x9b\xdf\xae\x93\
-\x74\x75\x6a\x59\xc5\x36\xf1\x26\x14\x38\x92\x27\x57\xb6\xd5\xe0\
-\xf6\xbb\x5b\x15\x6d\x3b\x72\x59\x66\xc3\xea\xad\xa8\x28\x49\xa9\
-\xe6\x03\xd5\x01\x50\x14\x57\xd6\x83\x57\x69\x0c\x71\x6f\xc6\x17\
-\xb3\x55\x06\x5b\x49\xfb\x7a\xbb\x05\x43\xe8\xff\xc5\xfe\xa3\x23\
-\x93\x63\x07\xd8\x5e\xb6\x0b\x47\x24\x88\x46\x54\xa7\x04\x10\x8f\
-\x0d\x3b\x88\x41\xa2\x0b\x2f\x81\xdb\x8f\x5a\x61\x6d\x2d\xec\xff\
-\xf4\x78\xa7\x0b\x79\xe0\xbb\x4e\x93\xb2\x2f\xea\x03\x97\x47\xdd\
-\xf8\x29\xc4\x9e\x04\x85\x16\x22\x2f\x39\x21\x68\x52\x8e\x73\x59\
-\xde\x06\xb1\x48\x0c\x12\x85\x01\x2f\x3c\xf1\xb0\x7a\x2b\x2a\x4a\
-\x52\xea\x38\x55\x75\x00\x14\xc5\x85\x89\xcb\x62\x83\xf8\x15\xee\
-\xbb\x3d\xe8\x12\x7d\x1a\xa2\xfc\x63\x76\xc4\xfd\x64\x75\x55\x8f\
-\x90\x9d\x2c\xa4\x03\xf2\x91\x9b\xac\x80\x8e\x9e\xe0\x88\xda\x79\
-\x84\x9d\x8f\x5c\x64\x05\xca\x92\x5f\x94\x86\x9d\xd9\x0f\x9d\x3b\
-\x63\xc0\x8c\x2e\x4b\x37\x6e\xdd\x0c\x71\xaf\xc6\x4f\xb1\x85\x27\
-\x7e\xb9\x41\x59\x72\x6c\xc9\xdc\x1e\xd2\x76\xf7\xf3\xf7\xf9\x12\
-\x8c\x7e\xc6\xd7\x4c\xb1\x7a\x23\x2a\x4a\xd2\x52\x1d\x00\x45\x71\
-\x65\x69\xf0\xc6\x0b\x8c\x86\x46\x6f\xe3\x1b\xe0\x43\xe3\x07\xe3\
-\x2f\xab\x8b\x7a\x0e\xba\xec\x08\x88\xb7\xc4\xab\x34\x00\xd1\x92\
-\x96\x54\x80\xb5\x83\xb6\x8f\x3b\x5c\x0e\xce\xfc\x75\x79\xc2\xcd\
-\xd0\xc4\x2f\x23\xed\x4a\xff\x72\x69\xbe\x80\x3c\x69\x03\xb3\x67\
-\xde\x0c\xc6\x58\x63\x9f\xe1\x67\xf5\xc6\x51\x94\xa4\xa5\x3a\x00\
-\x8a\x92\x1c\x38\xd7\xb9\x4f\x29\x53\xd8\x9a\x23\x04\xe2\xaa\xd8\
-\x2c\x26\x40\x44\xfd\x07\xef\xc5\xe4\x83\xfb\xa3\x1e\x1c\x8a\x69\
-\x9f\xf8\x6f\xaf\xb5\x17\x85\x84\x1b\x68\xdb\xdc\xba\x68\x99\x81\
-\x8b\x5c\xe3\xa6\xd5\x1b\x45\x51\x92\x96\xbb\xd5\x05\x28\x8a\x92\
-\x0a\x99\xe7\xdc\x1d\xef\xea\x67\xf5\x66\x50\xf4\xdb\x7c\x9d\x73\
-\x7a\x43\x70\x81\x9c\x31\x59\xea\x25\xfe\xdb\x3f\x98\x13\xdd\x37\
-\xb6\x19\xdc\xfe\x3d\xf4\x70\x78\x6e\x10\x99\xc4\x6d\xd6\x9a\xff\
-\xb8\xc8\xea\x8d\xa3\x28\x49\x43\x8d\x00\x28\x8a\xf2\xdc\x8c\xf4\
-\x54\xa5\x2b\x7f\x5f\xf4\xf7\x58\x5e\x78\xe2\x0e\xfa\x52\xe3\xa6\
-\x91\x17\xfc\xdc\x7c\x0b\x7a\xa7\x83\x57\xe6\x35\x5e\x59\xe5\x18\
-\x64\xcf\x91\xb9\x5e\xfa\x13\x89\x5f\x6f\x58\xdd\xf0\x89\x91\xfb\
-\xe0\x76\xa5\xb0\xc8\x88\x1b\x20\x3c\xc4\x59\x31\xdf\xea\xad\xa8\
-\x28\x49\x4b\x8d\x00\x28\x8a\x2b\xd3\xcd\xdb\x00\x83\xc9\x45\x16\
-\x20\x0e\x07\xe9\xac\x2e\xea\x9f\x42\x36\xdc\xad\x7a\xff\x0a\xb0\
-\x9c\x1f\x99\xf5\x88\x27\x68\x68\x08\x30\x7a\x18\x9f\xf2\x2b\x78\
-\x7e\xe6\xee\xee\x5e\x00\xda\x8d\x6a\x7c\xbd\xea\x65\x68\x66\xab\
-\xf5\x55\xd9\x26\xc0\x18\xfa\xf2\x46\xe2\xd7\x7b\x6d\xfd\xed\xcc\
-\x77\xfd\x41\x3f\xa4\x97\x33\x26\x00\x6e\x5c\xa1\x85\xd5\x5b\x51\
-\x51\x92\x96\x1a\x01\x50\x14\x17\x26\x1a\xc8\xdb\xe9\x6c\x5d\xec\
-\xe9\x1c\x06\xd8\xa7\x3a\xf2\xe8\x07\xad\xae\xea\x9f\xa2\x8b\xc6\
-\xce\x8d\xfb\x09\x8c\x2d\xec\xe5\xd4\xff\xfb\x87\x34\xf8\xe0\x05\
-\x86\x87\x51\xd2\x78\x0d\xdc\xb2\xbb\xfd\xac\x65\x80\xc6\x0d\x6a\
-\x2c\x2b\xfd\x1e\x74\x3b\xd7\x7a\x63\x1d\xc0\x3b\x83\xe7\x16\x8f\
-\x24\x68\xf8\xe9\xc9\xa7\xfc\x0a\x57\xa6\xdd\xc8\x1a\xf2\x21\xe8\
-\x47\xf5\x02\xfa\xb7\x56\x6f\x3d\x45\xb1\x86\x1a\x01\x50\x14\x17\
-\x26\x22\xc4\x6e\x31\x0d\xc2\x6d\x91\xbf\x44\x1f\x81\xa8\x66\x31\
-\xb3\x63\x37\x02\x07\x39\x6b\x75\x6d\x09\xd4\xa0\x2c\x85\x41\x68\
-\x84\x22\x80\xd2\x72\x91\x1d\xe3\xa0\x81\x51\x1e\xbc\x87\x79\xdd\
-\xf5\x1c\x0d\x6d\x46\x36\xfc\xab\xd2\x7c\x78\xc3\x78\xa5\x52\xbd\
-\x00\x48\xbf\x2d\x60\x4d\x9a\x76\x49\x57\x66\xcc\xb2\xd8\xd2\xf1\
-\x27\xe1\x4c\x83\x4b\xc7\x6e\x7e\x0c\x7a\xac\x5e\xd3\x08\x06\x4d\
-\x68\x1b\x44\x2d\xab\x37\xa2\xa2\x24\x2d\x35\x02\xa0\x28\xae\x2c\
-\x88\x1c\x64\x06\xfd\x9c\x5e\x59\x1f\x0b\xfa\x40\x7d\xa9\x11\x65\
-\x75\x51\x8f\x20\x10\x08\xfe\xbe\x5b\x41\xbf\xa2\x57\x31\x7e\x02\
-\xdf\x57\x7d\x56\x7b\xdd\x82\xce\x87\x5a\x9c\xae\xf5\x17\xf4\x0d\
-\xe8\x50\xa8\xf1\x9f\x90\x71\x5b\xba\x35\xfe\xc1\x49\x5f\xe6\xfe\
-\x1f\x4f\x0c\xbf\x10\x0c\x47\xde\x3e\x73\xe0\xf2\x67\x40\x2f\xd1\
-\x81\x46\x56\x6f\x3c\x45\xb1\x86\x1a\x01\x50\x14\x57\xe6\x9c\x50\
-\xc7\x39\xc1\x4e\x04\x59\x48\x6f\x75\x51\x8f\xb0\x8a\x6d\x1c\x04\
-\xbd\x9b\xbe\xcb\x08\x81\xec\xf6\xcc\x8e\xf4\x9e\xd0\x6d\x4b\xeb\
-\x6f\x6b\xb7\x82\x56\xb9\xeb\x07\x54\x1a\x01\xde\x6b\xbd\x5e\xf5\
-\x18\x99\xf4\xe5\x45\x76\x8b\xfa\x32\xe6\x3e\xcc\xcf\xbe\xe6\xe2\
-\xee\x81\x70\xd7\x27\xe2\xfc\x83\xfe\xa0\xbd\x2d\x2a\x0a\x3b\xe0\
-\x0f\xf8\x58\xbd\x11\x15\x25\x69\xa9\x0e\x80\xa2\x28\xcf\x4d\xbb\
-\x29\xa6\x69\xcd\xa1\x6c\x58\xd1\xcc\x79\xd7\xc3\x5b\xa5\x5e\x1b\
-\xd0\xe8\x5b\xa8\xd0\xbd\x84\x67\xbe\x07\xe0\x56\x45\x9b\xab\x5d\
-\xb4\xae\xbe\x6d\x63\x0e\xe4\x3e\x5d\x0d\x76\x54\x3a\x70\xe5\xd4\
-\x71\x10\x6f\x88\xec\xa2\x17\x10\x80\x1f\x95\x51\x6b\x01\x28\xa9\
-\x92\xea\x00\x28\x8a\xf2\xcc\x8c\x2d\x46\x0c\x65\xa0\xf4\xad\x22\
-\xfd\x82\xf2\x42\x95\xaf\x4b\x1f\x2d\xf8\x01\xe4\x29\x18\xb8\x38\
-\xd3\x2a\xab\xab\x83\x88\x1b\x0f\x7a\x47\xdf\x85\x25\xd5\x36\xcc\
-\xda\x5b\x01\xa2\xe6\xc6\xce\x8d\xf3\x00\xb7\x16\x5a\x3d\xad\x22\
-\xa0\xa9\x86\x5f\x49\xbd\x54\x07\x40\x51\x94\x67\x26\x32\x8b\x5b\
-\xac\x80\x42\x95\x82\x2e\x06\x36\x04\x91\x5b\xf8\xb2\xd4\xea\xaa\
-\xc0\x51\xcc\xb1\x5b\x1f\x04\x0b\x1b\xae\x1d\xb2\xe7\x34\x1c\xf8\
-\xf4\x44\x8e\x8b\xdb\x41\x1b\x25\xb2\x89\xaf\x00\x8d\x15\x08\xab\
-\xab\x54\x14\x6b\xa9\x8b\x00\x15\x25\x39\xb8\xc9\x1d\xc2\xc1\xee\
-\xed\x98\xa8\x0f\xb2\xba\x98\xff\xa7\x08\x79\xc9\x0e\xa2\x95\x48\
-\xcf\x51\xc0\x1b\x2f\x57\x58\x55\x6f\x7d\xb9\x5d\xa3\x8e\xb6\x80\
-\x3f\xf6\x2d\x29\xbb\xf9\x47\x88\x79\x27\xf6\x5c\xdc\xef\x20\x2e\
-\x88\xf5\x62\xbc\xd5\xd5\x29\x8a\x6b\x50\x1d\x00\x45\x49\x0e\xde\
-\x63\x24\x7f\xc0\x9d\xb1\x61\xe5\x22\x0a\x59\x5d\x8c\xeb\x3a\x50\
-\xed\x44\xa1\x8b\x6e\xf0\x53\x91\x99\x5e\xab\x5f\x82\x3b\xb1\x61\
-\x63\xee\x37\x02\x91\x5b\x84\x8b\x2d\x40\x2c\x71\xd8\xac\xae\x52\
-\x51\x5c\x83\x3a\x05\xa0\x28\xc9\x80\x71\x96\xcb\xdc\x82\xf8\x6f\
-\x6d\xc5\xed\x75\xad\xae\xc6\xf5\x9c\x3f\x7a\xb5\xf7\xed\x81\x30\
-\xe6\xfc\xf4\x88\x65\xaf\xc1\x85\x8c\x57\x27\xde\xf6\x02\xed\xb6\
-\xd6\x54\x78\x02\xe9\x09\x50\x43\xfe\x8a\x92\x90\x1a\x01\x50\x94\
-\x64\x40\xb8\xc9\x89\x75\x78\x4b\xb4\xa7\xa1\xd5\xd5\xb8\x8e\xb3\
-\x99\x2e\x17\xb9\x39\x05\x46\x15\x9f\xda\x66\x69\x18\x1c\x3e\x73\
-\xda\xf3\xf2\x0d\xd0\x06\x6a\x55\x44\x2c\xb2\xe1\x4f\x63\x75\x95\
-\x8a\xe2\x9a\x54\x07\x40\x51\x94\xe4\xe3\x2a\x57\xb9\x03\xc7\xed\
-\xe7\xc2\xae\x75\x82\x61\xf9\x26\xcc\x5e\xb0\x07\xb6\x4e\xd8\x57\
-\xeb\xa4\x3b\xe0\x8b\x17\x69\x81\x42\xe4\x25\xd0\xea\x62\x15\xc5\
-\xb5\xa9\x0e\x80\xa2\x28\xc9\xc6\x9e\x15\x47\x02\xce\x8d\x82\x2f\
-\x43\x7e\x5a\x31\x77\x09\xec\x9f\x77\xa2\xef\x85\xb2\xa0\x7d\xa4\
-\xd5\x10\x3a\x88\x72\x14\x23\x1f\xff\x9b\x40\x49\x51\x94\xc7\x52\
-\x1d\x00\x45\x49\x0e\xcc\xf3\xd7\xa2\x04\x85\x44\x5e\xab\x8b\x49\
-\x3a\x8e\x73\x7a\x2b\xfd\x01\xac\x7b\x77\x67\xe6\xa3\xc1\x30\x3c\
-\xdf\x6f\xfd\x17\x74\x87\x93\x9f\x9c\x2f\x74\xad\x24\x68\x05\x45\
-\xa4\xd8\x04\xe4\x25\x27\x59\xad\xae\x56\x51\x92\x93\x3f\xbb\xa9\
-\x8b\x00\x15\x25\x19\x30\xc2\x89\x24\x0a\x1c\xbf\xea\xfb\xf4\x54\
-\x70\x17\x40\x44\x50\xe4\xda\xe8\x0f\x61\x7e\xdf\xb5\x27\x76\xaf\
-\x82\x3f\xc2\x17\x77\xdf\xfc\x33\x84\xce\xbc\xd7\x3e\xb2\x27\x68\
-\x5b\xb5\x8f\x45\x19\xa0\x20\x41\x78\xf2\xbf\x65\x93\x15\x45\x79\
-\x42\x5b\xfc\x54\x07\x40\x51\x92\x83\xc9\xc6\x7c\x36\x40\x78\xa9\
-\xc8\x4a\x51\x7f\x82\x51\xc1\xf8\xca\x38\x0a\x62\xaf\xf8\x4c\x94\
-\xb0\xba\xb8\x17\xe7\xd2\xa1\xeb\xfb\x43\x7e\x86\x89\xd1\x73\x27\
-\xac\x8b\x87\x55\xef\x6d\xab\x73\x68\x04\xc4\x1f\xb4\x2d\xb2\xef\
-\x07\xad\xa3\x76\x4c\x94\x45\x2e\x33\xec\x81\x9a\xc2\x57\x51\x9e\
-\x83\x79\x0a\x60\xd7\x7a\xab\x0b\x51\x14\xe5\x11\x34\x34\x04\xb0\
-\x94\xcd\xc6\x7e\x88\x1f\x16\x3f\xd7\x7e\x14\x8c\x9a\x46\x57\xbe\
-\xb2\xba\xb8\xe7\x67\x9f\xe8\x68\xab\x67\x87\x4d\x4b\xf6\x7a\x9e\
-\xc8\x0c\x1f\xdf\x1b\xe3\x3f\xb3\x28\x2c\x8b\xd9\x74\x76\x7f\x28\
-\xd8\xc6\xd9\x7a\x38\x5a\x82\xd6\x47\x94\x11\x91\xfc\xbd\xda\xa0\
-\x6a\xf8\x15\xe5\xf9\x99\x23\x00\x53\x17\xc9\xac\x5c\xcf\xea\x82\
-\x14\x45\x01\x3c\x70\xc7\x1d\x8c\x1f\x8c\xe9\x2c\x03\xc3\x87\x62\
-\xa4\x03\xaf\xda\x9e\x4d\x3d\xbe\x01\x71\x4b\x1c\x62\x3b\x30\x2a\
-\x99\x75\x03\x7a\xf3\x05\x53\x21\xe4\xca\xdd\x5e\xf7\xf7\xc3\x82\
-\x12\x6b\xc7\xec\xee\x0c\xb3\x0a\xaf\x5c\xba\x7d\x38\x84\x7e\x78\
-\xf7\x70\x64\x21\xd0\x1e\x68\x76\x51\x16\xc4\x54\xf1\x0d\x7d\x91\
-\x43\xfc\xf1\x56\x17\xaf\x28\x29\x8b\x3a\x05\xa0\x28\xae\x40\x20\
-\x10\x40\x04\x0f\x88\x06\xfd\x17\xe3\x80\xe1\x0f\x1e\xc1\xee\x5f\
-\xbb\x1d\x82\x3a\xbf\x56\xdc\x5c\xbc\x3d\x34\x7a\xa9\xfa\x07\xa5\
-\xbe\x01\xf1\x97\xf8\x59\x94\xb1\xba\xe8\x27\xe7\x68\xaf\x0b\xfd\
-\x4b\xd8\x3b\xf2\xe8\x91\xf3\x87\x60\x52\x9a\x79\x17\xd6\x57\x80\
-\x03\x7e\x27\xb6\x5f\xe8\x0a\xb6\x39\xb6\x58\x47\x3f\xd0\x0c\xed\
-\x35\xd1\x1e\x28\x49\x41\xe2\x50\x57\xf3\x2b\x4a\xa2\x31\xbe\x54\
-\x1d\x00\x45\xb1\x92\x73\x88\xff\x3c\x57\xb8\x03\xfa\x70\x7d\xab\
-\x01\x64\xb9\x94\xb1\x77\xda\x3d\xd0\xf6\x41\xe3\xa9\x55\x6e\x42\
-\xfb\x13\x4d\x36\x54\x8d\x86\xf4\x73\x03\x76\xa7\x79\xdb\xea\xa2\
-\x9f\xdc\xbd\xbb\xf7\xa7\x46\x8d\x87\x85\x45\xd7\x15\xd8\xdd\x0d\
-\x66\xfd\xbc\xbc\xc8\x76\x1d\x6e\x36\x0d\xcd\x15\x3e\x05\x44\x01\
-\x11\x2f\xba\x80\x36\x4a\xdb\x25\x4a\x23\x87\xf6\xe3\xac\xae\x5a\
-\x51\x52\xb2\xed\xef\xcb\x5c\x5e\xca\xec\x00\x1c\x6a\x2e\xf3\x9c\
-\xbf\xcc\xfc\x91\x56\x97\xa8\x28\x29\x9a\x73\x88\x5f\x33\x8a\x19\
-\xed\x41\x6c\x10\x23\x84\x0e\xc5\x37\x15\x2c\x9b\x2b\x08\xde\x0a\
-\x7c\xb5\x4d\xa3\x77\xa1\xda\x81\x32\xd7\x0a\xb5\x05\xb7\xb9\x6e\
-\xee\x5a\x33\xab\x8b\xfe\x6f\xfa\xa7\xfa\x6d\xa3\x15\xec\x6f\x71\
-\x62\xf0\x85\x5c\x30\x63\xf2\x12\xef\x2d\x99\x61\xdb\xa9\xfd\x13\
-\x4e\x35\x83\xf8\xf2\xb6\x8b\xf6\xdc\xa0\xf5\xd0\x4a\x89\x7c\xc8\
-\x8b\xf9\x4a\xa1\xce\xe9\x2b\x4a\x92\xb9\x3d\x42\xe6\x0d\xcd\xec\
-\x00\xec\x31\x27\x17\x3d\x62\xde\x48\x93\xdf\xea\x0a\x15\x25\x65\
-\x4a\x83\x0f\x5e\x60\xdc\x35\xb2\x1b\x8d\xc1\x37\xc0\xfb\x65\xaf\
-\x59\xd0\xf8\xf5\x1a\xa3\x4b\x57\x82\x4e\xef\xb7\xa8\x50\x6b\x1c\
-\xe4\x1b\x9c\x6b\x47\x56\x3f\xe0\x1a\xee\xb8\x72\xc3\x1f\xc2\x3d\
-\xa2\xe1\x76\xf1\xb0\x9c\x11\x69\x60\x71\xdc\xfa\x9e\x7b\x0e\xc2\
-\xbc\x6d\xab\x3f\xd8\x95\x16\x6e\x7e\x16\xda\x38\x7c\x3c\x88\x0a\
-\x62\xb9\xc8\x03\x5a\x4d\xad\x82\x28\x02\xf8\xe2\x8d\x01\xaa\xd9\
-\x57\x14\xeb\xa8\x53\x00\x8a\x92\x98\x9c\xe7\xf6\xe3\x88\xc7\x0e\
-\x8e\x35\x7a\x66\x7d\x20\x64\x58\x9e\x36\xc6\x2f\x16\xba\x5f\x6e\
-\x7d\xba\x6e\x2c\xb4\x1d\xdd\xa8\x57\x95\xee\x90\xa6\x87\x6f\x69\
-\xaf\x70\xa0\x87\xd5\x85\x3f\x99\xf8\x35\xb6\xb5\xf6\x03\x30\x62\
-\xd6\xe4\x92\x8b\x3f\x87\x0d\x83\x76\x4d\x3a\x7a\x03\xec\xb5\xed\
-\xef\xea\x5f\x83\xd6\x49\x0b\x12\x19\x81\x2c\x64\xa4\x08\xea\x48\
-\x5f\x51\x5c\x88\x9a\x09\x50\x51\x12\x53\x18\xe1\x44\x82\x3e\xcc\
-\xd8\x66\xd8\x20\xf7\xe1\xec\xf5\x33\x9d\x85\x77\xfb\x74\x1d\xf3\
-\xf2\x0c\xe8\xf0\xf2\x4b\x25\xab\x7f\x04\x69\x22\xcd\x86\x3f\x99\
-\xb1\x17\x76\x6c\xd4\x7b\xc3\xd9\xdb\x97\x7e\xbe\xe9\x0d\xb6\xef\
-\xec\x65\x1c\xd9\x41\x5b\xac\x0d\x10\x79\x81\xcc\x64\xc0\x1f\xd5\
-\xf0\x2b\x8a\xcb\xb8\x10\xea\xfc\x7f\x0f\x8d\x00\xc4\xdd\x32\xff\
-\x4f\x76\xab\x4b\x54\x94\x64\xc9\xb9\x6a\xdf\x31\xce\x72\x15\xf4\
-\x19\xc6\x09\x23\x13\x14\xdf\x9e\x7f\x6b\xae\x56\x30\xc8\xa7\x6b\
-\xb7\x97\x36\x40\x85\x46\xc5\xef\xe7\x7b\x1d\x44\x79\xd1\x53\x64\
-\xb3\xba\xe8\xe7\x50\x98\x60\x02\x41\x6b\xa2\x55\x14\x31\xc0\x3e\
-\x3a\x12\x08\xe8\x84\xab\x06\x5f\x51\x5c\xc9\xbd\x85\x32\x7f\xae\
-\xef\x7c\xe4\xa1\x0e\xc0\x18\x1f\x99\xcd\xa2\x64\x06\xa8\x85\x34\
-\x15\xe5\x49\x98\x43\xfd\xc6\x36\xf6\x73\x0a\xb8\xc9\x4d\x42\xa1\
-\xd4\xbc\x42\x2f\xe7\xf9\x0c\x3e\x32\x7a\x75\x6f\x95\x13\x8a\x7d\
-\x9d\xff\x54\xae\xba\x56\x17\xab\x28\x4a\x2a\xb4\x52\x86\xf1\xb5\
-\xf3\x81\x87\x4e\x01\x84\x98\x13\x01\x39\x06\x59\x5d\xa9\xa2\x24\
-\x0b\x6e\x68\x68\xc0\x09\xce\x73\x0d\x8c\x25\xc6\x35\x23\x17\x94\
-\xac\x5a\xe0\x4e\xee\x16\xf0\xf1\x89\x5e\x93\x5b\x6f\x84\x62\xa3\
-\xf3\x9f\xcc\x15\x60\x75\xb1\x8a\xa2\x28\xff\xa3\xae\x01\x50\x94\
-\xe7\x71\x88\x53\x5c\x02\x63\x82\x31\x83\x55\x50\xaa\x70\xa1\xef\
-\x82\x7e\x83\x8f\xde\xec\x5d\xb7\xd5\x3b\x50\x74\x7a\xfe\x0c\x39\
-\xfb\x5a\x5d\x64\xe2\x89\x2f\x19\xdf\xca\xf6\x1e\x38\x46\x3b\x62\
-\xf4\x2e\x20\x0a\x92\x47\x04\x5a\x5d\x95\xa2\x28\xff\x74\xec\x0d\
-\x99\x91\x63\x9d\x8f\x3c\xd4\x01\xb0\xe7\x91\x79\x3f\x99\x5c\x83\
-\xac\x28\x16\x31\xef\xe3\xd7\x8f\x1b\x1e\x46\x69\x28\x7e\xbd\xc0\
-\x85\x5c\xaf\xc3\xc7\x7d\x7a\xd5\x6b\x35\x18\x8a\x7d\x99\x7f\x7f\
-\x2e\x0f\xab\x8b\x4c\x7c\x61\x71\xe1\x3e\x0f\x06\x40\x5c\x19\x5b\
-\x13\xfb\x17\x40\x1f\x3a\xd0\xd0\xea\xaa\x14\x45\xf9\xa7\x99\xe6\
-\x35\x00\x61\xd5\x8f\x1c\x59\xbc\x78\xd4\xa8\x7f\x74\x00\xae\x99\
-\x4f\x18\xbf\xc9\xea\x52\x15\xc5\x25\x69\x72\xc8\x5f\x1f\x6f\xec\
-\x33\xfc\x20\x53\x4c\xfa\x70\xff\x3e\xf0\x56\xa5\xd7\xa2\x1b\xbe\
-\x0f\x45\x77\xe4\x2f\x9d\x73\x98\xd5\x45\x26\x1d\xc7\xc7\xfa\x09\
-\xbd\x1b\x18\xd9\x8d\x2a\x46\x5f\x20\x00\x3f\x7c\xac\xae\x4a\x51\
-\x94\x27\xa1\x39\x7b\x02\x09\x3d\x08\xb7\xba\x30\x45\x71\x45\xc6\
-\x17\xc6\x78\x66\x83\xe7\x35\x0f\x9b\x7b\x18\xbc\x3a\xaf\xc9\xf6\
-\x6a\xe7\xa0\x52\x6c\xc9\x6c\x05\xa2\xac\xae\xce\x02\x45\xc9\x47\
-\x0e\x20\x00\x7f\x7c\x51\xb7\xfb\x29\x8a\xcb\xb1\x65\x95\x79\xbf\
-\xc6\xc3\xff\xf2\x98\x6b\x00\x8e\xef\x93\x79\x43\x5d\xb6\xa4\x28\
-\xf0\x77\xc3\x66\x1c\x31\x30\x2a\x40\xa5\xc8\x92\x4d\x0b\xac\x84\
-\xf6\xbf\x37\x39\x59\x35\x1e\x3c\x9b\x7b\xd4\x75\x2f\x62\x75\x91\
-\x8a\xa2\x28\x0f\xdb\x36\x45\xe6\xfc\x4b\x0f\xff\xcb\xdf\x1d\x80\
-\x84\x23\x01\x5b\x57\xc8\x3c\x76\xcf\xea\xd2\x15\xc5\x52\xe6\xf1\
-\xac\xee\xa5\x77\x30\x16\x40\x50\xab\x9c\x41\x99\xbf\x82\xde\x1f\
-\xb5\xcb\x5f\x7f\x06\xa4\xbb\x16\xd0\x20\x4d\x55\xab\x8b\x54\x14\
-\x45\x79\x1c\x5b\x63\x99\x71\x3d\x1f\x1e\xf1\x7f\xdc\x5d\x00\x66\
-\xc3\xaf\x7f\x6e\x75\xe9\x8a\x62\x25\x63\x33\xfb\x38\x01\x6e\x76\
-\xb7\xcf\xb5\xfb\xd0\xc0\xbf\x6a\x70\xa9\x52\x50\xf2\xf3\x42\x55\
-\x83\x5a\x58\x5d\x9d\xf5\x44\x6b\xd1\x80\x8a\x20\x72\x93\x8d\x8c\
-\xa8\x53\x00\x8a\xe2\x32\x74\xb3\xe1\x5f\x3f\xc7\x7c\xc0\xf3\xe1\
-\x67\x3c\xae\x03\x60\x9e\x33\x18\x9b\x49\x66\x9c\xbf\xd5\x1f\x45\
-\x51\x2c\xd1\xc5\xf8\xc0\x18\x0f\x19\x2f\xa4\xbb\xe6\x37\x01\x1a\
-\x8c\xac\x7a\xaf\x44\x24\x88\x3e\xa2\x06\xd7\x93\xb0\x8e\x7d\x1c\
-\xe7\x3c\xc4\xce\x8f\xcf\x62\x7b\x1f\x0c\x28\x46\x5b\xab\x37\x0e\
-\xd8\x5e\xb3\xe7\x71\xdc\x00\xbd\xad\x31\xd9\xb8\x06\x04\x92\x99\
-\x0c\x56\x57\xa5\x28\x0a\xc4\x98\xb9\xb4\xd7\xe3\x9e\xf1\x1f\xf3\
-\x00\x5c\x32\x47\x00\xec\xd5\xac\xfe\x28\x8a\x92\xa4\xbc\xf0\xc4\
-\x03\x8c\x83\x86\x41\x19\x28\xbd\xb0\x48\xe1\xbc\x33\x20\xe8\x56\
-\xe0\xfe\x2c\xdf\x25\x7d\x39\x21\x1e\xf7\x86\xdc\xd7\x60\xd6\xec\
-\xe5\x87\xb6\xdf\x84\x58\x47\x5c\xbd\xf8\x3f\xac\xde\x48\x10\xbe\
-\xf8\xfe\x5b\x51\x79\x21\xbe\xa8\x2d\x9f\x3d\x27\xd0\x51\xbc\x44\
-\x8d\xe7\x7e\x59\x45\x51\x9e\x9b\xfd\x82\x4c\xfd\xd3\xc7\x3d\xe3\
-\x3f\x3a\x00\x0f\xbe\x97\x79\x79\xa7\xd5\x1f\x45\x51\x92\x92\x51\
-\xd3\xe8\x68\x7c\x0e\xbe\xa3\x7c\x62\xbc\xd2\x42\x83\x4f\xaa\x2c\
-\x2e\x19\x0d\x3e\xf3\xbc\x73\x7a\x26\xe1\x89\xb1\xd0\xdf\xc3\xdd\
-\x23\xfb\xc1\x8f\xc5\xfe\xd8\xbf\xe2\x00\x2c\x5c\xbd\xae\xc1\xee\
-\x61\xf0\x60\x50\xd4\xeb\xb1\x9b\xac\xde\x4a\x60\x7c\xc6\x38\x66\
-\x03\x87\xe5\x84\x48\xb8\xe1\x86\xb0\xba\x2a\x45\x51\x60\x52\x6e\
-\x99\x67\xbb\x3c\xee\x19\xff\xd1\x01\xb8\xfa\xa6\xcc\x69\xd7\xac\
-\xfe\x28\x8a\x92\x94\x1c\xfd\xf4\xa3\x46\x7d\x28\x90\x2d\x4f\xbb\
-\xec\xb7\xa1\xdc\x37\xc5\xfb\x04\x8f\x7a\xfe\xd7\x7d\x52\x0f\x16\
-\x47\xff\x15\x7b\x16\x7e\xbd\x3e\xbb\xdc\x5a\x4f\x58\xd2\x77\xfd\
-\x98\xbd\x75\x20\xba\x79\xec\xe9\xf8\xe1\x70\x6f\x48\x64\xd5\x28\
-\x75\xbf\xbd\xa2\x28\x8f\x75\xab\x8e\x4c\x3d\xfb\xa3\x6f\xf7\x7f\
-\x44\x07\xe0\xd1\x4f\x34\xc6\xa2\x28\xa9\x81\x0d\x3b\x0e\x60\x08\
-\x63\x8d\xf9\x90\xf5\xb3\x8c\x8b\xd3\xfa\x41\xe6\xd8\xf4\x9f\x07\
-\xc4\x26\xfe\xdb\x1b\x23\x8c\xad\xa4\x81\x15\x1f\x6c\xf6\x3f\x58\
-\x1a\x96\x8e\xdb\x30\x64\x9f\x3f\xe8\x86\xde\xd8\x98\x09\xfc\xce\
-\x77\xf4\x03\x8e\x1a\x67\xb8\x62\xf5\xc6\x52\x14\xc5\xf5\x44\x76\
-\x96\x79\x69\xcd\x7f\x3d\xf3\x09\xd7\x02\x58\xb7\x48\xe6\x85\x53\
-\x56\x7f\x34\x45\x49\x54\x77\x08\x23\x02\xdc\x7c\xb4\x91\x9a\x06\
-\x99\x33\x67\xf8\x3d\x20\x0a\x68\x4c\x79\x2a\x26\xfe\xdb\x9f\xec\
-\x73\xe1\xe0\xb5\xf5\xf0\xfb\xf0\x25\xef\x6e\x2e\x09\x51\xbf\xc7\
-\x76\x8b\x73\x80\xc8\x2b\xee\x8b\x2d\x80\x03\x5d\x5d\x65\xaf\x28\
-\xca\xe3\x1d\x31\xaf\xc2\x59\xf8\xd7\x7f\x3d\xf3\xb1\x1d\x80\x84\
-\x23\x01\x47\xc7\xc9\xbc\xb9\xc4\xea\x8f\xa6\x28\x89\xc9\x08\x25\
-\x9c\x48\x70\x9b\xab\x35\xd6\xf6\x42\xfa\xc1\x69\xc3\xd3\x6c\x4c\
-\x82\x37\x6e\xc2\x60\x3e\x87\xb5\x03\x76\xbc\x7f\xa4\x0e\x5c\x1d\
-\x7a\xb3\x60\x68\x39\x10\xe5\x85\xbb\x38\x00\xc4\x12\x8f\xcd\xea\
-\xad\xf3\x08\x41\xe4\x20\x0b\x90\x06\x5f\xbc\x41\xdd\x04\xa8\x28\
-\x96\x73\xce\xdf\x73\xe5\x71\x43\xff\x4e\x4f\x38\x02\x60\x54\x92\
-\x19\xb1\xca\xea\x4f\xa6\x28\x89\xea\x0e\x61\x84\x83\x9b\x9f\xdb\
-\x24\x2d\x27\x64\x8a\x49\x9f\x21\xe0\x58\xe2\xbf\x6d\x58\xe3\xf0\
-\x37\x1e\x7c\x0b\x87\x4b\x9f\x3a\x78\xe9\x1a\xd8\x7f\x74\xe4\xd4\
-\xd7\x82\xa8\x4d\x45\x8a\x59\xbd\x51\x1e\x4f\xbf\xac\x97\x31\x46\
-\x83\x51\xd3\xe8\xc0\xa7\x20\xfc\xcc\x8e\x80\xa2\x28\x49\xcc\x11\
-\x2f\x73\xfa\x2e\xf3\xe7\x2a\xff\xf5\x1b\x4f\xd8\x01\xd0\xcd\xe7\
-\x8d\x30\xcf\x82\xda\xd4\x75\xbe\x4a\xca\x14\x4d\x0c\x71\x20\xde\
-\x11\xe5\x45\x0c\xf8\x0e\xf6\xbe\xe2\xd9\x3c\xf1\xdf\xd6\x26\xec\
-\xcb\xed\xfb\x21\xbe\xb5\x2d\xb7\xa3\x23\x88\xce\xb4\xa4\x7a\x82\
-\xa7\x18\x00\x22\x80\x34\xf8\x00\x05\xc8\x43\x36\xab\x37\x16\x84\
-\x7d\x71\xef\xd5\xfb\x13\x20\xce\x23\xde\xd7\x56\x0e\xe8\x4f\x67\
-\x9a\x59\x5d\x95\xa2\xa4\x46\x0e\xb3\xeb\xbd\xbf\xf0\x93\xfe\xc6\
-\x13\x76\x00\x9c\xf6\x99\x13\x0a\xcc\x7d\xe2\x37\x50\x94\x64\xc5\
-\x5d\x2e\xf3\x6b\x74\xe0\x5d\xc6\x80\x6d\xa3\xbd\xb7\x9e\x33\xf1\
-\xdf\x36\xe3\xc6\x74\xd3\xfd\x3f\x83\xe0\x21\xb9\xf2\x67\x79\x19\
-\x44\x1b\x51\x58\x5c\x06\x2e\x73\x83\x10\xa0\x90\x08\x26\x07\x38\
-\xbe\xd0\xaf\x1a\xf5\x21\xce\xd3\x96\xcd\x56\xd4\xea\x8d\x05\x71\
-\x93\x6d\xdf\xda\xbf\x00\x7d\x85\x9e\x46\x7f\x03\xc8\x4f\x6e\x91\
-\xdd\xea\xaa\x14\x25\x35\x9a\x57\x48\xe6\xe9\x82\x4f\xfa\x1b\xff\
-\xd9\x01\x48\x78\x0e\x21\xaa\x9b\xcc\x33\x53\xad\xfe\xa8\x8a\x92\
-\x18\x84\xb9\xba\x9d\xed\x35\x5b\x19\x7b\x29\x38\x1b\x7f\x79\xf8\
-\x4d\x8f\xc4\x7f\x5f\x8f\x85\xee\x87\xdc\x16\x41\xd3\x5c\x35\x07\
-\x96\x3d\x02\x01\x53\xfc\x3e\xf4\xa9\x00\x46\x4e\xa3\x96\xd1\x1b\
-\x68\x49\x5d\x2a\x80\x2d\xaf\x3d\xd6\x7e\x10\x22\x7b\x3e\xd8\x10\
-\x93\xc5\xea\xad\x05\x94\xa4\x30\x41\x40\x7a\x02\x48\x83\xba\x06\
-\x40\x51\x92\xdc\xbd\xf2\x32\x67\x35\x91\x19\xd5\xed\xbf\xce\xfd\
-\x3b\x3d\xe5\x08\x80\xd3\xac\xda\x32\xcf\x1f\xb2\xfa\xa3\x2b\xca\
-\x0b\x95\x8b\xec\x64\x02\x7b\x4b\xc7\x4d\xfd\x6b\xb8\x5c\xe6\x7a\
-\xe9\x3b\x2b\xc0\xf6\xae\xbd\x89\xa3\x67\xe2\xbf\x7d\xa9\x9a\x85\
-\xe7\xe5\xf9\x1c\x6a\xdf\xa9\xb4\xb3\xf8\x04\x10\xdd\x44\x21\x71\
-\x0d\x38\xc6\x59\xae\x02\xeb\xd8\xc5\x09\x30\xea\xf0\x06\x16\xcc\
-\x48\xa8\x28\x8a\xab\xb9\x64\x9e\x74\x5b\x13\xf3\xb4\xbf\xf9\x8c\
-\x1d\x80\x4b\xe6\xc2\xa7\xf7\x92\xe0\xce\x68\x45\x49\x42\xee\xb8\
-\xe1\x06\xe2\x4f\xbe\xa7\x2f\xdc\xfe\x3e\xac\x55\x84\x06\x77\x5e\
-\xb9\x7b\x2b\xe2\xe7\xc4\x7f\x7b\x9f\xba\x5e\xfb\x3c\x73\x40\xcf\
-\xef\x5f\xf9\xa4\x5e\x31\x28\xfa\x55\xbe\x98\x9c\x6b\x40\x6f\xea\
-\x58\xad\x17\x05\x34\x34\x04\xe0\x8d\x17\x49\x30\x32\xa1\x28\x8a\
-\xab\x5b\xfb\x89\xcc\xf8\x7e\x4f\xfb\x9b\xcf\xd8\x01\x88\x3b\x24\
-\xf3\x47\x73\x2a\x12\x43\x9d\xf5\x53\x52\x14\xf1\xb5\xd6\x48\x78\
-\x42\xc8\x27\x77\x4f\xdd\x1f\x04\x37\xe6\xdd\xde\x7c\xaf\xfa\xf3\
-\xbf\xee\x93\x0a\xfa\x38\x47\xcf\xcc\xdb\xe0\xcd\x98\x57\x67\x34\
-\xbc\x0d\x59\x16\x67\x2a\x97\xb6\x3e\xe8\xdf\xe8\x9b\x0c\x0d\x70\
-\x95\xab\xed\x35\xc4\xdf\x53\xff\xaa\x4b\x83\x15\x25\x09\x39\xcc\
-\x31\xc0\xa5\x5f\xcb\x34\x8a\x3f\xe9\xd0\xbf\xd3\x13\x77\x00\x1e\
-\xfd\xc2\x17\x26\xca\x8c\x57\xd7\x04\x28\x29\x8a\xd6\x44\x64\x11\
-\x17\x21\xac\x69\x78\xf9\xc8\xce\x70\x40\x3b\xe1\x71\xe1\x5b\x30\
-\x72\x1b\x83\x8c\x5d\x49\x57\x47\xf5\xdb\xe5\x6a\x15\x9e\x0d\x03\
-\xa6\xbc\xfe\x5d\xd3\x21\x90\xc9\x33\x3d\x01\x1f\x80\x5e\x4d\xff\
-\xca\x38\x6c\xf5\x56\x02\x7a\xf3\xa5\xf1\x2b\xb0\x9b\xa3\x9c\x45\
-\xae\x05\xf0\x8c\x87\x15\x8a\xa2\x3c\x8d\x1d\xe6\x22\x7d\x17\xda\
-\x3f\xeb\x2b\x3c\xe7\x57\x75\x7f\x98\xcc\xd9\xaf\x59\xbd\x29\x14\
-\xe5\x85\x2a\x46\x7e\x72\x80\xfe\x91\xb1\xc8\xf0\x85\x35\x1f\xee\
-\xa8\x74\x64\x00\xdc\xd8\x10\xb2\xf7\x5e\x12\x8e\x77\xb9\xa5\xd5\
-\xbe\xd3\x7c\xe0\xa5\x46\xb5\x6d\xe5\x04\xf4\xef\xff\xfa\x80\xc6\
-\x73\x20\xa0\x7c\x9a\x00\x9f\xdd\x56\x6f\x24\x08\x1b\x11\x3e\xf6\
-\xc1\x7a\x88\x7b\xc3\xf6\xb1\x7d\x12\xf0\xa6\x68\x4f\x03\xab\xab\
-\x52\x94\x94\xcc\xd6\x47\xe6\x1c\x37\x99\x37\x9e\xfa\xc8\xdf\xe9\
-\xa9\x3b\x00\x09\xdf\x28\xee\xa0\xcc\x3f\xaa\xca\x0c\x0d\xb1\x7a\
-\xd3\x28\xca\x0b\xa1\xcb\xeb\xd9\x45\x84\xd8\x2b\xa6\xc3\x85\x73\
-\x57\x5b\xdc\xf6\x83\xd5\x7d\xb7\xce\x3e\x9c\x37\xe9\xcb\xf1\x68\
-\xe7\x3e\xc0\x6d\x34\xd4\x1e\x58\xf1\x56\xb1\x78\x28\x14\x90\xf7\
-\xaf\xc0\x50\xab\x37\x12\xc4\xfc\x11\x9b\x31\xfe\x0a\x38\x66\x3a\
-\x8a\xe8\x07\x41\x94\xa7\x38\xc1\x56\x57\xa5\x28\x29\xd9\x85\x5b\
-\x32\xa7\xef\x78\xde\x57\x7a\x41\x83\x75\xbb\xcc\xab\x0f\x43\x23\
-\xac\xda\x24\x8a\x92\x18\x44\x2b\xea\x53\x11\x6c\x99\xed\x67\xed\
-\xf3\x61\x55\xd6\x6d\x03\x0f\xee\x85\xcb\xdf\xde\x18\x1f\x62\xc1\
-\x0d\x6f\x6e\x25\xb4\x85\x5a\x6e\xf0\xbe\xe0\xf5\x85\xc7\x6d\xab\
-\xb7\x0e\x50\x91\x12\xe4\x07\x32\x91\x0e\x7f\xe4\x6d\x80\xea\x46\
-\x40\x45\x49\x44\xc7\x3f\x96\x19\xff\x9f\x73\xfd\xff\x97\x17\xd4\
-\x01\x70\xce\x0f\x30\x6b\xb2\x55\x9b\x44\x51\x12\x85\x86\x86\x06\
-\x9a\xbf\xb6\x49\xeb\x0a\x67\xc3\x2f\x2f\xbe\x99\x03\x56\x35\xde\
-\x36\xe5\x70\x4e\xd0\x47\xe9\xba\xd1\xcb\xea\x22\x15\x45\x49\x05\
-\xea\xcb\xf8\xad\xad\xcc\xb8\xfd\xcf\xfb\x82\xcf\xdc\x01\x48\x78\
-\x2a\xc0\x30\x97\x1f\x5c\xf8\x83\xcc\xf3\xd1\x16\x6d\x20\x45\x49\
-\x14\xa2\x31\xd5\x28\x03\xf6\x79\x8e\x46\xfa\x3a\x98\x7d\x64\xc5\
-\xa8\xed\xfd\x60\xb7\xd7\x91\x79\x67\x93\x60\x95\x40\x45\x51\x52\
-\xbb\xf3\xe6\x62\x7c\x37\x6f\x39\x1f\x79\xd6\x73\xff\x4e\xcf\x3d\
-\x02\x90\xb0\x80\x23\xe6\xbc\x00\x0b\xd4\x6c\xe0\x4a\xca\x62\xc7\
-\x81\x03\xb4\x1c\x22\x4c\x6c\x84\x90\x4e\xf7\x46\xdf\xcf\x03\x93\
-\x2e\xce\xeb\xbd\xfe\x28\x5c\x9d\x7b\xab\x62\x58\x57\xab\x8b\x54\
-\x14\x25\xe5\x72\xb6\xab\x47\x62\x9f\xb7\xe1\x77\x4a\xa4\x1b\x76\
-\xc6\x99\x23\x02\xd7\x7e\x4f\x9a\x0d\xa3\x28\x49\x24\x27\xd9\xc8\
-\x00\x22\x42\x1c\x14\x33\x60\x5f\xee\x63\xdf\x9f\xaf\x07\x93\x5b\
-\xcc\xaf\xb3\xe1\x02\x3c\x88\x8b\x8e\x8f\x55\xd3\x63\x29\x8a\xf2\
-\xc2\x38\xdb\x51\x67\xbb\xfa\xe2\x24\x52\x07\x20\xe2\x25\x99\xb7\
-\x9f\x7a\x6a\x42\x45\x71\x69\x3a\x3a\x06\x88\x3a\x72\x99\x5e\x63\
-\x8d\xf1\xc0\x28\x02\xab\x1b\x6c\x7d\xf5\xd0\x25\x58\xb4\x66\x7d\
-\x89\xbd\xf5\xc0\xb6\xda\xfe\x95\xe3\x6b\xab\x8b\x4d\x3c\xf6\x43\
-\x8e\x6f\xf5\xea\x70\xbf\x7a\xd4\xd0\x98\x53\x20\x56\xf1\x1b\x9f\
-\x58\x5d\x95\xa2\xa4\x44\xbf\x9a\x8b\xfc\x5c\xbb\xf2\xa2\x5f\x39\
-\x91\x3a\x00\xf7\xcd\x65\x4a\x46\x75\x4a\xac\x4d\xa2\x28\x96\x72\
-\x76\x04\xae\x89\x8d\xe2\x57\x88\xb2\xc7\x2c\x8d\x5d\x0a\xbf\xd6\
-\x9b\xfd\xd9\xda\x40\x98\x7f\x66\xcd\x81\x5d\x1d\xc1\x91\xcf\xb1\
-\x58\xff\xdc\xea\x62\x5f\xbc\xf8\x25\xb6\x05\xf6\xf3\x10\x5d\x22\
-\xe6\x7c\xdc\x4d\xe0\x07\xf1\xb1\x78\xe1\xc7\x27\x8a\x92\x9a\x9d\
-\xd9\x20\x73\x49\x15\x99\xc6\x17\x2f\x6a\xe8\xdf\xe9\x85\x75\x00\
-\x1e\x5d\xd8\x1a\x73\x95\xa2\xf5\xdd\x13\x6f\x23\x29\x8a\xf5\x44\
-\xb4\x38\x24\x66\x40\x78\x58\xe4\xcf\x51\x75\xe0\x97\xc9\x7f\x75\
-\x5a\xd3\x04\x96\x6e\xdd\xf4\xd7\xfe\x13\x60\xbc\x6e\xfc\x62\x5c\
-\xb5\xba\xca\x17\x48\x03\xdc\x00\x77\x84\x5a\x93\x40\x51\x12\xc3\
-\x52\xf3\x76\xbf\x23\xc6\x8b\x6e\xf8\x9d\x5e\xf8\x08\x40\xc2\x42\
-\xc3\x4e\xca\x9c\x69\x0e\x61\xc4\x1e\x7f\xf1\x1f\x41\x51\x5c\x80\
-\x39\x22\xa0\x35\x13\x59\xc4\x05\xb8\x5b\x39\xa2\xc0\x83\x9c\x30\
-\xa1\xcb\xac\x5b\x6b\xce\xc2\xc6\x12\xbb\x8b\x1e\xff\x1c\x88\x23\
-\x9a\x78\xab\x8b\x7d\x01\x9c\x8b\x12\xb9\xc9\xdb\x24\x15\x45\x79\
-\x51\x6e\x8e\x97\xf9\xe3\x92\xc4\x7e\xa7\x24\xfa\xea\x2e\x0a\x94\
-\x79\x54\xdd\x1e\xa8\xa4\x6c\xe6\x82\x38\xda\x41\xed\x2b\x51\x01\
-\xae\x97\xbe\x3d\xf9\x6e\x6e\x18\x55\x79\x5a\xbf\xa5\xf9\x60\x79\
-\x9b\x4d\xc6\x81\x76\x60\xfb\xc3\xfe\x9e\xe3\x1d\xab\x8b\x55\x14\
-\xc5\xf5\xfc\x54\x4c\xe6\xd5\xeb\x89\xfd\x4e\x49\xd4\x01\xb8\x6b\
-\x9e\x1d\x1c\xe7\x5c\xc1\xfc\x85\x5f\xcc\xa0\x28\x2e\x25\x96\x78\
-\x6c\xa0\xcd\xd3\xde\x14\xb9\xe1\x4a\xe6\x9b\x22\xd4\x07\xbe\x5d\
-\x38\x69\xe9\x22\x2f\x58\xd0\x73\x4d\xdd\xdd\x6b\xc1\x1e\x60\xdf\
-\xe7\xd8\x62\x75\xb1\x8a\xa2\x58\xef\xd4\x72\x99\x8b\xff\x34\x1f\
-\x28\x9b\x58\x43\xff\x4e\x89\xd6\x01\x78\x74\xe1\x4b\xcc\xd5\x03\
-\x37\xaa\x29\x83\x95\xd4\x21\x80\x34\xf8\x80\xf6\xba\x28\x20\x6e\
-\x43\x44\x89\xc8\x3d\x51\xfd\x61\x6c\xc9\x19\xcb\x57\x34\x84\x5f\
-\x1d\x73\x3e\x5c\x7b\x0e\xa2\x3a\xc7\xbc\x14\x57\xd5\xea\x62\x9f\
-\x42\x16\x32\x92\x16\xc8\x41\x36\x32\x02\xf1\xd8\xb0\x5b\x5d\x94\
-\xa2\x24\x4b\x97\x64\x2c\xab\x23\xf3\xd8\xe4\xc4\x6e\xf8\x9d\x12\
-\x7d\x04\x20\xe1\x07\x89\xc8\x20\x73\x9a\x79\xd9\x50\x9c\x3a\xf6\
-\x51\x52\x07\x07\x0e\x74\x10\x3e\xe2\x92\x58\x02\xf7\x37\x45\x5d\
-\x8c\x29\x05\x53\xcf\x2e\x0c\xd9\x34\x1e\xc6\xd5\x9e\x31\x6a\x65\
-\x29\x08\xe9\x75\x37\xec\xfe\x68\xab\x8b\x7d\x82\x8f\x73\xdf\xd1\
-\x59\xbf\x0b\xf1\x99\x6c\xd7\xed\x76\x30\xb2\x1a\x35\x8d\x9e\x80\
-\x03\x1d\xdd\xea\xea\x14\x25\x39\xb9\xb5\x4f\xe6\x4f\x49\x3e\x81\
-\x9e\x45\x97\xef\xac\x34\x3f\xf0\xc1\x48\x6b\xde\x5f\x51\x2c\xa2\
-\xcb\x06\x52\xab\x21\x7c\xc4\x31\x88\xef\x1f\xdf\xcb\xb6\x10\x66\
-\x15\x5a\x71\x62\x7b\x1e\x18\x5e\xfa\xb7\x52\x0b\x4a\xc0\xf9\x6e\
-\x57\xee\xdc\xf6\xb7\xba\xd8\xc7\xf3\x1b\xe5\xbb\xca\x6b\x3d\xd4\
-\xfb\xb3\xca\xa9\x12\x0d\x21\xa7\x47\xb6\xfe\x19\x97\x83\xfe\xb6\
-\x3e\xdf\x88\x04\x62\x89\x23\x1e\x10\x08\xe7\x75\x11\x8a\xa2\x3c\
-\xca\x4f\xe6\x81\xf1\xa5\x4d\x49\xfd\xce\x6e\x49\xf5\x46\xb7\x6f\
-\x9f\x3e\xbd\x73\x27\x64\xcd\x5a\xb8\x70\xd5\xaa\xd1\x0b\xe5\xa3\
-\xfa\x76\x99\xcd\x3f\x95\x29\x3e\x4e\xea\x0d\xa0\x28\x96\x70\x2e\
-\x37\x1c\x25\xae\x89\x83\x60\x94\x33\x7a\x30\x15\x2e\xae\xbc\x96\
-\xf3\xf6\x20\x38\xb5\xe0\x82\xcf\xf5\xdf\x21\xd0\x3b\xcb\xaf\x19\
-\x96\x40\x8e\x91\x59\x2f\x65\x68\x02\xe2\x55\x51\x46\xb8\x40\xc7\
-\x40\xbc\x2b\x5a\x8a\xcc\x50\xe8\x87\xbc\x69\x02\xb7\x42\xce\x6c\
-\x59\xbf\xcc\xb8\x04\x4e\x0f\xbe\x54\xfb\xfa\x87\x70\xd7\x3f\xe2\
-\xed\xa8\x51\x20\x42\xc4\x76\x91\x13\xf0\xc5\x1b\x2f\xab\xab\x56\
-\x14\x57\x72\x2a\x9f\xcc\x2f\x6c\x32\x43\xf7\x26\xd5\xd0\xbf\x53\
-\x92\x75\x00\x9c\x64\x07\xc0\xf9\xd3\xd9\xe6\x32\xfd\xd7\xc9\x74\
-\xae\xaa\x22\xdc\x93\xba\x2e\x45\xb1\x84\xf3\xd4\xc0\x16\xb1\x92\
-\xe2\x20\xd6\x89\x65\x62\x3e\xdc\xf2\x0b\xbd\x12\xfe\x39\x1c\xb8\
-\x7b\xe2\xf6\x85\xd7\xc1\xff\x23\xbf\x50\xdf\x86\x90\xb7\x67\x8e\
-\x53\x99\x5b\x83\x7b\x67\xb7\x6a\x6e\x69\xad\x2e\x1e\xa8\x46\x79\
-\x0a\x43\xd0\x77\x39\xd6\x64\x6e\x0f\x05\x83\x82\xba\x04\xce\x85\
-\x53\xc3\x2f\xbd\x76\x23\x10\x42\xbe\xbf\xfb\x4a\xc4\x04\x10\xf7\
-\xc5\x5e\xf1\x07\x90\x99\xf4\xe6\xb2\xc1\x8a\x92\x5a\x7d\x23\x63\
-\x8a\x79\x51\xfc\x5f\x9d\x92\xba\xe1\x77\x4a\xf2\x0e\x40\xc2\x91\
-\x00\xdb\x11\xf9\xe8\xb9\x0a\x32\xdb\x86\xc8\xf4\xcf\x9b\xf4\x9b\
-\x42\x51\x2c\xe4\x6c\x10\xb3\x93\x89\x74\x20\xa2\xc5\x75\x71\x08\
-\x22\xca\x46\x7e\x1a\x33\x19\xf6\xbb\x1d\xcf\x70\xa1\x0d\xc4\x67\
-\xb0\xa5\xb7\x6f\x82\x82\x79\xf3\x7e\x1d\xf8\x0b\x78\xa7\xf7\x7a\
-\xc5\xe3\x55\xab\x8b\x07\xf1\x92\x28\x2d\xfc\x21\xb0\x79\x96\xa0\
-\xf4\x75\x21\xf8\x4a\xae\xdd\x59\xfb\xc1\xb9\x2e\x57\x72\xdf\x3a\
-\x08\x77\x06\xdf\x3d\x17\x51\x12\xc4\xc7\xe2\xba\x38\x01\x64\x27\
-\x0b\xe9\x40\x8e\x83\x28\x4a\x6a\x32\x3d\x40\xe6\x60\xf3\x7e\x7f\
-\xdb\x5e\x67\xbb\x98\xd4\x5c\x64\x0a\x8f\x73\x0b\x64\x0e\x98\x2d\
-\x33\x2c\x87\xd5\x15\x29\x8a\x25\xcc\x53\x03\x64\x93\x1d\x01\xed\
-\x8a\x36\x41\x34\x80\x88\x2a\x0f\x3e\x89\x76\x83\x29\x59\x16\x0c\
-\xde\xd0\x10\xfe\x3c\xbb\xb4\xfa\xd6\x8b\xe0\xf8\x51\xcf\xab\xaf\
-\xb3\xba\xe8\x7f\x2a\x7f\xb8\x58\xf7\xe0\xa9\x30\xac\xc0\xc0\x9c\
-\xaf\x15\x85\x2a\x7a\xe9\x12\x05\x33\x81\xb1\xde\x38\xc0\x4e\x30\
-\x76\x71\x88\x73\xa8\x6b\x04\x94\x54\x24\xcc\x5c\x2d\x63\x4e\x69\
-\x99\xd1\x3f\x5b\x75\xe4\xef\xe4\x32\x5f\xbd\x92\x25\x5b\xb4\x78\
-\xf7\x5d\xcd\xb9\x9c\xb0\x39\x03\x52\x8b\xb6\x56\xd7\xa5\x28\x2e\
-\x41\x93\x33\xee\xd9\x73\x38\x56\x39\xba\x43\x93\x4f\x6b\xdc\x2a\
-\xdb\x09\x86\xde\x19\xd0\xa3\x7d\x2c\xf8\x36\xf7\x9e\xeb\x79\xd4\
-\xea\x22\x1f\xef\x6c\x8b\xcb\xdd\x6e\x9e\x84\x2f\xb3\xff\x94\x77\
-\xae\x1d\x0e\xa5\x39\xf5\xc5\xa5\x7d\xe0\xb6\x56\x7b\x59\x3b\x86\
-\xea\x08\x28\xa9\xc0\xe2\xb9\x32\x5b\x37\x97\x0d\xbf\xee\x6d\x75\
-\x45\x2e\x32\x02\xe0\xe4\xdc\x20\x23\x7f\x94\x19\xa7\x56\x13\x54\
-\x14\xf8\xfb\xee\x01\xba\xd1\x4a\xd4\x06\xf1\x86\xe8\xc6\xeb\xc0\
-\x19\x6e\x93\x0c\xe6\xd7\x2c\xb0\x38\xcf\xd4\xec\x45\xe0\x5d\xa3\
-\x9b\xfd\xe5\x74\x50\xb8\x51\x70\xee\x1c\x01\xa0\x97\xd2\x3f\x36\
-\xf6\x00\xe1\xdc\x27\xca\xea\x2a\x15\x25\x31\xec\xec\x27\xf3\xdd\
-\xdf\x64\x5a\xdf\xf0\x3b\xb9\x58\x07\xc0\xe9\xc0\x56\x99\x63\xcd\
-\x65\x85\x6d\x03\xac\xae\x48\x51\x5c\x82\x1f\xbe\x78\x83\x91\xd7\
-\xa8\x61\x74\x00\x86\x18\x63\x8c\xa9\x56\x17\xf5\xe4\xca\x54\x2e\
-\x52\x29\xef\x79\x78\xdf\xb7\xfb\xcf\x2d\xbe\x82\xe0\x36\xb9\x6e\
-\x64\x4d\x0b\xfa\x9b\xfa\x4c\x23\x0c\x35\x12\xa0\xa4\x20\x76\xf3\
-\x76\xf7\x99\xbf\xcb\x3c\xbf\xce\xea\x21\xff\x87\xb9\x4c\x07\x20\
-\xe1\x86\x89\x31\xeb\xfa\x72\xa9\xcc\x63\xe7\xad\xae\x4f\x51\x5c\
-\x81\x18\xc7\x27\xf4\x80\x28\xaf\x98\xc3\x71\x13\x21\x6e\xa2\x6d\
-\xa6\x7d\xb1\xd5\x55\x3d\x85\x6e\x34\xa3\x36\x54\xaa\x5e\xb2\x69\
-\xfe\x43\xd0\x2f\xbe\xe3\xf2\xc6\x25\x21\x7d\x70\xda\xf6\x69\xde\
-\x06\x23\xab\x51\xdd\xe8\x01\x78\xe2\x81\xba\x17\x48\x49\xd6\x8e\
-\x0e\x91\x39\xf5\x96\xd5\x95\x3c\x8e\xcb\x74\x00\x1e\x2d\x2a\x8d\
-\xcc\xd1\xb5\x65\x1a\xf5\xad\xae\x48\x51\x2c\xf5\xba\x78\x89\x6a\
-\x10\x17\x1c\xdf\xc1\xfe\x23\xd8\x71\x2c\x77\xf4\xb1\xba\xa8\x67\
-\x57\xfb\x58\x45\xb7\x62\x07\xe0\xd5\x77\x9b\x1a\xd5\x3e\x06\x8f\
-\xd6\x1e\xdf\xbb\x7f\x0b\x46\x7b\x63\x10\x63\xac\xae\x4e\x51\x9e\
-\xc5\x4d\x73\x4a\xdf\x2f\xc2\x65\x3a\xdb\x31\xd7\xe3\x72\x1d\x80\
-\x47\x0f\x91\x6c\xe8\x24\x73\xa3\x0b\xdc\xf0\xa4\x28\x16\xb2\xcb\
-\x79\x03\xa8\x45\x79\x8a\x00\xf9\xc9\x4d\x36\xab\x8b\x7a\x76\x1e\
-\x43\xdd\x7f\x75\x5b\x05\xed\xca\x37\xfe\xbc\xea\x7d\xa8\xd2\xa7\
-\xd4\xf0\x82\x37\xc0\x38\x66\xe8\x46\x15\xc0\x1b\x2f\x3c\xac\xae\
-\x52\x51\x9e\xc6\x9f\xe6\x82\xdf\x4b\x76\x38\x1f\x71\xb5\xa1\x7f\
-\x27\x97\xeb\x00\x38\x25\xdc\x60\x37\xb2\xcb\xec\x65\x5e\x1b\x70\
-\x79\x86\xd5\xf5\x29\x8a\xf2\xe2\x64\x5a\x94\xbe\xbe\xff\x41\xe8\
-\x55\xa2\xdd\xa9\xfa\x23\x21\xa8\x73\x8e\xe2\x59\xb6\x83\xde\x43\
-\xff\xd3\x08\x41\x9d\x12\x50\x92\x81\x75\xc3\x65\x8e\xfb\xda\xf9\
-\x88\xab\x36\xfc\x4e\x2e\xdb\x01\x78\xb4\x8b\xe6\xd5\x94\xd3\xcd\
-\x29\x13\x6c\x97\xad\xae\x48\x51\x94\x17\xa7\xe4\x95\x42\x7b\xf3\
-\x8c\x87\x0e\x5f\xbe\xd4\xa3\xda\x21\xf0\xde\xe3\xf5\xb9\x47\x69\
-\x30\x4a\x1b\xad\x8d\xf7\xad\xae\x4e\x51\x1e\x65\x47\x0b\x99\xdd\
-\x5f\x96\x79\xa5\xae\xd5\x15\x3d\x29\x97\xef\x00\x24\xec\x41\xe9\
-\xe6\x5c\xc1\xc3\x5f\x91\x39\xec\x98\x4c\x5b\x49\xab\xeb\x54\x94\
-\x24\xe5\x89\x07\x1e\x80\x3b\x6e\x49\x3f\x9f\x67\x22\xba\xcb\x06\
-\x26\x42\x83\x1f\xab\x6d\x2d\x35\x1a\x0a\x7f\x16\x9c\x3e\x47\x7a\
-\x30\x76\x1b\x31\x94\x46\xce\x87\xa0\xee\x12\x50\x5c\x82\xdd\x53\
-\xe6\xbc\x4a\x32\xaf\x96\x74\xb6\x57\xae\x7e\xe4\xef\xe4\xf2\x1d\
-\x00\xa7\x84\x1b\x34\xce\xec\x61\xfd\x18\x24\xf3\x6c\x76\xab\xeb\
-\x53\x94\x24\xe1\xbc\x4d\xee\x0e\x57\xb8\x06\x44\x72\x8f\x70\xab\
-\x8b\x7a\xf1\x32\x95\x4e\x77\xc7\x7f\x32\xb4\xa8\x57\xd7\x51\xa1\
-\x2b\x78\x64\x76\xaf\xe5\xd6\x1d\xb8\xcc\x0d\x42\xad\xae\x4e\x51\
-\x00\x46\x37\x95\x39\x36\xbf\xd5\x95\x3c\xab\x64\xd3\x01\x78\xb4\
-\xf0\xe2\x32\x07\x5e\x90\x79\xd5\x65\x26\x58\x50\x94\xc4\x20\x26\
-\xf0\xb5\xe8\x07\x51\x7f\x46\x07\xc5\x46\x41\x7c\xf7\xf8\x5a\xf6\
-\x96\x56\x57\x95\x78\x6a\xfa\x97\xaf\x57\x64\x3a\x94\xcc\x55\x68\
-\x77\x9e\x03\xe0\xf8\x54\xbf\xa2\xb7\x42\x8d\x04\x28\x16\xba\xe2\
-\x90\x39\xcf\xbc\x4f\xc5\xd1\x3e\xb9\x1c\xf1\x3f\x2c\xd9\x75\x00\
-\x1e\x3d\xc4\xb2\xf6\x9c\xcc\x5e\x6b\x65\x46\x4e\xb3\xba\x4e\x45\
-\x49\x14\xf3\xc4\x8f\xbc\x07\x91\x81\xd1\x65\x62\xda\x42\xec\xa7\
-\xf1\xcb\x6c\x91\x56\x17\x95\x78\xb2\x1c\xcc\x58\x21\x6d\x07\xa8\
-\x59\xb1\xc2\xa8\x22\x33\xc0\xf3\x43\xf7\x09\xee\xd3\xc0\x18\x61\
-\x4c\x66\x89\xd5\xd5\x29\xa9\xcb\xd5\x30\x99\x6f\x98\xcb\xf8\xee\
-\x0d\x4e\xae\x0d\xbf\x53\xb2\xeb\x00\xfc\xbb\xed\x07\x64\x6e\xfe\
-\xd1\xea\x4a\x14\x25\x51\xe8\xe6\x6d\x80\x65\x29\x4a\x30\x90\x8b\
-\x6c\x64\xb2\xba\xa8\xc4\x57\x7a\x63\xe1\xf6\x79\x9b\x41\x5a\x9b\
-\xff\x52\xdf\x60\x30\xd2\x52\xce\xe8\x64\x75\x55\x4a\xea\xf2\x4d\
-\xb8\xcc\xb5\x29\xe6\xe2\xf3\x64\xdf\x01\x48\xd8\x03\x8b\x1c\x28\
-\xb3\xb7\x39\xf5\xe2\x32\xb5\xd4\xa8\xa2\xa4\x00\xf9\x97\xe6\x0e\
-\xc9\xba\x01\xb2\x64\xcf\x38\x25\xed\x74\x60\x88\xf1\x13\x73\xac\
-\xae\x4a\x49\x1d\x9c\xed\xc8\xe2\xbf\x57\xdd\x48\xee\x47\xfe\x4e\
-\xc9\xbe\x03\xe0\xf4\xd0\xbc\x01\xe6\x5d\x01\x83\xdf\x96\x19\x3e\
-\xcc\xea\xfa\x14\x25\x25\x89\x5f\x62\x5b\x6e\x3f\x0e\xd1\xa5\x62\
-\x42\xe2\x4e\x25\xfe\xfb\xf9\x7e\xea\xb3\xc7\x3b\x0d\x14\xfe\x2a\
-\xb8\x74\x8e\x7e\x20\xd6\x8b\x69\x7c\x61\xf5\x56\x50\x52\xb6\x95\
-\x21\x32\x7b\x76\x91\x79\xa3\x64\x4a\x69\xf8\x9d\x52\x4c\x07\xe0\
-\xd1\xce\x99\xcb\xa4\x7c\x57\x48\x66\x4c\xb0\xd5\x15\x29\x4a\x4a\
-\x70\xf1\xbd\x6b\x5b\xee\x0c\x84\x5d\x7b\x8f\x7c\x76\x36\x24\xf1\
-\xdf\xcf\xfd\x53\xb7\xcd\x9a\x0d\x8a\xb5\xca\x3f\x2c\x97\x0d\x88\
-\x15\x87\xc5\x4c\xab\xb7\x82\x92\x32\x39\x17\xa1\x9d\xbe\x45\xe6\
-\xad\x3f\x52\x5a\xc3\xef\x94\xe2\x3a\x00\x09\xff\x43\xd9\x1e\xc8\
-\x1c\xd1\x44\xe6\x97\x66\x07\xc0\xf6\xba\xd5\x75\x2a\xca\x33\xd1\
-\x31\x30\x80\x22\x04\x93\x0b\xc8\x46\x26\xd2\x27\x7d\x19\xa7\xaf\
-\x5c\x2c\x75\x03\x58\xfd\xe7\xb6\x6d\x87\x1b\x42\xd4\x85\x98\x71\
-\x71\x49\x70\xe5\x4d\x8e\xf9\x59\x1a\x64\x58\x03\x62\x02\x43\xe8\
-\x99\xf4\x9f\x5b\x49\xc9\x9c\xed\xc2\x97\xe6\x9a\x33\x73\x1b\x5b\
-\x5d\x51\x62\x4b\x71\x1d\x00\xa7\x87\x26\x10\xf2\x93\x39\xda\x5c\
-\x36\xe5\xf3\x95\x32\x63\xd4\x04\x42\x4a\xb2\x22\x3e\xa2\x17\x2d\
-\x20\x26\x24\xb6\x75\x7c\x5a\xb0\xad\xb0\x0d\xb7\x7f\x97\xf4\x75\
-\xd8\x3b\x38\x2e\x39\x16\xc2\xd1\x34\x67\xbc\x2f\x5f\x82\x70\xcf\
-\xc8\x2f\xa3\x9a\x24\xc1\x1b\xe7\x17\x39\xc9\x0e\x5c\xe5\x26\x61\
-\xa8\xdb\x01\x95\x17\xc0\xd9\x0e\x38\xdb\x05\x67\x3b\xa1\xfb\xa5\
-\xd4\x23\x7f\xa7\x14\xdb\x01\x70\x7a\x68\x44\xa0\x8d\xcc\x11\xd5\
-\x65\x7e\xb9\x5c\x66\xfc\x1d\xab\xeb\x54\x94\x27\x21\x0e\x88\x79\
-\xe2\x3b\x88\x98\x18\x99\x3f\x7a\x3b\xc4\x78\xc5\x0d\x8d\xf7\xb5\
-\xa0\x8e\x75\x62\xb2\xf8\x0c\xc2\x47\xdc\xef\x11\x15\x09\xf1\xd9\
-\x6d\x79\xec\x49\x50\x87\xdb\x3e\xad\x87\x76\x08\xdc\x37\xb8\x95\
-\x71\xeb\x07\xc6\x4e\x0e\x72\x36\xe9\x3f\xbf\x92\x12\x38\xf7\xfb\
-\xce\x76\xc0\xd9\x2e\xd8\xda\xa4\xf4\x86\xdf\x29\xc5\x77\x00\x9c\
-\x1e\x1a\x11\x30\xef\x20\x1e\x65\xae\x29\x30\x65\x90\xd5\xf5\x29\
-\xca\x13\x71\xc3\x0d\x0d\xd8\xcc\x5e\x8e\x03\x67\xb9\xcc\x4d\x0b\
-\xea\x88\x20\x92\x18\x10\xab\xb5\x4f\x45\x36\x10\x53\xf8\x56\x24\
-\xc1\x90\xbc\x5f\xa4\xaf\xe6\x1d\x02\xe9\x8c\x80\x9e\xbe\xbf\x02\
-\x01\x46\x05\xa3\xab\x05\x9f\x5f\x49\xc6\x62\x96\xca\xfc\xdc\x3c\
-\xd2\x1f\x93\x5b\xa6\xbe\x24\xb5\x34\xfc\x4e\xa9\xa6\x03\xe0\x94\
-\xf0\x3f\xb0\xbd\xbd\xcc\x19\xe6\xb5\x02\x17\xce\x59\x5d\x9f\xa2\
-\x24\x07\x46\x03\xa3\xbb\x31\x0c\x32\xa6\x4d\x97\xd6\x7f\x0a\x78\
-\x5d\xf6\xdc\xe7\x9e\x04\x3b\x4e\x91\x5f\x44\xb0\x0d\xc4\x70\x51\
-\x57\x78\x81\x71\x8b\xb0\x94\x38\x15\xb2\x92\x18\xe2\xbd\x64\x0e\
-\x5d\x20\x73\xc4\x14\xf3\xf1\x14\x73\x5b\xdf\xd3\x4a\x75\x1d\x80\
-\x47\xdb\x6e\x8e\x08\x74\xab\x2c\xf3\xfc\xaf\x56\x57\xa4\x28\xae\
-\xcc\xa8\x6e\x74\xe5\x5d\x28\x97\xb3\x68\x87\xe0\xc3\x90\xbe\x4b\
-\xda\x79\x7e\x1b\x13\xff\x7d\x6f\x97\x0d\x3b\x1f\x11\x01\x77\x17\
-\x47\xfc\xf1\xe0\x26\x68\x19\xc5\x0d\xb1\xc2\xea\xad\xa1\xb8\xb6\
-\xd8\xd9\x32\x3f\x5b\x2c\x73\xd4\x10\x99\x46\xda\xd4\xda\xf0\x3b\
-\xa5\xda\x0e\xc0\xa3\xa7\x14\xde\x62\x4e\xf5\xd8\xd5\x5c\x5b\xe0\
-\x82\x9a\x6a\x44\x51\xfe\xbf\x9f\x99\xcd\x66\x08\xe8\xe6\xe7\xee\
-\xf3\x29\xd4\xee\x5a\x31\xa4\x58\x08\x78\x17\xf0\xdc\xef\xd1\x37\
-\xf1\xde\xd6\x78\xdd\xf8\xc3\x08\x87\x53\x5d\x2f\x84\x5e\xd7\xc0\
-\x7e\xd3\xfe\x83\xa3\x19\x50\x86\xa2\x04\x59\xbd\x51\x14\xd7\x76\
-\xa2\xbb\xcc\x9f\xcc\x11\x00\x5b\xde\xd4\xde\xf0\x3b\xa5\xda\x0e\
-\xc0\xbf\xdb\x36\x42\x66\xd7\x28\x99\x17\x52\xd2\x82\xab\x8a\xf2\
-\xcc\xf4\x21\xfa\x15\xa3\x05\x64\xf9\x20\x63\xb1\xb4\x3d\xa0\xdc\
-\xb8\x62\xfb\x82\xef\x25\xfe\xfb\xda\xcb\x3a\x36\xea\x6f\xc2\xe5\
-\x85\x37\xfc\x43\x5f\x01\x63\x38\xbf\x30\x17\x70\x98\x53\x23\x2b\
-\xca\x3f\x38\xf7\xdb\x03\xc7\xcb\x8c\xaa\x6b\x75\x45\xae\xc6\xdd\
-\xea\x02\x5c\xc5\xc3\x3d\xc2\x92\x25\x5b\xb4\x78\xf7\xdd\xad\x66\
-\xcf\xb1\xab\x79\x7f\xe8\x34\xf3\x32\xa7\xe0\x89\x56\xd7\xab\xa4\
-\x6e\xc6\x6f\xcc\x61\x03\xc4\x4e\x89\x0b\xb0\xe5\x34\x1f\xac\x98\
-\xf8\xef\xab\x55\xd6\x2e\x8b\x4f\xa0\x90\x5b\xd0\xb5\xc0\xf3\xe0\
-\x3d\xc2\x6b\xbd\x47\xeb\xc4\x7f\xdf\xd8\xde\xf1\xbf\xdb\xee\xc0\
-\x85\xd5\x57\x67\xde\xce\x0b\x7c\x65\xc4\x32\x06\x40\x2c\xa0\x5d\
-\xe2\xbf\xbf\x92\x9c\x5c\x30\xf7\xd3\x5d\x3b\xc8\xdc\xda\x5d\x1d\
-\xf1\x3f\x9a\xea\x00\x3c\x91\xad\x33\x64\x76\x35\x77\xb5\xd3\xcc\
-\xbb\x07\x82\xab\x58\x5d\x99\x92\x3a\x19\xa1\x46\x76\xa3\x31\xdc\
-\xd9\x19\xd6\x21\xa2\x4e\x12\xbe\xf1\x52\xc6\xf3\x3e\x78\xe3\x85\
-\x87\x7c\xe4\xd5\xa4\x78\xdb\x93\xeb\xcf\x67\xbd\xd6\x18\xee\x9c\
-\xbe\xfb\x7a\xc4\x09\x60\xae\x28\xc9\xeb\x40\x1b\x72\x72\x25\x09\
-\x3f\xbf\xe2\xc2\x2e\x98\xfb\xe5\xae\xab\x64\x6e\xbd\x66\x75\x45\
-\xae\x4e\x75\x00\x1e\xe3\x31\x23\x02\xe6\x1f\x54\xd7\x0a\x32\xa7\
-\x05\xc9\x0c\xbe\x64\x75\xbd\x4a\x2a\x73\x87\xbb\xdc\x07\xbd\x8e\
-\x31\xca\x38\x0e\x40\x63\x52\xe0\xbc\x65\x8e\xf4\x8e\x7d\x7a\x27\
-\xd8\x22\xf6\x0e\x39\x51\x0f\xc2\x3d\xef\xff\x1c\x75\x12\xc4\x5b\
-\xe2\x96\x90\xbb\xf9\x9c\x14\xb5\xba\x4a\xc5\x5a\x17\x82\x64\x76\
-\x35\xef\xe2\xda\x7a\x4d\x1d\xf1\x3f\x19\x75\x0d\xc0\x33\xd9\x6a\
-\x1e\xfc\x74\x19\x2e\xf3\xc2\x2e\xab\x2b\x52\x52\x19\xe7\xec\x77\
-\x59\xc8\x40\x80\xd5\xc5\x24\x9e\x6b\xf6\xdb\xbd\xc3\x1a\xc1\xd6\
-\x5d\x07\x7a\x9f\xda\x09\x7a\x01\xfd\x13\x63\x3b\x88\xfa\x54\xa6\
-\x84\xd5\xd5\x29\xd6\x88\xfd\x59\xe6\x34\xf3\xaa\xfe\xce\xe6\x32\
-\xf0\xce\xfd\xb2\xf2\xa4\xd4\x08\xc0\x13\x7a\xf4\x88\xc0\xb6\x8e\
-\xf2\xa7\x6e\xe6\x59\xc8\x29\x23\x65\xe6\xcb\x6d\x75\xbd\x8a\x92\
-\x12\x6c\x8d\xde\xb7\xf6\x64\x06\xb8\x3c\xe3\xfa\xd7\x21\x57\x40\
-\xbb\xad\x4d\x16\x8d\x01\x1f\xbc\x71\x58\x5d\x9d\x92\xb4\x62\xcc\
-\xfd\xea\xd0\x2f\x65\x8e\x1a\x20\xd3\x76\x45\x1d\xf1\x3f\x1b\x35\
-\x02\xf0\x42\x6c\x31\x6f\x17\xec\x6c\x9e\x8d\xfd\xad\xb6\xcc\x58\
-\x75\x7d\xb2\xa2\x3c\x83\x3b\xbf\xdd\xcd\x19\x11\x03\xeb\xd8\xf9\
-\xe1\xd1\x16\xe0\x78\xe0\xe8\xad\x03\xf8\xe2\x83\x97\xd5\xd5\x29\
-\x49\xcb\x66\x4e\xd8\xf6\xa5\x79\x99\xeb\x08\xf3\x6a\x7e\xd5\xf0\
-\x3f\x2f\xd5\x01\x78\x46\x8f\x9e\x47\x60\x87\x39\x7f\x40\xbf\x4f\
-\x64\x7e\x69\xde\x86\x12\x93\x04\xd7\x67\x2b\xa9\x8a\x86\x86\x06\
-\x14\xa5\x00\x29\x68\xbc\x49\xaf\xa1\x2f\x34\xaa\xc1\xb2\x0f\x36\
-\xf6\xdd\xaf\xc3\xd1\x2d\x67\x97\x5f\xf9\x06\x44\x4e\x11\x21\x36\
-\x02\x86\xb9\x1a\xa2\x92\x0a\x38\xf7\x9b\x9f\x9b\x07\x58\xa3\x7b\
-\xcb\xd4\x83\x54\xc3\xff\x62\xa8\x0e\xc0\x0b\xf2\xd0\xa2\x43\x0d\
-\x65\x8e\x30\x47\x04\xbe\x5c\x27\x33\xfe\x84\xd5\x75\x2a\x29\xc4\
-\x26\xf6\x70\x14\x6c\x97\xec\xd3\x1d\x3d\xac\x2e\xe6\xc5\x39\xfd\
-\xe6\xa5\xa5\x37\xfc\x61\xfe\xf5\xb5\x79\x77\xdf\x86\x78\x2f\x9b\
-\xb7\x3d\x0e\xc4\x9f\x62\x04\x6f\x5b\x5d\x9d\x92\x34\x9c\xfb\x49\
-\xe7\x7e\xd3\xb9\x1f\xb5\x35\x54\x0d\xff\x8b\xa5\x3a\x00\x2f\xd8\
-\x43\x8b\x0e\x99\x93\xa3\x8e\x49\x27\xf3\xf3\x7e\x32\x63\xd4\x45\
-\x83\xca\x73\x31\xca\x1a\x6d\x8d\x0f\xe1\x5e\xdf\xfb\x35\xa2\xd2\
-\x01\x2d\x18\x28\xef\x8b\x4f\x9e\x62\xab\xc4\xfd\x66\xcb\x0e\x33\
-\xb5\x65\x6e\x5b\xbf\x85\x2b\x7d\x6f\x04\x87\x76\x04\xed\x6d\x51\
-\x59\xc4\x00\x76\xec\xea\x9c\x7f\x4a\xe7\xdc\x2f\x3a\xf7\x93\xce\
-\xfd\xa6\xbe\x51\x35\xfc\x89\x43\x75\x00\x12\x49\xc2\x3f\xd8\x78\
-\x73\xd0\x72\xc4\x3c\x99\x43\xaf\xcb\x8c\x98\x24\x53\x9f\x64\x75\
-\xbd\x4a\x32\x73\x91\x6b\xdc\x01\xbd\xb9\xbe\x47\x6f\x0c\xec\xe2\
-\x08\xe7\xad\x2e\xea\xe9\x19\x4b\x8d\x07\xe4\x80\xd5\x03\xb6\x6f\
-\x3a\x34\x0e\x36\xfc\xb9\x2b\xef\xb1\xc5\x20\xfe\x10\x23\x78\x0f\
-\x78\x40\x14\xb1\x56\x57\xa9\x24\xae\xd5\xe6\xa9\xd2\x2e\xbf\xc8\
-\x1c\x95\x43\x66\xbc\xa1\x1a\xfe\xc4\xa5\x3a\x00\x89\x2c\xe1\x1f\
-\xb0\x91\x51\xe6\x0f\xe6\xdd\x02\x95\x6a\xca\x5c\x31\xd4\xea\x3a\
-\x95\x64\xc6\x79\x0d\x40\x19\x8a\x90\x07\x70\x37\x97\x09\x4e\x66\
-\x8e\x87\x9e\x1b\x7d\xd5\x0b\x26\x0d\x99\x5b\x60\xfd\x16\xb8\x3f\
-\x25\x6a\x6d\x4c\x16\x10\xa5\x05\x62\x8f\xd5\xd5\x29\x89\x6b\xd9\
-\x2d\x99\xce\xbb\xa8\xe6\xfe\x2e\xf7\x97\xf6\x19\xaa\xe1\x4f\x1a\
-\xc9\x70\x97\x91\x3c\x25\xbc\x68\x30\x76\xb7\x7c\xf4\x74\x21\x99\
-\xbd\xcc\x9e\xef\xd2\xb9\x32\x1f\x5c\xb7\xba\x5e\x45\x49\x4c\x37\
-\x86\xdf\xb9\x71\xaf\x05\xfc\x3c\x60\x66\xf7\x55\x7f\xc2\xa5\x15\
-\x37\x16\x84\xe4\x01\xad\x9a\xf0\x14\x27\x51\x43\xfe\x29\xd2\x65\
-\x73\x6d\x95\x3e\xe6\x55\xfd\x6f\x16\x97\x79\x73\x96\x6a\xf0\xad\
-\xa1\x3a\x00\x16\x49\xf8\x07\x7f\xf3\x25\x99\x1d\x32\xc9\x6c\x6b\
-\x2e\x70\x7a\x55\x3c\xed\xeb\x2a\x8a\x2b\x8b\xbe\x1a\xfb\x4e\x7c\
-\x0b\x98\xd6\x7d\x51\xef\x4d\xe7\x61\xc7\xe5\x43\xd1\x67\x0e\x80\
-\x38\xcc\x72\xf1\x23\x90\x06\x1f\x3c\x41\x5d\xe9\x9f\x92\x5c\x2d\
-\x25\xb3\xa7\xb9\x7f\xfb\xc5\xbc\xaa\xff\x7a\x98\x6a\xf8\xad\xa5\
-\x26\x02\xb2\x58\xc2\x2f\xc0\x83\xba\x72\x82\x21\x73\x2a\x6b\x7a\
-\x98\xf3\x08\x8c\xcd\x2b\x33\xa8\x91\x4c\xef\x09\x56\xd7\xad\x58\
-\xcc\x79\x0a\xa0\x04\x45\x08\x06\x0e\x70\x94\x0b\x56\x17\xf5\x78\
-\x8e\x97\x1c\xa7\xf4\x2f\x61\x7e\xec\xea\x8f\x77\xed\x85\xa5\x01\
-\x1b\x4e\xef\xcb\x01\x7a\x35\xfd\xae\xf1\x2e\x88\x99\x62\x24\x6f\
-\x23\x1b\x7e\x75\xe4\x9f\xcc\xc5\x4d\x95\x39\xce\x3c\xd5\x39\xab\
-\xba\xcc\xfd\x47\x54\x83\xef\x5a\xd4\x08\x80\x4b\x5b\x9f\x46\x66\
-\x15\x73\xea\x93\x6f\x3b\xcb\x74\x8c\xb3\xba\x32\xc5\x62\xa7\x38\
-\xc7\x65\x70\x1c\x74\xa4\xd3\x47\x81\xb1\x81\x2d\xec\xb7\xba\xa8\
-\x7f\x32\xe6\x19\x21\x14\x80\x55\xab\xb7\xe6\x3f\xb4\x08\x26\xcf\
-\x5c\x50\x7a\x43\x41\x78\x50\x34\x3a\x28\x36\x07\x88\x19\x62\x04\
-\x03\x00\x3b\x0e\xd5\xf0\x27\x77\x8e\x4e\x32\xbf\x79\x45\xe6\x27\
-\x17\x65\xee\x9f\xa8\x1a\x7e\xd7\xa4\x3a\x00\x2e\x26\xe1\xb5\x02\
-\x7a\x8c\x7c\x34\xfc\xb4\xcc\x6f\x22\x64\x0e\xfb\x51\xe6\xd5\x92\
-\x32\x8d\xaf\xad\xae\x5b\x49\x5a\x46\xa8\x91\xc9\xa8\x0b\x77\xf6\
-\x84\x65\x0c\x5f\x05\x46\x19\x7d\xb0\xbe\xd9\xea\xaa\xfe\x9f\xf1\
-\xcc\x64\x23\x6c\x8d\xd8\xbf\xff\x64\x05\x18\x5f\x60\x66\xfb\x95\
-\xbb\x21\x6c\x5f\x78\x74\x64\x65\xd0\x56\x69\x6f\x8b\x42\x80\x8e\
-\x8e\x9a\x2f\x33\x99\x5b\xfb\xa7\xcc\xc6\xe6\x22\x69\x23\x83\x65\
-\xc6\xc7\xaa\x86\xdf\xb5\xa9\x73\xcc\xc9\x84\x3c\x35\xe0\xfc\xc9\
-\xed\xa4\xcc\xdc\xe6\xb5\x03\x93\xfa\xca\xac\x5b\xce\x7c\x82\x73\
-\x99\x94\xf4\x56\xd7\xad\xbc\x20\xce\x6f\xaa\x03\x1d\x03\xf4\x8e\
-\xfa\x6f\xc6\x55\x68\x9d\xbb\x81\x6f\xa5\x5d\x30\x64\x5c\xdf\xe5\
-\x6d\x05\x68\x3b\xb5\xd7\xc4\x65\xab\x8b\x85\xc3\x3d\x4e\xfb\x5f\
-\x2e\x0a\x5f\xde\x1d\x1f\x3e\xf7\x02\x9c\xe1\xd2\xad\x1b\x43\xc0\
-\xed\x9c\xdb\x5b\x5a\x28\xf2\x14\x86\xda\xfb\x24\x53\x37\xcc\x11\
-\xc8\x99\xe6\x81\xc9\x4f\xb3\x65\x5e\x0a\x55\x0d\x7e\xf2\xa2\xbe\
-\x82\xc9\x54\xc2\x0e\x41\xa0\x79\xf6\xb7\xde\x59\x99\x83\xba\xc8\
-\x2c\x62\xde\x66\xe8\x3d\xdb\xea\x7a\x95\xe7\x24\xe4\xff\xf4\x0f\
-\x8c\x55\x46\x34\xe4\xc8\x9a\x65\x4b\x86\xac\xf0\x65\x44\xff\xce\
-\xed\x9a\x41\xa5\x56\x25\x4f\x15\x28\xf7\xdc\xef\xf2\xec\x8e\x73\
-\x89\x1b\x70\x6c\xdb\xd9\x3b\x57\x3b\xc2\xf0\x97\x7f\x1b\xba\xe0\
-\x55\x38\xf6\xf6\x99\x56\x57\x6a\x81\x38\x24\xe6\x88\x9f\x91\x73\
-\xf9\x7b\x5a\xbd\x31\x95\xa7\x13\x6b\x5e\xb5\x7f\x6a\x83\xcc\x2f\
-\xf2\xc8\x5c\xbc\x5f\x35\xf8\xc9\x9b\x3a\x05\x90\x4c\x25\xfc\xe2\
-\xdd\x30\x87\xdc\x66\x5c\x95\x59\xcd\x9c\x42\x73\xdc\x6d\x99\xb6\
-\x66\xe6\x13\xd3\x5a\x5d\xb7\xf2\x94\xd2\xe0\x8b\x37\xe8\x9d\xf4\
-\xa9\xc6\x0d\xc8\xb0\x3a\xad\xb7\xdf\x56\x78\xb3\xea\xab\xde\x0d\
-\x4f\x40\xf9\xce\xc5\x46\xe7\x1b\x6b\x75\x91\x70\xea\xb3\x0b\xd9\
-\xae\x6f\x86\xe1\xdb\x7e\x4d\xb7\xc0\x06\x47\x3b\x9d\x7e\xeb\xca\
-\x08\x60\xae\x18\x29\x3e\x37\x3f\x87\x5a\xc4\x27\x99\xd9\xb5\x49\
-\xe6\x3b\xe6\x01\x44\x8d\x78\x99\x4b\xde\xb2\xba\x32\xe5\xc5\x50\
-\x23\x00\x29\x4c\xc2\x91\x01\xbf\xd5\x32\x4b\x8d\x96\xf9\xde\x64\
-\x99\xd5\x7c\x64\x66\xce\x60\x75\xbd\xca\x63\x98\x57\xf9\x1b\x75\
-\x8d\x2e\xc6\x10\xf0\x71\xf3\x9e\xe9\x95\x13\xde\xb8\xfb\xca\x5b\
-\xf5\xa2\xa1\xdb\x96\x56\xd5\x6b\x6f\x00\xf7\x33\xee\xee\x6e\xd5\
-\xac\x2b\xf3\x5a\xb6\x5b\xc3\xc3\xb6\xc2\xb0\xd9\xbf\xfa\x2e\x38\
-\x0b\xdb\x0a\x1e\x58\x74\xea\x3e\x68\x35\x84\x97\xb8\x00\xf8\xe1\
-\x6b\xde\xd6\xa7\x6e\xec\x73\x79\x21\x77\x65\xee\x2c\x22\xf3\x3d\
-\x73\x4f\x72\xf6\x03\x75\xa4\x9f\x32\xa9\x11\x80\x14\xe6\xa1\xdb\
-\x0a\xcd\xdb\x06\xb7\x9b\x13\x70\xb4\x36\xa7\x1c\xee\xf3\x95\xcc\
-\x3b\xad\x65\xea\xfe\x56\xd7\xad\x24\x64\x2c\x63\x13\xfb\x41\x5c\
-\x15\x6b\xc5\x48\x78\xa9\x55\xed\x3a\xe5\xd2\x40\x87\xd1\x2f\xb9\
-\x55\x9f\x65\x7d\xc3\x7f\x75\xde\xad\x22\x61\x9f\xc2\xb7\xd7\x27\
-\x4d\x5b\x94\x1b\x76\xdc\x3b\x98\xef\x74\x51\x10\x11\x62\xa7\x98\
-\x83\x6c\xf8\xbd\x50\x0d\xbf\x4b\x73\x7e\xef\x9d\xfb\x01\xe7\x7e\
-\xa1\x65\x1f\x99\x67\x97\x5a\x5d\xa1\x92\xb8\xd4\x08\x40\x2a\xf1\
-\xd0\x45\x84\xe6\xba\x6a\x41\x0d\x64\x0e\x30\x2f\x16\xec\x77\x49\
-\xa6\xd6\xc1\xea\x7a\x53\x2d\x4f\x3c\x70\x07\xfd\xaa\x5e\xd9\xf8\
-\x09\xca\x6d\x28\x3e\x3f\x78\x3c\x0c\xef\x3d\xb0\x64\x87\xcf\x21\
-\x70\x6b\x96\x09\xe9\x2d\xbc\xc8\x2f\x7a\x69\x6c\xaf\xf8\x97\x61\
-\xc8\x9f\xe3\x2e\xcd\xae\x0a\xab\x67\x6c\x3f\x71\x78\x07\x10\x89\
-\x81\x03\x44\x3d\x2a\x51\x1c\x79\xb1\xa2\xba\xba\xdf\x45\x9d\x36\
-\xff\x82\x16\xcd\x94\x39\x69\x86\xcc\x8b\xe6\xfe\xc0\xf1\xa3\x3a\
-\xe2\x4f\x1d\x54\x07\x20\x95\x7a\xe8\x54\x81\x79\xd1\x60\xdb\xc5\
-\x32\x7b\x99\x33\x75\x95\x35\x57\xe5\xf2\x3c\x6d\x75\xbd\x29\x9e\
-\x79\x3b\x9c\x3e\x48\x5f\x60\x44\x41\xce\xf9\xd9\xde\xca\x38\x0f\
-\x86\x16\x1b\xb0\xb4\x7d\x79\xa8\x30\xa2\xf8\xad\x7c\xab\xad\x2e\
-\x12\xae\x7c\x7c\xb3\x4d\xe8\x5a\x78\xab\xe2\x97\x62\xe2\x75\xb8\
-\x6c\xdc\xb8\x1c\x52\x10\xdc\xbe\xd2\x72\x69\x8b\x50\x0d\xbf\x4b\
-\x8a\x37\xa7\x1c\x3f\x68\x4e\xcc\xd3\xcd\x3c\xa7\x7f\x72\xa6\xf3\
-\x19\xaa\xc1\x4f\x9d\xd4\x4c\x80\xa9\xd4\x43\xa7\x0a\xa6\xcb\x0e\
-\x81\x39\x81\x17\x4b\xcd\x09\x3d\x9a\x9a\x43\x81\xdd\xcd\x65\x8d\
-\x6b\x74\x93\xa9\x5d\xb2\xba\xfe\x14\x43\x43\x20\xc0\xe8\x63\x7c\
-\xc5\x14\xf0\x1d\xec\xe3\xe3\x39\x11\xba\x6d\x6b\xfd\x53\x9d\x1b\
-\x50\xfe\x93\x62\x95\x83\x5d\x68\xad\x48\x7d\xa5\x1e\x64\x8c\x00\
-\x4a\x70\x91\x4e\x20\x3a\xd2\x90\x4a\x40\x09\x8e\xb3\xc0\xea\xea\
-\x14\x49\x0f\x92\xb9\xd5\xfc\x42\x4f\xe9\x28\x73\x45\x2f\x99\xa1\
-\xb7\x55\x83\xaf\x80\xea\x00\x28\xa6\x84\x3b\x84\xd0\xdb\xb2\x43\
-\xf0\xfb\x10\xf9\xf3\x12\xf3\xae\x82\x97\x6b\xc8\xec\x6f\x8e\x18\
-\x14\xff\x56\xa6\x4f\x76\xab\xeb\x4f\xb6\xee\x11\x49\x14\x70\x8b\
-\xdb\xc6\x1d\xa8\xf2\x4e\xe9\x6f\x0a\xb5\x81\x46\x4b\xab\x8f\x2c\
-\xd5\x1a\xc4\x7c\x71\x56\x64\xb5\xba\xc8\xff\x27\x0f\x81\x64\x02\
-\x02\x08\x41\x5e\x4a\xaa\xce\xf1\x5b\xc6\x7e\x4a\x66\x88\x79\xee\
-\xfe\x27\x73\xc4\xee\xbc\x79\x71\xef\x2a\x73\x2c\x26\x7c\x88\x6a\
-\xf0\x95\x47\x51\x17\x01\x2a\x8f\x94\x70\x87\x11\x5e\x5f\xe6\x1f\
-\xe6\xcc\x83\x8d\xf6\xc9\xec\xdb\x5c\xe6\xa6\x40\xf3\x89\x8d\xad\
-\xae\x3b\xd9\x10\xf2\xc8\x5f\xbf\xab\xd7\x31\xa6\x42\x8e\xd3\x59\
-\x67\x64\xb8\x0b\xdd\x1c\xad\xbf\xae\x73\x06\xd2\xbe\xef\x77\xd6\
-\xb7\x9b\xd5\x45\x2a\xae\xe9\xac\xb9\x58\xc8\x18\xb3\x03\x50\xd9\
-\x1c\x7b\x19\x31\x45\xe6\xac\x83\xf2\xfb\x1b\x5e\x5f\x35\xfc\xca\
-\xbf\x51\x23\x00\xca\xbf\x7a\x68\x07\x32\x58\xc6\x3d\x1e\x3a\x65\
-\x70\x44\x66\x83\xc2\x32\xdf\xfd\x40\x66\x36\xf3\x08\x24\x5b\x41\
-\x99\x6e\x3d\xad\xfe\x3c\xae\xc2\xd8\xc9\x21\xce\x80\x47\x09\xf7\
-\xaf\xdd\x7a\x42\x9b\x32\x0d\xb7\x56\xf6\x81\xe2\xa5\x0b\x84\xe5\
-\x9a\x6f\x75\x75\xff\xe2\x43\x7a\xd0\x12\xc8\xc7\x44\x0a\x80\x61\
-\x27\x14\x07\x50\xc6\xea\xc2\x52\x22\xc7\x44\x99\x37\xd7\xca\x9c\
-\x68\xde\xf7\xb1\xc0\xfc\x46\x1e\xbb\xfa\xd0\xf7\xd3\x85\x4e\x16\
-\x29\xc9\x81\x1a\x01\x50\x9e\xc9\x43\xa7\x0c\xcc\x91\x81\x59\xe6\
-\x48\x40\xbd\x79\x32\xab\xb4\x93\x39\xea\xa6\xcc\x0b\x2e\xb8\x5c\
-\x4d\x12\xf3\xc0\x1d\x77\x30\x56\x1b\x21\x46\x3e\xc8\xbf\x27\x4f\
-\xce\xec\x4b\xa1\xd9\x8c\x5a\x0b\xca\x86\x80\x5b\x03\x6d\xb9\x56\
-\xdc\xea\x22\x1f\x2f\xf6\x93\xb8\x1b\xf1\xad\xc1\x51\xc0\xb1\x5b\
-\xef\x0f\xa2\x0e\x15\x85\x0b\xd7\x9b\x3c\x39\xbf\x27\xce\xef\x4d\
-\xd5\x96\x32\x87\x9b\x8b\xec\xfc\xa3\xe1\x57\x94\x67\xa2\xee\x02\
-\x50\x12\x55\xc2\xbb\x0d\x8a\x99\x33\x13\xb6\x33\x27\x1a\x69\x7f\
-\x42\x66\x7a\x73\x64\x21\xcb\x74\xab\xeb\x4d\x6c\xc6\x30\xe3\x17\
-\x16\x80\x7b\x01\xf7\xd1\xda\x06\x18\xf8\x5d\xe7\xd8\x66\x77\xa0\
-\xf3\xe1\x16\x37\x6a\xad\x07\xf6\x33\x9f\x8f\xac\xae\xf2\xf1\xf6\
-\x05\x1c\x9b\x7b\xfe\x14\x0c\xfe\xe4\xfb\x80\x19\x2b\x20\x24\xd3\
-\xdd\xba\xf7\x4f\x80\x36\x56\x6b\x2b\xd2\x59\x5d\x5d\x72\x73\xc7\
-\xbc\x96\xe6\xde\x08\x99\xb3\x8b\xca\x9c\x63\xae\xf5\x71\x3c\xab\
-\x6a\xe8\x95\xc4\xa4\x46\x00\x94\x44\x95\x70\x07\x76\xdc\xbc\x9c\
-\xed\xab\x65\x32\xcb\x98\xb7\x25\xbd\x36\x48\xe6\x0c\x73\x71\xa3\
-\x38\xf3\x36\x44\xdd\x9c\x83\x9c\x70\xab\x3f\xc7\x73\xd3\xe5\x94\
-\x38\x7a\x3a\xa3\x9b\xbe\x10\x0a\xb5\x0c\x6a\x15\xb8\x11\xea\x75\
-\xad\xb2\xa2\x44\x41\x5c\xbe\xe1\xff\xdb\x4b\xd4\x12\x65\x81\x60\
-\x72\x92\xf5\x7f\x9f\x4b\x79\x14\xa3\xab\x99\x2b\x65\x6e\xdd\x26\
-\x73\x94\x79\xd1\x5e\xc7\x50\x99\xce\xef\x81\xf3\x7b\xa1\x1a\x7e\
-\x25\x69\xa8\x6b\x00\x94\x24\x91\x70\x87\x66\xaf\x6a\xa6\x39\x42\
-\xb0\xc1\xfc\x97\xdd\xe6\xdf\xe3\x4f\xe6\x6d\x87\xf9\xcd\x65\x46\
-\x07\xdc\x90\x99\xde\x6c\x22\xf3\xd7\x31\x5f\xa8\x9d\xd5\x9f\xeb\
-\x89\x85\x71\x8f\x48\xf0\x68\xe2\x36\xdf\xed\x26\x34\x8c\xab\x76\
-\xa0\x54\x04\xe4\x28\x95\x65\x5f\x86\x74\x56\x17\xa7\xbc\x20\x66\
-\xc7\xf5\xa2\x43\xe6\xdc\x59\x32\x17\x0f\x95\x79\xd5\xbc\xbd\xf6\
-\xea\x96\x87\x1a\xf8\x15\x66\xaa\x26\x5f\x49\x52\xaa\x03\xa0\x58\
-\x2a\xe1\x8e\x30\xca\x2e\x3b\x04\xbb\xec\xf2\xe7\xdd\x91\x32\x67\
-\xe5\x96\x99\xcf\xbc\xea\xb0\x9d\x79\x8e\xb4\xb0\x79\xb1\xe1\x2b\
-\xe6\x91\x95\x67\x57\xf3\x85\xd6\x5a\xfd\xb9\x1e\x66\xfc\x69\x2c\
-\x67\x0b\xf8\x8f\xf7\x8b\xf3\xa9\x05\x15\x33\x94\x9c\x94\xff\x65\
-\x20\x2d\x8d\xac\xae\x4d\x79\x5a\x76\x73\xc4\x4a\x5f\x28\x73\x9e\
-\xb9\xb6\xc6\x29\x73\x6a\xdd\x39\xe6\xdf\xef\x99\x9f\x65\x1a\x79\
-\xd4\x11\xbd\xe2\x8a\x54\x07\x40\x71\x29\x09\x77\x94\x46\x67\x99\
-\xe6\xfe\x94\xd3\xe6\x88\xc1\x57\x7b\xe5\xcf\x01\x73\x65\xfe\xf6\
-\x8e\xcc\xc1\xe6\x91\x57\x5a\x6f\x99\x59\x23\x64\xe6\xb7\x6e\x1d\
-\x3a\xf3\x76\x3f\xa3\x93\x31\xd5\xb8\x03\xc5\xef\x17\x28\x94\x2b\
-\x27\xe4\x6c\x92\xb5\x6f\xc6\x09\xe6\x73\x46\x5a\x56\x9d\xf2\x44\
-\xce\xc5\xc9\xbc\xfd\x85\xcc\xe9\xe6\x54\xba\x7b\x82\x64\x5e\xca\
-\x24\x33\x62\xfe\x43\x0d\x7d\x0f\xab\x2b\x57\x94\x7f\xa3\x3a\x00\
-\x4a\xb2\xe2\xdc\xc1\xca\x8e\xc0\xfd\xb6\xf2\xd1\xcd\xe6\xd5\xd1\
-\xdb\xf2\xca\xd4\xcd\x53\x06\xa5\xcc\x89\x8b\x1a\x9a\x3f\x1b\xe6\
-\xc5\x55\x5d\x73\xca\xcc\xeb\x3c\x85\xf0\xb5\x0c\x1f\x73\x39\x65\
-\xca\xbf\xb0\x82\x8f\x73\x96\xab\x40\x9c\x10\x7c\x07\x65\xda\x16\
-\xbd\x9d\x37\x3d\xa4\x9d\xed\x3f\xcc\x37\x39\x36\xfc\x3d\x44\x5b\
-\xea\x03\x39\x58\x4f\x1e\x60\x13\xb6\x64\x38\xf5\xaf\x39\x8f\x45\
-\x4c\x2e\xf3\xe7\x4f\x65\x5c\x34\x87\xf0\xa7\x5d\x93\x29\xcc\x8b\
-\x55\xd7\x98\x77\xb7\x1c\x36\x17\xd5\xc2\x9c\x5a\xd7\xd8\xac\x8e\
-\xec\x95\xe4\x4c\x75\x00\x94\x64\xe9\xa1\x1d\xaf\x79\xdb\xa1\xe3\
-\xa1\x67\x1d\xfa\x3b\xcd\xbb\x11\xcc\x8b\xaf\xe6\x44\xcb\xf4\x36\
-\x87\x16\x82\xff\x92\x39\xc0\xbc\x28\x4b\x98\x8b\x23\x15\x35\xef\
-\x5a\xc8\x55\xf5\x59\xeb\xd4\xe7\x19\xd7\x8c\x5c\x90\xc9\x2d\x9d\
-\xbf\xff\x6a\x28\x3e\xa5\x40\xa9\xdc\xe6\xf4\x2d\xc9\xf1\x8c\xaf\
-\xad\x87\xad\x82\xbd\x18\xe8\x25\xf4\x63\x46\x3d\x60\xb0\x78\x09\
-\x79\x22\xa6\x3c\xd1\x56\x57\xf7\x38\x57\x77\xc8\x3c\x61\x5e\x84\
-\x6a\x2c\x92\x39\xd6\x3c\x72\xbf\x60\xfe\x1d\xc4\x9a\x9f\xe0\xf2\
-\x57\xe6\xdf\xd7\x75\xf3\x05\xae\x3f\xf4\x82\x27\xac\xfe\x44\x8a\
-\xf2\x22\xa8\xdb\x00\x95\x54\x29\xe1\xed\x89\x54\x36\x73\x83\x99\
-\xbe\x32\x6a\x98\x33\x20\x96\x30\x8f\x71\x7d\xcd\xf3\xf5\xfd\x6a\
-\xc9\x4c\xfb\x86\x4c\xc3\x3c\x07\xec\x66\x8e\x20\x04\x78\x9a\xaf\
-\x73\xd9\xd1\x4b\x3f\xa8\xd7\x81\x02\x13\x72\x1f\xcb\x3e\x16\xc6\
-\x7d\xf6\x59\xc5\x1e\x27\x21\x67\xbb\xac\x27\x33\x5c\xb1\x7a\x2b\
-\x3c\xbd\x65\x6c\x8a\xdd\x1f\x0b\x5f\x67\xfb\xe5\xf8\xfc\x5e\x10\
-\x5d\x31\x76\x7b\xdc\x17\x20\x2e\x8b\x0d\xe2\xe7\xc4\x7e\xf7\x98\
-\x9a\x66\x6e\x96\x29\x7a\x9b\xb9\x53\x66\x84\x39\x11\xce\x78\xf3\
-\xdf\xa3\xcd\xe5\x93\x8e\x9a\x77\x3b\x6d\x35\xa7\xb4\xfe\xbb\xab\
-\x52\xd7\xcc\x5d\xea\x48\x5e\x49\x8d\xd4\x08\x80\x92\x2a\x3d\xb4\
-\xc3\xdf\x65\xa6\x6f\xc2\x67\x6d\x5d\x27\x3b\x0a\x5b\xcd\x9f\x35\
-\x73\xd9\xd4\x59\x66\x03\xef\x5e\x51\xa6\xfe\xb2\xcc\xac\xb5\x65\
-\x0e\x8a\x91\xe9\x5d\xda\xa8\x64\xb4\xe7\x63\xe3\xa0\xef\x38\x9f\
-\xde\x9e\x9b\x8d\xf7\xb3\x14\xcc\xf0\x67\x40\x74\x49\xf3\x08\xb2\
-\xc0\x0a\x92\x19\x3d\x40\xff\x48\xbf\x01\xfa\x72\xa3\xb2\xe1\x0f\
-\x4c\x27\x13\xe9\x80\x17\xb2\x44\xf1\xd9\xa6\x32\x8f\x98\xf7\xc3\
-\x0b\xf3\x24\x89\x9b\xf9\x5f\x6a\xa1\x39\xd3\xe4\x7a\xf3\xe2\x50\
-\x77\xe7\xc4\x52\xe6\x7f\x07\x7b\x7e\x99\x37\xcc\x8b\x46\xf5\x0f\
-\x1e\xd3\xb0\xfb\xa2\x28\x8a\xea\x00\x28\xca\xbf\x49\xd8\x80\xe8\
-\xe6\xb9\xe0\x6b\x0f\x3f\xcd\x9c\x83\xdd\x79\x48\xdf\xe1\x7f\xff\
-\x52\x01\x00\xed\xb8\xb1\xd4\x30\xd2\x99\x8f\xa5\xab\xd4\x5a\xfe\
-\x9f\x32\xe6\x11\xa9\x6e\x2e\xc3\xac\xd7\x93\xd9\xc3\xbc\x9a\xbc\
-\x72\x3d\xab\x3f\xff\x3f\x14\x26\x1f\xb9\x80\x0c\xa4\xc5\x1f\x30\
-\x08\xfb\xef\x79\x00\x22\xcc\x93\x1e\x5f\x9f\x31\x7f\x36\x8f\xc0\
-\xc5\x76\x99\x5a\x0b\x99\x07\xcd\x91\x94\xdd\xa3\xcc\xed\xfe\xb8\
-\x63\xf2\x89\x0f\xfd\x7c\xc0\xcc\x29\x56\x6f\x1e\x45\x49\x4e\xfe\
-\x0f\x3d\x9e\xba\xe2\x31\x67\x1f\x6d\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\x28\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\
-\x00\x01\x00\x20\x00\x00\x00\x00\x00\x00\x00\x01\x00\xe5\x4c\x00\
-\x00\xe5\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x06\x73\x4f\x2e\x20\x73\x4f\x2e\
-\x2f\x71\x4d\x2b\x63\x8c\x6e\x53\x6c\xf8\xf6\xf4\xa7\xff\xff\xff\
-\xc1\xff\xff\xff\xf0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfe\xfd\xff\xa5\x8e\x79\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xde\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xa7\x73\x4f\x2e\x6d\x73\x4f\x2e\x55\x73\x4f\x2e\x26\x73\x4f\x2e\
-\x21\x73\x4f\x2e\x06\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x05\x73\x4f\x2e\x1e\x73\x4f\x2e\
-\x48\x73\x4f\x2e\x7a\x73\x4f\x2e\xb1\x73\x4f\x2e\xdc\x73\x4f\x2e\
-\xe7\x72\x4e\x2d\xfb\x82\x62\x44\xfe\xe9\xe4\xdf\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfe\xfe\xff\xaa\x94\x80\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\xf6\x73\x4f\x2e\xe4\x73\x4f\x2e\
-\xdd\x73\x4f\x2e\xb1\x73\x4f\x2e\x7a\x73\x4f\x2e\x48\x73\x4f\x2e\
-\x1e\x73\x4f\x2e\x05\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x0b\x73\x4f\x2e\
-\x45\x73\x4f\x2e\x7b\x73\x4f\x2e\xb3\x73\x4f\x2e\xde\x73\x4f\x2e\
-\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x75\x52\x31\xff\xce\xc1\xb6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x9c\x89\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf6\x73\x4f\x2e\
-\xde\x73\x4f\x2e\xb3\x73\x4f\x2e\x77\x73\x4f\x2e\x34\x73\x4f\x2e\
-\x0b\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x0a\x73\x4f\x2e\x34\x73\x4f\x2e\x77\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xf2\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xa8\x91\x7c\xff\xfd\xfd\xfc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x9b\x89\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\xed\x73\x4f\x2e\
-\xbe\x73\x4f\x2e\x6a\x73\x4f\x2e\x22\x73\x4f\x2e\x05\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x16\x73\x4f\x2e\x5e\x73\x4f\x2e\
-\xae\x73\x4f\x2e\xee\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x81\x61\x43\xff\xe3\xdc\xd5\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x9c\x89\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xe1\x73\x4f\x2e\xa8\x73\x4f\x2e\
-\x5f\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x2a\x73\x4f\x2e\x79\x73\x4f\x2e\xca\x73\x4f\x2e\xfb\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\xad\x98\x85\
-\xff\xfc\xfc\xfb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb6\xa3\x92\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfb\x73\x4f\x2e\xcb\x73\x4f\x2e\x67\x73\x4f\x2e\x16\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x2a\x73\x4f\x2e\x89\x73\x4f\x2e\
-\xe2\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7c\x5b\x3c\
-\xff\xd7\xcc\xc3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb8\xa5\x95\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x69\x73\x4f\x2e\x25\x73\x4f\x2e\x03\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x27\x73\x4f\x2e\x8a\x73\x4f\x2e\xe2\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\x93\x78\x5e\xff\xef\xeb\xe7\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb8\xa6\x96\xff\x71\x4c\x2a\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\xe1\x73\x4f\x2e\x87\x73\x4f\x2e\x1a\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x09\x73\x4f\x2e\x5e\x73\x4f\x2e\
-\xd7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\xab\x96\x82\xff\xfa\xf8\xf7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdd\xd4\xcc\xff\x84\x65\x48\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\xcc\x73\x4f\x2e\
-\x5e\x73\x4f\x2e\x09\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x36\x73\x4f\x2e\xad\x73\x4f\x2e\xf4\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4e\x2d\xff\x77\x54\x33\xff\xbe\xae\x9e\xff\xfd\xfc\xfc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd4\xc9\xbf\
-\xff\x80\x60\x42\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xf5\x73\x4f\x2e\xa0\x73\x4f\x2e\x2b\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x19\x73\x4f\x2e\
-\x87\x73\x4f\x2e\xe5\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7d\x5b\x3d\xff\xdc\xd2\xca\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xcf\xc3\xb7\xff\x7e\x5d\x3e\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe3\x73\x4f\x2e\x72\x73\x4f\x2e\
-\x10\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x37\x73\x4f\x2e\xc6\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x76\x52\x32\xff\xd1\xc5\xba\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfe\xfe\xfd\xff\xc6\xb7\xaa\xff\x79\x57\x38\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\xb4\x73\x4f\x2e\x30\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x08\x73\x4f\x2e\x65\x73\x4f\x2e\xe5\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x77\x54\x34\xff\xd6\xcb\xc1\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfc\xfb\xfb\xff\xb8\xa6\x95\xff\x75\x51\x30\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xd8\x73\x4f\x2e\x5a\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x19\x73\x4f\x2e\
-\x98\x73\x4f\x2e\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x77\x54\x34\xff\xd6\xcb\xc1\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf4\xf1\xff\xa2\x8a\x74\
-\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xef\x73\x4f\x2e\x8a\x73\x4f\x2e\
-\x11\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\xc6\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2d\xff\x78\x55\x35\xff\xd6\xcc\xc2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe8\xe2\xdd\
-\xff\x89\x6a\x4f\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\xb6\x73\x4f\x2e\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x2f\x73\x4f\x2e\xcb\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x79\x57\x37\xff\xdc\xd3\xca\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc6\xb7\xaa\xff\x76\x53\x32\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x5a\x73\x4f\x2e\xd9\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x7a\x57\x38\xff\xdd\xd4\xcc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf5\xf2\xf0\xff\x95\x7a\x61\xff\x71\x4d\x2b\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\x2f\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x5e\x73\x4f\x2e\
-\xec\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x79\x57\x38\xff\xdd\xd4\xcc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xc5\xb6\xa9\xff\x74\x51\x30\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xda\x73\x4f\x2e\
-\x5a\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x5e\x73\x4f\x2e\xec\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7b\x59\x3a\xff\xe1\xd9\xd2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfc\xfc\xff\xfe\xfe\xfe\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xeb\xe6\xe1\xff\x84\x64\x47\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xec\x73\x4f\x2e\x5e\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x01\x73\x4f\x2e\x5e\x73\x4f\x2e\xec\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7c\x5b\x3c\xff\xe6\xe0\xda\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xec\xe7\xe2\xff\xf0\xec\xe8\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf9\xf7\xf5\xff\x97\x7c\x63\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xec\x73\x4f\x2e\x4e\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5a\x73\x4f\x2e\xec\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7c\x5b\x3c\xff\xe6\xe0\xda\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdd\xd5\xcd\xff\xcb\xbe\xb2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x84\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xce\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x30\x73\x4f\x2e\
-\xd8\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7d\x5b\x3d\xff\xe7\xe0\xdb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xda\xd1\xc8\xff\xba\xa8\x97\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xae\x9a\x87\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x82\x62\x44\xff\xeb\xe5\xe1\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xde\xd6\xce\xff\xc9\xbb\xaf\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xa8\x92\x7e\xff\x70\x4c\x2a\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xcb\x73\x4f\x2e\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x1a\x73\x4f\x2e\xc5\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x84\x64\x47\xff\xec\xe7\xe3\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf5\xf2\xf0\xff\xf2\xee\xeb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfa\xf9\xf8\xff\x9b\x81\x69\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xb5\x73\x4f\x2e\x11\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x09\x73\x4f\x2e\x97\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x84\x64\x47\xff\xec\xe7\xe3\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xec\xe7\xe2\xff\x84\x65\x48\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\x8a\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x65\x73\x4f\x2e\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x86\x67\x4a\xff\xee\xe9\xe5\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xcb\xbe\xb2\xff\x75\x52\x32\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xef\x73\x4f\x2e\x5b\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x38\x73\x4f\x2e\
-\xe5\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x8b\x6d\x51\xff\xf2\xee\xeb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf6\xf3\xf1\xff\x97\x7c\x64\xff\x71\x4d\x2b\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xd6\x73\x4f\x2e\
-\x28\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x19\x73\x4f\x2e\xc5\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x8b\x6d\x52\xff\xf2\xee\xeb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc7\xb8\xab\xff\x76\x53\x33\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xa4\x73\x4f\x2e\x10\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x88\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x8b\x6d\x52\xff\xf2\xee\xeb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe2\xda\xd3\
-\xff\x85\x65\x48\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\x73\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x37\x73\x4f\x2e\xe4\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\x8e\x71\x57\xff\xf4\xf2\xef\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xef\xeb\xe7\xff\x98\x7e\x65\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xe2\x73\x4f\x2e\x2c\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x08\x73\x4f\x2e\xad\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2b\xff\x90\x73\x59\xff\xf6\xf4\xf2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf3\xf0\xed\xff\xa1\x89\x72\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x9f\x73\x4f\x2e\x08\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5e\x73\x4f\x2e\xf5\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x78\x55\x35\xff\xb9\xa7\x97\xff\xfd\xfc\xfc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf0\xed\xe9\xff\xa4\x8d\x77\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf2\x73\x4f\x2e\x4b\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x27\x73\x4f\x2e\
-\xd6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\x80\x60\x42\xff\xc7\xb8\xab\xff\xfb\xfa\xf9\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xed\xe8\xe4\
-\xff\x9e\x85\x6e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xc7\x73\x4f\x2e\
-\x16\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x89\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x8a\x6c\x50\
-\xff\xd8\xce\xc4\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xf7\xf6\xff\xa0\x88\x72\
-\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\x68\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2b\x73\x4f\x2e\xe1\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x93\x77\x5d\xff\xe3\xdc\xd6\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf3\xf1\xff\x8f\x73\x58\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xca\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x89\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x99\x7f\x67\xff\xea\xe5\xe0\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf4\xf1\xff\x91\x74\x5a\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\x68\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x2b\x73\x4f\x2e\xe1\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\
-\xff\x93\x78\x5e\xff\xea\xe4\xe0\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf4\xf2\xff\x91\x74\x5a\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xc9\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x79\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x89\x6b\x50\
-\xff\xe5\xde\xd8\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfa\xf8\xf7\xff\x96\x7a\x61\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\x68\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x16\x73\x4f\x2e\xc9\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7b\x59\x3a\xff\xd1\xc5\xba\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfb\xfa\xff\x98\x7d\x65\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xc9\x73\x4f\x2e\x15\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5f\x73\x4f\x2e\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\xac\x96\x83\xff\xfc\xfc\xfb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfb\xfa\xff\x98\x7d\x65\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf7\x73\x4f\x2e\x4b\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x09\x73\x4f\x2e\
-\xad\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x80\x60\x42\xff\xe2\xdb\xd4\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfb\xf9\xf8\xff\xeb\xe5\xe0\xff\xfe\xfe\xfd\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfb\xfa\xff\x9a\x80\x68\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x92\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x35\x73\x4f\x2e\
-\xed\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\xa5\x8e\x79\xff\xfc\xfc\xfb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfe\xfe\xfe\xff\xc3\xb3\xa5\xff\xb4\xa1\x8f\xff\xfe\xfe\xfe\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfd\xfc\xff\xa2\x8a\x74\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe0\x73\x4f\x2e\
-\x23\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x77\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\xc3\xb3\xa5\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xdc\xd3\xcb\xff\x7e\x5c\x3e\xff\xab\x96\x82\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfd\xfc\xff\xa2\x8b\x75\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\x5f\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x0b\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2d\
-\xff\x78\x56\x36\xff\xd9\xcf\xc6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\
-\xff\xa1\x89\x73\xff\x6f\x4a\x28\xff\xb0\x9b\x89\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfd\xfc\xff\xa2\x8a\x75\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xaf\x73\x4f\x2e\x0a\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x46\x73\x4f\x2e\xf3\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x7b\x59\x3a\xff\xde\xd6\xce\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf2\xef\xec\
-\xff\x8a\x6d\x51\xff\x6f\x4a\x29\xff\xb5\xa1\x90\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\xff\xa8\x92\x7d\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xed\x73\x4f\x2e\x35\x73\x4f\x2e\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x7a\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x77\x54\x33\xff\xd4\xca\xc0\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\xa9\x93\x7f\xff\x6f\x4a\x28\xff\xb5\xa1\x90\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x84\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x6a\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x05\x73\x4f\x2e\xb3\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4e\x2d\xff\xc4\xb5\xa7\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe7\xe1\xdc\xff\x89\x6b\x4f\xff\xb4\xa0\x8e\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x84\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xa3\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x1e\x73\x4f\x2e\xde\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\x9d\x83\x6c\xff\xfa\xf8\xf7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xda\xd1\xc8\xff\xd1\xc5\xba\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x85\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xd0\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x49\x73\x4f\x2e\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7c\x5b\x3c\xff\xdd\xd5\xcd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfe\xfe\xff\xfc\xfb\xfb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\xa0\x8e\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xef\x73\x4f\x2e\x37\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x7a\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\xa1\x89\x73\xff\xf7\xf5\xf4\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\xa2\x90\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x69\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x06\x73\x4f\x2e\xb1\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x76\x52\x32\xff\xc1\xb1\xa2\
-\xff\xff\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb5\xa1\x90\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xa2\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x21\x73\x4f\x2e\xdd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7f\x5e\x40\
-\xff\xd0\xc4\xb9\xff\xff\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb9\xa7\x97\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xbf\x73\x4f\x2e\x0f\x73\x4f\x2e\
-\x2f\x73\x4f\x2e\xe7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x80\x60\x42\xff\xd0\xc4\xb9\xff\xfe\xfe\xfe\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbf\xaf\xa0\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe3\x73\x4f\x2e\x25\x73\x4f\x2e\
-\x63\x73\x4f\x2e\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x7f\x5e\x40\xff\xc7\xb9\xab\xff\xfc\xfb\xfa\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbf\xae\x9f\
-\xff\x70\x4b\x29\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xee\x73\x4f\x2e\x41\x73\x4f\x2e\
-\x6c\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x79\x57\x37\xff\xb6\xa3\x92\
-\xff\xf4\xf1\xee\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdf\xd7\xd0\
-\xff\x90\x73\x59\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\x6a\x73\x4f\x2e\
-\xa7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x74\x50\x2f\
-\xff\x9c\x82\x6b\xff\xe3\xdc\xd6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xef\xeb\xe8\xff\xb3\x9f\x8d\xff\x7b\x59\x3a\xff\x71\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\x79\x73\x4f\x2e\
-\xbf\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\x88\x69\x4d\xff\xe3\xdb\xd5\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfc\xfb\xfb\xff\xd3\xc8\xbe\xff\x8f\x72\x58\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb8\x73\x4f\x2e\
-\xf0\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x76\x52\x32\xff\xd3\xc8\xbe\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xed\xe8\xe4\
-\xff\xa8\x92\x7d\xff\x76\x53\x33\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2d\xff\x78\x55\x36\xff\xda\xd0\xc7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf9\xf7\xf6\xff\xc1\xb1\xa2\xff\x7d\x5b\x3d\xff\x72\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2d\xff\x78\x56\x36\xff\xda\xd1\xc8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfd\xfd\xff\xce\xc1\xb6\xff\x81\x61\x43\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2d\xff\x78\x56\x36\xff\xda\xd1\xc8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd4\xc8\xbe\
-\xff\x81\x60\x42\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4e\x2d\xff\x7a\x57\x38\xff\xdf\xd7\xd0\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc9\xbc\xaf\xff\x7a\x58\x39\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7b\x59\x3a\xff\xe4\xdd\xd7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf4\xf2\
-\xff\xf6\xf4\xf1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfc\xfc\xfb\xff\xb2\x9e\x8c\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7b\x59\x3a\xff\xe4\xdd\xd7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdc\xd3\xca\
-\xff\xa3\x8c\x76\xff\xe7\xe1\xdb\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xe9\xe4\xdf\xff\x87\x68\x4c\xff\x72\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7c\x5a\x3b\xff\xe5\xde\xd8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xda\xd0\xc7\
-\xff\x77\x54\x33\xff\x8e\x70\x56\xff\xdf\xd7\xcf\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb9\xa7\x96\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x81\x60\x43\xff\xe9\xe3\xde\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdc\xd3\xcb\
-\xff\x79\x56\x37\xff\x71\x4c\x2b\xff\x89\x6a\x4f\xff\xe1\xd9\xd2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd9\xcf\xc6\xff\x78\x56\x36\
-\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x82\x62\x44\xff\xea\xe5\xe0\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe3\xdc\xd6\
-\xff\x7b\x59\x3a\xff\x72\x4e\x2d\xff\x71\x4c\x2b\xff\x98\x7d\x65\
-\xff\xf5\xf3\xf1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe9\xe4\xdf\xff\x81\x61\x43\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x82\x62\x44\xff\xea\xe5\xe0\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe4\xdd\xd7\
-\xff\x7b\x59\x3a\xff\x73\x4e\x2d\xff\x72\x4e\x2c\xff\x7f\x5e\x3f\
-\xff\xe8\xe2\xdc\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf1\xed\xea\xff\x89\x6b\x50\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x85\x65\x48\xff\xec\xe8\xe3\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe4\xdd\xd7\
-\xff\x7b\x59\x3a\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\xad\x97\x84\
-\xff\xfb\xfa\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe5\xdf\xd9\xff\x7f\x5e\x3f\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x89\x6b\x4f\xff\xf0\xec\xe9\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe7\xe1\xdc\
-\xff\x7e\x5d\x3e\xff\x73\x4f\x2f\xff\xa6\x8f\x7a\xff\xf4\xf1\xee\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd1\xc5\xbb\xff\x76\x53\x32\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcd\x73\x4f\x2e\
-\xde\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x89\x6b\x4f\xff\xf0\xec\xe9\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe9\xe4\xdf\
-\xff\x8a\x6c\x51\xff\xb6\xa4\x92\xff\xf6\xf3\xf1\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfd\xfc\xfc\xff\xab\x95\x82\xff\x71\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xbd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x89\x6b\x4f\xff\xf0\xec\xe9\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf4\xf1\xee\
-\xff\xdd\xd5\xcd\xff\xfb\xfb\xfa\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xdc\xd4\xcb\xff\x7e\x5c\x3e\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb8\x73\x4f\x2e\
-\xa7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2c\xff\x8d\x6f\x54\xff\xf3\xf0\xed\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf5\xf2\xef\xff\x9d\x84\x6d\xff\x71\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\x79\x73\x4f\x2e\
-\x6c\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\x8e\x71\x57\xff\xf5\xf2\xef\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf5\
-\xff\xad\x98\x85\xff\x74\x50\x2f\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\x64\x73\x4f\x2e\
-\x55\x73\x4f\x2e\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\x8e\x71\x56\xff\xf4\xf2\xef\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf7\xf4\xf2\xff\xb3\x9f\x8e\
-\xff\x76\x52\x32\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe7\x73\x4f\x2e\x30\x73\x4f\x2e\
-\x26\x73\x4f\x2e\xe3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\x90\x73\x59\xff\xf6\xf4\xf2\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xee\xea\xe6\xff\xa5\x8e\x79\xff\x75\x51\x31\
-\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe3\x73\x4f\x2e\x25\x73\x4f\x2e\
-\x21\x73\x4f\x2e\xdd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x70\x4b\x29\xff\x94\x78\x5f\xff\xfa\xf9\xf8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfd\xfd\
-\xff\xdb\xd2\xc9\xff\x93\x78\x5e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xbf\x73\x4f\x2e\x0f\x73\x4f\x2e\
-\x06\x73\x4f\x2e\xb1\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x72\x4e\x2d\
-\xff\x85\x66\x49\xff\xc4\xb4\xa6\xff\xfe\xfe\xfd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xf0\xed\xff\xb9\xa7\x97\
-\xff\x7f\x5e\x3f\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xa2\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x7a\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2d\xff\x71\x4d\x2b\xff\x7f\x5d\x3f\xff\xb1\x9e\x8b\
-\xff\xe9\xe3\xde\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfa\xf9\xf8\xff\xd3\xc8\xbd\xff\x94\x79\x60\xff\x74\x50\x2f\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x69\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x49\x73\x4f\x2e\xf6\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x77\x54\x34\xff\xa1\x89\x73\xff\xde\xd5\xcd\xff\xfd\xfc\xfc\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\
-\xff\xb1\x9d\x8a\xff\x79\x56\x37\xff\x71\x4d\x2b\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xef\x73\x4f\x2e\x37\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x1e\x73\x4f\x2e\xde\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x72\x4e\x2c\xff\x8a\x6c\x51\
-\xff\xcb\xbd\xb1\xff\xf9\xf7\xf6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xf8\xf6\
-\xff\x92\x76\x5c\xff\x70\x4c\x2a\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xd0\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x05\x73\x4f\x2e\xb3\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x77\x54\x34\xff\xa9\x93\x7f\xff\xea\xe5\xe0\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xf9\xf8\
-\xff\x95\x7a\x61\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x90\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x78\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x7f\x5e\x40\xff\xc3\xb3\xa5\xff\xfa\xf8\xf7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfa\xf9\xf8\
-\xff\x95\x7a\x61\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\x5b\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x35\x73\x4f\x2e\xed\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x85\x66\x49\
-\xff\xd6\xcc\xc2\xff\xfe\xfe\xfd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\
-\xff\x98\x7e\x66\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xe0\x73\x4f\x2e\x23\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x0b\x73\x4f\x2e\xbd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x82\x62\x45\xff\xd6\xcc\xc2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\x9f\x87\x70\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xa7\x73\x4f\x2e\x04\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x6a\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x79\x57\x38\xff\xcc\xbf\xb3\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xe1\xda\xd3\xff\xd2\xc6\xbc\xff\xfe\xfd\xfd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\x9f\x87\x70\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\x5f\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x23\x73\x4f\x2e\
-\xe0\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2c\xff\xa4\x8c\x77\xff\xfa\xf9\xf8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf5\xf2\xf0\xff\xbf\xaf\xa0\
-\xff\x81\x60\x43\xff\xac\x97\x84\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\xa0\x87\x71\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xd2\x73\x4f\x2e\
-\x18\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x03\x73\x4f\x2e\
-\xa6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x7d\x5c\x3e\xff\xdd\xd5\xcd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xe6\xe0\xda\xff\x9c\x83\x6c\xff\x74\x51\x30\
-\xff\x70\x4b\x29\xff\xb2\x9e\x8b\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfd\xfd\
-\xff\xa6\x90\x7b\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x91\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5f\x73\x4f\x2e\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2b\
-\xff\x94\x79\x5f\xff\xf8\xf7\xf5\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xd8\xce\xc5\xff\x8a\x6c\x50\xff\x71\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xb2\x9e\x8b\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xaa\x94\x80\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf2\x73\x4f\x2e\x46\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x16\x73\x4f\x2e\xc9\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\xa4\x8c\x77\xff\xfd\xfd\xfc\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe2\xdb\xd4\
-\xff\x87\x68\x4b\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xb3\x9f\x8d\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xaa\x94\x80\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xbe\x73\x4f\x2e\x0c\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x68\x73\x4f\x2e\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\xb1\x9d\x8a\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc7\xb9\xab\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xba\xa8\x98\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xab\x95\x81\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\x68\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x16\x73\x4f\x2e\xc9\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\xa6\x8f\x7a\xff\xfd\xfd\xfc\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xf0\xee\
-\xff\xa3\x8c\x76\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xbc\xab\x9b\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xb1\x9d\x8a\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xc9\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x69\x73\x4f\x2e\xfd\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x88\x69\x4d\xff\xee\xea\xe6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf4\xf1\xef\xff\xb1\x9d\x8b\xff\x7a\x58\x39\xff\x71\x4d\x2c\
-\xff\x71\x4c\x2b\xff\xbc\xaa\x9b\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xb2\x9e\x8b\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\x68\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x26\x73\x4f\x2e\xe0\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x76\x53\x33\xff\xcf\xc3\xb7\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfb\xfb\xfa\xff\xd3\xc8\xbd\xff\x90\x73\x59\
-\xff\x72\x4d\x2c\xff\xbf\xae\x9f\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xb2\x9e\x8b\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xca\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x88\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x92\x76\x5d\xff\xef\xea\xe6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\xec\xe8\
-\xff\xbb\xa9\x99\xff\xd3\xc7\xbd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xb7\xa5\x94\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\x68\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1a\x73\x4f\x2e\
-\xca\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\xab\x96\x82\xff\xfa\xf9\xf7\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfe\xfd\xfd\xff\xfb\xfb\xfa\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xbc\xab\x9b\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb4\x73\x4f\x2e\
-\x11\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5e\x73\x4f\x2e\xf5\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x77\x54\x34\xff\xb6\xa3\x92\
-\xff\xf7\xf5\xf4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xbc\xab\x9b\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xef\x73\x4f\x2e\x47\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x08\x73\x4f\x2e\x9f\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x75\x51\x30\
-\xff\xa9\x93\x7f\xff\xf2\xef\xeb\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xbd\xac\x9d\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x8e\x73\x4f\x2e\x03\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x2c\x73\x4f\x2e\xe2\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2d\
-\xff\x73\x4f\x2e\xff\x98\x7d\x65\xff\xdc\xd3\xcb\xff\xfd\xfd\xfd\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc4\xb5\xa8\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xd6\x73\x4f\x2e\x28\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x73\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x7f\x5f\x41\xff\xba\xa9\x98\
-\xff\xf1\xee\xeb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc6\xb7\xaa\xff\x72\x4d\x2c\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\x6a\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x10\x73\x4f\x2e\xb4\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x74\x50\x2f\
-\xff\x90\x74\x59\xff\xcb\xbe\xb1\xff\xf7\xf5\xf3\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe6\xdf\xd9\xff\xa1\x89\x72\xff\x7c\x5a\x3b\xff\x71\x4d\x2b\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xa4\x73\x4f\x2e\x10\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x31\x73\x4f\x2e\
-\xd7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2c\xff\x76\x53\x33\xff\x9b\x81\x6a\xff\xd5\xca\xc0\
-\xff\xf7\xf6\xf4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfa\xf9\xf8\xff\xdc\xd3\xca\xff\xa6\x8f\x7a\
-\xff\x7d\x5b\x3c\xff\x71\x4d\x2b\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xce\x73\x4f\x2e\
-\x27\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x5b\x73\x4f\x2e\xef\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x78\x56\x36\
-\xff\x9c\x83\x6b\xff\xeb\xe6\xe1\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\
-\xff\xdd\xd4\xcc\xff\xa6\x8f\x7a\xff\x7c\x5b\x3c\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xee\x73\x4f\x2e\x49\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x8a\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x76\x52\x32\xff\xd7\xcd\xc3\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfb\xfa\xfa\xff\xdb\xd2\xc9\xff\x9e\x85\x6f\
-\xff\x77\x54\x34\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\x75\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x11\x73\x4f\x2e\xb5\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2d\
-\xff\x79\x56\x37\xff\xde\xd5\xcd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\
-\xff\xcc\xbf\xb3\xff\x8f\x72\x57\xff\x72\x4e\x2d\xff\x73\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\x9a\x73\x4f\x2e\x0f\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\
-\xff\x7a\x57\x38\xff\xe2\xda\xd3\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xee\xea\xe6\xff\xac\x96\x82\xff\x78\x55\x35\
-\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xb7\x73\x4f\x2e\x11\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\xcb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\
-\xff\x7a\x57\x38\xff\xe1\xda\xd3\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfa\xf9\xf8\xff\xc9\xbb\xaf\
-\xff\x82\x62\x44\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x30\x73\x4f\x2e\xda\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\
-\xff\x7b\x59\x3a\xff\xe3\xdb\xd5\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfa\xf9\xf8\xff\xfb\xfa\xf8\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xd4\xc9\xbf\xff\x83\x62\x45\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x5b\x73\x4f\x2e\xec\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x80\x5f\x41\xff\xe7\xe1\xdc\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe0\xd8\xd0\xff\xa8\x91\x7d\xff\xdd\xd4\xcc\xff\xfc\xfb\xfa\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xd3\xc7\xbd\xff\x7e\x5d\x3f\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xce\x73\x4f\x2e\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x5e\x73\x4f\x2e\xec\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x80\x60\x42\xff\xe8\xe2\xdd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe1\xd9\xd2\xff\x78\x55\x35\xff\x7d\x5b\x3d\xff\xa9\x93\x7f\
-\xff\xe5\xdf\xd9\xff\xfe\xfe\xfd\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfd\xfd\xff\xb1\x9d\x8a\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xcf\x73\x4f\x2e\x41\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x4d\x73\x4f\x2e\
-\xcf\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x80\x60\x42\xff\xe8\xe2\xdc\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe2\xda\xd3\xff\x7a\x57\x38\xff\x72\x4e\x2c\xff\x72\x4d\x2c\
-\xff\x83\x64\x46\xff\xbb\xaa\x9a\xff\xf3\xf0\xee\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe8\xe2\xdc\xff\x86\x67\x4b\
-\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x2e\x73\x4f\x2e\xcb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\
-\xff\x83\x64\x47\xff\xeb\xe6\xe1\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe2\xda\xd3\xff\x7a\x57\x38\xff\x73\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x74\x50\x2f\xff\x9a\x80\x68\xff\xe3\xdc\xd5\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x85\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\xcb\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x87\x68\x4c\xff\xee\xea\xe6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe6\xdf\xd9\xff\x7e\x5d\x3e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\x8b\x6d\x51\
-\xff\xe0\xd8\xd0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbb\xa9\x99\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\xb7\x73\x4f\x2e\x2e\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x2e\x73\x4f\x2e\xb6\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x87\x68\x4c\xff\xee\xea\xe6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe8\xe2\xdd\xff\x80\x60\x42\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\xbe\xae\x9f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc2\xb3\xa5\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\
-\x9a\x73\x4f\x2e\x10\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x11\x73\x4f\x2e\
-\x8a\x73\x4f\x2e\xef\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x87\x68\x4c\xff\xef\xea\xe6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe8\xe2\xdc\xff\x80\x60\x42\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x78\x55\x35\xff\xb1\x9d\x8a\
-\xff\xf6\xf3\xf1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc2\xb2\xa4\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xee\x73\x4f\x2e\x75\x73\x4f\x2e\
-\x0f\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x5a\x73\x4f\x2e\xd7\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\x8b\x6d\x52\xff\xf2\xef\xec\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe9\xe3\xde\xff\x81\x61\x44\xff\x72\x4e\x2d\xff\x72\x4e\x2d\
-\xff\x72\x4e\x2d\xff\x8a\x6c\x51\xff\xcb\xbd\xb1\xff\xfb\xf9\xf8\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\xff\x9a\x80\x69\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xcf\x73\x4f\x2e\x49\x73\x4f\x2e\x03\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x26\x73\x4f\x2e\xa4\x73\x4f\x2e\
-\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\x8c\x6e\x53\xff\xf3\xf0\xed\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xee\xe9\xe5\xff\x85\x66\x49\xff\x71\x4c\x2a\xff\x82\x62\x45\
-\xff\xb6\xa4\x93\xff\xec\xe8\xe3\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd7\xcd\xc3\xff\x7a\x57\x38\
-\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\xa4\x73\x4f\x2e\x26\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x10\x73\x4f\x2e\
-\x72\x73\x4f\x2e\xe3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\x8c\x6e\x53\xff\xf3\xf0\xed\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xef\xea\xe7\xff\x98\x7e\x66\xff\xb2\x9e\x8c\xff\xe5\xdf\xd9\
-\xff\xfe\xfd\xfd\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf4\xf1\xee\xff\x9d\x84\x6d\xff\x71\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xd7\x73\x4f\x2e\x69\x73\x4f\x2e\
-\x10\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x2b\x73\x4f\x2e\xa0\x73\x4f\x2e\xf3\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2b\
-\xff\x8e\x71\x57\xff\xf5\xf3\xf1\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfa\xf9\xf8\xff\xf0\xec\xe8\xff\xfd\xfd\xfc\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf6\xf4\xf2\xff\xa9\x92\x7e\xff\x74\x50\x2f\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xef\x73\x4f\x2e\x8e\x73\x4f\x2e\x27\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x09\x73\x4f\x2e\x4a\x73\x4f\x2e\
-\xc7\x73\x4f\x2e\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\x92\x77\x5d\xff\xf9\xf8\xf6\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xf0\xed\
-\xff\xad\x98\x84\xff\x74\x51\x30\xff\x73\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xb5\x73\x4f\x2e\
-\x45\x73\x4f\x2e\x04\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x16\x73\x4f\x2e\x67\x73\x4f\x2e\xcb\x73\x4f\x2e\xfb\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\x92\x77\x5d\xff\xf9\xf8\xf7\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xe0\xd8\xd1\xff\x99\x7f\x67\
-\xff\x74\x50\x2f\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfb\x73\x4f\x2e\xcb\x73\x4f\x2e\x67\x73\x4f\x2e\x12\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x16\x73\x4f\x2e\x67\x73\x4f\x2e\
-\xcb\x73\x4f\x2e\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\x93\x77\x5d\xff\xf9\xf8\xf7\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf3\xf0\xee\xff\xc1\xb1\xa3\xff\x83\x64\x46\xff\x71\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x67\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x16\x73\x4f\x2e\x67\x73\x4f\x2e\xca\x73\x4f\x2e\xf7\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x6f\x4a\x28\
-\xff\x99\x7f\x67\xff\xfb\xfa\xf9\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\xff\xcf\xc3\xb7\
-\xff\x93\x78\x5e\xff\x74\x51\x30\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xf1\x73\x4f\x2e\xbf\x73\x4f\x2e\x68\x73\x4f\x2e\x16\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x15\x73\x4f\x2e\x49\x73\x4f\x2e\
-\x92\x73\x4f\x2e\xe0\x73\x4f\x2e\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x71\x4d\x2b\xff\x79\x57\x37\xff\x96\x7a\x62\
-\xff\xd0\xc4\xb9\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf6\xf4\xf1\xff\xd1\xc5\xba\xff\x9c\x82\x6b\xff\x78\x55\x35\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xd2\x73\x4f\x2e\x91\x73\x4f\x2e\
-\x45\x73\x4f\x2e\x0b\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x03\x73\x4f\x2e\x23\x73\x4f\x2e\x5f\x73\x4f\x2e\xb0\x73\x4f\x2e\
-\xee\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x72\x4e\x2c\
-\xff\x81\x61\x43\xff\xa8\x92\x7d\xff\xd7\xcd\xc4\xff\xf7\xf5\xf3\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xf2\xef\xec\xff\xcb\xbd\xb1\
-\xff\x97\x7c\x63\xff\x77\x54\x34\xff\x71\x4d\x2b\xff\x73\x4f\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xe1\x73\x4f\x2e\
-\xa8\x73\x4f\x2e\x5f\x73\x4f\x2e\x18\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x0a\x73\x4f\x2e\
-\x35\x73\x4f\x2e\x6a\x73\x4f\x2e\xa3\x73\x4f\x2e\xd1\x73\x4f\x2e\
-\xf0\x73\x4f\x2e\xff\x76\x53\x32\xff\x89\x6b\x4f\xff\xb6\xa3\x92\
-\xff\xe5\xde\xd8\xff\xfc\xfc\xfb\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfd\xfd\xfc\xff\xc5\xb5\xa8\xff\x8d\x70\x56\xff\x75\x52\x32\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf0\x73\x4f\x2e\
-\xd1\x73\x4f\x2e\x90\x73\x4f\x2e\x5b\x73\x4f\x2e\x23\x73\x4f\x2e\
-\x05\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x15\x73\x4f\x2e\
-\x37\x74\x51\x30\x69\xa2\x89\x73\xa1\xe6\xe0\xda\xc0\xfe\xfe\xfe\
-\xe3\xff\xff\xff\xee\xff\xff\xff\xfe\xff\xff\xff\xfe\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfa\xf9\xf8\xff\x96\x7a\x62\xff\x70\x4b\x29\xff\x73\x4f\x2e\
-\xfe\x73\x4f\x2e\xfc\x73\x4f\x2e\xe7\x73\x4f\x2e\xe3\x73\x4f\x2e\
-\xc0\x73\x4f\x2e\xa1\x73\x4f\x2e\x69\x73\x4f\x2e\x37\x73\x4f\x2e\
-\x15\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\
-\x00\xff\xff\xff\x00\xff\xff\xff\x01\xff\xff\xff\x0f\xff\xff\xff\
-\x24\xff\xff\xff\x41\xff\xff\xff\x69\xff\xff\xff\x79\xff\xff\xff\
-\xb8\xff\xff\xff\xbc\xff\xff\xff\xcd\xff\xff\xff\xfd\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xfd\xfc\xfb\xfa\xcd\x9c\x83\x6b\xbc\x71\x4c\x2b\xb8\x73\x4f\x2e\
-\x7a\x73\x4f\x2e\x63\x73\x4f\x2e\x30\x73\x4f\x2e\x25\x73\x4f\x2e\
-\x0f\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\
-\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe0\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\
-\xff\x80\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
-\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
-\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
-\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\
-\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\
-\x80\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xfe\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xfc\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xf8\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xe0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xc0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\x80\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xfe\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfc\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xf8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xe0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xe0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xc0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xfe\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xfe\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xc0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xe0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xf8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xfc\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xfe\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x80\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\x80\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xc0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xf0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xf8\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xfc\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xfe\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xff\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\
-\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\
-\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\
-\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\
-\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\
-\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\
-\xff\x80\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe0\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf8\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xe0\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xf8\x00\x00\x00\x00\x3f\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xff\xff\xff\x28\x00\x00\
-\x00\x40\x00\x00\x00\x80\x00\x00\x00\x01\x00\x20\x00\x00\x00\x00\
-\x00\x00\x40\x00\x00\xe5\x4c\x00\x00\xe5\x4c\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x04\x73\x4f\x2e\x1a\x73\x4f\x2e\x45\x73\x4f\x2e\x7d\x70\x4c\x2a\
-\xa9\xbb\xaa\x9a\xcc\xff\xff\xff\xee\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcf\xc2\xb7\xff\x74\x51\x30\
-\xfe\x73\x4f\x2e\xea\x73\x4f\x2e\xcb\x73\x4f\x2e\xa4\x73\x4f\x2e\
-\x7d\x73\x4f\x2e\x45\x73\x4f\x2e\x1a\x73\x4f\x2e\x04\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x1c\x73\x4f\x2e\x58\x73\x4f\x2e\
-\xa3\x73\x4f\x2e\xd4\x73\x4f\x2e\xf1\x73\x4f\x2e\xfe\x71\x4c\x2b\
-\xff\x9d\x84\x6d\xff\xfb\xf9\xf8\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd2\xc6\xbc\xff\x75\x52\x31\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfe\x73\x4f\x2e\xf1\x73\x4f\x2e\xd4\x73\x4f\x2e\x9e\x73\x4f\x2e\
-\x54\x73\x4f\x2e\x17\x73\x4f\x2e\x02\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x05\x73\x4f\x2e\
-\x35\x73\x4f\x2e\x8c\x73\x4f\x2e\xd9\x73\x4f\x2e\xfb\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x7c\x5a\x3b\xff\xdc\xd2\xca\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd4\xc9\xbe\xff\x76\x52\x32\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xf9\x73\x4f\x2e\xd4\x73\x4f\x2e\x8b\x73\x4f\x2e\x2d\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x03\x73\x4f\x2e\x38\x73\x4f\x2e\x9f\x73\x4f\x2e\
-\xec\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2c\xff\x9c\x82\x6b\xff\xf6\xf3\xf1\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd7\xcd\xc3\xff\x76\x52\x32\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe4\x73\x4f\x2e\
-\x96\x73\x4f\x2e\x35\x73\x4f\x2e\x02\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x1b\x73\x4f\x2e\x82\x73\x4f\x2e\xe9\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x74\x50\x2f\xff\xb7\xa4\x93\xff\xfc\xfb\xfb\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf1\xee\xeb\xff\x9a\x80\x68\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xe7\x73\x4f\x2e\x7f\x73\x4f\x2e\x17\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x03\x73\x4f\x2e\x4f\x73\x4f\x2e\
-\xcd\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7e\x5d\x3f\xff\xe5\xdf\xd9\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xeb\xe6\xe1\
-\xff\x93\x77\x5e\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfd\x73\x4f\x2e\xc6\x73\x4f\x2e\
-\x47\x73\x4f\x2e\x02\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x10\x73\x4f\x2e\x7f\x73\x4f\x2e\xef\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7c\x5a\x3b\xff\xe3\xdb\xd5\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe2\xdb\xd4\xff\x86\x67\x4b\xff\x72\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xec\x73\x4f\x2e\x77\x73\x4f\x2e\x0d\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x19\x73\x4f\x2e\xa6\x73\x4f\x2e\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7d\x5b\x3d\xff\xe5\xde\xd7\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xc9\xbc\xaf\xff\x76\x53\x33\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfb\x73\x4f\x2e\xa2\x73\x4f\x2e\x16\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x26\x73\x4f\x2e\
-\xba\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7e\x5d\x3e\xff\xe6\xe0\xda\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf7\xf5\xf3\xff\x97\x7c\x63\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\xad\x73\x4f\x2e\
-\x22\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x26\x73\x4f\x2e\xc1\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7f\x5f\x40\xff\xe9\xe3\xde\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xf8\xf6\xff\xfa\xf8\xf7\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xbe\xad\x9e\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc0\x73\x4f\x2e\x20\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x19\x73\x4f\x2e\xba\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x80\x60\x42\xff\xeb\xe5\xe0\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xeb\xe5\xe0\xff\xe4\xdd\xd7\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd1\xc5\xba\xff\x75\x51\x30\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xaa\x73\x4f\x2e\x16\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x10\x73\x4f\x2e\xa5\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x83\x63\x46\xff\xed\xe8\xe4\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf3\xf0\xed\xff\xef\xeb\xe7\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcb\xbd\xb1\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xa2\x73\x4f\x2e\x0d\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x03\x73\x4f\x2e\
-\x7f\x73\x4f\x2e\xfc\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x84\x65\x48\xff\xee\xea\xe6\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xae\x99\x86\xff\x71\x4d\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfa\x73\x4f\x2e\x77\x73\x4f\x2e\
-\x01\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x50\x73\x4f\x2e\
-\xef\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x87\x68\x4b\xff\xf0\xec\xe9\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xe6\xe0\xda\xff\x84\x64\x47\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xea\x73\x4f\x2e\
-\x43\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1b\x73\x4f\x2e\xcc\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x87\x68\x4c\xff\xf1\xed\xea\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf6\xf3\xf1\xff\xa1\x89\x73\xff\x72\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc5\x73\x4f\x2e\x18\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x82\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2b\xff\x98\x7d\x65\xff\xf7\xf5\xf3\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf7\xf5\xf3\
-\xff\xad\x98\x85\xff\x74\x50\x2f\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfe\x73\x4f\x2e\x7b\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x39\x73\x4f\x2e\xe9\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x9b\x81\x6a\xff\xe8\xe3\xdd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xf9\xf8\xff\xad\x98\x85\
-\xff\x74\x50\x2f\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xe1\x73\x4f\x2e\x2d\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x05\x73\x4f\x2e\x9e\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\xa6\x8f\x7a\xff\xf2\xef\xec\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf2\xef\xec\xff\x88\x6a\x4e\
-\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x8e\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x36\x73\x4f\x2e\xeb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\xa2\x8a\x74\
-\xff\xf4\xf2\xef\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf4\xf1\xee\xff\x8b\x6d\x52\
-\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe3\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x8b\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x8a\x6c\x50\xff\xeb\xe5\xe1\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf3\xf1\xff\x8d\x70\x55\
-\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x85\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1d\x73\x4f\x2e\
-\xd8\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\xbf\xae\x9f\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfb\xfa\xf9\xff\xdc\xd3\xcb\xff\xfa\xf9\xf8\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf7\xf5\xf3\xff\x90\x73\x59\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xce\x73\x4f\x2e\
-\x16\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x58\x73\x4f\x2e\
-\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4e\x2d\xff\x7a\x58\x39\xff\xdf\xd7\xcf\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xd6\xcc\xc2\xff\x9f\x86\x6f\xff\xf9\xf8\xf6\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\xff\x92\x76\x5c\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf8\x73\x4f\x2e\
-\x4f\x73\x4f\x2e\x00\x73\x4f\x2e\x03\x73\x4f\x2e\xa3\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7d\x5b\x3d\xff\xe4\xde\xd7\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xc6\xb7\xaa\xff\x99\x7f\x67\xff\xfb\xfa\xf9\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xf7\xf6\xff\x95\x79\x60\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\x9b\x73\x4f\x2e\x01\x73\x4f\x2e\x1b\x73\x4f\x2e\xd3\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x76\x52\x32\xff\xd1\xc5\xba\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf1\xee\xeb\xff\xc6\xb7\xaa\xff\xfb\xfa\xf9\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfa\xf8\xf7\xff\x96\x7b\x63\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xcc\x73\x4f\x2e\x15\x73\x4f\x2e\x45\x73\x4f\x2e\xf1\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xa0\x87\x71\xff\xf9\xf7\xf6\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfc\xfb\xff\xff\xff\xfe\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\xff\x99\x7e\x66\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xed\x73\x4f\x2e\x3d\x73\x4f\x2e\x7d\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x76\x53\x33\xff\xc1\xb1\xa2\
-\xff\xfd\xfd\xfd\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfb\xfa\xff\x9a\x81\x69\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\x6f\x73\x4f\x2e\xa9\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7b\x58\x39\
-\xff\xc3\xb3\xa5\xff\xfb\xfa\xf9\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfc\xfc\xff\x9e\x85\x6e\
-\xff\x6f\x4b\x29\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x9c\x73\x4f\x2e\xcc\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x78\x55\x35\xff\xb0\x9c\x89\xff\xf2\xef\xec\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd5\xca\xc0\
-\xff\x8c\x6e\x53\xff\x72\x4e\x2c\xff\x73\x4f\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xc1\x73\x4f\x2e\xee\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x71\x4d\x2c\xff\xb3\xa0\x8e\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xec\xe8\xe3\xff\xa9\x93\x7f\xff\x76\x53\x33\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xde\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2a\xff\xab\x95\x81\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfa\xf9\xf7\xff\xc0\xb0\xa1\xff\x7b\x59\x39\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xf3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2a\xff\xae\x99\x85\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfd\xfd\xff\xc4\xb5\xa7\
-\xff\x78\x55\x36\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2a\xff\xb1\x9d\x8a\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\xff\xde\xd5\xce\
-\xff\xf2\xee\xeb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfb\xfa\xf9\
-\xff\xa8\x92\x7e\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4c\x2b\xff\xb4\xa0\x8f\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xad\x98\x85\
-\xff\x9e\x85\x6e\xff\xf1\xee\xeb\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xdc\xd3\xcb\xff\x7a\x58\x38\xff\x73\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xb7\xa4\x93\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb0\x9c\x8a\
-\xff\x6f\x49\x27\xff\xc0\xb0\xa1\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xed\xe9\xe4\xff\x84\x64\x47\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xba\xa8\x98\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb1\x9d\x8b\
-\xff\x86\x67\x4a\xff\xe0\xd8\xd1\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe5\xdf\xd9\xff\x7e\x5d\x3e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xf3\x73\x4f\x2e\xea\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\xbc\xab\x9b\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd6\xcb\xc1\
-\xff\xe1\xda\xd3\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xbe\xae\x9e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xde\x73\x4f\x2e\xcc\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\xbf\xaf\xa0\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdf\xd6\xcf\
-\xff\x84\x64\x47\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xbf\x73\x4f\x2e\xa4\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xc0\xb0\xa1\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xdb\xd2\xca\xff\x8b\x6d\x52\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x98\x73\x4f\x2e\x7d\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2d\
-\xff\x71\x4d\x2b\xff\x7e\x5c\x3e\xff\xd3\xc8\xbd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xf7\xf5\xf3\xff\xc2\xb2\xa4\xff\x81\x61\x43\xff\x72\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\x6f\x73\x4f\x2e\x45\x73\x4f\x2e\xf1\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x77\x54\x34\
-\xff\xa1\x89\x73\xff\xdf\xd6\xcf\xff\xfd\xfc\xfc\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe6\xdf\xd9\
-\xff\x9b\x81\x69\xff\x75\x51\x31\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xed\x73\x4f\x2e\x3d\x73\x4f\x2e\x1b\x73\x4f\x2e\xd3\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\x88\x6a\x4e\xff\xcc\xbe\xb2\
-\xff\xf9\xf8\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc4\xb5\xa7\
-\xff\x71\x4c\x2a\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc9\x73\x4f\x2e\x14\x73\x4f\x2e\x02\x73\x4f\x2e\x9e\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x99\x7f\x67\xff\xe7\xe1\xdb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xc6\xb8\xaa\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\x91\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x54\x73\x4f\x2e\
-\xf9\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x95\x79\x60\xff\xee\xe9\xe5\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf1\xee\xeb\xff\xf2\xee\xeb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xca\xbc\xb0\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf7\x73\x4f\x2e\
-\x4c\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x18\x73\x4f\x2e\
-\xd3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x7a\x58\x39\
-\xff\xd8\xce\xc4\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfd\
-\xff\xd8\xce\xc5\xff\x94\x78\x5f\xff\xd3\xc8\xbd\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcc\xbf\xb3\
-\xff\x74\x50\x2f\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xcb\x73\x4f\x2e\
-\x13\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x8b\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\x8f\x72\x57\
-\xff\xf6\xf3\xf1\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcd\xc0\xb4\
-\xff\x7e\x5c\x3e\xff\x73\x50\x2f\xff\xd4\xc8\xbe\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xcf\xc3\xb8\
-\xff\x74\x51\x30\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x80\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x2e\x73\x4f\x2e\xe3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\x94\x79\x5f\
-\xff\xf8\xf7\xf5\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb9\xa7\x96\
-\xff\x73\x4f\x2e\xff\x75\x52\x31\xff\xd7\xcd\xc4\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd1\xc6\xbb\
-\xff\x75\x51\x31\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe3\x73\x4f\x2e\x2d\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x01\x73\x4f\x2e\x96\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x81\x60\x42\
-\xff\xe6\xe0\xda\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\
-\xff\xbe\xad\x9e\xff\x85\x66\x49\xff\xd9\xcf\xc6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd3\xc8\xbe\
-\xff\x75\x52\x31\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x8e\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x36\x73\x4f\x2e\xe6\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\xab\x95\x81\xff\xfa\xf9\xf8\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfe\xfd\xfd\xff\xe5\xdf\xd8\xff\xf1\xed\xea\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd7\xcc\xc3\
-\xff\x76\x53\x33\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xde\x73\x4f\x2e\x2b\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x7f\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2d\
-\xff\x76\x53\x33\xff\xb4\xa0\x8f\xff\xf7\xf4\xf2\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd9\xcf\xc6\
-\xff\x77\x53\x33\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\x74\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x18\x73\x4f\x2e\xc5\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x74\x51\x30\xff\x9f\x86\x6f\xff\xe3\xdb\xd4\
-\xff\xfe\xfe\xfd\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xdd\xd4\xcc\
-\xff\x78\x55\x35\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc1\x73\x4f\x2e\x15\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x48\x73\x4f\x2e\
-\xeb\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x81\x61\x43\
-\xff\xb6\xa3\x91\xff\xeb\xe6\xe1\xff\xfe\xfe\xfe\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf5\xf3\xf1\
-\xff\xbd\xac\x9d\xff\x8a\x6b\x50\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe7\x73\x4f\x2e\
-\x43\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x77\x73\x4f\x2e\xfa\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\x72\x4e\x2c\xff\x8c\x6f\x54\xff\xeb\xe6\xe1\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xee\xea\xe6\xff\xbd\xac\x9d\xff\x86\x67\x4b\
-\xff\x72\x4d\x2c\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf9\x73\x4f\x2e\x6f\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x0d\x73\x4f\x2e\xa2\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7d\x5c\x3d\xff\xe7\xe0\xdb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xe9\xe4\xdf\
-\xff\xaa\x94\x80\xff\x77\x54\x34\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\x93\x73\x4f\x2e\x0a\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x16\x73\x4f\x2e\xad\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7f\x5e\x40\xff\xe9\xe3\xde\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\xfb\xfa\xf9\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfb\xfa\xf8\xff\xc4\xb5\xa7\xff\x7b\x5a\x3b\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfe\x73\x4f\x2e\xa8\x73\x4f\x2e\x15\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x23\x73\x4f\x2e\xc0\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x81\x61\x43\xff\xeb\xe6\xe1\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xea\xe5\xe0\
-\xff\xab\x95\x81\xff\xdb\xd2\xca\xff\xfd\xfc\xfb\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xfe\xfe\xfd\xff\xbd\xad\x9d\xff\x74\x51\x30\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\
-\xad\x73\x4f\x2e\x17\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1f\x73\x4f\x2e\
-\xaa\x73\x4f\x2e\xfe\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x83\x63\x45\xff\xec\xe7\xe3\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xe8\xe2\xdd\
-\xff\x7d\x5b\x3c\xff\x7c\x5a\x3b\xff\xb2\x9e\x8b\xff\xf2\xef\xec\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf1\xee\xeb\xff\x8c\x6f\x54\
-\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfe\x73\x4f\x2e\xa8\x73\x4f\x2e\
-\x17\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x16\x73\x4f\x2e\xa2\x73\x4f\x2e\xfb\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x85\x66\x49\xff\xee\xea\xe6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xeb\xe5\xe1\
-\xff\x81\x61\x43\xff\x71\x4d\x2b\xff\x70\x4b\x2a\xff\xb1\x9d\x8b\
-\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xfd\xfc\xfb\xff\x9e\x85\x6e\
-\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xf9\x73\x4f\x2e\x93\x73\x4f\x2e\x15\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x0d\x73\x4f\x2e\x77\x73\x4f\x2e\xea\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x86\x67\x4b\xff\xf0\xec\xe8\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xec\xe7\xe2\
-\xff\x81\x60\x42\xff\x73\x4f\x2e\xff\x97\x7c\x64\xff\xe1\xd9\xd2\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf8\xf6\xf4\xff\x96\x7b\x62\
-\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xe8\x73\x4f\x2e\x6f\x73\x4f\x2e\x0a\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x43\x73\x4f\x2e\
-\xc6\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x88\x69\x4d\xff\xf1\xed\xea\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xef\xeb\xe8\
-\xff\xa0\x87\x71\xff\xc4\xb5\xa7\xff\xf5\xf2\xef\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xd3\xc7\xbd\xff\x79\x57\x37\
-\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\xc2\x73\x4f\x2e\
-\x42\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x17\x73\x4f\x2e\x7b\x73\x4f\x2e\xe2\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4d\x2c\xff\x8a\x6b\x50\xff\xf3\xf0\xed\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xfc\xfb\
-\xff\xf7\xf4\xf2\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xdd\xd5\xcd\xff\x88\x6a\x4e\xff\x72\x4e\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xdf\x73\x4f\x2e\x74\x73\x4f\x2e\x14\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x02\x73\x4f\x2e\x2c\x73\x4f\x2e\x8e\x73\x4f\x2e\
-\xe4\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\x8a\x6c\x50\xff\xf4\xf1\xef\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf7\xf5\xf3\
-\xff\xc6\xb7\xa9\xff\x83\x63\x46\xff\x72\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe4\x73\x4f\x2e\
-\x8e\x73\x4f\x2e\x2b\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x02\x73\x4f\x2e\
-\x2d\x73\x4f\x2e\x85\x73\x4f\x2e\xcf\x73\x4f\x2e\xf8\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x71\x4d\x2b\
-\xff\x78\x55\x36\xff\xa6\x8f\x7b\xff\xf9\xf8\xf6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xf8\xf6\xf4\xff\xd4\xc8\xbe\xff\x99\x7f\x67\
-\xff\x76\x52\x32\xff\x72\x4e\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xf7\x73\x4f\x2e\xcc\x73\x4f\x2e\x80\x73\x4f\x2e\x2c\x73\x4f\x2e\
-\x02\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x01\x73\x4f\x2e\x15\x73\x4f\x2e\x4f\x73\x4f\x2e\
-\x9b\x73\x4f\x2e\xcd\x73\x4f\x2e\xee\x7f\x5f\x41\xfc\xa8\x92\x7e\
-\xff\xd9\xd0\xc7\xff\xf8\xf6\xf5\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xfc\xfb\
-\xff\xcf\xc2\xb7\xff\x98\x7d\x65\xff\x78\x55\x35\xff\x71\x4d\x2b\
-\xfc\x73\x4f\x2e\xee\x73\x4f\x2e\xca\x73\x4f\x2e\x91\x73\x4f\x2e\
-\x4b\x73\x4f\x2e\x13\x73\x4f\x2e\x01\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x02\x72\x4e\x2d\x15\x75\x51\x30\x3d\xbc\xab\x9b\x6f\xfa\xf8\xf7\
-\x9c\xff\xff\xff\xc1\xff\xff\xff\xde\xff\xff\xff\xf3\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf6\xf4\xf2\
-\xf3\x8e\x71\x56\xde\x6e\x49\x27\xbf\x72\x4e\x2d\x98\x73\x4f\x2e\
-\x70\x73\x4f\x2e\x3d\x73\x4f\x2e\x13\x73\x4f\x2e\x01\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xff\xfc\x00\x00\x3f\xff\xff\xff\xff\xe0\
-\x00\x00\x07\xff\xff\xff\xff\x80\x00\x00\x01\xff\xff\xff\xfe\x00\
-\x00\x00\x00\x7f\xff\xff\xfc\x00\x00\x00\x00\x3f\xff\xff\xf0\x00\
-\x00\x00\x00\x0f\xff\xff\xe0\x00\x00\x00\x00\x07\xff\xff\xc0\x00\
-\x00\x00\x00\x03\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\x00\x00\
-\x00\x00\x00\x00\xff\xfe\x00\x00\x00\x00\x00\x00\x7f\xfc\x00\x00\
-\x00\x00\x00\x00\x3f\xf8\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
-\x00\x00\x00\x00\x1f\xf0\x00\x00\x00\x00\x00\x00\x0f\xe0\x00\x00\
-\x00\x00\x00\x00\x0f\xe0\x00\x00\x00\x00\x00\x00\x07\xc0\x00\x00\
-\x00\x00\x00\x00\x03\xc0\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x03\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\xc0\x00\x00\x00\x00\x00\x00\x03\xc0\x00\x00\
-\x00\x00\x00\x00\x03\xc0\x00\x00\x00\x00\x00\x00\x03\xe0\x00\x00\
-\x00\x00\x00\x00\x07\xe0\x00\x00\x00\x00\x00\x00\x0f\xf0\x00\x00\
-\x00\x00\x00\x00\x0f\xf8\x00\x00\x00\x00\x00\x00\x1f\xf8\x00\x00\
-\x00\x00\x00\x00\x1f\xfc\x00\x00\x00\x00\x00\x00\x3f\xfe\x00\x00\
-\x00\x00\x00\x00\x7f\xff\x00\x00\x00\x00\x00\x00\xff\xff\x80\x00\
-\x00\x00\x00\x01\xff\xff\xc0\x00\x00\x00\x00\x03\xff\xff\xe0\x00\
-\x00\x00\x00\x07\xff\xff\xf0\x00\x00\x00\x00\x0f\xff\xff\xfc\x00\
-\x00\x00\x00\x3f\xff\xff\xfe\x00\x00\x00\x00\x7f\xff\xff\xff\x80\
-\x00\x00\x01\xff\xff\xff\xff\xe0\x00\x00\x07\xff\xff\xff\xff\xfc\
-\x00\x00\x3f\xff\xff\x28\x00\x00\x00\x20\x00\x00\x00\x40\x00\x00\
-\x00\x01\x00\x20\x00\x00\x00\x00\x00\x00\x10\x00\x00\xe5\x4c\x00\
-\x00\xe5\x4c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x06\x73\x4f\x2e\x31\x73\x4f\x2e\x77\x71\x4c\x2a\
-\xb6\x94\x79\x5f\xe1\xf7\xf5\xf4\xfa\xff\xff\xff\xff\xe1\xd9\xd2\
-\xff\x7b\x59\x39\xf9\x72\x4e\x2d\xe0\x73\x4f\x2e\xb6\x73\x4f\x2e\
-\x76\x73\x4f\x2e\x2f\x73\x4f\x2e\x06\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x05\x73\x4f\x2e\
-\x41\x73\x4f\x2e\xa2\x73\x4f\x2e\xe5\x73\x4f\x2e\xfd\x73\x4e\x2d\
-\xff\x7a\x58\x39\xff\xd5\xca\xc0\xff\xff\xff\xff\xff\xe4\xdd\xd6\
-\xff\x7b\x59\x3a\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xfd\x73\x4f\x2e\xe4\x73\x4f\x2e\x9f\x73\x4f\x2e\x3e\x73\x4f\x2e\
-\x05\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x21\x73\x4f\x2e\x95\x73\x4f\x2e\
-\xf0\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2c\xff\x90\x74\x5a\xff\xf3\xf0\xed\xff\xf9\xf7\xf6\
-\xff\xa7\x91\x7c\xff\x73\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xef\x73\x4f\x2e\
-\x92\x73\x4f\x2e\x1f\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x3f\x73\x4f\x2e\xcd\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x7f\x5e\x40\xff\xe9\xe3\xde\xff\xff\xff\xff\
-\xff\xf1\xee\xea\xff\x95\x79\x60\xff\x71\x4d\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xca\x73\x4f\x2e\x3d\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x4d\x73\x4f\x2e\xe1\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2d\xff\x81\x61\x43\xff\xeb\xe6\xe1\xff\xfe\xfe\xfe\
-\xff\xff\xff\xfe\xff\xce\xc1\xb5\xff\x75\x52\x31\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xde\x73\x4f\x2e\x4a\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x40\x73\x4f\x2e\
-\xe1\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x83\x63\x46\xff\xed\xe9\xe5\xff\xf9\xf7\xf5\
-\xff\xf8\xf6\xf5\xff\xdf\xd7\xcf\xff\x79\x57\x37\xff\x73\x4f\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xdd\x73\x4f\x2e\
-\x3d\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x22\x73\x4f\x2e\xcc\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x72\x4e\x2c\xff\x84\x65\x48\xff\xef\xea\xe6\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xc2\xb2\xa4\xff\x73\x50\x2f\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc8\x73\x4f\x2e\x1e\x73\x4f\x2e\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x04\x73\x4f\x2e\x95\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\x8c\x6e\x53\xff\xf3\xf0\xed\xff\xff\xff\xff\
-\xff\xde\xd6\xce\xff\x85\x66\x49\xff\x72\x4e\x2c\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x91\x73\x4f\x2e\x03\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x42\x73\x4f\x2e\xef\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x87\x68\x4b\xff\xd7\xcd\xc4\xff\xff\xff\xff\xff\xf5\xf2\xf0\
-\xff\x92\x76\x5c\xff\x71\x4c\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xec\x73\x4f\x2e\x3c\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x05\x73\x4f\x2e\xa2\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7e\x5d\x3f\
-\xff\xd8\xce\xc5\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf1\xee\xeb\
-\xff\x87\x68\x4c\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x9d\x73\x4f\x2e\x04\x73\x4f\x2e\
-\x32\x73\x4f\x2e\xe4\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\xff\xa6\x8f\x7a\
-\xff\xfd\xfc\xfb\xff\xda\xd0\xc8\xff\xf7\xf5\xf3\xff\xf4\xf1\xee\
-\xff\x8a\x6c\x50\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe1\x73\x4f\x2e\x2e\x73\x4f\x2e\
-\x77\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\xff\xab\x96\x82\
-\xff\xfe\xfd\xfd\xff\xd1\xc5\xbb\xff\xf6\xf4\xf2\xff\xf5\xf2\xf0\
-\xff\x8c\x6e\x53\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\x72\x73\x4f\x2e\
-\xb6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x86\x67\x4a\
-\xff\xe5\xde\xd8\xff\xfe\xfe\xfe\xff\xff\xff\xff\xff\xf6\xf3\xf1\
-\xff\x8d\x6f\x54\xff\x71\x4d\x2b\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb0\x73\x4f\x2e\
-\xe0\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\
-\xff\x91\x74\x5a\xff\xe1\xd9\xd2\xff\xff\xff\xff\xff\xfa\xf9\xf8\
-\xff\xa5\x8e\x79\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xdb\x73\x4f\x2e\
-\xfa\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x70\x4b\x2a\xff\x9a\x80\x69\xff\xfb\xf9\xf8\xff\xff\xff\xff\
-\xff\xf5\xf3\xf1\xff\xb7\xa4\x93\xff\x78\x56\x36\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf4\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\x97\x7c\x63\xff\xfa\xf9\xf8\xff\xfd\xfd\xfc\
-\xff\xf2\xef\xec\xff\xfc\xfb\xfa\xff\xb7\xa5\x94\xff\x74\x50\x2f\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\x9a\x7f\x68\xff\xfc\xfb\xfa\xff\xfa\xf8\xf7\
-\xff\xab\x96\x82\xff\xe7\xe1\xdc\xff\xea\xe5\xe0\xff\x80\x5f\x42\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xf9\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\x9c\x83\x6b\xff\xfc\xfc\xfb\xff\xfb\xfa\xf9\
-\xff\xc6\xb7\xaa\xff\xf2\xee\xeb\xff\xe0\xd9\xd1\xff\x7c\x5a\x3c\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xf4\x73\x4f\x2e\
-\xdf\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x70\x4b\x29\xff\x9d\x84\x6d\xff\xfd\xfc\xfc\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xef\xeb\xe7\xff\x9d\x83\x6c\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xda\x73\x4f\x2e\
-\xb6\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4d\x2c\
-\xff\x86\x67\x4b\xff\xcb\xbe\xb2\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xda\xd1\xc8\xff\x91\x75\x5b\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb0\x73\x4f\x2e\
-\x76\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x74\x50\x2f\xff\xa3\x8b\x75\
-\xff\xea\xe5\xe0\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfd\xfd\
-\xff\xa2\x8a\x74\xff\x6f\x4a\x28\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\x6f\x73\x4f\x2e\
-\x2f\x73\x4f\x2e\xe3\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2c\xff\x9b\x81\x6a\xff\xf5\xf3\xf1\
-\xff\xed\xe9\xe5\xff\xd7\xcd\xc3\xff\xfe\xfe\xfe\xff\xfe\xfe\xfe\
-\xff\xa3\x8c\x76\xff\x71\x4c\x2a\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xe0\x73\x4f\x2e\x2c\x73\x4f\x2e\
-\x05\x73\x4f\x2e\x9e\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4d\x2c\xff\xc0\xb0\xa1\xff\xff\xff\xff\
-\xff\xa8\x92\x7d\xff\xa7\x90\x7b\xff\xff\xff\xff\xff\xff\xff\xfe\
-\xff\xa6\x8f\x7a\xff\x71\x4c\x2a\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\x9c\x73\x4f\x2e\x03\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x3f\x73\x4f\x2e\xee\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\xa4\x8d\x77\xff\xfa\xf9\xf8\
-\xff\xe4\xdd\xd7\xff\xd2\xc7\xbc\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xa9\x92\x7e\xff\x71\x4c\x2a\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xeb\x73\x4f\x2e\x3b\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x04\x73\x4f\x2e\x92\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x76\x53\x33\xff\xb0\x9c\x8a\
-\xff\xf2\xee\xeb\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xae\x99\x86\xff\x6f\x4a\x28\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\x8e\x73\x4f\x2e\x03\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1f\x73\x4f\x2e\xc9\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x8e\x71\x56\xff\xd7\xcd\xc3\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe8\xe2\xdc\xff\xac\x97\x84\xff\x7d\x5c\x3e\xff\x72\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xc6\x73\x4f\x2e\x1d\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x3d\x73\x4f\x2e\
-\xde\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x6f\x4a\x29\xff\xb3\xa0\x8e\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfc\xfb\xfa\xff\xfd\xfd\xfc\xff\xdd\xd4\xcc\xff\x91\x74\x5a\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xdb\x73\x4f\x2e\
-\x39\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x4a\x73\x4f\x2e\xdd\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xb7\xa5\x94\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xc5\xb6\xa9\xff\xbe\xad\x9e\xff\xf8\xf7\xf5\xff\xe2\xda\xd4\
-\xff\x80\x5f\x42\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xdb\x73\x4f\x2e\x43\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x3d\x73\x4f\x2e\xc9\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4d\x2b\xff\xba\xa8\x98\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xb5\xa2\x91\xff\x85\x65\x48\xff\xe4\xdd\xd6\xff\xf6\xf3\xf1\
-\xff\x8c\x6f\x54\xff\x71\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xc6\x73\x4f\x2e\x39\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1e\x73\x4f\x2e\x91\x73\x4f\x2e\
-\xed\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x71\x4c\x2b\xff\xbc\xab\x9b\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xe1\xda\xd3\xff\xe6\xe0\xda\xff\xfe\xfd\xfd\xff\xc8\xba\xae\
-\xff\x78\x56\x36\xff\x73\x4f\x2d\xff\x73\x4f\x2e\xec\x73\x4f\x2e\
-\x8e\x73\x4f\x2e\x1d\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x04\x73\x4f\x2e\
-\x3b\x73\x4f\x2e\x9d\x73\x4f\x2e\xe2\x73\x4f\x2e\xfc\x73\x4f\x2e\
-\xff\x7a\x58\x39\xff\xca\xbc\xaf\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xfe\xfe\xfe\xff\xea\xe5\xe0\xff\xb3\x9f\x8d\xff\x7c\x5a\x3b\
-\xfc\x72\x4e\x2d\xe1\x73\x4f\x2e\x9c\x73\x4f\x2e\x3a\x73\x4f\x2e\
-\x04\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x05\x73\x4f\x2e\x2d\x72\x4d\x2c\x72\x84\x65\x48\
-\xb1\xcc\xbe\xb2\xdc\xf8\xf6\xf5\xf5\xff\xff\xff\xff\xff\xff\xff\
-\xff\xd9\xcf\xc6\xf5\x8b\x6d\x51\xda\x72\x4d\x2c\xb0\x71\x4d\x2b\
-\x6f\x73\x4f\x2e\x2b\x73\x4f\x2e\x04\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\x01\
-\xff\xfe\x00\x00\x7f\xfc\x00\x00\x3f\xf8\x00\x00\x1f\xf0\x00\x00\
-\x0f\xe0\x00\x00\x07\xc0\x00\x00\x03\x80\x00\x00\x01\x80\x00\x00\
-\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x01\x80\x00\x00\
-\x01\xc0\x00\x00\x03\xe0\x00\x00\x07\xf0\x00\x00\x0f\xf8\x00\x00\
-\x1f\xfc\x00\x00\x3f\xfe\x00\x00\x7f\xff\x80\x01\xff\x28\x00\x00\
-\x00\x10\x00\x00\x00\x20\x00\x00\x00\x01\x00\x20\x00\x00\x00\x00\
-\x00\x00\x04\x00\x00\xe5\x4c\x00\x00\xe5\x4c\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x08\x73\x4f\x2e\x4e\x72\x4d\x2c\xad\x83\x63\x46\
-\xe8\xe8\xe3\xdd\xfe\xb4\xa0\x8e\xfd\x70\x4b\x29\xe7\x73\x4f\x2e\
-\xac\x73\x4f\x2e\x4c\x73\x4f\x2e\x08\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x1b\x73\x4f\x2e\x98\x73\x4f\x2e\xf1\x73\x4f\x2e\xff\x72\x4e\x2d\
-\xff\xbf\xae\x9f\xff\xdf\xd7\xcf\xff\x81\x61\x44\xff\x72\x4e\x2d\
-\xff\x73\x4f\x2e\xf0\x73\x4f\x2e\x96\x73\x4f\x2e\x1a\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x1b\x73\x4f\x2e\
-\xb7\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4c\x2b\
-\xff\xb6\xa4\x93\xff\xfd\xfc\xfc\xff\xa7\x91\x7c\xff\x71\x4c\x2b\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb5\x73\x4f\x2e\
-\x1a\x73\x4f\x2e\x00\x73\x4f\x2e\x07\x73\x4f\x2e\x98\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x71\x4d\x2c\
-\xff\xbf\xaf\xa0\xff\xf1\xed\xea\xff\x91\x75\x5b\xff\x71\x4d\x2c\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\x96\x73\x4f\x2e\x07\x73\x4f\x2e\x4f\x73\x4f\x2e\xf0\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\xff\x99\x7f\x67\
-\xff\xef\xeb\xe8\xff\xc2\xb3\xa4\xff\x72\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xee\x73\x4f\x2e\x4c\x73\x4f\x2e\xad\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x74\x50\x2f\xff\xc8\xb9\xac\
-\xff\xf3\xef\xed\xff\xbd\xad\x9d\xff\x71\x4d\x2b\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xaa\x73\x4f\x2e\xe7\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x9f\x86\x6f\
-\xff\xf2\xee\xeb\xff\xca\xbd\xb0\xff\x75\x51\x31\xff\x73\x4e\x2d\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xe4\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\xca\xbc\xb0\xff\xf4\xf2\xef\xff\xb5\xa2\x90\xff\x76\x52\x32\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\xfd\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2c\
-\xff\xc8\xba\xad\xff\xe8\xe2\xdc\xff\xda\xd0\xc7\xff\x80\x5f\x41\
-\xff\x72\x4e\x2d\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xfc\x73\x4f\x2e\xe7\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x7e\x5d\x3f\
-\xff\xd9\xcf\xc6\xff\xf1\xee\xeb\xff\xa6\x8f\x7a\xff\x74\x50\x2f\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xe4\x73\x4f\x2e\xac\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x84\x64\x47\xff\xce\xc1\xb6\
-\xff\xf4\xf1\xee\xff\xcf\xc2\xb7\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xa9\x73\x4f\x2e\x4d\x73\x4f\x2e\xef\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x71\x4d\x2b\xff\x97\x7c\x64\xff\xde\xd5\xcd\
-\xff\xe5\xde\xd8\xff\xcf\xc3\xb8\xff\x73\x4e\x2d\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\xee\x73\x4f\x2e\x4b\x73\x4f\x2e\x07\x73\x4f\x2e\x96\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x77\x54\x34\xff\xab\x95\x81\
-\xff\xf2\xef\xeb\xff\xe4\xdc\xd6\xff\x8d\x70\x55\xff\x73\x4f\x2e\
-\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x73\x4f\x2e\
-\x94\x73\x4f\x2e\x06\x73\x4f\x2e\x00\x73\x4f\x2e\x1b\x73\x4f\x2e\
-\xb5\x73\x4f\x2e\xff\x73\x4f\x2e\xff\x72\x4e\x2d\xff\x75\x51\x31\
-\xff\xd7\xcd\xc3\xff\xf0\xec\xe8\xff\xd7\xcd\xc4\xff\x9d\x84\x6d\
-\xff\x72\x4d\x2c\xff\x73\x4f\x2e\xff\x73\x4f\x2e\xb2\x73\x4f\x2e\
-\x19\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\x00\x73\x4f\x2e\
-\x1a\x73\x4f\x2e\x96\x73\x4f\x2e\xf0\x73\x4f\x2e\xff\x76\x53\x33\
-\xff\xd9\xcf\xc6\xff\xe7\xe0\xdb\xff\xd5\xcb\xc1\xff\xae\x9a\x87\
-\xff\x71\x4d\x2b\xef\x73\x4f\x2e\x94\x73\x4f\x2e\x19\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x4f\x2e\
-\x00\x73\x4f\x2e\x08\x73\x4f\x2e\x4b\x72\x4e\x2c\xab\x8e\x71\x57\
-\xe5\xea\xe5\xe0\xfc\xf6\xf3\xf1\xfc\xb8\xa6\x95\xe5\x7d\x5c\x3e\
-\xa9\x71\x4d\x2c\x4b\x73\x4f\x2e\x07\x73\x4f\x2e\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xe0\x07\x00\x00\xc0\x03\x00\x00\x80\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x01\x00\x00\xc0\x03\x00\
-\x00\xe0\x07\x00\x00\
-\x00\x00\x03\x23\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x33\x20\x31\x2e\x30\x30\x39\x37\x36\x35\x36\x20\
-\x43\x20\x33\x20\x31\x2e\x30\x30\x39\x37\x36\x35\x36\x20\x32\x20\
-\x31\x2e\x30\x30\x39\x37\x36\x35\x36\x20\x32\x20\x32\x2e\x30\x30\
-\x39\x37\x36\x35\x36\x20\x4c\x20\x32\x20\x31\x31\x2e\x30\x30\x35\
-\x38\x35\x39\x20\x4c\x20\x32\x20\x31\x34\x2e\x30\x30\x39\x37\x36\
-\x36\x20\x43\x20\x32\x20\x31\x35\x2e\x30\x30\x39\x37\x36\x36\x20\
-\x33\x20\x31\x35\x2e\x30\x30\x39\x37\x36\x36\x20\x33\x20\x31\x35\
-\x2e\x30\x30\x39\x37\x36\x36\x20\x4c\x20\x31\x33\x20\x31\x35\x2e\
-\x30\x30\x39\x37\x36\x36\x20\x43\x20\x31\x34\x20\x31\x35\x2e\x30\
-\x30\x39\x37\x36\x36\x20\x31\x34\x20\x31\x34\x2e\x30\x30\x39\x37\
-\x36\x36\x20\x31\x34\x20\x31\x34\x2e\x30\x30\x39\x37\x36\x36\x20\
-\x4c\x20\x31\x34\x20\x39\x2e\x37\x35\x39\x37\x36\x35\x36\x20\x4c\
-\x20\x31\x32\x20\x31\x31\x2e\x30\x30\x39\x37\x36\x36\x20\x4c\x20\
-\x31\x32\x20\x31\x33\x2e\x30\x30\x39\x37\x36\x36\x20\x4c\x20\x34\
-\x20\x31\x33\x2e\x30\x30\x39\x37\x36\x36\x20\x4c\x20\x34\x20\x33\
-\x2e\x30\x31\x33\x36\x37\x31\x39\x20\x4c\x20\x31\x32\x20\x33\x2e\
-\x30\x31\x33\x36\x37\x31\x39\x20\x4c\x20\x31\x32\x20\x35\x2e\x30\
-\x30\x39\x37\x36\x35\x36\x20\x4c\x20\x31\x34\x20\x36\x2e\x32\x35\
-\x39\x37\x36\x35\x36\x20\x4c\x20\x31\x34\x20\x32\x2e\x30\x30\x39\
-\x37\x36\x35\x36\x20\x43\x20\x31\x34\x20\x31\x2e\x30\x30\x39\x37\
-\x36\x35\x36\x20\x31\x33\x20\x31\x2e\x30\x30\x39\x37\x36\x35\x36\
-\x20\x31\x33\x20\x31\x2e\x30\x30\x39\x37\x36\x35\x36\x20\x4c\x20\
-\x33\x20\x31\x2e\x30\x30\x39\x37\x36\x35\x36\x20\x7a\x20\x4d\x20\
-\x31\x30\x20\x35\x2e\x30\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x31\
-\x30\x20\x37\x2e\x30\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x36\x20\
-\x37\x2e\x30\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x36\x20\x39\x2e\
-\x30\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x31\x30\x20\x39\x2e\x30\
-\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x31\x30\x20\x31\x31\x2e\x30\
-\x30\x37\x38\x31\x32\x20\x4c\x20\x31\x34\x2e\x35\x20\x38\x2e\x30\
-\x30\x37\x38\x31\x32\x35\x20\x4c\x20\x31\x30\x20\x35\x2e\x30\x30\
-\x37\x38\x31\x32\x35\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x01\x5f\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x33\x20\x37\x20\x4c\x20\x33\x20\x39\x20\x4c\x20\
-\x31\x33\x20\x39\x20\x4c\x20\x31\x33\x20\x37\x20\x4c\x20\x33\x20\
-\x37\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x2f\
-\x3c\
-\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\
-\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\
-\x22\x3e\x0a\x20\x3c\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x74\
-\x79\x6c\x65\x20\x69\x64\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x2d\
-\x63\x6f\x6c\x6f\x72\x2d\x73\x63\x68\x65\x6d\x65\x22\x20\x74\x79\
-\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x20\
-\x20\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\
-\x65\x78\x74\x20\x7b\x20\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x63\x36\
-\x31\x36\x63\x3b\x20\x7d\x20\x2e\x43\x6f\x6c\x6f\x72\x53\x63\x68\
-\x65\x6d\x65\x2d\x48\x69\x67\x68\x6c\x69\x67\x68\x74\x20\x7b\x20\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x35\x32\x39\x34\x65\x32\x3b\x20\x7d\
-\x0a\x20\x20\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x63\x75\x72\x72\x65\x6e\x74\x43\
-\x6f\x6c\x6f\x72\x22\x20\x63\x6c\x61\x73\x73\x3d\x22\x43\x6f\x6c\
-\x6f\x72\x53\x63\x68\x65\x6d\x65\x2d\x54\x65\x78\x74\x22\x20\x64\
-\x3d\x22\x4d\x20\x35\x2e\x39\x39\x38\x30\x34\x36\x39\x20\x31\x2e\
-\x30\x31\x39\x35\x33\x31\x32\x20\x4c\x20\x35\x2e\x39\x39\x38\x30\
-\x34\x36\x39\x20\x37\x2e\x30\x31\x39\x35\x33\x31\x32\x20\x4c\x20\
-\x33\x2e\x36\x35\x38\x32\x30\x33\x31\x20\x37\x2e\x30\x31\x39\x35\
-\x33\x31\x32\x20\x4c\x20\x37\x2e\x39\x39\x30\x32\x33\x34\x34\x20\
-\x31\x33\x2e\x33\x32\x34\x32\x31\x39\x20\x4c\x20\x31\x32\x2e\x33\
-\x37\x31\x30\x39\x34\x20\x37\x2e\x30\x31\x39\x35\x33\x31\x32\x20\
-\x4c\x20\x39\x2e\x39\x39\x38\x30\x34\x36\x39\x20\x37\x2e\x30\x31\
-\x39\x35\x33\x31\x32\x20\x4c\x20\x39\x2e\x39\x39\x38\x30\x34\x36\
-\x39\x20\x31\x2e\x30\x34\x38\x38\x32\x38\x31\x20\x4c\x20\x35\x2e\
-\x39\x39\x38\x30\x34\x36\x39\x20\x31\x2e\x30\x31\x39\x35\x33\x31\
-\x32\x20\x7a\x20\x4d\x20\x31\x20\x31\x34\x2e\x30\x33\x31\x32\x35\
-\x20\x4c\x20\x31\x20\x31\x36\x20\x4c\x20\x31\x35\x2e\x30\x30\x35\
-\x38\x35\x39\x20\x31\x36\x20\x4c\x20\x31\x35\x20\x31\x34\x2e\x30\
-\x33\x31\x32\x35\x20\x4c\x20\x31\x20\x31\x34\x2e\x30\x33\x31\x32\
-\x35\x20\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x0b\x66\x08\x22\
-\x00\x54\
-\x00\x6f\x00\x6f\x00\x6c\x00\x42\x00\x61\x00\x72\
-\x00\x06\
-\x04\x90\x2a\xc2\
-\x00\x42\
-\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\
-\x00\x11\
-\x01\xa6\xc9\x07\
-\x00\x64\
-\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2d\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x14\
-\x07\x40\xaf\x47\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x69\x00\x63\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2d\x00\x65\x00\x78\x00\x69\x00\x74\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x45\
-\x00\xcd\xf7\x27\
-\x00\x61\
-\x00\x70\x00\x70\x00\x6c\x00\x69\x00\x63\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2d\x00\x76\x00\x6e\x00\x64\x00\x2e\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x78\x00\x6d\x00\x6c\x00\x66\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x73\x00\x2d\x00\x6f\x00\x66\
-\x00\x66\x00\x69\x00\x63\x00\x65\x00\x64\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x70\x00\x72\
-\x00\x65\x00\x61\x00\x64\x00\x73\x00\x68\x00\x65\x00\x65\x00\x74\x00\x6d\x00\x6c\x00\x2e\x00\x73\x00\x68\x00\x65\x00\x65\x00\x74\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x13\
-\x0c\x8b\x3b\x07\
-\x00\x6c\
-\x00\x69\x00\x73\x00\x74\x00\x2d\x00\x72\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x2d\x00\x61\x00\x6c\x00\x6c\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x1c\
-\x08\x06\xc8\xe7\
-\x00\x72\
-\x00\x65\x00\x73\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x2d\x00\x63\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\
-\x00\x2d\x00\x69\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x09\xc6\x14\xa7\
-\x00\x6c\
-\x00\x69\x00\x73\x00\x74\x00\x2d\x00\x61\x00\x64\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0a\x61\x42\x7f\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
-\x00\x13\
-\x01\x1b\xca\x67\
-\x00\x64\
-\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2d\x00\x65\x00\x78\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x0f\
-\x02\x30\x86\x67\
-\x00\x6c\
-\x00\x69\x00\x73\x00\x74\x00\x2d\x00\x72\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0f\xe3\xd8\xe7\
-\x00\x64\
-\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2d\x00\x73\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x03\
-\x00\x00\x00\x7c\x00\x01\x00\x00\x00\x01\x00\x00\x04\xe0\
-\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x01\xe3\x24\
-\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x01\xe6\x4b\
-\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x02\x10\
-\x00\x00\x01\x38\x00\x00\x00\x00\x00\x01\x00\x00\x16\xbc\
-\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xa5\
-\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x3a\
-\x00\x00\x01\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x13\x83\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x01\xe7\xae\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x7c\x00\x01\x00\x00\x00\x01\x00\x00\x04\xe0\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x01\xe3\x24\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x01\xe6\x4b\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x02\x10\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\x38\x00\x00\x00\x00\x00\x01\x00\x00\x16\xbc\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\x76\x00\x00\x00\x00\x00\x01\x00\x00\x1a\xa5\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\x94\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x3a\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x13\x83\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x01\xe7\xae\
-\x00\x00\x01\x70\x57\xb4\x0b\xff\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
+RCC_DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons.rcc')
 
 def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return QtCore.QResource.registerResource(RCC_DATEI)
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    return QtCore.QResource.unregisterResource(RCC_DATEI)
 
 qInitResources()
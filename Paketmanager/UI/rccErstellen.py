@@ -0,0 +1,38 @@
+"""Erstellt eine binaere Qt Ressource (.rcc) aus der Ausgabe von pyrcc5
+
+pyrcc5 kann keine binaeren Ressourcen schreiben. Die Python Datei, die es
+erstellt, enthaelt aber die gleichen drei Bloecke wie eine .rcc Datei (Baum,
+Daten und Namen), es fehlt nur der Header.
+
+Aufruf: python rccErstellen.py icons_rc_pyrcc5.py icons.rcc
+"""
+
+import runpy
+import struct
+import sys
+
+RCC_MAGIC = b'qres'
+RCC_VERSION = 2
+# Magic, Version und die drei Offsets
+RCC_HEADER_GROESSE = 4 + 4 * 4
+
+def rccErstellen(pyrccDatei, rccDatei):
+    """Schreibt die Ressourcen aus pyrccDatei als .rcc Datei"""
+    ressourcen = runpy.run_path(pyrccDatei)
+    baum = ressourcen['qt_resource_struct_v2']
+    daten = ressourcen['qt_resource_data']
+    namen = ressourcen['qt_resource_name']
+
+    baumOffset = RCC_HEADER_GROESSE
+    datenOffset = baumOffset + len(baum)
+    namenOffset = datenOffset + len(daten)
+    with open(rccDatei, 'wb') as datei:
+        datei.write(RCC_MAGIC)
+        datei.write(struct.pack('>IIII', RCC_VERSION,
+                                baumOffset, datenOffset, namenOffset))
+        datei.write(baum)
+        datei.write(daten)
+        datei.write(namen)
+
+if __name__ == '__main__':
+    rccErstellen(sys.argv[1], sys.argv[2])
@@ -0,0 +1,316 @@
+"""Verfolgung der Benachrichtigungen von ObserverSubject
+
+Aenderungen laufen als Kette von Benachrichtigungen durch die Anwendung:
+ExcelDaten benachrichtigt Regeln und KategorieModel, Regeln wertet die
+Regeln neu aus und benachrichtigt RegelListe und InfoTable. Ist eine
+Verfolgung aktiv, ruft ObserverSubject.notifyObserver die Observer ueber die
+Verfolgung auf. Pro Benachrichtigung werden die Quelle, der Ausloeser (die
+Methode, die notifyObserver aufgerufen hat), die Anzahl Observer und die Zeit
+jedes update() erfasst, zusammen mit den Benachrichtigungen, die ein update()
+selbst ausloest.
+
+Die Benachrichtigungen werden zu Aktionen zusammengefasst, z.B. "Rohdaten
+laden" oder "Regel hinzufuegen":
+
+    with Verfolgung() as verfolgung:
+        with verfolgung.aktion('Rohdaten laden'):
+            excelDaten.dataframe = daten
+            excelDaten.addKategorie('00.0010')
+    print(verfolgung.bericht())
+
+Ausserhalb von aktion beginnt die erste Benachrichtigung eine neue Aktion,
+die bis zum Aufruf von aktionBeenden dauert. Die GUI beendet sie, sobald die
+Ereignisschleife wieder laeuft, eine Aktion ist dann alles, was ein Klick
+ausloest. Wird in einer Aktion dasselbe Subjekt mehrmals benachrichtigt oder
+derselbe Observer mehrmals aufgerufen, sind die weiteren Aufrufe redundant.
+
+Verfolgt wird nur der Thread, der die Verfolgung gestartet hat, z.B. der GUI
+Thread. Benachrichtigungen der Jobs aus anderen Threads laufen unveraendert.
+"""
+
+import collections
+import contextlib
+import datetime
+import json
+import sys
+import threading
+import time
+
+VERFOLGUNG_FORMAT = 'Paketmanager-Benachrichtigungen'
+VERFOLGUNG_VERSION = 1
+
+# Die aktive Verfolgung oder None
+_aktiv = None
+
+def aktiveVerfolgung():
+    """Gibt die Verfolgung zurueck, wenn sie im aktuellen Thread aktiv ist,
+    sonst None"""
+    verfolgung = _aktiv
+    if verfolgung is None or verfolgung.thread != threading.get_ident():
+        return None
+    return verfolgung
+
+def ausloeser(tiefe):
+    """Gibt den Namen der Methode zurueck, die tiefe Aufrufe weiter oben
+    steht, z.B. 'Regeln.addRegel'"""
+    code = sys._getframe(tiefe + 1).f_code
+    return getattr(code, 'co_qualname', code.co_name)
+
+class Update:
+    """Ein Aufruf von update() eines Observers"""
+
+    def __init__(self, observer):
+        self.observer = type(observer).__name__
+        self.zeit = None
+        # Zeit ohne die darin ausgeloesten Benachrichtigungen
+        self.eigenzeit = None
+        self.benachrichtigungen = []
+
+    def alsDict(self):
+        return {
+            'observer': self.observer,
+            'zeit': self.zeit,
+            'eigenzeit': self.eigenzeit,
+            'benachrichtigungen': [b.alsDict()
+                                   for b in self.benachrichtigungen],
+            }
+
+class Benachrichtigung:
+    """Ein Aufruf von notifyObserver mit den Updates aller Observer"""
+
+    def __init__(self, subjekt, ausloeser, anzahlObserver):
+        self.quelle = type(subjekt).__name__
+        self.ausloeser = ausloeser
+        self.fanOut = anzahlObserver
+        self.zeit = None
+        self.updates = []
+
+    def alsDict(self):
+        return {
+            'quelle': self.quelle,
+            'ausloeser': self.ausloeser,
+            'fanOut': self.fanOut,
+            'zeit': self.zeit,
+            'updates': [u.alsDict() for u in self.updates],
+            }
+
+class Aktion:
+    """Alle Benachrichtigungen, die eine Aktion ausloest"""
+
+    def __init__(self, name):
+        self.name = name
+        self.zeitpunkt = datetime.datetime.now().isoformat(timespec='seconds')
+        self.benachrichtigungen = []
+        # id -> Anzahl Benachrichtigungen bzw. Updates, id -> Klassenname
+        self._subjekte = collections.Counter()
+        self._observer = collections.Counter()
+        self._namen = {}
+
+    def zaehlen(self, subjekt, observer):
+        """Zaehlt eine Benachrichtigung des Subjekts an die Observer"""
+        self._subjekte[id(subjekt)] += 1
+        self._namen[id(subjekt)] = type(subjekt).__name__
+        for o in observer:
+            self._observer[id(o)] += 1
+            self._namen[id(o)] = type(o).__name__
+
+    def anzahlBenachrichtigungen(self):
+        return sum(self._subjekte.values())
+
+    def anzahlUpdates(self):
+        return sum(self._observer.values())
+
+    def zeit(self):
+        """Gibt die Zeit aller Benachrichtigungen der Aktion zurueck"""
+        return sum(b.zeit for b in self.benachrichtigungen)
+
+    def _redundant(self, zaehler):
+        redundant = collections.Counter()
+        for objekt, anzahl in zaehler.items():
+            if anzahl > 1:
+                redundant[self._namen[objekt]] += anzahl - 1
+        return dict(redundant)
+
+    def redundant(self):
+        """Gibt die redundanten Aufrufe der Aktion zurueck
+
+        :returns: Dict mit 'benachrichtigungen' (Klassenname des Subjekts ->
+        Anzahl weitere Benachrichtigungen) und 'updates' (Klassenname des
+        Observers -> Anzahl weitere Aufrufe von update)
+        """
+        return {
+            'benachrichtigungen': self._redundant(self._subjekte),
+            'updates': self._redundant(self._observer),
+            }
+
+    def alsDict(self):
+        return {
+            'format': VERFOLGUNG_FORMAT,
+            'version': VERFOLGUNG_VERSION,
+            'aktion': self.name,
+            'zeitpunkt': self.zeitpunkt,
+            'anzahlBenachrichtigungen': self.anzahlBenachrichtigungen(),
+            'anzahlUpdates': self.anzahlUpdates(),
+            'zeit': self.zeit(),
+            'redundant': self.redundant(),
+            'benachrichtigungen': [b.alsDict()
+                                   for b in self.benachrichtigungen],
+            }
+
+    def text(self):
+        """Gibt die Aktion mit ihren Benachrichtigungen als Text zurueck"""
+        redundant = self.redundant()
+        zeilen = ['{}: {} Benachrichtigungen, {} Updates, {:.1f} ms'.format(
+            self.name, self.anzahlBenachrichtigungen(), self.anzahlUpdates(),
+            self.zeit() * 1000)]
+        for art in ['benachrichtigungen', 'updates']:
+            if redundant[art]:
+                zeilen.append('  redundante {}: {}'.format(art.capitalize(),
+                    ', '.join('{} {}x'.format(name, anzahl) for name, anzahl
+                              in sorted(redundant[art].items()))))
+
+        def hinzufuegen(benachrichtigung, tiefe):
+            zeilen.append('{}{} ({}) -> {} Observer, {:.1f} ms'.format(
+                '  ' * tiefe, benachrichtigung.quelle,
+                benachrichtigung.ausloeser, benachrichtigung.fanOut,
+                benachrichtigung.zeit * 1000))
+            for update in benachrichtigung.updates:
+                zeilen.append('{}{}.update {:.1f} ms (eigen {:.1f} ms)'.format(
+                    '  ' * (tiefe + 1), update.observer, update.zeit * 1000,
+                    update.eigenzeit * 1000))
+                for kind in update.benachrichtigungen:
+                    hinzufuegen(kind, tiefe + 2)
+        for benachrichtigung in self.benachrichtigungen:
+            hinzufuegen(benachrichtigung, 1)
+        return '\n'.join(zeilen)
+
+class Verfolgung:
+    """Zeichnet die Benachrichtigungen von ObserverSubject auf"""
+
+    def __init__(self, protokollDatei=None, aktionGeoeffnet=None):
+        """
+        :protokollDatei: Optional, Datei, an die jede beendete Aktion als
+        eine Zeile JSON angehaengt wird
+        :aktionGeoeffnet: Optional, Funktion ohne Argumente, die aufgerufen
+        wird, wenn eine Benachrichtigung ausserhalb von aktion eine neue
+        Aktion beginnt. Sie sorgt dafuer, dass aktionBeenden aufgerufen wird.
+        """
+        self.protokollDatei = protokollDatei
+        self.aktionGeoeffnet = aktionGeoeffnet
+        # Wird mit jeder beendeten Aktion aufgerufen
+        self.aktionBeendet = None
+        self.aktionen = []
+        self.thread = None
+        self._aktion = None
+        # Offene Updates, das innerste zuletzt
+        self._updates = []
+
+    def starten(self):
+        """Aktiviert die Verfolgung im aktuellen Thread
+
+        :raises RuntimeError: Wenn schon eine Verfolgung aktiv ist
+        """
+        global _aktiv
+        if _aktiv is not None:
+            raise RuntimeError("Es ist schon eine Verfolgung aktiv")
+        self.thread = threading.get_ident()
+        _aktiv = self
+
+    def beenden(self):
+        """Beendet die offene Aktion und deaktiviert die Verfolgung"""
+        global _aktiv
+        self.aktionBeenden()
+        if _aktiv is self:
+            _aktiv = None
+
+    def __enter__(self):
+        self.starten()
+        return self
+
+    def __exit__(self, typ, wert, traceback):
+        self.beenden()
+        return False
+
+    @contextlib.contextmanager
+    def aktion(self, name):
+        """Fasst alle Benachrichtigungen im with Block zu einer Aktion
+        zusammen"""
+        self.aktionBeenden()
+        self._aktion = Aktion(name)
+        try:
+            yield self._aktion
+        finally:
+            self.aktionBeenden()
+
+    def aktionBeenden(self):
+        """Beendet die offene Aktion, wenn es eine gibt und gerade keine
+        Benachrichtigung laeuft"""
+        if self._aktion is None or self._updates:
+            return
+        aktion, self._aktion = self._aktion, None
+        if not aktion.benachrichtigungen:
+            return
+        self.aktionen.append(aktion)
+        if self.protokollDatei is not None:
+            with open(str(self.protokollDatei), 'a', encoding='utf-8') as datei:
+                datei.write(json.dumps(aktion.alsDict(), ensure_ascii=False)
+                            + '\n')
+        if self.aktionBeendet is not None:
+            self.aktionBeendet(aktion)
+
+    def benachrichtigen(self, subjekt, observer):
+        """Ruft update fuer alle Observer auf und zeichnet es auf. Wird von
+        ObserverSubject.notifyObserver aufgerufen.
+
+        :subjekt: Das ObserverSubject
+        :observer: Liste mit den Observern
+        """
+        if self._aktion is None:
+            self._aktion = Aktion(ausloeser(2))
+            if self.aktionGeoeffnet is not None:
+                self.aktionGeoeffnet()
+        aktion = self._aktion
+        observer = list(observer)
+        aktion.zaehlen(subjekt, observer)
+        benachrichtigung = Benachrichtigung(subjekt, ausloeser(2),
+                                            len(observer))
+        if self._updates:
+            self._updates[-1].benachrichtigungen.append(benachrichtigung)
+        else:
+            aktion.benachrichtigungen.append(benachrichtigung)
+
+        start = time.perf_counter()
+        try:
+            for o in observer:
+                update = Update(o)
+                benachrichtigung.updates.append(update)
+                self._updates.append(update)
+                updateStart = time.perf_counter()
+                try:
+                    o.update()
+                finally:
+                    self._updates.pop()
+                    update.zeit = time.perf_counter() - updateStart
+                    update.eigenzeit = update.zeit - sum(
+                        b.zeit for b in update.benachrichtigungen)
+        finally:
+            benachrichtigung.zeit = time.perf_counter() - start
+
+    def zusammenfassung(self):
+        """Fasst die redundanten Aufrufe ueber alle Aktionen zusammen
+
+        :returns: Liste mit Tupeln (Aktion, Anzahl Benachrichtigungen,
+        Anzahl Updates, Anzahl redundante Updates, Zeit), die Aktionen mit
+        den meisten redundanten Updates zuerst
+        """
+        zeilen = []
+        for aktion in self.aktionen:
+            redundant = sum(aktion.redundant()['updates'].values())
+            zeilen.append((aktion.name, aktion.anzahlBenachrichtigungen(),
+                           aktion.anzahlUpdates(), redundant, aktion.zeit()))
+        return sorted(zeilen, key=lambda zeile: -zeile[3])
+
+    def bericht(self):
+        """Gibt alle Aktionen mit ihren Benachrichtigungen als Text
+        zurueck"""
+        return '\n\n'.join(aktion.text() for aktion in self.aktionen)
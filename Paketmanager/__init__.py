@@ -1,2 +1,14 @@
-from .TarmedPaketmanager import TarmedPaketManagerApp as GUI
-from PyQt5.QtWidgets import QApplication
+"""Tarmed Paketmanager
+
+GUI und QApplication werden erst beim ersten Zugriff importiert, damit das
+Paket ohne PyQt5 und ohne die grossen Module importiert werden kann.
+"""
+
+def __getattr__(name):
+    if name == 'GUI':
+        from .TarmedPaketmanager import TarmedPaketManagerApp
+        return TarmedPaketManagerApp
+    if name == 'QApplication':
+        from PyQt5.QtWidgets import QApplication
+        return QApplication
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
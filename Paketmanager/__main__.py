@@ -0,0 +1,6 @@
+"""Aufruf ohne GUI mit python -m Paketmanager, siehe Kommandozeile"""
+
+import sys
+from .Kommandozeile import main
+
+sys.exit(main())
@@ -0,0 +1,376 @@
+"""Misst Laufzeit und Speicher der einzelnen Schritte und des ganzen Ablaufs
+
+Die Schritte werden auf synthetischen Rohdaten (siehe testdaten.py) in
+verschiedenen Groessen gemessen:
+
+ * einlesen: datenEinlesen einer CSV Datei
+ * pakete: createPakete
+ * regeln: Regeln erstellen und auswerten (regelnErstellen, wie Regel.update)
+ * export: writePaketeToExcel mit Kategorien
+ * export_parquet: paketeExportieren als Parquet
+ * gesamt: Kommandozeile.pipeline mit Regeln, Export der Pakete und Regeln
+
+Jede Messung laeuft in einem eigenen Prozess. Gemessen werden die Zeit
+(Median und Minimum ueber die Wiederholungen) und der Spitzenspeicher des
+Schritts, d.h. das hoechste RSS waehrend des Schritts minus das RSS vorher.
+Die Testdaten werden beim ersten Mal erzeugt und in benchmarks/daten
+gespeichert, es wird kein Netzwerk gebraucht. Der Speicher wird wie in der
+Anwendung mit Paketmanager.Messung bestimmt; wo das nicht geht (Windows),
+fehlt er in den Resultaten.
+
+Aufruf:
+
+    python benchmarks/pipeline.py
+    python benchmarks/pipeline.py --zeilen 10000 1000000 --regeln 10 100
+    python benchmarks/pipeline.py --stufen pakete regeln --speichern main
+    python benchmarks/pipeline.py --vergleich main
+
+Die Resultate werden in benchmarks/ergebnisse geschrieben. Mit --speichern
+NAME werden sie als Baseline in benchmarks/baselines/NAME.json gespeichert,
+mit --vergleich NAME (oder einem Dateinamen) wird ein Vergleich mit einer
+Baseline ausgegeben. Baselines sind nur auf dem gleichen Rechner
+vergleichbar.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARKS = pathlib.Path(__file__).resolve().parent
+REPO = BENCHMARKS.parent
+sys.path.insert(0, str(REPO))
+
+from Paketmanager.Messung import speicherStatus, spitzeZuruecksetzen
+
+DATEN = BENCHMARKS / 'daten'
+ERGEBNISSE = BENCHMARKS / 'ergebnisse'
+BASELINES = BENCHMARKS / 'baselines'
+
+BENCHMARK_FORMAT = 'Paketmanager-Benchmark'
+BENCHMARK_VERSION = 1
+
+STUFEN = ['einlesen', 'pakete', 'regeln', 'export', 'export_parquet',
+          'gesamt']
+# Stufen, deren Resultat von der Anzahl Regeln abhaengt
+REGEL_STUFEN = ['regeln', 'gesamt']
+
+# Anzahl Kategorien der Testdaten
+KATEGORIEN = 5
+
+def messen(funktion, wiederholungen):
+    """Fuehrt eine Funktion mehrmals aus und misst Zeit und Speicher
+
+    :returns: Dict mit zeiten (Sekunden) und speicher (Bytes oder None, wenn
+    der Speicher nicht bestimmt werden kann)
+    """
+    zeiten = []
+    speicher = 0
+    for _ in range(wiederholungen):
+        gc.collect()
+        spitzeZuruecksetzen()
+        vorher, _ = speicherStatus()
+        start = time.perf_counter()
+        funktion()
+        zeiten.append(time.perf_counter() - start)
+        _, spitze = speicherStatus()
+        if spitze is None:
+            speicher = None
+        elif speicher is not None:
+            speicher = max(speicher, spitze - (vorher or 0))
+    return {'zeiten': zeiten, 'speicher': speicher}
+
+def stufeVorbereiten(stufe, rohdaten, regelDatei, ordner):
+    """Bereitet die Daten einer Stufe vor, ohne sie zu messen
+
+    :returns: Tupel (Funktion, die gemessen wird, Dict mit Kennzahlen)
+    """
+    from Paketmanager.ExcelCalc import datenEinlesen, createPakete
+    from Paketmanager.ExcelCalc import regelnLaden, regelnErstellen
+    from Paketmanager.ExcelCalc import writePaketeToExcel
+    from Paketmanager.Export import paketeExportieren
+    from Paketmanager.Kern import Datensatz
+    from Paketmanager.Kommandozeile import pipeline
+
+    rohdaten = str(rohdaten)
+    ordner = pathlib.Path(ordner)
+    if stufe == 'einlesen':
+        return (lambda: datenEinlesen(rohdaten)), {}
+    if stufe == 'gesamt':
+        return (lambda: pipeline(
+            [rohdaten], ordner / 'pakete.xlsx', regelDatei,
+            kategorien=testdatenKategorien(rohdaten),
+            regelAusgabe=ordner / 'regeln.xlsx')), {}
+
+    daten, _ = datenEinlesen(rohdaten)
+    kategorien = testdatenKategorien(rohdaten)
+    if stufe == 'pakete':
+        return (lambda: createPakete(daten, kategorien)), {}
+    pakete = createPakete(daten, kategorien)
+    kennzahlen = {'anzahlPakete': int(pakete['paketID'].nunique())}
+    if stufe == 'regeln':
+        definitionen = regelnLaden(regelDatei)
+        # Jedes Mal ein neuer Datensatz, damit auch die Keys neu berechnet
+        # werden wie nach dem Laden neuer Daten
+        return (lambda: regelnErstellen(definitionen, Datensatz(pakete))), \
+            kennzahlen
+    if stufe == 'export':
+        return (lambda: writePaketeToExcel(
+            pakete, kategorien, ordner / 'pakete.xlsx')), kennzahlen
+    if stufe == 'export_parquet':
+        return (lambda: paketeExportieren(
+            pakete, kategorien, ordner / 'pakete.parquet')), kennzahlen
+    raise ValueError("Unbekannte Stufe '{}'".format(stufe))
+
+def stufeAusfuehren(stufe, rohdaten, regelDatei, wiederholungen):
+    """Misst eine Stufe im aktuellen Prozess, siehe --einzeln"""
+    with tempfile.TemporaryDirectory() as ordner:
+        funktion, kennzahlen = stufeVorbereiten(stufe, rohdaten, regelDatei,
+                                                ordner)
+        resultat = messen(funktion, wiederholungen)
+    resultat.update(kennzahlen)
+    return resultat
+
+def testdatenKategorien(rohdaten):
+    """Liest die Kategorien, die testdaten.py neben die Rohdaten schreibt"""
+    path = pathlib.Path(rohdaten)
+    datei = path.with_name(path.stem + '_kategorien.txt')
+    if not datei.exists():
+        return None
+    return [z.strip() for z in datei.read_text(encoding='utf-8').split()]
+
+def testdatenBereitstellen(zeilen, muster, regeln, seed=0):
+    """Erzeugt Rohdaten und Regeln, wenn sie noch nicht vorhanden sind
+
+    :returns: Tupel (Dateiname der Rohdaten, Dateiname der Regeln)
+    """
+    import numpy as np
+    from testdaten import Katalog, testdatenSchreiben
+    DATEN.mkdir(parents=True, exist_ok=True)
+    rohdaten = DATEN / 'rohdaten_{}_{}_{}.csv'.format(zeilen, muster, seed)
+    if not rohdaten.exists():
+        teil = rohdaten.with_name(rohdaten.stem + '.teil.csv')
+        testdatenSchreiben(teil, zeilen, seed, KATEGORIEN,
+                           anzahlMuster=muster)
+        teil.with_name(teil.stem + '_kategorien.txt').replace(
+            rohdaten.with_name(rohdaten.stem + '_kategorien.txt'))
+        teil.replace(rohdaten)
+
+    regelDatei = DATEN / 'regeln_{}_{}.json'.format(regeln, seed)
+    if not regelDatei.exists():
+        # Der Katalog ist das Erste, was testdatenErzeugen mit dem Seed macht
+        katalog = Katalog(np.random.default_rng(seed), anzahlMuster=muster)
+        rng = np.random.default_rng(seed + 1)
+        code = lambda rang: '{:07.4f}'.format(katalog.tarmed[rang])
+        definitionen = []
+        for i in range(regeln):
+            raenge = np.minimum(rng.zipf(1.3, 5) - 1, katalog.tarmed.size - 1)
+            definitionen.append({
+                'Name': 'Regel {}'.format(i + 1),
+                'UND': [code(raenge[0])] if rng.random() < 0.8 else [],
+                'ODER': [code(r) for r in raenge[1:1 + rng.integers(0, 4)]],
+                'NICHT': [code(raenge[4])] if rng.random() < 0.3 else [],
+                })
+        inhalt = {'format': 'Paketmanager-Regeln', 'version': 1,
+                  'regeln': definitionen}
+        regelDatei.write_text(json.dumps(inhalt, indent=1), encoding='utf-8')
+    return rohdaten, regelDatei
+
+def benchmarkAusfuehren(stufe, zeilen, muster, regeln, wiederholungen):
+    """Misst eine Stufe in einem neuen Prozess
+
+    :returns: Dict mit dem Resultat, siehe messen
+    """
+    rohdaten, regelDatei = testdatenBereitstellen(zeilen, muster, regeln)
+    prozess = subprocess.run(
+        [sys.executable, str(pathlib.Path(__file__).resolve()),
+         '--einzeln', stufe, str(rohdaten), str(regelDatei),
+         str(wiederholungen)],
+        cwd=str(REPO), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    if prozess.returncode != 0:
+        raise RuntimeError("Stufe {} fehlgeschlagen:\n{}".format(
+            stufe, prozess.stderr))
+    resultat = json.loads(prozess.stdout.strip().splitlines()[-1])
+    zeiten = resultat.pop('zeiten')
+    return dict(resultat, stufe=stufe, zeilen=zeilen, muster=muster,
+                regeln=regeln if stufe in REGEL_STUFEN else None,
+                zeit=statistics.median(zeiten), minimum=min(zeiten),
+                zeiten=zeiten)
+
+def rechner():
+    """Beschreibt den Rechner und die Versionen, um Baselines zuzuordnen"""
+    import numpy
+    import pandas
+    return {
+        'rechner': platform.node(),
+        'system': platform.platform(),
+        'prozessor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'pandas': pandas.__version__,
+        'numpy': numpy.__version__,
+    }
+
+def schluessel(resultat):
+    """Identifiziert eine Messung unabhaengig von ihrem Resultat"""
+    return (resultat['stufe'], resultat['zeilen'], resultat['muster'],
+            resultat['regeln'])
+
+def ergebnisseLesen(dateiname):
+    """Liest gespeicherte Resultate oder eine Baseline
+
+    :dateiname: Dateiname oder Name einer Baseline in benchmarks/baselines
+    """
+    path = pathlib.Path(dateiname)
+    if not path.exists() and path.suffix != '.json':
+        path = BASELINES / (str(dateiname) + '.json')
+    with open(str(path), encoding='utf-8') as datei:
+        inhalt = json.load(datei)
+    if inhalt.get('format') != BENCHMARK_FORMAT:
+        raise ValueError("{} enthaelt keine Benchmark Resultate".format(path))
+    return inhalt
+
+def vergleichen(ergebnisse, basis, schwelle=0.1):
+    """Vergleicht Resultate mit einer Baseline
+
+    :ergebnisse: Liste mit Resultaten
+    :basis: Liste mit Resultaten der Baseline
+    :schwelle: Relative Aenderung, ab der eine Messung als schneller bzw.
+    langsamer gilt
+    :returns: Liste mit Dicts pro Messung mit faktorZeit, faktorSpeicher und
+    status ('schneller', 'gleich', 'langsamer' oder 'neu')
+    """
+    basisNach = {schluessel(b): b for b in basis}
+    vergleich = []
+    for resultat in ergebnisse:
+        alt = basisNach.get(schluessel(resultat))
+        zeile = dict(resultat, basisZeit=None, basisSpeicher=None,
+                     faktorZeit=None, faktorSpeicher=None, status='neu')
+        if alt is not None:
+            zeile['basisZeit'] = alt['zeit']
+            zeile['basisSpeicher'] = alt['speicher']
+            zeile['faktorZeit'] = resultat['zeit'] / max(alt['zeit'], 1e-9)
+            if resultat['speicher'] is not None and \
+                    alt['speicher'] is not None:
+                zeile['faktorSpeicher'] = resultat['speicher'] / \
+                    max(alt['speicher'], 1)
+            if zeile['faktorZeit'] > 1 + schwelle:
+                zeile['status'] = 'langsamer'
+            elif zeile['faktorZeit'] < 1 - schwelle:
+                zeile['status'] = 'schneller'
+            else:
+                zeile['status'] = 'gleich'
+        vergleich.append(zeile)
+    return vergleich
+
+def mb(speicher):
+    """Formatiert Bytes als MB, '-' wenn der Speicher nicht bekannt ist"""
+    return '{:.1f}'.format(speicher / 2**20) if speicher is not None else '-'
+
+def bericht(zeilen):
+    """Erstellt eine Tabelle mit Resultaten oder einem Vergleich als Text"""
+    faktor = lambda f: '{:.2f}x'.format(f) if f is not None else '-'
+    kopf = ['Stufe', 'Zeilen', 'Muster', 'Regeln', 'Pakete', 'Zeit s',
+            'Min s', 'Speicher MB']
+    mitVergleich = any('status' in z for z in zeilen)
+    if mitVergleich:
+        kopf += ['Basis s', 'Zeit', 'Speicher', 'Status']
+    tabelle = [kopf]
+    for z in zeilen:
+        zeile = [z['stufe'], str(z['zeilen']), str(z['muster']),
+                 '-' if z['regeln'] is None else str(z['regeln']),
+                 str(z.get('anzahlPakete', '-')), '{:.3f}'.format(z['zeit']),
+                 '{:.3f}'.format(z['minimum']), mb(z['speicher'])]
+        if mitVergleich:
+            zeile += ['-' if z['basisZeit'] is None else
+                      '{:.3f}'.format(z['basisZeit']),
+                      faktor(z['faktorZeit']), faktor(z['faktorSpeicher']),
+                      z['status']]
+        tabelle.append(zeile)
+    breiten = [max(len(zeile[i]) for zeile in tabelle)
+               for i in range(len(kopf))]
+    return '\n'.join(
+        '  '.join(w.rjust(b) if i else w.ljust(b)
+                  for i, (w, b) in enumerate(zip(zeile, breiten)))
+        for zeile in tabelle)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--zeilen', type=int, nargs='+',
+                        default=[10000, 100000],
+                        help='Groessen der Testdaten in Zeilen')
+    parser.add_argument('--muster', type=int, nargs='+', default=[20000],
+                        help='Anzahl Behandlungsmuster der Testdaten, mehr '
+                             'Muster ergeben mehr Pakete')
+    parser.add_argument('--regeln', type=int, nargs='+', default=[10],
+                        help='Anzahl Regeln fuer regeln und gesamt')
+    parser.add_argument('--stufen', nargs='+', choices=STUFEN, default=STUFEN)
+    parser.add_argument('--wiederholungen', type=int, default=3)
+    parser.add_argument('--speichern', metavar='NAME',
+                        help='Resultate als Baseline NAME speichern')
+    parser.add_argument('--vergleich', metavar='BASELINE',
+                        help='Name oder Datei einer Baseline')
+    parser.add_argument('--schwelle', type=float, default=0.1,
+                        help='Relative Aenderung, ab der eine Stufe als '
+                             'langsamer oder schneller gilt')
+    parser.add_argument('--einzeln', nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.einzeln:
+        stufe, rohdaten, regelDatei, wiederholungen = args.einzeln
+        print(json.dumps(stufeAusfuehren(stufe, rohdaten, regelDatei,
+                                         int(wiederholungen))))
+        return 0
+
+    basis = None
+    if args.vergleich:
+        basis = ergebnisseLesen(args.vergleich)['ergebnisse']
+
+    ergebnisse = []
+    for zeilen in args.zeilen:
+        for muster in args.muster:
+            for stufe in args.stufen:
+                anzahlRegeln = args.regeln if stufe in REGEL_STUFEN \
+                    else args.regeln[:1]
+                for regeln in anzahlRegeln:
+                    resultat = benchmarkAusfuehren(stufe, zeilen, muster,
+                                                   regeln, args.wiederholungen)
+                    ergebnisse.append(resultat)
+                    print('{:<15} {:>9} Zeilen {:8.3f} s {:>8} MB'.format(
+                        stufe, zeilen, resultat['zeit'],
+                        mb(resultat['speicher'])), file=sys.stderr)
+
+    inhalt = {
+        'format': BENCHMARK_FORMAT,
+        'version': BENCHMARK_VERSION,
+        'erstellt': datetime.datetime.now().isoformat(timespec='seconds'),
+        'rechner': rechner(),
+        'wiederholungen': args.wiederholungen,
+        'ergebnisse': ergebnisse,
+        }
+    ERGEBNISSE.mkdir(parents=True, exist_ok=True)
+    ziele = [ERGEBNISSE / (time.strftime('%Y%m%d-%H%M%S') + '.json')]
+    if args.speichern:
+        BASELINES.mkdir(parents=True, exist_ok=True)
+        ziele.append(BASELINES / (args.speichern + '.json'))
+    for ziel in ziele:
+        ziel.write_text(json.dumps(inhalt, indent=1), encoding='utf-8')
+
+    if basis is not None:
+        print(bericht(vergleichen(ergebnisse, basis, args.schwelle)))
+    else:
+        print(bericht(ergebnisse))
+    print('Resultate in {}'.format(', '.join(str(z) for z in ziele)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
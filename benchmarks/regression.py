@@ -0,0 +1,324 @@
+"""Prueft Resultate, Durchsatz und Speicher der Berechnung gegen Referenzen
+
+Auf festen synthetischen Testdaten (siehe DATENSAETZE und testdaten.py)
+werden die Rohdaten eingelesen, die Pakete berechnet und die Regeln
+ausgewertet. Geprueft wird:
+
+ * Resultate: paketID, key und Anzahl jeder Zeile, die Anzahl Pakete und
+   die Falldaten, die jede Regel erfuellt, muessen genau gleich sein wie in
+   der Referenz benchmarks/referenz.json. Gespeichert sind Pruefsummen.
+ * Leistung: Die Schritte einlesen, pakete und regeln werden wie in
+   pipeline.py in eigenen Prozessen gemessen. Der Durchsatz (Zeilen pro
+   Sekunde, aus der schnellsten Wiederholung) darf hoechstens um die
+   Schwelle sinken, der Spitzenspeicher hoechstens um die Schwelle steigen,
+   verglichen mit einer Baseline in benchmarks/baselines.
+
+Aufruf:
+
+    python benchmarks/regression.py --baseline-speichern
+    python benchmarks/regression.py
+    python benchmarks/regression.py --nur-resultate
+
+Der Exit Code ist 1, wenn ein Resultat abweicht oder eine Regression
+gefunden wurde. Die Referenz haengt nicht vom Rechner ab und wird nur mit
+--referenz-erstellen neu geschrieben, wenn sich die Resultate absichtlich
+aendern. Die Baseline gilt nur fuer den Rechner, auf dem sie gespeichert
+wurde, sie ist im Format von pipeline.py und kann auch mit
+pipeline.py --vergleich verwendet werden.
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import pathlib
+import sys
+
+from pipeline import BENCHMARK_FORMAT, BENCHMARK_VERSION, BASELINES
+from pipeline import benchmarkAusfuehren, ergebnisseLesen, rechner, mb
+from pipeline import schluessel, testdatenBereitstellen, testdatenKategorien
+
+REFERENZ = pathlib.Path(__file__).resolve().parent / 'referenz.json'
+REFERENZ_FORMAT = 'Paketmanager-Referenz'
+REFERENZ_VERSION = 1
+
+# Name -> (Zeilen, Muster, Regeln) der Testdaten, immer mit Seed 0
+DATENSAETZE = {
+    'klein': (20000, 2000, 20),
+    'mittel': (100000, 20000, 50),
+}
+
+STUFEN = ['einlesen', 'pakete', 'regeln']
+
+# Kleinere Aenderungen des Spitzenspeichers sind Messrauschen
+MIN_SPEICHER_DIFFERENZ = 16 * 2**20
+
+def pruefsumme(*teile):
+    """Berechnet eine SHA-256 Pruefsumme ueber numpy arrays, Strings oder
+    Bytes"""
+    summe = hashlib.sha256()
+    for teil in teile:
+        if isinstance(teil, str):
+            teil = teil.encode('utf-8')
+        elif not isinstance(teil, bytes):
+            teil = teil.tobytes()
+        summe.update(teil)
+        summe.update(b'|')
+    return summe.hexdigest()
+
+def resultateBerechnen(rohdaten, regelDatei):
+    """Berechnet Pakete und Regeln und fasst sie mit Pruefsummen zusammen
+
+    :returns: Dict mit Kennzahlen und Pruefsummen
+    """
+    import numpy as np
+    from Paketmanager.Kern import Datensatz, PaketEngine, RegelEngine
+
+    datensatz = Datensatz.einlesen([rohdaten],
+                                   testdatenKategorien(rohdaten))
+    datensatz = PaketEngine().berechnen(datensatz)
+    ergebnis = RegelEngine.ausDatei(regelDatei).auswerten(datensatz)
+
+    daten = datensatz.daten
+    paketID = daten['paketID'].to_numpy(dtype=np.int64)
+    anzahl = daten['Anzahl'].to_numpy(dtype=np.int64)
+    pakete = daten.drop_duplicates('paketID').sort_values('paketID')
+    regeln = {}
+    for name, anzahlFalldaten in ergebnis.anzahlen().items():
+        falldaten = np.unique(ergebnis.falldaten(name)).astype(np.int64)
+        regeln[name] = {
+            'anzahl': anzahlFalldaten,
+            'falldaten': pruefsumme(falldaten),
+            }
+    statistik = datensatz.statistik()
+    return {
+        'rohdaten': pruefsumme(pathlib.Path(rohdaten).read_bytes()),
+        'anzahlZeilen': int(statistik['anzahlZeilen']),
+        'anzahlFalldaten': int(statistik['anzahlFalldaten']),
+        'anzahlPakete': int(statistik['anzahlPakete']),
+        'pakete': pruefsumme(paketID, anzahl),
+        'keys': pruefsumme('\n'.join(pakete['key'])),
+        'regeln': regeln,
+        }
+
+def resultateVergleichen(resultat, referenz):
+    """Vergleicht die Resultate eines Datensatzes mit der Referenz
+
+    :returns: Liste mit Texten zu den Abweichungen, leer wenn alles gleich
+    ist
+    """
+    if resultat['rohdaten'] != referenz['rohdaten']:
+        return ['Die Testdaten sind nicht die der Referenz, wurde '
+                'testdaten.py oder numpy geaendert?']
+    abweichungen = []
+    for name in ['anzahlZeilen', 'anzahlFalldaten', 'anzahlPakete']:
+        if resultat[name] != referenz[name]:
+            abweichungen.append('{}: {} statt {}'.format(
+                name, resultat[name], referenz[name]))
+    if resultat['pakete'] != referenz['pakete']:
+        abweichungen.append('paketID oder Anzahl der Zeilen sind anders')
+    if resultat['keys'] != referenz['keys']:
+        abweichungen.append('Die Keys der Pakete sind anders')
+    for name in sorted(set(resultat['regeln']) | set(referenz['regeln'])):
+        neu = resultat['regeln'].get(name)
+        alt = referenz['regeln'].get(name)
+        if neu is None or alt is None:
+            abweichungen.append('{}: fehlt in {}'.format(
+                name, 'den Resultaten' if neu is None else 'der Referenz'))
+        elif neu['anzahl'] != alt['anzahl']:
+            abweichungen.append('{}: {} statt {} Falldaten'.format(
+                name, neu['anzahl'], alt['anzahl']))
+        elif neu['falldaten'] != alt['falldaten']:
+            abweichungen.append('{}: andere Falldaten'.format(name))
+    return abweichungen
+
+def referenzLesen():
+    """Liest die Referenz oder gibt None zurueck, wenn es keine gibt"""
+    if not REFERENZ.exists():
+        return None
+    inhalt = json.loads(REFERENZ.read_text(encoding='utf-8'))
+    if inhalt.get('format') != REFERENZ_FORMAT:
+        raise ValueError("{} ist keine Referenz".format(REFERENZ))
+    return inhalt['datensaetze']
+
+def resultatePruefen(namen, erstellen=False):
+    """Berechnet die Resultate der Datensaetze und vergleicht sie mit der
+    Referenz oder schreibt die Referenz neu
+
+    :returns: True, wenn alle Resultate gleich sind
+    """
+    referenz = referenzLesen()
+    if erstellen:
+        referenz = referenz or {}
+    elif referenz is None:
+        print('Keine Referenz {}, zuerst mit --referenz-erstellen '
+              'erstellen'.format(REFERENZ), file=sys.stderr)
+        return False
+    ok = True
+    for name in namen:
+        zeilen, muster, regeln = DATENSAETZE[name]
+        rohdaten, regelDatei = testdatenBereitstellen(zeilen, muster, regeln)
+        resultat = resultateBerechnen(rohdaten, regelDatei)
+        if erstellen:
+            referenz[name] = resultat
+            print('{}: Referenz erstellt, {} Pakete'.format(
+                name, resultat['anzahlPakete']))
+            continue
+        if name not in referenz:
+            print('{}: keine Referenz'.format(name))
+            ok = False
+            continue
+        abweichungen = resultateVergleichen(resultat, referenz[name])
+        if abweichungen:
+            ok = False
+            print('{}: Resultate ABWEICHEND'.format(name))
+            for abweichung in abweichungen:
+                print('  ' + abweichung)
+        else:
+            print('{}: Resultate gleich ({} Pakete, {} Regeln)'.format(
+                name, resultat['anzahlPakete'], len(resultat['regeln'])))
+    if erstellen:
+        inhalt = {
+            'format': REFERENZ_FORMAT,
+            'version': REFERENZ_VERSION,
+            'erstellt': datetime.datetime.now().isoformat(timespec='seconds'),
+            'datensaetze': {n: referenz[n] for n in sorted(referenz)},
+            }
+        REFERENZ.write_text(json.dumps(inhalt, indent=1) + '\n',
+                            encoding='utf-8')
+    return ok
+
+def leistungMessen(namen, wiederholungen):
+    """Misst die Stufen auf allen Datensaetzen, siehe pipeline.py
+
+    :returns: Liste mit Resultaten im Format von pipeline.py
+    """
+    ergebnisse = []
+    for name in namen:
+        zeilen, muster, regeln = DATENSAETZE[name]
+        for stufe in STUFEN:
+            resultat = benchmarkAusfuehren(stufe, zeilen, muster, regeln,
+                                           wiederholungen)
+            ergebnisse.append(dict(resultat, datensatz=name))
+            print('{:<8} {:<10} {:8.3f} s {:>8} MB'.format(
+                name, stufe, resultat['minimum'],
+                mb(resultat['speicher'])), file=sys.stderr)
+    return ergebnisse
+
+def leistungVergleichen(ergebnisse, basis, schwelle, schwelleSpeicher):
+    """Vergleicht Durchsatz und Spitzenspeicher mit der Baseline
+
+    :returns: Tupel (Liste mit Zeilen fuer die Ausgabe, True wenn es keine
+    Regression gibt)
+    """
+    basisNach = {schluessel(b): b for b in basis}
+    ok = True
+    zeilen = []
+    for resultat in ergebnisse:
+        alt = basisNach.get(schluessel(resultat))
+        durchsatz = resultat['zeilen'] / max(resultat['minimum'], 1e-9)
+        zeile = [resultat['datensatz'], resultat['stufe'],
+                 '{:.0f}'.format(durchsatz), '-', '-',
+                 mb(resultat['speicher']), '-', '-',
+                 'neu']
+        if alt is not None:
+            basisDurchsatz = resultat['zeilen'] / max(alt['minimum'], 1e-9)
+            faktorDurchsatz = durchsatz / basisDurchsatz
+            faktorSpeicher = None
+            groesser = False
+            if resultat['speicher'] is not None and \
+                    alt['speicher'] is not None:
+                # Ohne Speicher (z.B. unter Windows) nur den Durchsatz
+                differenz = resultat['speicher'] - alt['speicher']
+                faktorSpeicher = resultat['speicher'] / max(alt['speicher'], 1)
+                groesser = (faktorSpeicher > 1 + schwelleSpeicher
+                            and differenz > MIN_SPEICHER_DIFFERENZ)
+            langsamer = faktorDurchsatz < 1 - schwelle
+            status = []
+            if langsamer:
+                status.append('LANGSAMER')
+            if groesser:
+                status.append('MEHR SPEICHER')
+            ok = ok and not status
+            zeile[3:5] = ['{:.0f}'.format(basisDurchsatz),
+                          '{:.2f}x'.format(faktorDurchsatz)]
+            zeile[6:9] = [mb(alt['speicher']),
+                          '-' if faktorSpeicher is None else
+                          '{:.2f}x'.format(faktorSpeicher),
+                          ', '.join(status) or 'ok']
+        zeilen.append(zeile)
+    return zeilen, ok
+
+def tabelle(zeilen):
+    """Formatiert die Zeilen von leistungVergleichen als Text"""
+    kopf = ['Daten', 'Stufe', 'Zeilen/s', 'Basis', 'Faktor', 'Speicher MB',
+            'Basis', 'Faktor', 'Status']
+    alle = [kopf] + zeilen
+    breiten = [max(len(zeile[i]) for zeile in alle) for i in range(len(kopf))]
+    return '\n'.join(
+        '  '.join(w.rjust(b) if 1 < i < len(kopf) - 1 else w.ljust(b)
+                  for i, (w, b) in enumerate(zip(zeile, breiten)))
+        for zeile in alle)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--datensaetze', nargs='+', choices=list(DATENSAETZE),
+                        default=list(DATENSAETZE))
+    parser.add_argument('--nur-resultate', action='store_true',
+                        help='Nur die Resultate pruefen, ohne Messungen')
+    parser.add_argument('--referenz-erstellen', action='store_true',
+                        help='Referenz neu schreiben statt vergleichen')
+    parser.add_argument('--baseline', default='regression', metavar='NAME',
+                        help='Name oder Datei der Baseline')
+    parser.add_argument('--baseline-speichern', action='store_true',
+                        help='Messungen als Baseline speichern statt '
+                             'vergleichen')
+    parser.add_argument('--schwelle', type=float, default=0.2,
+                        help='Erlaubte relative Abnahme des Durchsatzes')
+    parser.add_argument('--schwelle-speicher', type=float, default=0.2,
+                        help='Erlaubte relative Zunahme des Spitzenspeichers')
+    parser.add_argument('--wiederholungen', type=int, default=3)
+    args = parser.parse_args()
+
+    ok = resultatePruefen(args.datensaetze, args.referenz_erstellen)
+    if args.nur_resultate or args.referenz_erstellen:
+        return 0 if ok else 1
+
+    basis = None
+    if not args.baseline_speichern:
+        try:
+            inhalt = ergebnisseLesen(args.baseline)
+        except FileNotFoundError:
+            print('Keine Baseline {}, zuerst mit --baseline-speichern '
+                  'erstellen'.format(args.baseline), file=sys.stderr)
+            return 1
+        basis = inhalt['ergebnisse']
+        if inhalt.get('rechner', {}).get('rechner') != rechner()['rechner']:
+            print('Warnung: Die Baseline stammt von einem anderen Rechner',
+                  file=sys.stderr)
+
+    ergebnisse = leistungMessen(args.datensaetze, args.wiederholungen)
+    if args.baseline_speichern:
+        inhalt = {
+            'format': BENCHMARK_FORMAT,
+            'version': BENCHMARK_VERSION,
+            'erstellt': datetime.datetime.now().isoformat(timespec='seconds'),
+            'rechner': rechner(),
+            'wiederholungen': args.wiederholungen,
+            'ergebnisse': ergebnisse,
+            }
+        BASELINES.mkdir(parents=True, exist_ok=True)
+        ziel = BASELINES / (args.baseline + '.json')
+        ziel.write_text(json.dumps(inhalt, indent=1), encoding='utf-8')
+        print('Baseline in {}'.format(ziel))
+        return 0 if ok else 1
+
+    zeilen, leistungOk = leistungVergleichen(
+        ergebnisse, basis, args.schwelle, args.schwelle_speicher)
+    print(tabelle(zeilen))
+    ok = ok and leistungOk
+    print('OK' if ok else 'REGRESSION')
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
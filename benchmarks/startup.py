@@ -0,0 +1,75 @@
+"""Misst, wie lange es dauert, bis das Hauptfenster angezeigt wird
+
+Startet den Paketmanager mehrmals in einem neuen Python Prozess und misst
+die Zeit vom Start des Prozesses bis das Fenster angezeigt ist und die
+Ereignisschleife laeuft.
+
+Aufruf: python benchmarks/startup.py [--wiederholungen N] [--ziel SEKUNDEN]
+
+Ohne Display wird die Qt Plattform 'offscreen' verwendet. Der Exit Code ist
+1, wenn der Median ueber dem Ziel liegt.
+"""
+
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+REPO = pathlib.Path(__file__).resolve().parent.parent
+
+# Wird im neuen Prozess ausgefuehrt, meldet sich, sobald das Fenster steht
+PROGRAMM = """
+import sys
+import Paketmanager
+from PyQt5 import QtCore
+app = Paketmanager.QApplication([])
+application = Paketmanager.GUI()
+def angezeigt():
+    print('angezeigt', flush=True)
+    app.quit()
+QtCore.QTimer.singleShot(0, angezeigt)
+app.exec_()
+"""
+
+def startMessen():
+    """Startet den Paketmanager einmal und gibt die Zeit in Sekunden zurueck"""
+    umgebung = dict(os.environ)
+    if not umgebung.get('DISPLAY') and not umgebung.get('WAYLAND_DISPLAY'):
+        umgebung.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    start = time.perf_counter()
+    prozess = subprocess.Popen(
+        [sys.executable, '-c', PROGRAMM], cwd=str(REPO), env=umgebung,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        universal_newlines=True)
+    for zeile in prozess.stdout:
+        if zeile.startswith('angezeigt'):
+            dauer = time.perf_counter() - start
+            break
+    else:
+        prozess.wait()
+        raise RuntimeError("Der Paketmanager hat sich nicht gemeldet")
+    prozess.wait()
+    return dauer
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--wiederholungen', type=int, default=5)
+    parser.add_argument('--ziel', type=float, default=1.0,
+                        help='Maximaler Median in Sekunden')
+    args = parser.parse_args()
+
+    # Der erste Start schreibt die .pyc Dateien und zaehlt nicht
+    startMessen()
+    zeiten = [startMessen() for _ in range(args.wiederholungen)]
+    median = statistics.median(zeiten)
+    print('Start bis Fenster: Median {:.3f} s, Min {:.3f} s, Max {:.3f} s'.format(
+        median, min(zeiten), max(zeiten)))
+    print('Ziel: {:.3f} s -> {}'.format(
+        args.ziel, 'OK' if median <= args.ziel else 'ZU LANGSAM'))
+    return 0 if median <= args.ziel else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
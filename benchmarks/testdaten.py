@@ -0,0 +1,308 @@
+"""Erzeugt synthetische Rohdaten fuer Benchmarks und Tests
+
+Echte Rohdaten enthalten Patientendaten und koennen nicht weitergegeben
+werden. Die erzeugten Daten haben die gleichen Spalten (FallNr, Datumsfeld,
+Tarifgruppe, Leistung) und eine aehnliche Struktur:
+
+ * Faelle mit einem oder mehreren Behandlungstagen, FallNr aufsteigend
+ * Pro Falldatum ein Behandlungsmuster, d.h. eine haeufige Kombination von
+   TARMED Leistungen (z.B. Konsultation mit Zuschlaegen), dazu einzelne
+   weitere TARMED Leistungen und Leistungen anderer Tarifgruppen
+ * Leistungen und Behandlungsmuster sind Zipf-verteilt: wenige sind sehr
+   haeufig, die meisten selten
+ * Zeitleistungen werden mehrmals am selben Tag abgerechnet
+
+Mit dem gleichen Seed und den gleichen Parametern entsteht immer die gleiche
+Datei. Die Daten werden in Stuecken erzeugt und geschrieben, so dass auch
+50 Millionen Zeilen wenig Speicher brauchen (ausser fuer Excel, das
+hoechstens 1048575 Zeilen haben kann).
+
+Aufruf:
+
+    python benchmarks/testdaten.py daten.csv --zeilen 1000000
+    python benchmarks/testdaten.py daten.xlsx --zeilen 100000 --kategorien 5
+    python benchmarks/testdaten.py daten.parquet --zeilen 50000000 --seed 7
+
+Das Format folgt aus der Endung. Die Kategorien stehen bei Excel im zweiten
+Sheet, sonst in 'daten_kategorien.txt' (siehe --kategorien der
+Kommandozeile).
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Maximale Anzahl Datenzeilen eines Excel sheets
+MAX_ZEILEN_EXCEL = 1048575
+
+# Tarifgruppen ausser TARMED mit ihrem Anteil an den anderen Leistungen und
+# dem Bereich ihrer Leistungsnummern
+ANDERE_TARIFGRUPPEN = [
+    ('Labor', 0.5, 1000, 1800),
+    ('Medikamente', 0.3, 1000000, 8000000),
+    ('MiGeL', 0.1, 10000, 40000),
+    ('Physiotherapie', 0.1, 7301, 7355),
+]
+
+# Erster Behandlungstag und Zeitraum der Daten in Tagen
+STARTDATUM = pd.Timestamp(2020, 1, 1)
+ZEITRAUM = 730
+
+# Anzahl Faelle, die auf einmal erzeugt werden, ergibt etwa 1 Mio Zeilen
+FAELLE_PRO_STUECK = 100000
+
+class Katalog:
+    """Leistungen, Behandlungsmuster und ihre Haeufigkeiten"""
+
+    def __init__(self, rng, anzahlLeistungen=4000, anzahlMuster=20000,
+                 zipf=1.1, anteilZeitleistungen=0.03):
+        """
+        :rng: numpy Generator
+        :anzahlLeistungen: Anzahl verschiedener TARMED Leistungen
+        :anzahlMuster: Anzahl verschiedener Behandlungsmuster
+        :zipf: Exponent der Zipf Verteilung, groesser ist ungleichmaessiger
+        :anteilZeitleistungen: Anteil der Leistungen, die pro Tag mehrmals
+        vorkommen koennen
+        """
+        # TARMED Nummern kk.nnnn, der Rang in der Haeufigkeit ist zufaellig
+        nummern = set()
+        while len(nummern) < anzahlLeistungen:
+            kapitel = rng.integers(0, 40, anzahlLeistungen)
+            position = rng.integers(1, 1000, anzahlLeistungen) * 10
+            for k, p in zip(kapitel.tolist(), position.tolist()):
+                if len(nummern) < anzahlLeistungen:
+                    nummern.add(k * 10000 + p)
+        nummern = rng.permutation(np.array(sorted(nummern)))
+        self.tarmed = nummern / 10000.0
+        self.tarmedCdf = zipfCdf(anzahlLeistungen, zipf)
+        self.zeitleistung = rng.random(anzahlLeistungen) < anteilZeitleistungen
+
+        # Ein Muster sind 1 bis 10 verschiedene Leistungen, die haeufigen
+        # Leistungen kommen in vielen Mustern vor
+        groessen = np.minimum(1 + rng.poisson(2.5, anzahlMuster), 10)
+        muster = []
+        for groesse in groessen.tolist():
+            muster.append(np.unique(ziehen(rng, self.tarmedCdf, groesse)))
+        self.musterOffsets = np.zeros(anzahlMuster + 1, dtype=np.int64)
+        self.musterOffsets[1:] = np.cumsum([m.size for m in muster])
+        self.musterLeistungen = np.concatenate(muster)
+        self.musterCdf = zipfCdf(anzahlMuster, zipf)
+
+        self.gruppen = np.array([g[0] for g in ANDERE_TARIFGRUPPEN] + ['TARMED'],
+                                dtype=object)
+        self.gruppenCdf = np.cumsum([g[1] for g in ANDERE_TARIFGRUPPEN])
+        self.andere = []
+        for _, _, von, bis in ANDERE_TARIFGRUPPEN:
+            anzahl = min(bis - von, 2000)
+            codes = von + rng.choice(bis - von, anzahl, replace=False)
+            self.andere.append((codes.astype(float), zipfCdf(anzahl, zipf)))
+
+    def kategorien(self, anzahl):
+        """Waehlt Kategorien aus den haeufigsten Leistungen
+
+        :anzahl: Anzahl Kategorien
+        :returns: Liste mit Leistungen im Format xx.xxxx
+        """
+        return ['{:07.4f}'.format(l) for l in self.tarmed[:anzahl]]
+
+def zipfCdf(anzahl, exponent):
+    """Gibt die kumulierte Zipf Verteilung ueber anzahl Raenge zurueck"""
+    gewichte = 1.0 / np.arange(1, anzahl + 1) ** exponent
+    cdf = np.cumsum(gewichte)
+    return cdf / cdf[-1]
+
+def ziehen(rng, cdf, anzahl):
+    """Zieht anzahl Raenge gemaess einer kumulierten Verteilung"""
+    return np.minimum(np.searchsorted(cdf, rng.random(anzahl)), cdf.size - 1)
+
+def wiederholen(zaehler):
+    """Gibt fuer Zaehler [2, 3] die Positionen [0, 1, 0, 1, 2] zurueck"""
+    starts = np.repeat(np.cumsum(zaehler) - zaehler, zaehler)
+    return np.arange(starts.size) - starts
+
+def stueckErzeugen(rng, katalog, ersterFall, anzahlFaelle):
+    """Erzeugt die Zeilen von anzahlFaelle Faellen
+
+    :returns: Pandas objekt mit den Spalten der Rohdaten
+    """
+    # Behandlungstage pro Fall, im Abstand von einigen Tagen
+    tageProFall = np.minimum(rng.geometric(0.6, anzahlFaelle), 30)
+    anzahlTage = int(tageProFall.sum())
+    tagFall = np.repeat(np.arange(anzahlFaelle), tageProFall)
+    abstand = 1 + rng.poisson(3, anzahlTage)
+    abstand[np.cumsum(tageProFall) - tageProFall] = 0
+    fallStart = rng.integers(0, ZEITRAUM, anzahlFaelle)
+    versatz = np.cumsum(abstand)
+    versatz -= np.repeat(versatz[np.cumsum(tageProFall) - tageProFall],
+                         tageProFall)
+    tagDatum = fallStart[tagFall] + versatz
+
+    # Behandlungsmuster
+    muster = ziehen(rng, katalog.musterCdf, anzahlTage)
+    anfang = katalog.musterOffsets[muster]
+    groesse = katalog.musterOffsets[muster + 1] - anfang
+    musterTag = np.repeat(np.arange(anzahlTage), groesse)
+    musterRang = katalog.musterLeistungen[
+        np.repeat(anfang, groesse) + wiederholen(groesse)]
+
+    # Einzelne weitere TARMED Leistungen
+    extra = rng.poisson(0.8, anzahlTage)
+    extraTag = np.repeat(np.arange(anzahlTage), extra)
+    extraRang = ziehen(rng, katalog.tarmedCdf, extraTag.size)
+
+    tarmedTag = np.concatenate([musterTag, extraTag])
+    tarmedRang = np.concatenate([musterRang, extraRang])
+    # Zeitleistungen mehrmals
+    anzahl = np.ones(tarmedRang.size, dtype=np.int64)
+    zeit = katalog.zeitleistung[tarmedRang]
+    anzahl[zeit] += np.minimum(rng.poisson(1.5, int(zeit.sum())), 12)
+    tarmedTag = np.repeat(tarmedTag, anzahl)
+    tarmedLeistung = katalog.tarmed[np.repeat(tarmedRang, anzahl)]
+
+    # Leistungen der anderen Tarifgruppen
+    andereAnzahl = rng.poisson(0.7, anzahlTage)
+    andereTag = np.repeat(np.arange(anzahlTage), andereAnzahl)
+    andereGruppe = np.searchsorted(katalog.gruppenCdf,
+                                   rng.random(andereTag.size) *
+                                   katalog.gruppenCdf[-1])
+    andereLeistung = np.empty(andereTag.size)
+    for i, (codes, cdf) in enumerate(katalog.andere):
+        auswahl = andereGruppe == i
+        andereLeistung[auswahl] = codes[ziehen(rng, cdf, int(auswahl.sum()))]
+
+    tag = np.concatenate([tarmedTag, andereTag])
+    gruppe = np.concatenate([
+        np.full(tarmedTag.size, len(ANDERE_TARIFGRUPPEN)), andereGruppe])
+    leistung = np.concatenate([tarmedLeistung, andereLeistung])
+    # Die Zeilen eines Tages zusammen, innerhalb des Tages gemischt
+    reihenfolge = np.lexsort((rng.random(tag.size), tag))
+    tag = tag[reihenfolge]
+
+    return pd.DataFrame({
+        'FallNr': ersterFall + tagFall[tag],
+        'Datumsfeld': STARTDATUM + pd.to_timedelta(tagDatum[tag], unit='D'),
+        'Tarifgruppe': katalog.gruppen[gruppe[reihenfolge]],
+        'Leistung': leistung[reihenfolge],
+        })
+
+def testdatenErzeugen(zeilen, seed=0, anzahlLeistungen=4000,
+                      anzahlMuster=20000, zipf=1.1):
+    """Erzeugt Rohdaten in Stuecken von etwa einer Million Zeilen
+
+    :zeilen: Anzahl Zeilen insgesamt
+    :seed: Seed des Zufallsgenerators
+    :returns: Tupel (Katalog, Generator mit Pandas objekten)
+    """
+    rng = np.random.default_rng(seed)
+    katalog = Katalog(rng, anzahlLeistungen, anzahlMuster, zipf)
+
+    def stuecke():
+        rest = zeilen
+        ersterFall = 100000
+        while rest > 0:
+            # Kleine Datensaetze nicht viel groesser erzeugen als noetig
+            faelle = int(min(FAELLE_PRO_STUECK, rest // 5 + 10))
+            stueck = stueckErzeugen(rng, katalog, ersterFall, faelle)
+            ersterFall += faelle
+            if stueck.shape[0] > rest:
+                stueck = stueck.iloc[:rest]
+            rest -= stueck.shape[0]
+            yield stueck
+    return katalog, stuecke()
+
+def testdatenSchreiben(dateiname, zeilen, seed=0, kategorien=0,
+                       anzahlLeistungen=4000, anzahlMuster=20000, zipf=1.1):
+    """Erzeugt Rohdaten und schreibt sie als Excel, CSV oder Parquet
+
+    :dateiname: Name der Datei, die Endung bestimmt das Format
+    :zeilen: Anzahl Zeilen
+    :seed: Seed des Zufallsgenerators
+    :kategorien: Anzahl Kategorien, 0 fuer keine
+    :returns: Liste mit den geschriebenen Dateien
+    """
+    path = pathlib.Path(dateiname)
+    endung = ''.join(path.suffixes[-2:]) if path.suffix == '.gz' \
+        else path.suffix
+    if endung not in ['.xlsx', '.csv', '.csv.gz', '.parquet']:
+        raise ValueError("Unbekanntes Format '{}'".format(endung))
+    if endung == '.xlsx' and zeilen > MAX_ZEILEN_EXCEL:
+        raise ValueError("Ein Excel kann hoechstens {} Zeilen haben".format(
+            MAX_ZEILEN_EXCEL))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    katalog, stuecke = testdatenErzeugen(zeilen, seed, anzahlLeistungen,
+                                         anzahlMuster, zipf)
+    dateien = [path]
+
+    if endung == '.xlsx':
+        daten = pd.concat(list(stuecke), ignore_index=True)
+        with pd.ExcelWriter(str(path), engine='xlsxwriter',
+                            datetime_format='yyyy-mm-dd') as writer:
+            daten.to_excel(writer, index=False)
+            if kategorien:
+                pd.DataFrame([float(k) for k in katalog.kategorien(kategorien)]
+                             ).to_excel(writer, sheet_name='Kategorien',
+                                        index=False, header=False)
+        return dateien
+    elif endung == '.parquet':
+        import pyarrow
+        import pyarrow.parquet
+        writer = None
+        try:
+            for stueck in stuecke:
+                tabelle = pyarrow.Table.from_pandas(stueck, preserve_index=False)
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(str(path),
+                                                           tabelle.schema)
+                writer.write_table(tabelle)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        if path.exists():
+            path.unlink()
+        for i, stueck in enumerate(stuecke):
+            stueck.to_csv(str(path), mode='a', header=(i == 0), index=False,
+                          float_format='%.4f', date_format='%Y-%m-%d',
+                          compression='gzip' if endung == '.csv.gz' else None)
+
+    if kategorien:
+        kategorienDatei = path.with_name(
+            path.name[:-len(endung)] + '_kategorien.txt')
+        kategorienDatei.write_text(
+            '\n'.join(katalog.kategorien(kategorien)) + '\n', encoding='utf-8')
+        dateien.append(kategorienDatei)
+    return dateien
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('dateiname',
+                        help='Zieldatei, .xlsx, .csv, .csv.gz oder .parquet')
+    parser.add_argument('-n', '--zeilen', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-k', '--kategorien', type=int, default=0,
+                        help='Anzahl Kategorien aus den haeufigsten Leistungen')
+    parser.add_argument('--leistungen', type=int, default=4000,
+                        help='Anzahl verschiedener TARMED Leistungen')
+    parser.add_argument('--muster', type=int, default=20000,
+                        help='Anzahl verschiedener Behandlungsmuster')
+    parser.add_argument('--zipf', type=float, default=1.1,
+                        help='Exponent der Zipf Verteilung')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        dateien = testdatenSchreiben(args.dateiname, args.zeilen, args.seed,
+                                     args.kategorien, args.leistungen,
+                                     args.muster, args.zipf)
+    except ValueError as error:
+        parser.error(str(error))
+    print('{} Zeilen in {:.1f} s: {}'.format(
+        args.zeilen, time.perf_counter() - start,
+        ', '.join(str(d) for d in dateien)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())